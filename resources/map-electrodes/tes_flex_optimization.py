@@ -3,6 +3,7 @@ import csv
 import os
 import time
 import h5py
+import hashlib
 import types
 import logging
 import sys
@@ -26,6 +27,7 @@ from scipy.optimize import (
     differential_evolution,
     linear_sum_assignment,
 )
+from scipy.stats import qmc
 
 from simnibs import __version__
 from simnibs.mesh_tools import mesh_io, gmsh_view
@@ -58,6 +60,25 @@ from .electrode_layout import (
 )
 
 
+# [TI-TOOLBOX] attributes shared between runs via export_prepared_state()
+_PREPARED_STATE_ATTRS = (
+    "fn_mesh",
+    "_mesh",
+    "_mesh_nodes_areas",
+    "_mesh_relabel",
+    "_original_skin_nodes",
+    "_original_skin_con",
+    "_skin_surface",
+    "_node_idx_msh",
+    "_ellipsoid",
+    "roi",
+    "_roi",
+    "_roi_properties",
+    "dirichlet_node",
+    "_ofem",
+)
+
+
 class TesFlexOptimization:
     """
     Defines a TES optimization problem using node-wise current sources.
@@ -138,6 +159,9 @@ class TesFlexOptimization:
     ----------------------
     initial_x0: numpy.array, optional, default: None
         starting values for optimization (will be automatically determined per default)
+    seed_population: numpy.array, optional, default: None
+        [TI-TOOLBOX] parameter vectors (e.g. optima of related runs) inserted into the initial
+        differential evolution population; the remaining members are drawn by Latin hypercube sampling
     detailed_results : bool, optional, default: False
         write detailed results into subfolder of output folder for visualization and control
     track_focality : bool, optional, default: False
@@ -160,6 +184,9 @@ class TesFlexOptimization:
         self._detailed_results_folder = None
         self.fn_final_sim = []
         self._prepared = False
+        # [TI-TOOLBOX] state exported by export_prepared_state() of an earlier
+        # run with identical head model / ROI / conductivity settings
+        self.prepared_state = None
 
         # map to net electrodes
         self.map_to_net_electrodes = False
@@ -191,6 +218,7 @@ class TesFlexOptimization:
         self.roi: list[RegionOfInterest] = []
         self._n_roi = None
         self._vol = []
+        self._roi_properties = []  # [TI-TOOLBOX] (vol, node_normals) per ROI
         self.disable_SPR_for_volume_roi = True
 
         # electrode
@@ -215,10 +243,21 @@ class TesFlexOptimization:
         self.polish = False
         self.n_test = 0  # number of tries to place the electrodes
         self.n_sim = 0  # number of final simulations carried out (only valid electrode positions)
+        # [TI-TOOLBOX] reuse goal values of candidates that map onto an already
+        # simulated electrode node assignment (see goal_fun)
+        self.cache_goal_evaluations = True
+        self.n_cache_hits = 0
+        self._goal_cache = {}
         self.optimize_init_vals = True
         self._bounds = None
         self.initial_x0 = None
         self.x0 = None
+        self.seed_population = None
+        self.optim_x = None
+        # [TI-TOOLBOX] mean field per ROI at the best evaluated electrode position
+        # (ROI 0: target, ROI 1: non-ROI for focality); saved with the positions
+        self.roi_mean_fields = None
+        self._best_goal_value = None
 
         # track goal fun value (in ROI 0) and focality measures for later analysis
         self.optim_funvalue = None
@@ -300,6 +339,10 @@ class TesFlexOptimization:
             if not os.path.exists(self._detailed_results_folder):
                 os.makedirs(self._detailed_results_folder)
 
+        # [TI-TOOLBOX] adopt head model / skin region / ROI / FEM state exported
+        # by an earlier run with identical settings (see export_prepared_state)
+        shared = self.prepared_state
+
         # setup headmodel
         ####################################################################################################
         logger.info("Setting up headmodel ...")
@@ -307,72 +350,77 @@ class TesFlexOptimization:
         # get subject specific filenames
         self._ff_subject = SubjectFiles(subpath=self.subpath)
 
-        # read mesh or store in self
-        self.fn_mesh = self._ff_subject.fnamehead
-        self._mesh = mesh_io.read_msh(self.fn_mesh)
-
-        # Calculate node areas for whole mesh
-        self._mesh_nodes_areas = self._mesh.nodes_areas()
-
-        # [TI-TOOLBOX] simplified relabel_internal_air (removed conditional check)
-        self._mesh_relabel = self._mesh.relabel_internal_air()
-
-        # [TI-TOOLBOX] make skin surface using standalone valid_skin_region
-        # which handles MNI masking and spurious patch removal
-        skin_crop = self._mesh_relabel.crop_mesh(tags=1005)
-        # [TI-TOOLBOX] save original skin surface nodes before filtering for valid regions
-        self._original_skin_nodes = skin_crop.nodes.node_coord.copy()
-        self._original_skin_con = skin_crop.elm.node_number_list[:, :3] - 1
-        self._skin_surface = valid_skin_region(
-            skin_surface=skin_crop,
-            fn_electrode_mask=self._fn_electrode_mask,
-            mesh=self._mesh_relabel,
-            additional_distance=0,
-            margin_mm=self.skin_region_margin_mm,
-            avoid_landmark_regions=self.avoid_landmark_regions,
-        )
+        if shared is not None:
+            logger.info("Reusing prepared headmodel, skin region and ROI ...")
+            for name in _PREPARED_STATE_ATTRS:
+                setattr(self, name, shared[name])
+        else:
+            # read mesh or store in self
+            self.fn_mesh = self._ff_subject.fnamehead
+            self._mesh = mesh_io.read_msh(self.fn_mesh)
+
+            # Calculate node areas for whole mesh
+            self._mesh_nodes_areas = self._mesh.nodes_areas()
+
+            # [TI-TOOLBOX] simplified relabel_internal_air (removed conditional check)
+            self._mesh_relabel = self._mesh.relabel_internal_air()
+
+            # [TI-TOOLBOX] make skin surface using standalone valid_skin_region
+            # which handles MNI masking and spurious patch removal
+            skin_crop = self._mesh_relabel.crop_mesh(tags=1005)
+            # [TI-TOOLBOX] save original skin surface nodes before filtering for valid regions
+            self._original_skin_nodes = skin_crop.nodes.node_coord.copy()
+            self._original_skin_con = skin_crop.elm.node_number_list[:, :3] - 1
+            self._skin_surface = valid_skin_region(
+                skin_surface=skin_crop,
+                fn_electrode_mask=self._fn_electrode_mask,
+                mesh=self._mesh_relabel,
+                additional_distance=0,
+                margin_mm=self.skin_region_margin_mm,
+                avoid_landmark_regions=self.avoid_landmark_regions,
+            )
 
-        # get mapping between skin_surface node indices and global mesh nodes
-        self._node_idx_msh = np.where(
-            np.isin(
-                self._mesh.nodes.node_coord, self._skin_surface.nodes.node_coord
-            ).all(axis=1)
-        )[0]
+            # get mapping between skin_surface node indices and global mesh nodes
+            self._node_idx_msh = np.where(
+                np.isin(
+                    self._mesh.nodes.node_coord, self._skin_surface.nodes.node_coord
+                ).all(axis=1)
+            )[0]
 
-        # fit optimal ellipsoid to valid skin points
-        self._ellipsoid.fit(points=self._skin_surface.nodes.node_coord)
+            # fit optimal ellipsoid to valid skin points
+            self._ellipsoid.fit(points=self._skin_surface.nodes.node_coord)
 
-        # setup ROI
-        ####################################################################################################
-        logger.info("Setting up ROI ...")
+            # setup ROI
+            ####################################################################################################
+            logger.info("Setting up ROI ...")
 
-        if type(self.roi) is not list:
-            self.roi = [self.roi]
+            if type(self.roi) is not list:
+                self.roi = [self.roi]
 
-        # initialize ROIs if not done already
-        self._roi = []
-        for i in range(len(self.roi)):
-            if (
-                self.subpath is not None
-                and self.roi[i].subpath is None
-                and self.roi[i].mesh is None
-            ):
-                self.roi[i].subpath = self.subpath
-            elif self.roi[i].subpath is None and self.roi[i].mesh is None:
-                self.roi[i].mesh = self._mesh
-            self._roi.append(
-                FemTargetPointCloud(
-                    self._mesh,
-                    self.roi[i].get_nodes(),
-                    nearest_neighbor=(
-                        (
-                            self.roi[i].method == "volume"
-                            or self.roi[i].method == "volume_from_surface"
-                        )
-                        and self.disable_SPR_for_volume_roi
-                    ),
+            # initialize ROIs if not done already
+            self._roi = []
+            for i in range(len(self.roi)):
+                if (
+                    self.subpath is not None
+                    and self.roi[i].subpath is None
+                    and self.roi[i].mesh is None
+                ):
+                    self.roi[i].subpath = self.subpath
+                elif self.roi[i].subpath is None and self.roi[i].mesh is None:
+                    self.roi[i].mesh = self._mesh
+                self._roi.append(
+                    FemTargetPointCloud(
+                        self._mesh,
+                        self.roi[i].get_nodes(),
+                        nearest_neighbor=(
+                            (
+                                self.roi[i].method == "volume"
+                                or self.roi[i].method == "volume_from_surface"
+                            )
+                            and self.disable_SPR_for_volume_roi
+                        ),
+                    )
                 )
-            )
 
         self._n_roi = len(self._roi)
 
@@ -466,8 +514,14 @@ class TesFlexOptimization:
         elif type(self.weights) is list:
             self.weights = np.array(self.weights)
 
+        # [TI-TOOLBOX] ROI element volumes / node normals are part of the
+        # shareable prepared state
+        if shared is None:
+            self._roi_properties = [
+                get_element_properties(self.roi[i_roi]) for i_roi in range(len(self._roi))
+            ]
         for i_roi in range(len(self._roi)):
-            vol, node_normals = get_element_properties(self.roi[i_roi])
+            vol, node_normals = self._roi_properties[i_roi]
             self._vol.append(vol)
             if (
                 "normal" in self.e_postproc
@@ -572,6 +626,13 @@ class TesFlexOptimization:
 
         # setup FEM
         ####################################################################################################
+        # [TI-TOOLBOX] the factorised FEM system only depends on mesh, ROI and
+        # conductivities; update_field() always receives the electrode
+        # explicitly, so a shared solver is safe to reuse
+        if shared is not None:
+            self._prepared = True
+            return
+
         # set dirichlet node to closest node of center of gravity of head model (indexing starting with 1)
         self.dirichlet_node = get_dirichlet_node_index_cog(
             mesh=self._mesh, roi=self._roi
@@ -593,6 +654,23 @@ class TesFlexOptimization:
         )
         self._prepared = True
 
+    # [TI-TOOLBOX] expensive, run-independent state built by _prepare()
+    def export_prepared_state(self):
+        """
+        Returns the head model, valid skin region, ROI and FEM state built by
+        _prepare() so that further runs with the same subject, ROI, skin-region
+        and conductivity settings can skip preparation by assigning it to their
+        ``prepared_state`` attribute before run().
+
+        Returns
+        -------
+        state : dict or None
+            Shared state, or None if this instance has not been prepared.
+        """
+        if not self._prepared:
+            return None
+        return {name: getattr(self, name) for name in _PREPARED_STATE_ATTRS}
+
     def _set_logger(self, fname_prefix="simnibs_optimization", summary=True):
         """
         Set-up logger to write to a file
@@ -1163,6 +1241,12 @@ class TesFlexOptimization:
             "optimized_positions": optimized_positions,
             "channel_array_indices": channel_array_indices,
         }
+        if self.optim_x is not None:
+            # optimizer parameters, used to warm-start related runs via seed_population
+            json_data["optim_x"] = self.optim_x.tolist()
+        if self.roi_mean_fields is not None:
+            # achieved fields, used to rank Pareto sweep points
+            json_data["roi_mean_fields"] = list(self.roi_mean_fields)
 
         positions_file = os.path.join(self.output_folder, "electrode_positions.json")
         with open(positions_file, "w") as f:
@@ -1598,6 +1682,11 @@ class TesFlexOptimization:
             result = differential_evolution(
                 self.goal_fun,
                 x0=self._optimizer_options_std["init_vals"],
+                init=(
+                    "latinhypercube"
+                    if self.seed_population is None
+                    else self._seeded_initial_population()
+                ),
                 strategy="best1bin",
                 recombination=self._optimizer_options_std["recombination"],
                 mutation=tuple(self._optimizer_options_std["mutation"]),
@@ -1621,6 +1710,7 @@ class TesFlexOptimization:
         logger.info(f"Global optimization finished! Best electrode position: {optim_x}")
         logger.log(26, f"Number of function evaluations (global optimization):   {self.n_test}")
         logger.log(26, f"Number of FEM evaluations (global optimization):        {self.n_sim}")
+        self._log_goal_cache_stats()
         logger.log(26, f"Goal function value (global optimization):              {self.optim_funvalue}")
         
         # run local optimization to polish results
@@ -1644,6 +1734,7 @@ class TesFlexOptimization:
                 self.optim_funvalue = result.fun
                 
         # transform optimal electrode pos from array to list of list
+        self.optim_x = np.asarray(optim_x, dtype=float)
         self.electrode_pos_opt = self.get_electrode_pos_from_array(optim_x)
         
         # internally update electrodes to correspond to optimal electrode pos
@@ -1654,6 +1745,7 @@ class TesFlexOptimization:
 
         logger.log(26, f"Total number of function evaluations:                   {self.n_test}")
         logger.log(26, f"Total number of FEM evaluations:                        {self.n_sim}")
+        self._log_goal_cache_stats()
         logger.log(26, f"Final goal function value:                              {self.optim_funvalue}")
         logger.log(26, f"Duration (setup and optimization):                      {time.time() - start}")
                     
@@ -1879,15 +1971,33 @@ class TesFlexOptimization:
         # transform electrode pos from array to list of list
         self.electrode_pos = self.get_electrode_pos_from_array(parameters)
 
-        # update field, returns list of list e[n_channel_stim][n_roi] (None if position is not applicable)
-        e = self.update_field(electrode_pos=self.electrode_pos, plot=False)
+        # [TI-TOOLBOX] assign skin nodes first; candidates that land on an
+        # already simulated node assignment reuse its goal value
+        node_idx_dict = self.get_nodes_electrode(electrode_pos=self.electrode_pos)
 
-        if e is None:
+        if type(node_idx_dict[0]) is str:
             # overlap --> skip further steps
+            logger.info(node_idx_dict[0])
             logger.info(f"Goal ({self.goal}): 2.0")
             logger.info("-" * len(parameters_str))
             return 2.0
 
+        cache_key = self._goal_cache_key() if self.cache_goal_evaluations else None
+        if cache_key is not None and cache_key in self._goal_cache:
+            goal_fun_value, tracked, roi_means = self._goal_cache[cache_key]
+            self._replay_tracking(tracked)
+            self._track_best(goal_fun_value, roi_means)
+            self.n_cache_hits += 1
+            logger.info(
+                f"Goal ({self.goal}): {goal_fun_value:.3f} (cached, n_sim: {self.n_sim}, n_test: {self.n_test})",
+            )
+            logger.info("-" * len(parameters_str))
+            return goal_fun_value
+
+        # solve fields, returns list of list e[n_channel_stim][n_roi]
+        logger.info("Electrode positions valid")
+        e = self._solve_fields(plot=False)
+
         self.n_sim += 1
 
         # post-process raw electric field (components Ex, Ey, Ez)
@@ -1912,11 +2022,25 @@ class TesFlexOptimization:
                     )
 
         # compute goal function value
+        n_tracked = self._tracking_lengths()
         if isinstance(self.goal[0], types.FunctionType):
             goal_fun_value = self.goal[0](e_pp)  # user provided goal function
         else:
             goal_fun_value = self.compute_goal(e_pp)
 
+        roi_means = [
+            float(np.mean([np.mean(_e[i_roi]) for _e in e_pp]))
+            for i_roi in range(self._n_roi)
+        ]
+        self._track_best(goal_fun_value, roi_means)
+
+        if cache_key is not None:
+            self._goal_cache[cache_key] = (
+                goal_fun_value,
+                self._tracked_since(n_tracked),
+                roi_means,
+            )
+
         logger.info(
             f"Goal ({self.goal}): {goal_fun_value:.3f} (n_sim: {self.n_sim}, n_test: {self.n_test})",
         )
@@ -1924,6 +2048,101 @@ class TesFlexOptimization:
 
         return goal_fun_value
 
+    # [TI-TOOLBOX] warm start
+    def _seeded_initial_population(self):
+        """
+        Initial differential evolution population containing the vectors of self.seed_population.
+
+        Returns
+        -------
+        population : np.ndarray of float [popsize * n_parameters, n_parameters]
+            Latin hypercube sample within the bounds whose leading members (after the first one, which scipy
+            replaces with x0) are the clipped seed vectors.
+        """
+        bounds = self._optimizer_options_std["bounds"]
+        lb = np.asarray(bounds.lb, dtype=float)
+        ub = np.asarray(bounds.ub, dtype=float)
+        n_dim = len(lb)
+        n_pop = max(5, int(self._optimizer_options_std["popsize"]) * n_dim)
+
+        sample = qmc.LatinHypercube(d=n_dim, seed=self.seed).random(n_pop)
+        population = lb + sample * (ub - lb)
+        seeds = [
+            np.clip(np.asarray(_x, dtype=float), lb, ub)
+            for _x in self.seed_population
+            if np.size(_x) == n_dim
+        ][: n_pop - 1]
+        if seeds:
+            population[1 : 1 + len(seeds)] = seeds
+        logger.info(f"Seeded {len(seeds)} of {n_pop} initial population members")
+        return population
+
+    # [TI-TOOLBOX] goal evaluation cache
+    def _goal_cache_key(self):
+        """
+        Key identifying the current electrode skin nodes and node currents of all stimulation channels.
+        Must be called after get_nodes_electrode() compiled the node arrays.
+
+        Returns
+        -------
+        key : bytes
+            Digest of node indices and currents of every channel.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for _electrode in self.electrode:
+            h.update(np.ascontiguousarray(_electrode._node_coords, dtype=float).tobytes())
+            # round currents so that floating point noise from the estimator does not defeat the cache
+            h.update(np.round(np.asarray(_electrode._node_current, dtype=float), 12).tobytes())
+            h.update(b"|")
+        return h.digest()
+
+    def _tracking_lengths(self):
+        """Current lengths of the goal/focality tracking lists (None if tracking is not set up)."""
+        if self.goal_fun_value is None:
+            return None
+        return [
+            [len(_l) for _l in _lists]
+            for _lists in (self.goal_fun_value, self.AUC, self.integral_focality)
+        ]
+
+    def _tracked_since(self, lengths):
+        """Tracking entries appended since _tracking_lengths() returned *lengths*."""
+        if lengths is None:
+            return None
+        return [
+            [_l[_n:] for _l, _n in zip(_lists, _lens)]
+            for _lists, _lens in zip(
+                (self.goal_fun_value, self.AUC, self.integral_focality), lengths
+            )
+        ]
+
+    def _replay_tracking(self, tracked):
+        """Append cached tracking entries so that the per-evaluation history stays complete."""
+        if tracked is None or self.goal_fun_value is None:
+            return
+        for _lists, _entries in zip(
+            (self.goal_fun_value, self.AUC, self.integral_focality), tracked
+        ):
+            for _l, _e in zip(_lists, _entries):
+                _l.extend(_e)
+
+    def _track_best(self, goal_fun_value, roi_means):
+        """Keep the ROI mean fields of the lowest goal value evaluated so far."""
+        if self._best_goal_value is None or goal_fun_value < self._best_goal_value:
+            self._best_goal_value = goal_fun_value
+            self.roi_mean_fields = roi_means
+
+    def _log_goal_cache_stats(self):
+        """Log how many goal evaluations were served from the evaluation cache."""
+        if not self.cache_goal_evaluations or not self.n_test:
+            return
+        logger.log(
+            26,
+            f"Number of cached goal evaluations:                      {self.n_cache_hits} "
+            f"({100.0 * self.n_cache_hits / self.n_test:.1f}% of evaluations, "
+            f"{len(self._goal_cache)} distinct electrode footprints)",
+        )
+
     def compute_goal(self, e):
         """
         Computes goal function value from postprocessed electric field
@@ -2712,8 +2931,24 @@ class TesFlexOptimization:
             logger.info(node_idx_dict[0])
             return None
 
-        # perform one electric field calculation for every stimulation condition (one at a time is on)
         logger.info("Electrode positions valid")
+        return self._solve_fields(plot=plot)
+
+    def _solve_fields(self, plot=False):
+        """
+        Calculate the E field for the electrode node assignment set by get_nodes_electrode().
+
+        Parameters
+        ----------
+        plot : bool, optional, default: False
+            Save data to plot e-field and electrode positions
+
+        Returns
+        -------
+        e : list of list of np.ndarray [n_channel_stim][n_roi]
+            Electric field for different stimulations in ROI(s).
+        """
+        # perform one electric field calculation for every stimulation condition (one at a time is on)
         e = [[] for _ in range(self.n_channel_stim)]
         for i_channel_stim in range(self.n_channel_stim):
             if plot:
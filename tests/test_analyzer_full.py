@@ -4,7 +4,7 @@ Tests for tit/analyzer/analyzer.py — Analyzer class methods.
 
 Covers: dispatch, sphere/cortex mesh/voxel, _analyze_mesh_roi,
 _analyze_voxel_roi, _load_surface_mesh,
-_get_normal_stats, _resolve_output_dir, _maybe_transform_coords,
+_get_normal_stats, _resolve_output_dir, _maybe_transform_coords, _cached,
 _field_values, _node_areas, _resolve_voxel_atlas.
 """
 
@@ -41,6 +41,17 @@ sys.modules.setdefault("matplotlib.patches", MagicMock())
 
 from tit.analyzer.analyzer import Analyzer, AnalysisResult  # noqa: E402
 
+
+@pytest.fixture(autouse=True)
+def _no_trace():
+    """Keep runs from writing trace files; tracing is covered in test_tracing.py."""
+    from tit.tracing import stop_trace
+
+    with patch("tit.analyzer.analyzer.start_trace"):
+        yield
+    stop_trace()
+
+
 # ---------------------------------------------------------------------------
 # Helper: build an Analyzer with everything mocked
 # ---------------------------------------------------------------------------
@@ -760,6 +771,11 @@ class TestCombinedCortexMesh:
 class TestMainRegionsKey:
     """__main__ reads 'regions' key for combined ROI."""
 
+    @pytest.fixture(autouse=True)
+    def _no_stage_cache(self):
+        with patch("tit.stage_cache.subject_stage_cache", return_value=None):
+            yield
+
     def test_run_single_uses_regions_list(self):
         from tit.analyzer.__main__ import _run_single
 
@@ -805,6 +821,45 @@ class TestMainRegionsKey:
             )
 
 
+class TestStageCacheResult:
+    """_cached records the full result, including NumPy scalars."""
+
+    def test_second_call_returns_recorded_result(self, tmp_path):
+        from tit.stage_cache import StageCache
+
+        a = _make_analyzer()
+        a.cache = StageCache(tmp_path / "manifest.json", root=tmp_path)
+        a._stage_files = lambda *args: []
+        out_dir = tmp_path / "analysis"
+        out_dir.mkdir()
+        (out_dir / "results.csv").write_text("roi_mean\n1.5\n")
+        calls = []
+
+        def compute():
+            calls.append(1)
+            a._last_output_dir = str(out_dir)
+            return AnalysisResult(
+                field_name="TI_max",
+                region_name="sphere",
+                space="mesh",
+                analysis_type="spherical",
+                roi_mean=np.float64(1.5),
+                roi_max=2.0,
+                roi_min=1.0,
+                roi_focality=1.2,
+                gm_mean=1.25,
+                gm_max=3.0,
+                n_elements=np.int64(5),
+            )
+
+        first = a._cached("spherical", {"radius": 5}, compute)
+        second = a._cached("spherical", {"radius": 5}, compute)
+
+        assert calls == [1]
+        assert second == first
+        assert type(second.n_elements) is int
+
+
 class TestVisualizeMesh:
     """Lines 648-658: _visualize_mesh calls save helpers."""
 
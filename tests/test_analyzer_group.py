@@ -248,6 +248,11 @@ class TestAddStdLines:
 class TestRunGroupAnalysis:
     """Integration: run_group_analysis orchestrates per-subject analysis."""
 
+    @pytest.fixture(autouse=True)
+    def _no_stage_cache(self):
+        with patch("tit.analyzer.group.subject_stage_cache", return_value=None):
+            yield
+
     @patch("tit.analyzer.group._generate_comparison_plot")
     @patch("tit.analyzer.group._build_summary_df")
     @patch("tit.analyzer.group.Analyzer")
@@ -27,6 +27,19 @@ from tit.analyzer.field_selector import select_field_file
 from tit.analyzer.group import GroupResult, _build_summary_df
 from tit.analyzer import visualizer
 
+
+@pytest.fixture(autouse=True)
+def _no_trace():
+    """Keep runs from writing trace files; tracing is covered in test_tracing.py."""
+    from tit.tracing import stop_trace
+
+    with (
+        patch("tit.analyzer.analyzer.start_trace"),
+        patch("tit.analyzer.group.start_trace"),
+    ):
+        yield
+    stop_trace()
+
 # ===========================================================================
 # Helpers
 # ===========================================================================
@@ -566,6 +579,11 @@ class TestBuildSummaryDf:
 class TestRunGroupAnalysis:
     """run_group_analysis end-to-end with mocked Analyzer."""
 
+    @pytest.fixture(autouse=True)
+    def _no_stage_cache(self):
+        with patch("tit.analyzer.group.subject_stage_cache", return_value=None):
+            yield
+
     @pytest.mark.unit
     @patch("tit.analyzer.group._generate_comparison_plot")
     @patch("tit.analyzer.group.Analyzer")
@@ -0,0 +1,170 @@
+"""
+Unit tests for tit/bench — synthetic benchmark inputs, timing and baselines.
+
+Covers:
+- Reproducibility and shapes of synthetic fields, meshes and volumes
+- Warm-up/repetition control and skipped benchmarks
+- Baseline round trip and regression detection
+- Benchmark selection and the ``python -m tit.bench`` entry point
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from tit.bench import __main__ as bench_main
+from tit.bench.kernels import KERNELS, select
+from tit.bench.runner import (
+    Benchmark,
+    BenchResult,
+    compare,
+    format_results,
+    load_baseline,
+    measure,
+    run_benchmarks,
+    save_results,
+)
+from tit.bench.synthetic import (
+    Scale,
+    field_set,
+    tet_mesh,
+    triangle_mesh,
+    volume_stack,
+)
+
+TINY = Scale("tiny", 500, 3, 4, (8, 10, 8), 6, 2)
+
+
+@pytest.mark.unit
+class TestSynthetic:
+    def test_field_set_is_reproducible(self):
+        a = field_set(100, 4, seed=3)
+        b = field_set(100, 4, seed=3)
+        assert len(a) == 4 and a[0].shape == (100, 3)
+        for x, y in zip(a, b):
+            np.testing.assert_array_equal(x, y)
+        assert not np.array_equal(a[0], field_set(100, 4, seed=4)[0])
+
+    def test_tet_mesh_fills_the_cube(self):
+        nodes, elements, volumes = tet_mesh(3)
+        assert nodes.shape == (64, 3)
+        assert elements.shape == (6 * 27, 4)
+        assert np.all(volumes > 0)
+        assert volumes.sum() == pytest.approx(27.0)
+
+    def test_triangle_mesh_areas(self):
+        nodes, triangles, areas = triangle_mesh(4)
+        assert triangles.shape == (32, 3) and triangles.max() < len(nodes)
+        assert np.all(areas >= 0.5)
+
+    def test_volume_stack_is_masked(self):
+        data, affine = volume_stack((8, 10, 8), 5, effect=1.0)
+        assert data.shape == (8, 10, 8, 5) and data.dtype == np.float32
+        assert data[0, 0, 0].max() == 0 and data[4, 5, 4].min() > 0
+        assert affine.shape == (4, 4)
+
+
+@pytest.mark.unit
+class TestMeasure:
+    def test_warmup_and_repeat_counts(self):
+        calls = []
+        times, peak_mb = measure(lambda: calls.append(1), warmup=2, repeat=3)
+        assert len(times) == 3
+        assert len(calls) == 2 + 3 + 1  # plus the traced run
+        assert peak_mb >= 0
+
+    def test_peak_memory_tracks_numpy_buffers(self):
+        _, peak_mb = measure(lambda: np.ones(4 * 1024 * 1024), warmup=0, repeat=1)
+        assert peak_mb == pytest.approx(32, rel=0.1)
+
+    def test_import_error_skips_benchmark(self):
+        def setup(scale):
+            raise ModuleNotFoundError("no", name="nibabel")
+
+        ok = Benchmark("ok", lambda scale: ((lambda: None), scale.n_elements))
+        results = run_benchmarks(
+            [Benchmark("needs_nib", setup), ok], [TINY], warmup=0, repeat=2
+        )
+        assert results[0].skipped == "missing dependency: nibabel"
+        assert results[1].key == "ok[tiny]" and len(results[1].times_s) == 2
+        assert results[1].n_items == 500
+
+    def test_numpy_kernels_run(self):
+        results = run_benchmarks(
+            select(KERNELS, ["calc.get_TI*", "fields"]), [TINY], warmup=0, repeat=1
+        )
+        assert {r.name for r in results} == {
+            "calc.get_TI_vectors",
+            "fields.hf_peak",
+            "fields.hf_peak_4pair",
+            "fields.hf_sar",
+        }
+        assert all(r.skipped is None and r.throughput > 0 for r in results)
+
+
+def _result(name, median, peak=10.0):
+    return BenchResult(name, "small", "elements", 1000, [median], peak)
+
+
+@pytest.mark.unit
+class TestBaseline:
+    def test_round_trip(self, tmp_path):
+        path = save_results([_result("a", 0.5)], tmp_path / "out" / "base.json")
+        baseline = load_baseline(path)
+        assert baseline["a[small]"]["median_s"] == 0.5
+        assert baseline["a[small]"]["throughput"] == 2000
+
+    def test_rejects_other_json(self, tmp_path):
+        path = tmp_path / "other.json"
+        path.write_text(json.dumps({"results": {}}))
+        with pytest.raises(ValueError):
+            load_baseline(path)
+
+    def test_regressions_beyond_threshold(self, tmp_path):
+        baseline = load_baseline(
+            save_results(
+                [_result("fast", 1.0), _result("same", 1.0), _result("mem", 1.0)],
+                tmp_path / "base.json",
+            )
+        )
+        current = [
+            _result("fast", 1.3),
+            _result("same", 1.1),
+            _result("mem", 1.0, peak=50.0),
+            _result("new", 1.0),
+        ]
+        by_key = {c.key: c for c in compare(current, baseline, threshold=0.2)}
+        assert set(by_key) == {"fast[small]", "same[small]", "mem[small]"}
+        assert by_key["fast[small]"].slower and by_key["fast[small]"].regressed
+        assert not by_key["same[small]"].regressed
+        assert by_key["mem[small]"].larger and not by_key["mem[small]"].slower
+        table = format_results(current, by_key.values())
+        assert "SLOWER" in table and "MEMORY" in table
+
+
+@pytest.mark.unit
+class TestCli:
+    def test_select_by_prefix_and_glob(self):
+        names = [b.name for b in select(KERNELS, ["stats", "*hf_sar"])]
+        assert names == [
+            "fields.hf_sar",
+            "stats.ttest_voxelwise",
+            "stats.correlation_voxelwise",
+            "stats.permutation",
+        ]
+        assert select(KERNELS, None) == KERNELS
+
+    def test_save_then_compare(self, tmp_path, capsys, monkeypatch):
+        monkeypatch.setitem(bench_main.SCALES, "small", TINY)
+        path = tmp_path / "base.json"
+        args = ["-k", "fields.hf_sar", "--repeat", "1", "--warmup", "0"]
+        assert bench_main.main(args + ["--save", str(path)]) == 0
+        assert "fields.hf_sar[tiny]" in load_baseline(path)
+
+        assert "fields.hf_sar[tiny]" in capsys.readouterr().out
+
+        compare_args = ["--baseline", str(path), "--threshold", "1000"]
+        assert bench_main.main(args + compare_args) == 0
+        line = capsys.readouterr().out.splitlines()[1]
+        assert line.startswith("fields.hf_sar[tiny]") and " x" in line
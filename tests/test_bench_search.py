@@ -0,0 +1,145 @@
+"""
+Unit tests for tit/bench/search.py — exhaustive-search benchmark harness.
+
+Covers:
+- Synthetic head elements and electrode positions
+- The synthetic leadfield store and ROI CSV
+- Case validation
+- Driving the two-pair engine end to end, with the candidate cap
+"""
+
+import json
+import signal
+import sys
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from tit.bench import search
+from tit.bench.search import (
+    SearchCase,
+    format_result,
+    run_search_case,
+    write_leadfield_store,
+)
+from tit.bench.synthetic import (
+    CSF_TAG,
+    GM_TAG,
+    HEAD_RADII,
+    WM_TAG,
+    electrode_positions,
+    head_elements,
+)
+
+for mod_name in ("simnibs.utils.TI_utils",):
+    if mod_name not in sys.modules:
+        sys.modules[mod_name] = MagicMock()
+
+SMALL = dict(n_elements=3000, n_electrodes=12, bucket_size=2, roi_radius=20.0)
+
+
+@pytest.mark.unit
+class TestSyntheticHead:
+    def test_tags_follow_radius(self):
+        tags, baricenters, volumes = head_elements(5000, seed=1)
+        radius = np.linalg.norm(baricenters, axis=1)
+        assert radius.max() < HEAD_RADII[-1]
+        assert np.all(radius[tags == WM_TAG] < HEAD_RADII[0])
+        gm = radius[tags == GM_TAG]
+        assert gm.min() >= HEAD_RADII[0] and gm.max() < HEAD_RADII[1]
+        assert np.all(radius[tags == CSF_TAG] >= HEAD_RADII[1])
+        assert np.all(volumes > 0)
+
+    def test_electrodes_on_upper_scalp(self):
+        positions = electrode_positions(32, radius=90.0)
+        np.testing.assert_allclose(np.linalg.norm(positions, axis=1), 90.0)
+        assert np.all(positions[:, 2] > 0)
+        assert np.all(np.diff(positions[:, 2]) < 0)
+
+
+@pytest.mark.unit
+class TestLeadfieldStore:
+    def test_store_is_readable(self, tmp_path):
+        from tit.opt.leadfield_store import LeadfieldStore
+
+        case = SearchCase(**SMALL)
+        synthetic = write_leadfield_store(case, tmp_path)
+        store = LeadfieldStore(synthetic["store"])
+        assert store.idx_lf["E000"] is None
+        assert set(store.idx_lf) == {"E000", *synthetic["electrodes"]}
+        assert len(synthetic["electrodes"]) == case.n_electrodes - 1
+        assert synthetic["leadfield_mb"] == pytest.approx(3000 * 11 * 3 * 4 / 2**20)
+        center = np.loadtxt(synthetic["roi_csv"], delimiter=",")
+        assert HEAD_RADII[0] < np.linalg.norm(center) < HEAD_RADII[1]
+
+
+@pytest.mark.unit
+class TestSearchCase:
+    def test_rejects_unknown_engine_and_mode(self):
+        with pytest.raises(ValueError, match="engine"):
+            SearchCase(engine="tes")
+        with pytest.raises(ValueError, match="mode"):
+            SearchCase(mode="grid")
+
+    def test_rejects_too_few_electrodes(self):
+        with pytest.raises(ValueError, match="needs 16 electrodes"):
+            SearchCase(engine="mex", n_electrodes=16, bucket_size=2)
+        assert SearchCase(engine="mex", n_electrodes=17, bucket_size=2)
+
+
+def _get_field(pair, leadfield, idx_lf):
+    plus, minus, current = pair
+    field = np.zeros(leadfield.shape[1:])
+    if idx_lf[plus] is not None:
+        field = field + leadfield[idx_lf[plus]]
+    if idx_lf[minus] is not None:
+        field = field - leadfield[idx_lf[minus]]
+    return field * current
+
+
+def _get_max_ti(e1, e2):
+    return np.minimum(np.linalg.norm(e1, axis=1), np.linalg.norm(e2, axis=1))
+
+
+@pytest.fixture
+def scored(monkeypatch):
+    """Score two-pair candidates with small NumPy stand-ins for TI_utils."""
+    from tit.opt.ex import engine as engine_mod
+
+    monkeypatch.setattr(engine_mod.TI, "get_field", _get_field, raising=False)
+    monkeypatch.setattr(engine_mod.TI, "get_maxTI", _get_max_ti, raising=False)
+
+
+@pytest.mark.unit
+class TestRunSearchCase:
+    def test_runs_two_pair_bucket_search(self, scored, tmp_path):
+        case = SearchCase(max_candidates=0, **SMALL)
+        result = run_search_case(case, workdir=tmp_path)
+        # 2**4 montages, 3 current splits of 2 mA in 0.5 mA steps.
+        assert result.candidates == 48 and result.reported > 0
+        assert result.first_result_s is not None and result.run_s > 0
+        assert result.n_roi > 0 and result.n_gm > result.n_roi
+        assert result.top["montage"].startswith("TI_field_")
+        assert format_result(result).startswith("ex.bucket[3000 el]")
+
+    def test_stops_at_max_candidates(self, scored, tmp_path):
+        before = signal.getsignal(signal.SIGINT)
+        result = run_search_case(SearchCase(max_candidates=5, **SMALL), tmp_path)
+        assert result.candidates == 5
+        assert signal.getsignal(signal.SIGINT) is before
+
+    def test_missing_engine_is_skipped(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "tit.opt.ex.engine", None)
+        result = run_search_case(SearchCase(**SMALL))
+        assert result.skipped == "missing dependency: tit.opt.ex.engine"
+        assert "skipped" in format_result(result)
+
+    def test_json_output(self, scored, tmp_path, capsys):
+        out = tmp_path / "search.json"
+        argv = ["--elements", "3000", "--electrodes", "12", "--bucket-size", "2"]
+        argv += ["--roi-radius", "20", "--max-candidates", "3", "--in-process"]
+        assert search.main(argv + ["--json", str(out)]) == 0
+        assert capsys.readouterr().out.startswith("ex.bucket[3000 el]")
+        (entry,) = json.loads(out.read_text())
+        assert entry["candidates"] == 3 and entry["candidates_per_s"] > 0
@@ -3,7 +3,7 @@
 Covers:
 - Binary STL write/read round-trip
 - PLY writing (with colors and with scalars)
-- simple_colormap and field_to_colormap
+- simple_colormap, piecewise_colormap and field_to_colormap
 - deduplicate_vertices
 """
 
@@ -15,6 +15,7 @@ import pytest
 from tit.blender.io import (
     deduplicate_vertices,
     field_to_colormap,
+    piecewise_colormap,
     read_binary_stl,
     simple_colormap,
     write_binary_stl,
@@ -310,6 +311,35 @@ class TestSimpleColormap:
         assert np.all(np.diff(red_channel) >= 0)
 
 
+class TestPiecewiseColormap:
+    """Tests for piecewise_colormap()."""
+
+    RGB = [[0, 0, 255], [0, 255, 0], [255, 0, 0]]
+
+    def test_breakpoints_hit_exact_colors(self):
+        colors = piecewise_colormap([0.0, 1.0, 2.0], [0.0, 1.0, 2.0], self.RGB)
+        np.testing.assert_array_equal(colors, self.RGB)
+
+    def test_midpoint_interpolates(self):
+        colors = piecewise_colormap([0.5], [0.0, 1.0, 2.0], self.RGB)
+        np.testing.assert_array_equal(colors, [[0, 127, 127]])
+
+    def test_clamped_outside_range(self):
+        colors = piecewise_colormap([-5.0, 9.0], [0.0, 1.0, 2.0], self.RGB)
+        np.testing.assert_array_equal(colors, [self.RGB[0], self.RGB[2]])
+
+    def test_coincident_breakpoints(self):
+        colors = piecewise_colormap([1.0, 1.5, 3.0], [1.0, 2.0, 2.0], self.RGB)
+        np.testing.assert_array_equal(
+            colors, [self.RGB[0], [0, 127, 127], self.RGB[2]]
+        )
+
+    def test_channel_count_follows_colors(self):
+        colors = piecewise_colormap([0.5], [0.0, 1.0], [[0, 0, 0, 255]] * 2)
+        assert colors.shape == (1, 4)
+        assert colors.dtype == np.uint8
+
+
 class TestFieldToColormap:
     """field_to_colormap with matplotlib (mocked) or fallback."""
 
@@ -0,0 +1,203 @@
+"""Unit tests for tit/blender/utils.py -- ROI surface extraction.
+
+Covers:
+- extract_roi_region_no_zeros (2-of-3 vertex rule, remapping, min_triangles)
+- partition_roi_regions (one-pass equivalent of per-region extraction)
+- create_roi_mesh (whole-surface ROI mesh written from arrays)
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from tit.blender.utils import (
+    create_roi_mesh,
+    extract_roi_region_no_zeros,
+    partition_roi_regions,
+)
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def grid_surface():
+    """A 6x6 node grid triangulated into 50 triangles (SimNIBS layout)."""
+    n = 6
+    xs, ys = np.meshgrid(np.arange(n, dtype=float), np.arange(n, dtype=float))
+    nodes = np.column_stack([xs.ravel(), ys.ravel(), np.zeros(n * n)])
+    tris = []
+    for r in range(n - 1):
+        for c in range(n - 1):
+            a, b = r * n + c, r * n + c + 1
+            tris += [[a, b, a + n], [b, b + n, a + n]]
+    tris = np.array(tris) + 1
+    # SimNIBS pads triangles to 4 columns with -1.
+    node_number_list = np.column_stack([tris, np.full(len(tris), -1)])
+    return SimpleNamespace(
+        nodes=SimpleNamespace(node_coord=nodes),
+        elm=SimpleNamespace(
+            node_number_list=node_number_list,
+            elm_type=np.full(len(tris), 2),
+        ),
+    )
+
+
+def _reference(mesh, roi_values, min_triangles=10):
+    """Loop-based reference implementation of the 2-of-3 extraction."""
+    tris = mesh.elm.node_number_list[:, :3] - 1
+    roi = set(np.flatnonzero(roi_values > 0))
+    keep = [t for t in tris if sum(int(i) in roi for i in t) >= 2]
+    if not roi or len(keep) < min_triangles:
+        return None, None, None
+    used = sorted({int(i) for t in keep for i in t})
+    remap = {old: new for new, old in enumerate(used)}
+    faces = np.array([[remap[int(i)] for i in t] for t in keep])
+    return mesh.nodes.node_coord[used], faces, roi_values[used]
+
+
+# ---------------------------------------------------------------------------
+# extract_roi_region_no_zeros
+# ---------------------------------------------------------------------------
+
+
+class TestExtractRoiRegion:
+    def test_matches_reference(self, grid_surface):
+        values = np.random.default_rng(1).uniform(-1, 1, 36)
+        got = extract_roi_region_no_zeros(
+            grid_surface, values, min_triangles=1, return_field_values=True
+        )
+        expected = _reference(grid_surface, values, min_triangles=1)
+        for g, e in zip(got, expected):
+            np.testing.assert_array_equal(g, e)
+
+    def test_faces_index_returned_vertices(self, grid_surface):
+        values = np.ones(36)
+        vertices, faces = extract_roi_region_no_zeros(grid_surface, values)
+        assert faces.shape == (50, 3)
+        assert len(vertices) == 36
+        assert faces.max() == len(vertices) - 1
+
+    def test_too_few_triangles(self, grid_surface):
+        values = np.zeros(36)
+        values[[0, 1, 6]] = 1.0
+        assert extract_roi_region_no_zeros(grid_surface, values) == (None, None)
+
+    def test_all_zero(self, grid_surface):
+        result = extract_roi_region_no_zeros(
+            grid_surface, np.zeros(36), return_field_values=True
+        )
+        assert result == (None, None, None)
+
+
+# ---------------------------------------------------------------------------
+# partition_roi_regions
+# ---------------------------------------------------------------------------
+
+
+class TestPartitionRoiRegions:
+    def _regions(self):
+        x = np.arange(36) % 6
+        return {"left": x < 3, "right": x >= 3}
+
+    def _per_region(self, mesh, regions, field, min_triangles):
+        return {
+            name: extract_roi_region_no_zeros(
+                mesh,
+                np.where(mask, field, 0),
+                min_triangles=min_triangles,
+                return_field_values=True,
+            )
+            for name, mask in regions.items()
+        }
+
+    @pytest.mark.parametrize("min_triangles", [1, 10])
+    def test_matches_per_region_extraction(self, grid_surface, min_triangles):
+        field = np.random.default_rng(2).uniform(-0.2, 1.0, 36)
+        regions = self._regions()
+
+        got = partition_roi_regions(grid_surface, regions, field, min_triangles)
+        expected = self._per_region(grid_surface, regions, field, min_triangles)
+
+        assert got.keys() == expected.keys()
+        for name in regions:
+            for g, e in zip(got[name], expected[name]):
+                if e is None:
+                    assert g is None
+                else:
+                    np.testing.assert_array_equal(g, e)
+
+    def test_overlapping_regions_fall_back(self, grid_surface):
+        field = np.ones(36)
+        regions = {"all": np.ones(36, dtype=bool), "left": self._regions()["left"]}
+
+        got = partition_roi_regions(grid_surface, regions, field)
+
+        assert len(got["all"][1]) == 50
+        assert len(got["left"][1]) == 25
+
+
+# ---------------------------------------------------------------------------
+# In-memory ROI meshes
+# ---------------------------------------------------------------------------
+
+
+class _FakeMsh:
+    def __init__(self, nodes, elements):
+        self.nodes = nodes
+        self.elm = elements
+        self.field = {}
+        self.written = []
+
+    def add_node_field(self, values, name):
+        self.field[name] = SimpleNamespace(value=values)
+
+    def write(self, path):
+        self.written.append(path)
+
+
+@pytest.fixture()
+def fake_mesh_io(monkeypatch):
+    import sys
+
+    fake = SimpleNamespace(
+        Msh=_FakeMsh,
+        Nodes=lambda coords: SimpleNamespace(node_coord=coords),
+        Elements=lambda triangles: SimpleNamespace(node_number_list=triangles),
+    )
+    monkeypatch.setattr(sys.modules["simnibs.mesh_tools"], "mesh_io", fake)
+    return fake
+
+
+class TestCreateRoiMesh:
+    def test_writes_whole_surface_with_roi_field(
+        self, grid_surface, fake_mesh_io, tmp_path, monkeypatch
+    ):
+        built = []
+
+        class RecordingMsh(_FakeMsh):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                built.append(self)
+
+        monkeypatch.setattr(fake_mesh_io, "Msh", RecordingMsh)
+        grid_surface.elm.tag1 = np.full(50, 1002)
+        field = np.linspace(0.1, 1.0, 36)
+        mask = np.arange(36) % 6 < 3
+
+        path = create_roi_mesh(
+            grid_surface, mask, field, "TI_max", "left", str(tmp_path)
+        )
+
+        assert path == str(tmp_path / "left_roi.msh")
+        assert (tmp_path / "left_roi.msh.opt").exists()
+        (roi,) = built
+        assert roi.written == [path]
+        assert len(roi.nodes.node_coord) == 36
+        assert len(roi.elm.node_number_list) == 50
+        assert np.all(roi.elm.tag1 == 1002)
+        values = roi.field["TI_max"].value
+        assert np.array_equal(values[mask], field[mask])
+        assert np.all(values[~mask] == 0)
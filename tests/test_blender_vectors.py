@@ -0,0 +1,221 @@
+"""Unit tests for tit/blender/vector_field_exporter.py -- arrow PLY export.
+
+Covers:
+- Arrow template geometry (closed, outward-facing)
+- Binary PLY header and body layout
+- Arrow placement, orientation and length per anchor mode
+"""
+
+import numpy as np
+import pytest
+
+from tit.blender.vector_field_exporter import _arrow_template, write_ply_arrows
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _read_ply(path):
+    """Parse the binary PLY written by write_ply_arrows."""
+    data = path.read_bytes()
+    end = data.index(b"end_header\n") + len(b"end_header\n")
+    header = data[:end].decode("ascii").splitlines()
+    n_v = int(next(l for l in header if l.startswith("element vertex")).split()[-1])
+    n_f = int(next(l for l in header if l.startswith("element face")).split()[-1])
+    vdt = np.dtype([("xyz", "<f4", (3,)), ("rgba", "u1", (4,))])
+    fdt = np.dtype([("n", "u1"), ("idx", "<i4", (3,))])
+    verts = np.frombuffer(data, vdt, count=n_v, offset=end)
+    faces = np.frombuffer(data, fdt, count=n_f, offset=end + n_v * vdt.itemsize)
+    assert end + n_v * vdt.itemsize + n_f * fdt.itemsize == len(data)
+    return header, verts, faces
+
+
+# ---------------------------------------------------------------------------
+# Template
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestArrowTemplate:
+    def test_closed_surface(self):
+        _, faces = _arrow_template(0.1)
+        edges = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+        edges = np.sort(edges, axis=1)
+        _, counts = np.unique(edges, axis=0, return_counts=True)
+        assert np.all(counts == 2)
+
+    def test_outward_normals(self):
+        vertices, faces = _arrow_template(0.1)
+        tri = vertices[faces]
+        normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        # Divergence theorem: positive signed volume means outward faces.
+        volume = np.einsum("ij,ij->i", tri[:, 0], normals).sum() / 6.0
+        assert volume > 0
+
+    def test_unit_length(self):
+        vertices, _ = _arrow_template(0.1)
+        assert vertices[:, 2].min() == pytest.approx(-0.4)
+        assert vertices[:, 2].max() == pytest.approx(0.6)
+
+
+# ---------------------------------------------------------------------------
+# write_ply_arrows
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestWritePlyArrows:
+    def test_binary_header_and_counts(self, tmp_path):
+        out = tmp_path / "arrows.ply"
+        write_ply_arrows(
+            out,
+            np.zeros((3, 3)),
+            np.eye(3),
+            np.ones(3),
+            np.tile([255, 0, 0, 255], (3, 1)),
+        )
+        header, verts, faces = _read_ply(out)
+        n_v, n_f = (len(a) for a in _arrow_template(0.05))
+
+        assert header[1] == "format binary_little_endian 1.0"
+        assert len(verts) == 3 * n_v
+        assert len(faces) == 3 * n_f
+        assert np.all(faces["n"] == 3)
+        assert faces["idx"].max() == len(verts) - 1
+        assert np.all(verts["rgba"] == [255, 0, 0, 255])
+
+    def test_empty_writes_nothing(self, tmp_path):
+        out = tmp_path / "arrows.ply"
+        write_ply_arrows(out, [], [], [], [])
+        assert not out.exists()
+
+    @pytest.mark.parametrize("direction", [[1.0, 0, 0], [0, -1.0, 0], [0, 0, 1.0]])
+    def test_tail_anchor_points_along_vector(self, tmp_path, direction):
+        out = tmp_path / "arrows.ply"
+        position = np.array([5.0, -2.0, 1.0])
+        d = np.array(direction)
+        write_ply_arrows(
+            out,
+            position[None],
+            (3.0 * d)[None],
+            [3.0],
+            [[0, 0, 0, 255]],
+            length_scale=2.0,
+            vector_scale=0.5,
+        )
+        _, verts, _ = _read_ply(out)
+        along = (verts["xyz"] - position) @ d
+
+        assert along.min() == pytest.approx(0.0, abs=1e-5)
+        assert along.max() == pytest.approx(3.0 * 2.0 * 0.5, rel=1e-5)
+
+    def test_head_anchor_ends_at_position(self, tmp_path):
+        out = tmp_path / "arrows.ply"
+        write_ply_arrows(
+            out,
+            [[0.0, 0.0, 0.0]],
+            [[0.0, 1.0, 0.0]],
+            [2.0],
+            [[0, 0, 0, 255]],
+            anchor="head",
+            vector_scale=1.0,
+        )
+        _, verts, _ = _read_ply(out)
+
+        assert verts["xyz"][:, 1].max() == pytest.approx(0.0, abs=1e-6)
+        assert verts["xyz"][:, 1].min() == pytest.approx(-2.0, rel=1e-5)
+
+
+# ---------------------------------------------------------------------------
+# Colour scale and interpolation
+# ---------------------------------------------------------------------------
+
+
+def _magscale_reference(mag, b, g, r):
+    """Per-element reference implementation of the blue-green-red scale."""
+    if mag <= b:
+        return [0, 0, 255, 255]
+    if mag <= g:
+        t = (mag - b) / (g - b)
+        return [0, int(255 * t), int(255 * (1.0 - t)), 255]
+    if mag <= r:
+        t = (mag - g) / (r - g)
+        return [int(255 * t), int(255 * (1.0 - t)), 0, 255]
+    return [255, 0, 0, 255]
+
+
+@pytest.mark.unit
+class TestMagscaleColors:
+    def test_matches_reference(self):
+        from tit.blender.vector_field_exporter import (
+            _map_magnitude_to_colors_magscale,
+        )
+
+        full = np.linspace(0.0, 10.0, 101)
+        mags = np.random.default_rng(0).uniform(-1.0, 11.0, 500)
+        colors = _map_magnitude_to_colors_magscale(
+            mags, all_magnitudes_full=full, blue_pct=20, green_pct=50, red_pct=90
+        )
+        expected = np.array([_magscale_reference(m, 2.0, 5.0, 9.0) for m in mags])
+
+        assert colors.dtype == np.uint8
+        assert np.abs(colors.astype(int) - expected).max() <= 1
+
+
+class _BruteTree:
+    built = 0
+
+    def __init__(self, points):
+        type(self).built += 1
+        self.points = np.asarray(points)
+
+    def query(self, x):
+        d = np.linalg.norm(self.points[None] - np.asarray(x)[:, None], axis=2)
+        return d.min(axis=1), d.argmin(axis=1)
+
+
+def _carrier_mesh(nodes, elements, field):
+    from types import SimpleNamespace
+
+    def elm2node_matrix():
+        # Dense stand-in: each node averages its adjacent elements.
+        M = np.zeros((len(nodes), len(elements)))
+        for e, elm in enumerate(elements):
+            M[elm - 1, e] = 1.0
+        return M / M.sum(axis=1, keepdims=True)
+
+    return SimpleNamespace(
+        nodes=SimpleNamespace(node_coord=nodes),
+        elm=SimpleNamespace(node_number_list=elements),
+        field={"E": SimpleNamespace(value=field)},
+        elm2node_matrix=elm2node_matrix,
+    )
+
+
+@pytest.mark.unit
+class TestFieldInterpolation:
+    def test_reuses_interpolator_across_carrier_meshes(self, monkeypatch):
+        import sys
+        from types import SimpleNamespace
+
+        from tit.blender import vector_field_exporter as vfe
+
+        monkeypatch.setattr(sys.modules["scipy.spatial"], "cKDTree", _BruteTree)
+        monkeypatch.setattr(vfe, "get_TI_vectors", lambda a, b: a + b)
+        _BruteTree.built = 0
+
+        nodes = np.array([[0.0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 1]])
+        elements = np.array([[1, 2, 3, 4], [2, 3, 4, 5]])
+        m1 = _carrier_mesh(nodes, elements, np.array([[1.0, 0, 0], [3.0, 0, 0]]))
+        m2 = _carrier_mesh(
+            nodes.copy(), elements.copy(), np.array([[0.0, 2, 0], [0.0, 4, 0]])
+        )
+        config = SimpleNamespace(is_mti=False, export_sum=False)
+        targets = np.array([[0.0, 0, 0.1], [1, 1, 0.9]])
+
+        fields = vfe._compute_fields(config, m1, m2, None, None, targets)
+
+        assert _BruteTree.built == 1
+        np.testing.assert_allclose(fields["E1"][:, 0], [1.0, 3.0])
+        np.testing.assert_allclose(fields["E2"][:, 1], [2.0, 4.0])
@@ -20,6 +20,7 @@ if str(project_root) not in sys.path:
 from tit.opt.ex.logic import (
     _electrode_combinations,
     count_combinations,
+    generate_canonical_montages,
     generate_current_ratios,
     generate_montage_combinations,
 )
@@ -249,6 +250,95 @@ class TestCountCombinations:
         assert count == 0
 
 
+# ===========================================================================
+# generate_canonical_montages
+# ===========================================================================
+
+
+def _expand(classes):
+    return [member for _, members in classes for member in members]
+
+
+@pytest.mark.unit
+class TestCanonicalMontages:
+    """Tests for generate_canonical_montages()."""
+
+    POOL = ["A", "B", "C", "D", "E", "F"]
+    RATIOS = [(1.5, 0.5), (1.0, 1.0), (0.5, 1.5)]
+
+    def test_pool_mode_reduces_eightfold(self):
+        full = list(
+            generate_montage_combinations(
+                self.POOL, [], [], [], self.RATIOS, all_combinations=True
+            )
+        )
+        classes = list(
+            generate_canonical_montages(
+                self.POOL, [], [], [], self.RATIOS, all_combinations=True
+            )
+        )
+
+        assert len(full) == 8 * len(classes)
+        assert all(len(members) == 8 for _, members in classes)
+        assert sorted(_expand(classes)) == sorted(full)
+
+    def test_representative_is_first_member(self):
+        classes = generate_canonical_montages(
+            self.POOL, [], [], [], self.RATIOS, all_combinations=True
+        )
+        rep, members = next(iter(classes))
+
+        assert rep == ("A", "B", "C", "D", (1.5, 0.5))
+        assert members[0] == rep
+        assert ("D", "C", "B", "A", (0.5, 1.5)) in members
+        assert ("B", "A", "C", "D", (1.5, 0.5)) in members
+
+    def test_bucket_mode_only_uses_enumerated_images(self):
+        buckets = (["A", "B"], ["A", "B", "C"], ["D"], ["E"])
+        full = list(generate_montage_combinations(*buckets, self.RATIOS, False))
+        classes = list(generate_canonical_montages(*buckets, self.RATIOS, False))
+
+        assert len(_expand(classes)) == len(full)
+        assert sorted(_expand(classes)) == sorted(full)
+        # ("A", "B") and ("B", "A") share a class; "C" cannot lead channel 1.
+        assert ("B", "A", "D", "E", (1.5, 0.5)) in dict(classes)[
+            ("A", "B", "D", "E", (1.5, 0.5))
+        ]
+        assert dict(classes)[("A", "C", "D", "E", (1.5, 0.5))] == [
+            ("A", "C", "D", "E", (1.5, 0.5))
+        ]
+
+    def test_disjoint_buckets_are_not_merged(self):
+        buckets = (["A"], ["B"], ["C"], ["D"])
+        classes = list(generate_canonical_montages(*buckets, self.RATIOS, False))
+        assert [members for _, members in classes] == [
+            [("A", "B", "C", "D", ratio)] for ratio in self.RATIOS
+        ]
+
+    def test_mirror_map_merges_reflections(self):
+        mirror = {"A": "B", "B": "A", "C": "D", "D": "C", "E": "E", "F": "F"}
+        full = list(
+            generate_montage_combinations(self.POOL, [], [], [], self.RATIOS, True)
+        )
+        plain = len(
+            list(generate_canonical_montages(self.POOL, [], [], [], self.RATIOS, True))
+        )
+        mirrored = list(
+            generate_canonical_montages(
+                self.POOL, [], [], [], self.RATIOS, True, mirror_map=mirror
+            )
+        )
+
+        assert len(mirrored) < plain
+        assert sorted(_expand(mirrored)) == sorted(full)
+
+    def test_class_count(self):
+        classes = generate_canonical_montages(
+            self.POOL, [], [], [], self.RATIOS, True
+        )
+        assert len(list(classes)) == len(self.POOL) * 5 * 4 * 3 * len(self.RATIOS) // 8
+
+
 # ===========================================================================
 # build_csv_rows
 # ===========================================================================
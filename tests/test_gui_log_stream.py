@@ -0,0 +1,125 @@
+"""
+Unit tests for tit/gui/components/log_stream.py — batched process output.
+
+The module is Qt-free, so it is loaded straight from its file: importing it
+through ``tit.gui.components`` would pull in PyQt5, which is unavailable
+outside the Docker image.
+
+Covers:
+- Block reading and incremental decoding of a pipe
+- Line splitting across blocks, including carriage-return redraws
+- Time- and size-bounded batching
+- Asynchronous log writing
+"""
+
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+_LOG_STREAM = (
+    Path(__file__).resolve().parent.parent
+    / "tit"
+    / "gui"
+    / "components"
+    / "log_stream.py"
+)
+
+
+def _load_log_stream():
+    spec = importlib.util.spec_from_file_location("_tit_log_stream", _LOG_STREAM)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+log_stream = _load_log_stream()
+
+
+def _drain(reader):
+    chunks = []
+    while (chunk := reader.queue.get(timeout=5)) is not None:
+        chunks.append(chunk)
+    return "".join(chunks)
+
+
+@pytest.mark.unit
+class TestBlockReader:
+    def test_reads_pipe_until_eof(self):
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd, "rb", buffering=0) as stream:
+            reader = log_stream.BlockReader(stream, block_size=4).start()
+            os.write(write_fd, "line 1\nline 2\n".encode())
+            os.close(write_fd)
+            assert _drain(reader) == "line 1\nline 2\n"
+
+    def test_multibyte_character_split_across_blocks(self):
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd, "rb", buffering=0) as stream:
+            reader = log_stream.BlockReader(stream, block_size=1).start()
+            os.write(write_fd, "✓ done\n".encode())
+            os.close(write_fd)
+            assert _drain(reader) == "✓ done\n"
+
+
+@pytest.mark.unit
+class TestLineSplitter:
+    def test_holds_partial_line_until_completed(self):
+        splitter = log_stream.LineSplitter()
+        assert splitter.feed("first\nsec") == ["first"]
+        assert splitter.feed("ond\n") == ["second"]
+        assert splitter.flush() == []
+
+    def test_carriage_return_ends_a_line(self):
+        splitter = log_stream.LineSplitter()
+        assert splitter.feed("10%\r20%\r") == ["10%", "20%"]
+        assert splitter.feed("done\r\n") == ["done"]
+
+    def test_flush_returns_unterminated_tail(self):
+        splitter = log_stream.LineSplitter()
+        splitter.feed("no newline")
+        assert splitter.flush() == ["no newline"]
+
+
+@pytest.mark.unit
+class TestOutputBatcher:
+    def test_batch_due_after_interval(self):
+        now = [0.0]
+        batcher = log_stream.OutputBatcher(interval=0.1, clock=lambda: now[0])
+        assert batcher.time_left() is None and not batcher.due()
+        batcher.add("a", "info")
+        now[0] = 0.05
+        batcher.add("b", "default")
+        assert not batcher.due()
+        assert batcher.time_left() == pytest.approx(0.05)
+        now[0] = 0.1
+        assert batcher.due()
+        assert batcher.take() == [("a", "info"), ("b", "default")]
+        assert len(batcher) == 0
+
+    def test_batch_due_when_full(self):
+        batcher = log_stream.OutputBatcher(interval=60, max_lines=3)
+        for i in range(3):
+            batcher.add(str(i), "default")
+        assert batcher.due()
+
+
+@pytest.mark.unit
+class TestAsyncLogWriter:
+    def test_writes_all_lines_on_close(self, tmp_path):
+        path = tmp_path / "logs" / "run.log"
+        writer = log_stream.AsyncLogWriter(str(path))
+        for i in range(1000):
+            writer.write(f"line {i}")
+        writer.close()
+        lines = path.read_text().splitlines()
+        assert len(lines) == 1000 and lines[-1] == "line 999"
+
+    def test_unwritable_path_does_not_raise(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        writer = log_stream.AsyncLogWriter(str(blocker / "run.log"))
+        writer.write("lost")
+        writer.close()
+        assert writer.error is not None
@@ -0,0 +1,98 @@
+"""
+Unit tests for tit/gui/process.py — process-tree sampling for the system monitor.
+
+Covers:
+- Discovery of the current process's descendants (children and grandchildren)
+- Handle caching between ticks and bounded per-process history
+- Exited processes keep their series for export
+- CSV export of the recorded samples
+"""
+
+import csv
+import subprocess
+import sys
+import time
+
+import pytest
+
+from tit.gui.process import ProcessSampler
+
+_SLEEP = [sys.executable, "-c", "import time; time.sleep(30)"]
+_NESTED = [
+    sys.executable,
+    "-c",
+    "import subprocess, sys, time; "
+    "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+    "time.sleep(30)",
+]
+
+
+@pytest.fixture
+def spawn():
+    procs = []
+
+    def _spawn(cmd):
+        proc = subprocess.Popen(cmd)
+        procs.append(proc)
+        return proc
+
+    yield _spawn
+    for proc in procs:
+        proc.kill()
+        proc.wait()
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.mark.unit
+class TestProcessSampler:
+    def test_finds_children_and_grandchildren(self, spawn):
+        proc = spawn(_NESTED)
+        sampler = ProcessSampler()
+        assert _wait_for(lambda: len(sampler.descendant_pids()) >= 2)
+        assert proc.pid in sampler.descendant_pids()
+        for pid in sampler.descendant_pids():
+            assert pid != sampler.root_pid
+
+    def test_sample_reports_rows_and_reuses_handles(self, spawn):
+        proc = spawn(_SLEEP)
+        sampler = ProcessSampler(history=3)
+        rows = sampler.sample()
+        assert proc.pid in [row["pid"] for row in rows]
+        row = next(row for row in rows if row["pid"] == proc.pid)
+        assert row["memory_mb"] > 0 and "python" in row["name"].lower()
+
+        handle = sampler._handles[proc.pid]
+        for _ in range(5):
+            sampler.sample()
+        assert sampler._handles[proc.pid] is handle
+        assert len(sampler.series[proc.pid]["samples"]) == 3
+
+    def test_exited_process_keeps_its_series(self, spawn):
+        proc = spawn(_SLEEP)
+        sampler = ProcessSampler()
+        sampler.sample()
+        proc.kill()
+        proc.wait()
+        rows = sampler.sample()
+        assert proc.pid not in [row["pid"] for row in rows]
+        assert sampler.series[proc.pid]["exited"] is not None
+        assert proc.pid not in sampler._handles
+
+    def test_export_csv(self, spawn, tmp_path):
+        proc = spawn(_SLEEP)
+        sampler = ProcessSampler()
+        sampler.sample()
+        sampler.sample()
+        path = sampler.export_csv(tmp_path / "logs" / "samples.csv")
+        with open(path) as f:
+            rows = [r for r in csv.DictReader(f) if r["pid"] == str(proc.pid)]
+        assert len(rows) == 2
+        assert float(rows[0]["rss_mb"]) > 0
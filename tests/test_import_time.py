@@ -0,0 +1,156 @@
+"""
+Import cost of the ``tit`` packages.
+
+Each check runs in a fresh interpreter (the ``conftest`` module mocks do
+not apply there) and inspects ``sys.modules``, so it captures what
+``python -m tit.*`` entry points, GUI tabs and pool workers load before
+doing any work without depending on how busy the machine is.
+
+Covers:
+- Package imports pull in none of the heavy dependencies
+- Subpackages import only their own ``__init__``
+- Lazy re-exports resolve, cache and list like eager ones
+- The default console handler binds stdout on first use
+"""
+
+import json
+import logging
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from tit._lazy import lazy_exports
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+PACKAGES = [
+    "tit",
+    "tit.opt",
+    "tit.opt.ex",
+    "tit.opt.mex",
+    "tit.opt.flex",
+    "tit.sim",
+    "tit.analyzer",
+    "tit.stats",
+    "tit.pre",
+    "tit.plotting",
+]
+HEAVY = ["numpy", "scipy", "nibabel", "matplotlib", "simnibs", "pandas", "h5py"]
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def _loaded_after(statement: str) -> list[str]:
+    code = f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    result = _run_python(code)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+@pytest.mark.unit
+class TestImportCost:
+    def test_packages_skip_heavy_dependencies(self):
+        loaded = _loaded_after("import " + ", ".join(PACKAGES))
+        assert [m for m in HEAVY if m in loaded] == []
+
+    def test_reexport_imports_only_its_module(self):
+        loaded = _loaded_after("from tit.opt import ExConfig")
+        assert "tit.opt.config" in loaded
+        assert "tit.opt.ex.ex" not in loaded and "tit.opt.flex.flex" not in loaded
+
+    def test_packages_load_only_their_init(self):
+        loaded = _loaded_after("import " + ", ".join(PACKAGES))
+        own = [m for m in loaded if m == "tit" or m.startswith("tit.")]
+        assert sorted(own) == sorted(PACKAGES + ["tit._lazy", "tit.logger"])
+
+
+@pytest.fixture
+def package(monkeypatch):
+    """A throwaway package re-exporting from ``tit.opt.config`` lazily."""
+    module = types.ModuleType("tit_lazy_probe")
+    module.__path__ = []
+    module.__getattr__, module.__dir__ = lazy_exports(
+        module.__name__, {"tit.opt.config": ["ExConfig"]}
+    )
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    return module
+
+
+@pytest.mark.unit
+class TestLazyExports:
+    def test_resolves_and_caches(self, package):
+        from tit.opt.config import ExConfig
+
+        assert package.ExConfig is ExConfig
+        assert vars(package)["ExConfig"] is ExConfig
+
+    def test_dir_lists_exports(self, package):
+        assert "ExConfig" in dir(package)
+
+    def test_unknown_name_is_attribute_error(self, package):
+        with pytest.raises(AttributeError, match="no_such_name"):
+            package.no_such_name
+        assert not hasattr(package, "__wrapped__")
+
+    def test_submodule_attribute(self):
+        import tit.opt
+
+        assert tit.opt.leadfield_store.__name__ == "tit.opt.leadfield_store"
+
+
+@pytest.mark.unit
+class TestDefaultConsole:
+    def test_binds_stdout_on_first_record(self):
+        code = (
+            "import io, logging, sys\n"
+            "import tit\n"
+            "sys.stdout = buffer = io.StringIO()\n"
+            "logging.getLogger('tit.sim').info('hello')\n"
+            "sys.stdout = sys.__stdout__\n"
+            "print(repr(buffer.getvalue()))\n"
+        )
+        result = _run_python(code)
+        assert result.stdout.strip() == repr("hello\n")
+
+    def test_opt_out(self, monkeypatch):
+        monkeypatch.setenv("TIT_LOG_CONSOLE", "0")
+        result = _run_python(
+            "import logging, tit; print(logging.getLogger('tit').handlers)"
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_child_debug_records_stay_quiet(self):
+        code = (
+            "import logging, tit\n"
+            "child = logging.getLogger('tit.x')\n"
+            "child.setLevel(logging.DEBUG)\n"
+            "child.debug('debug')\n"
+            "child.info('info')\n"
+        )
+        assert _run_python(code).stdout == "info\n"
+
+    def test_setup_logging_replaces_it(self):
+        from tit.logger import install_default_console, setup_logging
+
+        logger = logging.getLogger("tit")
+        saved = logger.handlers[:]
+        try:
+            logger.handlers.clear()
+            install_default_console()
+            install_default_console()
+            assert len(logger.handlers) == 1
+            setup_logging()
+            assert logger.handlers == []
+        finally:
+            logger.handlers[:] = saved
@@ -664,6 +664,45 @@ class TestInstallRatioSearch:
         messages = [r.getMessage() for r in caplog.records if r.name == "simnibs"]
         assert any("Goal (ratio):" in m and "split 3.0:1.0 mA" in m for m in messages)
 
+    @staticmethod
+    def _enable_goal_cache(opt, e):
+        """Give *opt* the vendored goal-cache hooks; returns the solve log."""
+        solves = []
+        opt.cache_goal_evaluations = True
+        opt.n_cache_hits = 0
+        opt._goal_cache = {}
+        opt.get_nodes_electrode = lambda electrode_pos, plot=False: [{0: [1]}]
+        opt._goal_cache_key = lambda: bytes(np.asarray(opt.electrode_pos))
+        opt._solve_fields = lambda plot=False: solves.append(1) or e
+        return solves
+
+    def test_repeated_footprint_served_from_goal_cache(self):
+        opt, e = _make_ratio_opt()
+        solves = self._enable_goal_cache(opt, e)
+        self._install(opt)
+
+        first = opt.goal_fun(np.zeros(3))
+        second = opt.goal_fun(np.zeros(3))
+
+        assert second == first
+        assert len(solves) == 1
+        assert opt.n_sim == 1
+        assert opt.n_test == 2
+        assert opt.n_cache_hits == 1
+        assert opt._best_current_split == pytest.approx((3.0, 1.0))
+
+    def test_distinct_footprints_are_solved(self):
+        opt, e = _make_ratio_opt()
+        solves = self._enable_goal_cache(opt, e)
+        self._install(opt)
+
+        opt.goal_fun(np.zeros(3))
+        opt.goal_fun(np.ones(3))
+
+        assert len(solves) == 2
+        assert opt.n_cache_hits == 0
+        assert len(opt._goal_cache) == 2
+
     def test_rejects_non_positive_base_current(self):
         opt, _ = _make_ratio_opt()
         with pytest.raises(ValueError, match="base_mA"):
@@ -652,6 +652,16 @@ class TestConfigureOptimizerOptions:
         configure_optimizer_options(opt, _make_config(recombination=0.9), MagicMock())
         assert opt._optimizer_options_std["recombination"] == 0.9
 
+    def test_sets_seed_population(self):
+        from tit.opt.flex.builder import configure_optimizer_options
+
+        opt = MagicMock()
+        opt._optimizer_options_std = {}
+        configure_optimizer_options(
+            opt, _make_config(seed_solutions=[[0.1, 0.2], [0.3, 0.4]]), MagicMock()
+        )
+        assert [list(x) for x in opt.seed_population] == [[0.1, 0.2], [0.3, 0.4]]
+
     def test_skips_none_values(self):
         from tit.opt.flex.builder import configure_optimizer_options
 
@@ -597,6 +597,54 @@ class TestRun:
 
         assert len(results) == 4  # 2 electrodes * 2 ratios
 
+    def test_symmetric_montages_evaluated_once(self):
+        engine = _make_engine()
+        engine.compute_ti_field = MagicMock(
+            side_effect=lambda ep1, em1, ch1, ep2, em2, ch2: {
+                "TestROI_TImax_ROI": 0.5,
+                "TestROI_TImean_ROI": 0.3,
+                "TestROI_TImean_GM": 0.2,
+                "TestROI_Focality": 1.5,
+                "TestROI_n_elements": 100,
+                "current_ch1_mA": ch1,
+                "current_ch2_mA": ch2,
+            }
+        )
+        pool = ["E1", "E2", "E3", "E4"]
+
+        results = engine.run(
+            e1_plus=pool,
+            e1_minus=pool,
+            e2_plus=pool,
+            e2_minus=pool,
+            current_ratios=[(1.5, 0.5), (0.5, 1.5)],
+            all_combinations=True,
+            output_dir="/tmp/out",
+        )
+
+        assert len(results) == 48  # P(4,4) * 2 ratios
+        assert engine.compute_ti_field.call_count == 6
+        swapped = results["TI_field_E3_E4_and_E1_E2_I1-0.5mA_I2-1.5mA.msh"]
+        assert (swapped["current_ch1_mA"], swapped["current_ch2_mA"]) == (0.5, 1.5)
+
+    def test_deduplicate_off_evaluates_all(self):
+        engine = _make_engine()
+        engine.compute_ti_field = MagicMock(
+            return_value={
+                "TestROI_TImax_ROI": 0.5,
+                "TestROI_TImean_ROI": 0.3,
+                "TestROI_TImean_GM": 0.2,
+                "TestROI_Focality": 1.5,
+            }
+        )
+        pool = ["E1", "E2", "E3", "E4"]
+
+        results = engine.run(
+            pool, pool, pool, pool, [(1.0, 1.0)], True, "/tmp/out", deduplicate=False
+        )
+
+        assert len(results) == engine.compute_ti_field.call_count == 24
+
     def test_empty_results_no_crash(self):
         engine = _make_engine()
         results = engine.run(
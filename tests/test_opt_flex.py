@@ -381,3 +381,205 @@ class TestValidateFlexInputs:
         )
         with pytest.raises(ValueError, match="ROI atlas file not found"):
             _validate_flex_inputs(config)
+
+
+# ---------------------------------------------------------------------------
+# Multi-start execution
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestMultistart:
+    def test_split_cpus(self):
+        from tit.opt.flex.multistart import split_cpus
+
+        assert split_cpus(16, 4) == 4
+        assert split_cpus(3, 4) == 1
+        assert split_cpus(None, 1) >= 1
+
+    def test_restarts_agree(self):
+        from tit.opt.flex.multistart import restarts_agree
+
+        inf = float("inf")
+        assert restarts_agree([-1.0, -0.995, inf], 2, 0.01)
+        assert not restarts_agree([-1.0, -0.9, inf], 2, 0.01)
+        assert not restarts_agree([-1.0, inf, inf], 2, 0.01)
+        assert not restarts_agree([-1.0, -1.0], None, 0.01)
+
+    def test_sequential_early_stop_skips_remaining(self, tmp_path):
+        import logging
+
+        from tit.opt.flex.multistart import run_restarts
+
+        calls = []
+
+        def run_one(config, folder, cpus):
+            calls.append(folder)
+            return -1.0, None
+
+        config = _make_config(n_multistart=5, early_stop_agree=2)
+        folders = [str(tmp_path / f"{i:02d}") for i in range(5)]
+        values, splits = run_restarts(
+            config, folders, run_one, logging.getLogger("test")
+        )
+
+        assert len(calls) == 2
+        assert list(values[:2]) == [-1.0, -1.0]
+        assert all(v == float("inf") for v in values[2:])
+        assert splits == [None] * 5
+
+    def test_parallel_splits_cpus_and_collects_values(self, tmp_path, monkeypatch):
+        import logging
+        from concurrent.futures import ThreadPoolExecutor
+
+        from tit.opt.flex import multistart
+
+        monkeypatch.setattr(
+            multistart,
+            "ProcessPoolExecutor",
+            lambda max_workers, **kwargs: ThreadPoolExecutor(max_workers),
+        )
+        seen_cpus = []
+        scores = {"00": -0.2, "01": -0.5, "02": -0.1, "03": -0.3}
+
+        def run_one(config, folder, cpus):
+            seen_cpus.append(cpus)
+            return scores[os.path.basename(folder)], (1.0, 3.0)
+
+        config = _make_config(n_multistart=4, parallel_restarts=2, cpus=8)
+        folders = [str(tmp_path / name) for name in scores]
+        values, splits = multistart.run_restarts(
+            config, folders, run_one, logging.getLogger("test")
+        )
+
+        assert list(values) == [-0.2, -0.5, -0.1, -0.3]
+        assert seen_cpus == [4, 4, 4, 4]
+        assert splits == [(1.0, 3.0)] * 4
+
+
+@pytest.mark.unit
+class TestPreparationCache:
+    def test_key_ignores_thresholds_and_solver_settings(self):
+        from tit.opt.flex.prepared import preparation_key
+
+        base = _make_config(goal="focality", thresholds="0.1,0.2")
+        same = _make_config(
+            goal="focality", thresholds="0.2,0.5", max_iterations=10, n_multistart=3
+        )
+        moved = _make_config(
+            goal="focality",
+            thresholds="0.1,0.2",
+            roi=SphericalROI(x=0, y=0, z=0, radius=10),
+        )
+
+        assert preparation_key(base) == preparation_key(same)
+        assert preparation_key(base) != preparation_key(moved)
+        assert preparation_key(base) != preparation_key(_make_config())
+
+    def test_key_covers_fem_solver_settings(self):
+        from tit.opt.flex.prepared import preparation_key
+
+        base = _make_config()
+
+        assert preparation_key(base) != preparation_key(base, cpus=4)
+        assert preparation_key(base, 4, "pardiso") == preparation_key(
+            _make_config(), 4, "pardiso"
+        )
+        assert preparation_key(base, 4, "pardiso") != preparation_key(
+            base, 4, "petsc"
+        )
+
+    def test_attach_rejects_state_built_for_another_solver(self):
+        from types import SimpleNamespace
+
+        from tit.opt.flex.prepared import PreparationCache
+
+        cache = PreparationCache()
+        config = _make_config()
+        first = SimpleNamespace(
+            prepared_state=None,
+            solver_options="pardiso",
+            export_prepared_state=lambda: {"_ofem": "pardiso solver"},
+        )
+        cache.remember(first, config)
+
+        other = SimpleNamespace(prepared_state=None, solver_options="petsc")
+        assert not cache.attach(other, config)
+        assert other.prepared_state is None
+        more_cpus = SimpleNamespace(prepared_state=None, solver_options="pardiso")
+        assert not cache.attach(more_cpus, config, cpus=8)
+        assert cache.attach(more_cpus, config)
+
+    def test_attach_after_remember_is_a_hit(self):
+        from types import SimpleNamespace
+
+        from tit.opt.flex.prepared import PreparationCache
+
+        cache = PreparationCache()
+        config = _make_config()
+        first = SimpleNamespace(
+            prepared_state=None, export_prepared_state=lambda: {"_mesh": "m"}
+        )
+        second = SimpleNamespace(prepared_state=None)
+
+        assert not cache.attach(first, config)
+        cache.remember(first, config)
+        assert cache.attach(second, config)
+        assert second.prepared_state == {"_mesh": "m"}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self):
+        from types import SimpleNamespace
+
+        from tit.opt.flex.prepared import PreparationCache
+
+        cache = PreparationCache(max_entries=1)
+        a = _make_config()
+        b = _make_config(roi=SphericalROI(x=0, y=0, z=0, radius=10))
+        opt = SimpleNamespace(prepared_state=None, export_prepared_state=dict)
+
+        cache.remember(opt, a)
+        cache.remember(opt, b)
+
+        assert len(cache) == 1
+        assert not cache.attach(opt, a)
+        assert cache.attach(opt, b)
+
+    def test_scope_clears_on_outermost_exit(self):
+        from types import SimpleNamespace
+
+        from tit.opt.flex.prepared import preparation_scope
+
+        opt = SimpleNamespace(prepared_state=None, export_prepared_state=dict)
+        with preparation_scope() as cache:
+            with preparation_scope():
+                cache.remember(opt, _make_config())
+            assert len(cache) == 1
+            with pytest.raises(RuntimeError):
+                with preparation_scope():
+                    raise RuntimeError("run failed")
+            assert len(cache) == 1
+        assert len(cache) == 0
+
+    def test_run_flex_search_releases_cache(self, monkeypatch):
+        from types import SimpleNamespace
+
+        from tit.opt.flex import flex
+        from tit.opt.flex.prepared import get_preparation_cache
+
+        cache = get_preparation_cache()
+        held = []
+
+        def run(config):
+            opt = SimpleNamespace(prepared_state=None, export_prepared_state=dict)
+            cache.remember(opt, config)
+            held.append(len(cache))
+            return MagicMock(success=True)
+
+        monkeypatch.setattr(flex, "_validate_flex_inputs", lambda config: None)
+        monkeypatch.setattr(flex, "_run_flex_search_inner", run)
+
+        flex.run_flex_search(_make_config())
+
+        assert held == [1]
+        assert len(cache) == 0
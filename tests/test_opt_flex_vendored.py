@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Tests for resources/map-electrodes/tes_flex_optimization.py -- the vendored
+SimNIBS flex optimizer.
+
+The file replaces ``simnibs.optimization.tes_flex_optimization.
+tes_flex_optimization`` inside the container and uses relative imports, so it
+is loaded here under that name with its SimNIBS siblings mocked.  numpy is
+real, so the goal-evaluation cache keys hash actual node arrays.
+
+Covers:
+- Goal cache key: stable for the same footprint, changes with node
+  coordinates or currents of any channel, ignores float noise in currents
+- Cache hits: goal value, tracking replay and achieved ROI fields
+- Cache statistics log line
+- ``_prepare`` adopting exported state instead of reading the mesh
+"""
+
+import importlib.util
+import logging
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+VENDORED = (
+    Path(__file__).resolve().parent.parent
+    / "resources"
+    / "map-electrodes"
+    / "tes_flex_optimization.py"
+)
+PACKAGE = "simnibs.optimization.tes_flex_optimization"
+
+# Every module the vendored file imports besides the standard library and numpy.
+_IMPORTS = (
+    "h5py",
+    "matplotlib",
+    "matplotlib.pyplot",
+    "nibabel",
+    "pandas",
+    "scipy",
+    "scipy.spatial",
+    "scipy.optimize",
+    "scipy.stats",
+    "simnibs",
+    "simnibs.mesh_tools",
+    "simnibs.simulation",
+    "simnibs.simulation.fem",
+    "simnibs.simulation.onlinefem",
+    "simnibs.utils",
+    "simnibs.utils.simnibs_logger",
+    "simnibs.utils.region_of_interest",
+    "simnibs.utils.roi_result_visualization",
+    "simnibs.utils.TI_utils",
+    "simnibs.utils.file_finder",
+    "simnibs.utils.csv_reader",
+    "simnibs.utils.transformations",
+    "simnibs.utils.mesh_element_properties",
+    "simnibs.optimization",
+    PACKAGE,
+    f"{PACKAGE}.ellipsoid",
+    f"{PACKAGE}.measures",
+    f"{PACKAGE}.electrode_layout",
+)
+
+
+@pytest.fixture
+def tfo(monkeypatch):
+    """The vendored module, loaded with mocked SimNIBS dependencies."""
+    for name in _IMPORTS:
+        monkeypatch.setitem(sys.modules, name, MagicMock())
+    sys.modules["simnibs"].__version__ = "4.5.0"
+    spec = importlib.util.spec_from_file_location(
+        f"{PACKAGE}.tes_flex_optimization", VENDORED
+    )
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "logger", logging.getLogger("test.tes_flex"))
+    return module
+
+
+def _electrode(coords, currents):
+    return SimpleNamespace(
+        _node_coords=np.asarray(coords, dtype=float),
+        _node_current=np.asarray(currents, dtype=float),
+    )
+
+
+def _optimizer(tfo, electrodes):
+    """A TesFlexOptimization with just the state goal_fun's cache path reads."""
+    opt = tfo.TesFlexOptimization.__new__(tfo.TesFlexOptimization)
+    opt.electrode = electrodes
+    opt.cache_goal_evaluations = True
+    opt._goal_cache = {}
+    opt.n_cache_hits = 0
+    opt.n_test = 0
+    opt.n_sim = 0
+    opt.goal_fun_value = [[]]
+    opt.AUC = [[]]
+    opt.integral_focality = [[]]
+    opt.roi_mean_fields = None
+    opt._best_goal_value = None
+    return opt
+
+
+def _two_channels():
+    return [
+        _electrode([[0, 0, 1], [0, 1, 0]], [1e-3, -1e-3]),
+        _electrode([[1, 0, 0], [0, 0, -1]], [2e-3, -2e-3]),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# _goal_cache_key
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestGoalCacheKey:
+    def test_stable_for_same_footprint(self, tfo):
+        assert (
+            _optimizer(tfo, _two_channels())._goal_cache_key()
+            == _optimizer(tfo, _two_channels())._goal_cache_key()
+        )
+
+    @pytest.mark.parametrize("channel", [0, 1])
+    @pytest.mark.parametrize("attr", ["_node_coords", "_node_current"])
+    def test_changes_with_any_channel_nodes_or_currents(self, tfo, channel, attr):
+        opt = _optimizer(tfo, _two_channels())
+        before = opt._goal_cache_key()
+        getattr(opt.electrode[channel], attr)[0] *= 1.5
+        assert opt._goal_cache_key() != before
+
+    def test_changes_when_nodes_move_between_channels(self, tfo):
+        a, b = _two_channels()
+        assert (
+            _optimizer(tfo, [a, b])._goal_cache_key()
+            != _optimizer(tfo, [b, a])._goal_cache_key()
+        )
+
+    def test_ignores_float_noise_in_currents(self, tfo):
+        opt = _optimizer(tfo, _two_channels())
+        before = opt._goal_cache_key()
+        opt.electrode[0]._node_current += 1e-16
+        assert opt._goal_cache_key() == before
+
+
+# ---------------------------------------------------------------------------
+# goal_fun cache hits
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def evaluating(tfo, monkeypatch):
+    """An optimizer whose goal_fun runs with stub placement and field solves.
+
+    The parameters are the node coordinates of a single channel; the field
+    in the one ROI equals the parameters.
+    """
+    opt = _optimizer(tfo, [_electrode([[0, 0, 0]], [1e-3])])
+    opt.goal = ["focality"]
+    opt.e_postproc = ["magn"]
+    opt.n_channel_stim = 1
+    opt._n_roi = 1
+    opt._goal_dir = [None]
+    opt.solves = 0
+
+    def get_nodes_electrode(electrode_pos):
+        opt.electrode[0]._node_coords = np.asarray(electrode_pos, dtype=float)
+        return [np.arange(len(electrode_pos))]
+
+    def solve_fields(plot=False):
+        opt.solves += 1
+        return [[opt.electrode[0]._node_coords.ravel()]]
+
+    def compute_goal(e_pp):
+        value = -float(np.sum(e_pp[0][0]))
+        opt.goal_fun_value[0].append(value)
+        opt.AUC[0].append(value / 2)
+        opt.integral_focality[0].append(value / 4)
+        return value
+
+    opt.get_electrode_pos_from_array = lambda p: p
+    opt.get_nodes_electrode = get_nodes_electrode
+    opt._solve_fields = solve_fields
+    opt.compute_goal = compute_goal
+    monkeypatch.setattr(tfo, "postprocess_e", lambda e, e2, dirvec, type: e)
+    return opt
+
+
+@pytest.mark.unit
+class TestGoalFunCache:
+    def test_hit_returns_value_without_solving(self, evaluating):
+        first = evaluating.goal_fun([[1.0, 2.0, 3.0]])
+        again = evaluating.goal_fun([[1.0, 2.0, 3.0]])
+
+        assert again == first == -6.0
+        assert evaluating.solves == evaluating.n_sim == 1
+        assert (evaluating.n_test, evaluating.n_cache_hits) == (2, 1)
+
+    def test_hit_replays_tracking(self, evaluating):
+        evaluating.goal_fun([[1.0, 2.0, 3.0]])
+        evaluating.goal_fun([[0.0, 0.0, 1.0]])
+        evaluating.goal_fun([[1.0, 2.0, 3.0]])
+
+        assert evaluating.solves == 2
+        assert evaluating.goal_fun_value == [[-6.0, -1.0, -6.0]]
+        assert evaluating.AUC == [[-3.0, -0.5, -3.0]]
+        assert evaluating.integral_focality == [[-1.5, -0.25, -1.5]]
+
+    def test_hit_keeps_best_roi_fields(self, evaluating):
+        evaluating.goal_fun([[0.0, 0.0, 1.0]])
+        evaluating.goal_fun([[1.0, 2.0, 3.0]])
+        evaluating.roi_mean_fields = evaluating._best_goal_value = None
+
+        evaluating.goal_fun([[1.0, 2.0, 3.0]])
+
+        assert evaluating.n_cache_hits == 1
+        assert evaluating._best_goal_value == -6.0
+        assert evaluating.roi_mean_fields == [2.0]
+
+    def test_disabled_cache_always_solves(self, evaluating):
+        evaluating.cache_goal_evaluations = False
+        evaluating.goal_fun([[1.0, 2.0, 3.0]])
+        evaluating.goal_fun([[1.0, 2.0, 3.0]])
+
+        assert evaluating.solves == 2
+        assert evaluating._goal_cache == {}
+
+
+# ---------------------------------------------------------------------------
+# _log_goal_cache_stats
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestGoalCacheStats:
+    def test_logs_hits_and_footprints(self, evaluating, caplog):
+        for params in ([[1.0, 2.0, 3.0]], [[1.0, 2.0, 3.0]], [[0.0, 0.0, 1.0]]):
+            evaluating.goal_fun(params)
+
+        with caplog.at_level(logging.INFO, logger="test.tes_flex"):
+            evaluating._log_goal_cache_stats()
+
+        (record,) = [r for r in caplog.records if "cached goal" in r.message]
+        assert record.levelno == 26
+        assert "1 (33.3% of evaluations, 2 distinct electrode footprints)" in (
+            record.message
+        )
+
+    def test_silent_without_evaluations_or_cache(self, evaluating, caplog):
+        with caplog.at_level(logging.INFO, logger="test.tes_flex"):
+            evaluating._log_goal_cache_stats()
+            evaluating.n_test = 3
+            evaluating.cache_goal_evaluations = False
+            evaluating._log_goal_cache_stats()
+        assert caplog.records == []
+
+
+# ---------------------------------------------------------------------------
+# _prepare with prepared_state
+# ---------------------------------------------------------------------------
+
+
+def _channel():
+    return MagicMock(
+        _electrode_arrays=[],
+        dirichlet_correction=False,
+        dirichlet_correction_detailed=False,
+        _current_estimator=None,
+    )
+
+
+@pytest.mark.unit
+class TestPrepareAdoptsState:
+    @pytest.fixture
+    def shared(self, tfo):
+        """Exported state of an earlier run: one entry per shared attribute."""
+        state = {name: MagicMock(name=name) for name in tfo._PREPARED_STATE_ATTRS}
+        state["roi"] = [MagicMock(name="roi"), MagicMock(name="non_roi")]
+        state["_roi"] = [MagicMock(name="roi_pc"), MagicMock(name="non_roi_pc")]
+        state["_roi_properties"] = [("roi_vol", None), ("non_roi_vol", None)]
+        return state
+
+    @pytest.fixture
+    def opt(self, tfo, shared, tmp_path, monkeypatch):
+        monkeypatch.setattr(tfo, "get_element_properties", MagicMock())
+        opt = tfo.TesFlexOptimization()
+        opt.output_folder = str(tmp_path / "run")
+        opt.subpath = str(tmp_path / "m2m_001")
+        opt.roi = [MagicMock(), MagicMock()]
+        opt.electrode = [_channel(), _channel()]
+        opt.goal = "focality"
+        opt.threshold = [0.1, 0.2]
+        opt.e_postproc = "max_TI"
+        opt.get_bounds = MagicMock(name="bounds")
+        opt.get_init_vals = MagicMock(name="x0")
+        opt.prepared_state = shared
+        return opt
+
+    def test_skips_mesh_roi_and_fem_setup(self, tfo, opt):
+        opt._prepare()
+
+        tfo.mesh_io.read_msh.assert_not_called()
+        tfo.FemTargetPointCloud.assert_not_called()
+        tfo.get_element_properties.assert_not_called()
+        tfo.get_dirichlet_node_index_cog.assert_not_called()
+        tfo.OnlineFEM.assert_not_called()
+        assert opt._prepared
+
+    def test_adopts_every_shared_attribute(self, tfo, opt, shared):
+        opt._prepare()
+
+        for name in tfo._PREPARED_STATE_ATTRS:
+            assert getattr(opt, name) is shared[name], name
+        assert opt._vol == ["roi_vol", "non_roi_vol"]
+        assert opt.export_prepared_state() == shared
+
+    def test_still_prepares_run_specific_state(self, opt):
+        opt._prepare()
+
+        for channel in opt.electrode:
+            channel._prepare.assert_called_once_with()
+            channel.compile_node_arrays.assert_called_once_with()
+        assert opt.x0 is opt.get_init_vals.return_value
+        assert opt.goal_fun_value == [[]]
+        assert opt._optimizer_options_std["bounds"] is opt.get_bounds.return_value
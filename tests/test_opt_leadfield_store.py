@@ -0,0 +1,291 @@
+"""Tests for tit/opt/leadfield_store.py -- memory-mapped leadfield store."""
+
+import csv
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# Ensure simnibs.utils.TI_utils is mocked (engine import)
+for mod_name in ("simnibs.utils.TI_utils",):
+    if mod_name not in sys.modules:
+        sys.modules[mod_name] = MagicMock()
+
+from tit.opt.leadfield_store import (
+    LeadfieldStore,
+    find_store,
+    store_path_for,
+    write_store,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+N_ELEC = 3
+N_ELM = 10
+
+
+def _source():
+    rng = np.random.default_rng(0)
+    scale = np.array([1.0, 10.0, 0.1])[:, None, None]
+    return rng.normal(size=(N_ELEC, N_ELM, 3)) * scale
+
+
+def _write(path, lf, dtype="float32", block_elements=4, source=None):
+    return write_store(
+        path,
+        lambda start, stop: lf[:, start:stop, :],
+        n_elements=N_ELM,
+        electrode_names=["E1", "E2", "E3"],
+        reference="Ref",
+        tags=np.array([1, 2] * (N_ELM // 2)),
+        baricenters=np.arange(N_ELM * 3, dtype=float).reshape(N_ELM, 3),
+        volumes=np.ones(N_ELM),
+        dtype=dtype,
+        block_elements=block_elements,
+        source=source,
+    )
+
+
+# ---------------------------------------------------------------------------
+# write_store / LeadfieldStore
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestLeadfieldStore:
+    def test_roundtrip_float32(self, tmp_path):
+        lf = _source()
+        store = LeadfieldStore(_write(tmp_path / "lf.lfstore", lf))
+
+        np.testing.assert_allclose(store.load(), lf, rtol=1e-6)
+        assert store.idx_lf == {"E1": 0, "E2": 1, "E3": 2, "Ref": None}
+        assert store.n_elements == N_ELM
+
+    def test_slices_elements_in_requested_order(self, tmp_path):
+        lf = _source()
+        store = LeadfieldStore(_write(tmp_path / "lf.lfstore", lf))
+
+        sub = store.load([7, 2, 5])
+
+        assert sub.shape == (N_ELEC, 3, 3)
+        np.testing.assert_allclose(sub, lf[:, [7, 2, 5], :], rtol=1e-6)
+
+    def test_float16_scaled_per_electrode(self, tmp_path):
+        lf = _source()
+        store = LeadfieldStore(_write(tmp_path / "lf.lfstore", lf, dtype="float16"))
+
+        assert store.memmap().dtype == np.float16
+        assert np.abs(store.memmap()).max() <= 1.0
+        np.testing.assert_allclose(store.load(), lf, rtol=2e-3, atol=1e-2)
+
+    def test_element_index(self, tmp_path):
+        store = LeadfieldStore(_write(tmp_path / "lf.lfstore", _source()))
+        elements = store.elements
+
+        assert len(elements) == N_ELM
+        assert list(elements.elm.tag1[:2]) == [1, 2]
+        assert elements.elements_baricenters().value.shape == (N_ELM, 3)
+
+    def test_rejects_unknown_dtype(self, tmp_path):
+        with pytest.raises(ValueError, match="dtype"):
+            _write(tmp_path / "lf.lfstore", _source(), dtype="int8")
+
+
+# ---------------------------------------------------------------------------
+# find_store
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestFindStore:
+    def test_store_path_for(self):
+        assert store_path_for("/a/sub_leadfield_EEG.hdf5") == Path(
+            "/a/sub_leadfield_EEG.lfstore"
+        )
+
+    def test_missing_store(self, tmp_path):
+        assert find_store(tmp_path / "lf.hdf5") is None
+
+    def test_current_and_stale(self, tmp_path):
+        hdf5 = tmp_path / "lf.hdf5"
+        hdf5.write_bytes(b"x" * 16)
+        _write(store_path_for(hdf5), _source(), source=hdf5)
+
+        assert find_store(hdf5) == store_path_for(hdf5)
+
+        hdf5.write_bytes(b"x" * 32)
+        assert find_store(hdf5) is None
+
+
+# ---------------------------------------------------------------------------
+# ExSearchEngine integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestEngineStore:
+    def test_loads_only_roi_and_gm_rows(self, tmp_path):
+        from tit.opt.ex.engine import ExSearchEngine
+
+        lf = _source()
+        store = _write(tmp_path / "lf.lfstore", lf)
+        roi_csv = tmp_path / "roi.csv"
+        with open(roi_csv, "w", newline="") as f:
+            csv.writer(f).writerow([3.0, 4.0, 5.0])  # barycenter of element 1
+
+        engine = ExSearchEngine(str(store), str(roi_csv), "R", MagicMock())
+        engine.initialize(roi_radius=0.5)
+
+        gm = np.arange(1, N_ELM, 2)  # tag 2 elements
+        np.testing.assert_array_equal(engine.element_rows, gm)
+        assert engine.leadfield.shape == (N_ELEC, len(gm), 3)
+        np.testing.assert_array_equal(engine.element_rows[engine.roi_indices], [1])
+        np.testing.assert_allclose(
+            engine.leadfield[:, engine.gm_indices], lf[:, gm], rtol=1e-6
+        )
+        assert engine.idx_lf["Ref"] is None
+
+
+# ---------------------------------------------------------------------------
+# Checksums / LeadfieldCatalog
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestVerify:
+    def test_clean_store_verifies(self, tmp_path):
+        store = LeadfieldStore(_write(tmp_path / "lf.lfstore", _source()))
+        assert store.verify() == []
+        assert store.index["tissues"] == [1, 2]
+
+    def test_detects_corrupted_block(self, tmp_path):
+        store = LeadfieldStore(_write(tmp_path / "lf.lfstore", _source()))
+        data = np.load(store.path / "leadfield.npy", mmap_mode="r+")
+        data[5, 0, 0] += 1.0  # element 5 lives in block 1 (4 per block)
+        data.flush()
+        del data
+
+        assert LeadfieldStore(store.path).verify() == [1]
+
+
+@pytest.mark.unit
+class TestLeadfieldCatalog:
+    def test_refresh_lists_stores(self, tmp_path):
+        from tit.opt.leadfield_catalog import CATALOG_FILE, LeadfieldCatalog
+
+        _write(tmp_path / "101_leadfield_GSN-HydroCel-185.lfstore", _source())
+        catalog = LeadfieldCatalog("101", tmp_path)
+
+        (entry,) = catalog.refresh()
+
+        assert entry.net_name == "GSN-HydroCel-185"
+        assert entry.format == "store"
+        assert entry.n_electrodes == N_ELEC + 1
+        assert entry.n_elements == N_ELM
+        assert entry.tissues == [1, 2]
+        assert (tmp_path / CATALOG_FILE).exists()
+        assert LeadfieldCatalog("101", tmp_path).get("GSN-HydroCel-185") == entry
+
+    def test_refresh_reuses_unchanged_entries(self, tmp_path, monkeypatch):
+        import tit.opt.leadfield_catalog as lc
+
+        path = _write(tmp_path / "101_leadfield_EEG10-20.lfstore", _source())
+        lc.LeadfieldCatalog("101", tmp_path).refresh()
+
+        calls = []
+        real = lc._describe_store
+        monkeypatch.setattr(
+            lc, "_describe_store", lambda p, *a: calls.append(p) or real(p, *a)
+        )
+        lc.LeadfieldCatalog("101", tmp_path).refresh()
+        assert calls == []
+
+        (path / "index.json").touch()
+        lc.LeadfieldCatalog("101", tmp_path).refresh()
+        assert calls == [path]
+
+    def test_validate_reports_corruption(self, tmp_path):
+        from tit.opt.leadfield_catalog import LeadfieldCatalog
+
+        path = _write(tmp_path / "101_leadfield_EEG10-20.lfstore", _source())
+        catalog = LeadfieldCatalog("101", tmp_path)
+        catalog.refresh()
+        assert catalog.validate() == {}
+
+        data = np.load(path / "leadfield.npy", mmap_mode="r+")
+        data[0, 0, 0] += 1.0
+        data.flush()
+        del data
+
+        problems = catalog.validate()
+        assert "checksum" in problems[path.name][0]
+
+    def test_mesh_read_deferred_until_requested(self, tmp_path, monkeypatch):
+        import tit.opt.leadfield_catalog as lc
+
+        path = tmp_path / "101_leadfield_EEG10-20.hdf5"
+        path.write_bytes(b"x" * 64)
+        calls = []
+
+        def describe(p, subject_id, read_mesh=True):
+            calls.append(read_mesh)
+            return lc.LeadfieldEntry(
+                name=p.name,
+                net_name="EEG10-20",
+                path=str(p),
+                format="hdf5",
+                mesh_hash="abc" if read_mesh else None,
+                size_bytes=64,
+                mtime_ns=p.stat().st_mtime_ns,
+            )
+
+        monkeypatch.setattr(lc, "_describe_hdf5", describe)
+        catalog = lc.LeadfieldCatalog("101", tmp_path)
+        catalog.refresh(read_mesh=False)
+        catalog.refresh(read_mesh=False)
+        assert calls == [False]
+        catalog.refresh()
+        catalog.refresh(read_mesh=False)
+        assert calls == [False, True]
+
+
+@pytest.mark.unit
+class TestGeneratorUsesCatalog:
+    def _generator(self, tmp_path, monkeypatch):
+        import tit.opt.leadfield as leadfield_mod
+
+        pm = MagicMock()
+        pm.leadfields.return_value = str(tmp_path)
+        monkeypatch.setattr(leadfield_mod, "get_path_manager", lambda: pm)
+        return leadfield_mod.LeadfieldGenerator("101")
+
+    def test_electrode_names_from_catalogue(self, tmp_path, monkeypatch):
+        _write(tmp_path / "101_leadfield_EEG10-20.lfstore", _source())
+        gen = self._generator(tmp_path, monkeypatch)
+        monkeypatch.setitem(sys.modules, "simnibs.utils.csv_reader", None)
+
+        assert gen.get_electrode_names("EEG10-20") == ["E1", "E2", "E3", "Ref"]
+
+    def test_list_leadfields_reuses_catalogue(self, tmp_path, monkeypatch):
+        import tit.opt.leadfield_catalog as lc
+
+        (tmp_path / "101_leadfield_EEG10-20.hdf5").write_bytes(b"x" * 64)
+        gen = self._generator(tmp_path, monkeypatch)
+        calls = []
+        real = lc._describe_hdf5
+        monkeypatch.setattr(
+            lc, "_describe_hdf5", lambda p, *a: calls.append(p) or real(p, *a)
+        )
+
+        (listed,) = gen.list_leadfields()
+        assert listed[0] == "EEG10-20" and listed[1].endswith(".hdf5")
+        assert gen.list_leadfields() == [listed]
+        assert len(calls) == 1
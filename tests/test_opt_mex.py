@@ -113,6 +113,80 @@ class TestGenerateMultipolarCombinations:
         assert symmetric == 2
 
 
+@pytest.mark.unit
+class TestCanonicalMultipolarCombinations:
+    def test_pool_mode_reduces_64_fold_and_expands_back(self):
+        from tit.opt.mex.logic import generate_canonical_multipolar_combinations
+
+        pool = [f"E{i}" for i in range(1, 9)]
+        classes = list(
+            generate_canonical_multipolar_combinations(pool, all_combinations=True)
+        )
+
+        assert len(classes) == math.factorial(8) // 64
+        members = [m for _, group in classes for m in group]
+        assert len(members) == len(set(members)) == math.factorial(8)
+        assert all(rep == group[0] for rep, group in classes)
+
+    def test_symmetric_bucket_classes_stay_within_enumeration(self):
+        from tit.opt.mex.logic import (
+            generate_canonical_multipolar_combinations,
+            generate_multipolar_combinations,
+        )
+
+        mirror_map = {"L1": "R1", "R1": "L1", "L2": "R2", "R2": "L2"}
+        mirror_map.update({"L3": "R3", "R3": "L3", "L4": "R4", "R4": "L4"})
+        left, right = ["L1", "L2", "L3", "L4"], ["R1", "R2", "R3", "R4"]
+        buckets = {
+            key: (left if key.endswith("plus") else right)
+            for key in (
+                "e1_plus",
+                "e1_minus",
+                "e2_plus",
+                "e2_minus",
+                "e3_plus",
+                "e3_minus",
+                "e4_plus",
+                "e4_minus",
+            )
+        }
+
+        full = set(
+            generate_multipolar_combinations(buckets, symmetry_mirror_map=mirror_map)
+        )
+        classes = list(
+            generate_canonical_multipolar_combinations(
+                buckets, symmetry_mirror_map=mirror_map
+            )
+        )
+
+        members = [m for _, group in classes for m in group]
+        assert sorted(members) == sorted(full)
+        # Pair polarity reversal would put a right electrode in a plus
+        # bucket, so only pair/channel reordering merges candidates here.
+        assert len(classes) == len(full) // 8
+
+    def test_orbit_images_share_the_mti_field(self):
+        from tit.calc import get_mTI_vectors
+        from tit.opt.mex.logic import _multipolar_orbit
+
+        rng = np.random.default_rng(0)
+        names = tuple("ABCDEFGH")
+        fields = {name: rng.normal(size=(20, 3)) for name in names}
+
+        def metric(combo):
+            pair_fields = [
+                fields[combo[idx]] - fields[combo[idx + 1]] for idx in range(0, 8, 2)
+            ]
+            return np.linalg.norm(get_mTI_vectors(pair_fields), axis=1)
+
+        reference = metric(names)
+        images = set(_multipolar_orbit(names))
+        assert len(images) == 64
+        for image in images:
+            np.testing.assert_allclose(metric(image), reference, atol=1e-9)
+
+
 # ---------------------------------------------------------------------------
 # tit.opt.ex.buckets -- build_electrode_mirror_map
 # ---------------------------------------------------------------------------
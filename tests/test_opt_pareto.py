@@ -19,9 +19,12 @@ from tit.opt.flex.pareto import (
     SweepPoint,
     build_focality_config,
     build_pareto_manifest_data,
+    complete_point,
     compute_sweep_grid,
     generate_pareto_plot,
     generate_summary_text,
+    pareto_front,
+    run_sweep,
     save_results,
     validate_grid,
     _promote_best_run,
@@ -208,6 +211,164 @@ class TestBuildFocalityConfig:
         assert base.goal == original_goal
 
 
+# ---------------------------------------------------------------------------
+# run_sweep
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestRunSweep:
+    def test_runs_pending_points_in_process(self, tmp_path):
+        result = _make_sweep_result(base=str(tmp_path))
+        result.points[0].status = "done"
+        seen = []
+
+        def fake_run(cfg):
+            seen.append(cfg.output_folder)
+            if len(seen) == 2:
+                raise RuntimeError("boom")
+            return MagicMock(best_value=-0.5)
+
+        with patch("tit.opt.flex.flex.run_flex_search", side_effect=fake_run):
+            run_sweep(_make_flex_config(), result)
+
+        assert seen == [p.output_folder for p in result.points[1:]]
+        assert [p.status for p in result.points] == [
+            "done",
+            "done",
+            "failed",
+            "done",
+        ]
+        assert result.points[1].focality_score == -0.5
+        archive = json.loads((tmp_path / "pareto_archive.json").read_text())
+        assert archive["n_done"] == 3
+        assert [p["status"] for p in archive["points"]][2] == "failed"
+
+    def test_warm_starts_from_finished_neighbours(self, tmp_path):
+        result = _make_sweep_result(base=str(tmp_path))
+        seeds_seen = {}
+
+        def fake_run(cfg):
+            seeds_seen[os.path.basename(cfg.output_folder)] = cfg.seed_solutions
+            os.makedirs(cfg.output_folder, exist_ok=True)
+            idx = len(seeds_seen)
+            positions = os.path.join(cfg.output_folder, "electrode_positions.json")
+            with open(positions, "w") as f:
+                json.dump({"optim_x": [float(idx)]}, f)
+            return MagicMock(best_value=-float(idx))
+
+        with patch("tit.opt.flex.flex.run_flex_search", side_effect=fake_run):
+            run_sweep(_make_flex_config(), result, n_seeds=2)
+
+        first, second = (os.path.basename(p.output_folder) for p in result.points[:2])
+        assert seeds_seen[first] is None
+        assert seeds_seen[second] == [[1.0]]
+        # best-scoring neighbour first
+        assert seeds_seen[os.path.basename(result.points[3].output_folder)] == [
+            [3.0],
+            [2.0],
+        ]
+
+    def test_in_process_points_share_prepared_state(self, tmp_path):
+        from types import SimpleNamespace
+
+        from tit.opt.flex.prepared import get_preparation_cache
+
+        cache = get_preparation_cache()
+        result = _make_sweep_result(base=str(tmp_path))
+        hits = []
+
+        def fake_run(cfg):
+            opt = SimpleNamespace(prepared_state=None, export_prepared_state=dict)
+            hits.append(cache.attach(opt, cfg))
+            cache.remember(opt, cfg)
+            return MagicMock(best_value=-0.1)
+
+        with patch("tit.opt.flex.flex.run_flex_search", side_effect=fake_run):
+            run_sweep(_make_flex_config(), result, warm_start=False)
+
+        assert hits == [False, True, True, True]
+        assert len(cache) == 0
+
+    def test_parallel_without_warm_start(self, tmp_path, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from tit.opt.flex import pareto
+
+        monkeypatch.setattr(
+            pareto,
+            "ProcessPoolExecutor",
+            lambda max_workers, **kwargs: ThreadPoolExecutor(max_workers),
+        )
+        result = _make_sweep_result(base=str(tmp_path))
+        cpus = []
+
+        def fake_run(cfg):
+            cpus.append(cfg.cpus)
+            return MagicMock(best_value=-0.1)
+
+        with patch("tit.opt.flex.flex.run_flex_search", side_effect=fake_run):
+            run_sweep(
+                _make_flex_config(cpus=8), result, n_parallel=2, warm_start=False
+            )
+
+        assert cpus == [4, 4, 4, 4]
+        assert all(p.status == "done" for p in result.points)
+
+
+@pytest.mark.unit
+class TestParetoFront:
+    def test_ranks_on_achieved_fields(self):
+        result = _make_sweep_result()
+        # (roi_field, nonroi_field) achieved at (80,20) (80,40) (60,20) (60,40)
+        achieved = [(0.08, 0.03), (0.09, 0.03), (0.07, 0.02), (0.06, 0.025)]
+        for p, (roi, nonroi) in zip(result.points, achieved):
+            p.status = "done"
+            p.focality_score = -1.0
+            p.roi_field, p.nonroi_field = roi, nonroi
+
+        front = pareto_front(result.points)
+
+        # (80,20) is dominated by (80,40), which reached more ROI field with
+        # the same non-ROI field; (60,40) by (60,20).
+        assert [(p.roi_pct, p.nonroi_pct) for p in front] == [
+            (80.0, 40.0),
+            (60.0, 20.0),
+        ]
+
+    def test_ignores_unfinished_points_and_missing_fields(self):
+        result = _make_sweep_result()
+        assert pareto_front(result.points) == []
+        result.points[0].status = "done"
+        result.points[0].focality_score = -1.0
+        assert pareto_front(result.points) == []
+
+
+@pytest.mark.unit
+class TestCompletePoint:
+    def test_reads_achieved_fields_and_writes_archive(self, tmp_path):
+        result = _make_sweep_result(base=str(tmp_path))
+        point = result.points[0]
+        os.makedirs(point.output_folder)
+        positions = os.path.join(point.output_folder, "electrode_positions.json")
+        with open(positions, "w") as f:
+            json.dump({"optim_x": [1.0], "roi_mean_fields": [0.08, 0.02]}, f)
+
+        complete_point(result, point, -0.4)
+
+        assert point.status == "done" and point.focality_score == -0.4
+        assert (point.roi_field, point.nonroi_field) == (0.08, 0.02)
+        archive = json.loads((tmp_path / "pareto_archive.json").read_text())
+        assert archive["front"] == [0]
+        assert archive["points"][0]["roi_field_vm"] == 0.08
+
+    def test_no_score_marks_failed(self, tmp_path):
+        result = _make_sweep_result(base=str(tmp_path))
+        complete_point(result, result.points[1], None)
+        assert result.points[1].status == "failed"
+        assert result.points[1].roi_field is None
+
+
 # ---------------------------------------------------------------------------
 # build_pareto_manifest_data
 # ---------------------------------------------------------------------------
@@ -241,6 +241,12 @@ class TestSubjectLevelPaths:
             root, "derivatives", "ti-toolbox", "tissue_analysis", "sub-001"
         )
 
+    def test_stage_manifest(self, pm):
+        p, root = pm
+        assert p.stage_manifest("001") == os.path.join(
+            root, "derivatives", "ti-toolbox", "stage_cache", "sub-001.json"
+        )
+
     def test_bids_subject(self, pm):
         p, root = pm
         assert p.bids_subject("001") == os.path.join(root, "sub-001")
@@ -8,6 +8,7 @@ Covers:
 - tit/plotting/static_overlay.py: generate_static_overlay_images
 - tit/plotting/stats.py: plot_permutation_null_distribution, plot_cluster_size_mass_correlation
 - tit/plotting/ti_metrics.py: plot_montage_distributions, plot_intensity_vs_focality
+- tit/plotting/figure_service.py: FigureSpec, render_figure, render_figures
 """
 
 import os
@@ -1169,6 +1170,126 @@ class TestPlotIntensityVsFocality:
         mock_fig.colorbar.assert_not_called()
 
 
+# ============================================================================
+# figure_service.py tests
+# ============================================================================
+
+_RENDERED = []
+
+
+class _FakeFigure:
+    def savefig(self, path, dpi=None, **kwargs):
+        with open(path, "w") as f:
+            f.write(f"{dpi}")
+
+
+class _BrokenFigure:
+    def savefig(self, path, **kwargs):
+        raise OSError("disk full")
+
+
+def _fake_render(spec, plt):
+    _RENDERED.append(spec.output.name)
+    return _FakeFigure()
+
+
+@pytest.mark.unit
+class TestFigureService:
+    """Tests for deferred figure rendering and its skip cache."""
+
+    def _spec(self, tmp_path, name="fig", value=1.0):
+        from tit.plotting.figure_service import FigureSpec
+
+        return FigureSpec(
+            render=_fake_render,
+            output=tmp_path / name,
+            arrays={"slice": np.full((4, 4), value)},
+            meta={"title": name},
+        )
+
+    def test_unknown_fidelity_raises(self, tmp_path):
+        from tit.plotting.figure_service import render_figure
+
+        with pytest.raises(ValueError, match="fidelity"):
+            render_figure(self._spec(tmp_path), "draft")
+
+    def test_fidelity_controls_formats_and_dpi(self, tmp_path):
+        from tit.plotting.figure_service import render_figures
+
+        out = render_figures([self._spec(tmp_path)], "preview", workers=1)
+        assert out[tmp_path / "fig"] == [tmp_path / "fig.png"]
+        assert (tmp_path / "fig.png").read_text() == "100"
+        assert not (tmp_path / "fig.pdf").exists()
+
+        render_figures([self._spec(tmp_path)], "publication", workers=1)
+        assert (tmp_path / "fig.png").read_text() == "300"
+        assert (tmp_path / "fig.pdf").exists()
+
+    def test_unchanged_specs_are_skipped(self, tmp_path):
+        from tit.plotting.figure_service import render_figures
+
+        _RENDERED.clear()
+        specs = [self._spec(tmp_path, "a"), self._spec(tmp_path, "b")]
+        render_figures(specs, workers=1)
+        assert sorted(_RENDERED) == ["a", "b"]
+
+        _RENDERED.clear()
+        specs = [self._spec(tmp_path, "a"), self._spec(tmp_path, "b", value=2.0)]
+        out = render_figures(specs, workers=1)
+        assert _RENDERED == ["b"]
+        assert out[tmp_path / "a"] == [tmp_path / "a.png", tmp_path / "a.pdf"]
+
+        _RENDERED.clear()
+        render_figures(specs, workers=1, force=True)
+        assert sorted(_RENDERED) == ["a", "b"]
+
+    def test_missing_output_is_rerendered(self, tmp_path):
+        from tit.plotting.figure_service import render_figures
+
+        render_figures([self._spec(tmp_path)], workers=1)
+        (tmp_path / "fig.pdf").unlink()
+
+        _RENDERED.clear()
+        render_figures([self._spec(tmp_path)], workers=1)
+        assert _RENDERED == ["fig"]
+
+    def test_figure_closed_when_savefig_fails(self, tmp_path):
+        from tit.plotting.figure_service import FigureSpec, render_figure
+
+        fig = _BrokenFigure()
+        spec = FigureSpec(render=lambda spec, plt: fig, output=tmp_path / "fig")
+        plt = MagicMock()
+
+        with pytest.raises(OSError, match="disk full"):
+            render_figure(spec, "preview", plt=plt)
+        plt.close.assert_called_once_with(fig)
+
+    def test_pool_does_not_fork(self):
+        from tit.plotting.figure_service import pool_context
+
+        assert pool_context().get_start_method() in ("forkserver", "spawn")
+
+    def test_process_pool(self, tmp_path, monkeypatch):
+        import multiprocessing as mp
+
+        from tit.plotting import figure_service
+        from tit.plotting.figure_service import render_figures
+
+        # Spawned workers would start without this suite's conftest mocks.
+        monkeypatch.setattr(
+            figure_service, "pool_context", lambda: mp.get_context("fork")
+        )
+        specs = [self._spec(tmp_path, name) for name in ("a", "b", "c")]
+        out = render_figures(specs, "preview", workers=2)
+
+        assert sorted(p.name for paths in out.values() for p in paths) == [
+            "a.png",
+            "b.png",
+            "c.png",
+        ]
+        assert all(p.read_text() == "100" for paths in out.values() for p in paths)
+
+
 # ============================================================================
 # __init__.py tests
 # ============================================================================
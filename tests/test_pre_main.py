@@ -70,6 +70,7 @@ class TestMain:
             "run_subcortical_segmentations": True,
             "skip_existing_outputs": True,
             "replace_existing_outputs": False,
+            "step_retries": 2,
         }
         with patch("builtins.open", mock_open(read_data=json.dumps(config))):
             from tit.pre.__main__ import main
@@ -83,6 +84,7 @@ class TestMain:
         assert call_kwargs.kwargs["create_m2m"] is True
         assert call_kwargs.kwargs["skip_existing_outputs"] is True
         assert call_kwargs.kwargs["replace_existing_outputs"] is False
+        assert call_kwargs.kwargs["step_retries"] == 2
 
     @patch(f"{MODULE}.sys.exit")
     @patch(f"{MODULE}.run_pipeline", return_value=0)
@@ -105,3 +107,4 @@ class TestMain:
         assert call_kwargs.kwargs["run_recon"] is False
         assert call_kwargs.kwargs["skip_existing_outputs"] is False
         assert call_kwargs.kwargs["replace_existing_outputs"] is False
+        assert call_kwargs.kwargs["step_retries"] == 0
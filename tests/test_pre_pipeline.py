@@ -6,6 +6,8 @@ Covers:
 - parallel_recon path (lines 296-392)
 - Report generation loop (lines 432-505)
 - Individual step flags: run_qsiprep, run_qsirecon, extract_dti, run_subcortical
+- Existing-output policy, and no resume from the scheduler state file alone
+- Subcortical segmentations cached on their output volumes
 - Runner stop_event reassignment (line 296)
 """
 
@@ -26,14 +28,44 @@ for _mod in (
 ):
     sys.modules.setdefault(_mod, MagicMock())
 
-from tit.pre.structural import _run_step, _run_subject_pipeline, run_pipeline
+from tit.pre.structural import (
+    _run_step,
+    _should_run_output_step,
+    _subject_steps,
+    run_pipeline,
+)
 from tit.pre.preflight import PreprocessingOutput
+from tit.pre.scheduler import PipelineStep
 from tit.pre.utils import PreprocessError, CommandRunner
 
 STRUCTURAL = "tit.pre.structural"
 REPORTING = "tit.reporting"
 
 
+@pytest.fixture(autouse=True)
+def _no_state_file():
+    """The mocked path manager has no real log directory for scheduler state.
+
+    StepScheduler's state file is covered in test_pre_scheduler.py.
+    """
+    with patch(f"{STRUCTURAL}._pipeline_state_file", return_value=None):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _no_stage_cache():
+    """Likewise for the per-subject stage cache, covered in test_stage_cache.py."""
+    with patch(f"{STRUCTURAL}.subject_stage_cache", return_value=None):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _no_trace():
+    """Likewise for the run's trace file, covered in test_tracing.py."""
+    with patch(f"{STRUCTURAL}.start_trace"):
+        yield
+
+
 @pytest.fixture(autouse=True)
 def _stub_bidsignore():
     """These tests mock the path manager, so the project root is not a real path.
@@ -87,7 +119,7 @@ def dummy_report():
 
 @pytest.fixture
 def pipeline_mocks():
-    """Provide common mocks for _run_subject_pipeline tests."""
+    """Provide common mocks for run_pipeline tests."""
     with (
         patch(f"{STRUCTURAL}.get_path_manager") as mock_pm,
         patch(f"{STRUCTURAL}.ensure_subject_dirs") as mock_dirs,
@@ -168,48 +200,31 @@ class TestRunStep:
 
 
 # ---------------------------------------------------------------------------
-# _run_subject_pipeline — individual step flags
+# run_pipeline — individual step flags for one subject
 # ---------------------------------------------------------------------------
 
 
-class TestRunSubjectPipeline:
-    """Tests for _run_subject_pipeline step dispatch."""
-
-    def _call(self, mocks, **overrides):
-        defaults = dict(
-            convert_dicom=False,
-            run_recon=False,
-            parallel_recon=False,
-            create_m2m=False,
-            run_tissue=False,
-            run_qsiprep_step=False,
-            run_qsirecon_step=False,
-            qsiprep_config=None,
-            qsi_recon_config=None,
-            extract_dti_step=False,
-            run_subcortical=False,
-            runner=MagicMock(),
-            callback=None,
-            skip_existing_outputs=False,
-            replace_existing_outputs=False,
-        )
-        defaults.update(overrides)
-        _run_subject_pipeline("/proj", "001", **defaults)
+class TestRunPipelineSteps:
+    """Tests for step dispatch through the scheduler for a single subject."""
+
+    def _call(self, mocks, **flags):
+        with patch(f"{REPORTING}.PreprocessingReportGenerator", DummyReportGen):
+            return run_pipeline(["001"], runner=_make_runner(), **flags)
 
     def test_qsiprep_step(self, pipeline_mocks):
-        self._call(pipeline_mocks, run_qsiprep_step=True)
+        self._call(pipeline_mocks, run_qsiprep=True)
         pipeline_mocks["qsiprep"].assert_called_once()
 
     def test_qsirecon_step(self, pipeline_mocks):
-        self._call(pipeline_mocks, run_qsirecon_step=True)
+        self._call(pipeline_mocks, run_qsirecon=True)
         pipeline_mocks["qsirecon"].assert_called_once()
 
     def test_extract_dti_step(self, pipeline_mocks):
-        self._call(pipeline_mocks, extract_dti_step=True)
+        self._call(pipeline_mocks, extract_dti=True)
         pipeline_mocks["dti"].assert_called_once()
 
     def test_subcortical_step(self, pipeline_mocks):
-        self._call(pipeline_mocks, run_subcortical=True)
+        self._call(pipeline_mocks, run_subcortical_segmentations=True)
         pipeline_mocks["subcort"].assert_called_once()
 
     def test_recon_only_path(self, pipeline_mocks):
@@ -233,7 +248,7 @@ class TestRunSubjectPipeline:
     def test_qsirecon_config_passed(self, pipeline_mocks):
         """qsi_recon_config dict is threaded through to run_qsirecon."""
         cfg = {"recon_specs": ["dipy_dki"], "atlases": ["AAL116"], "use_gpu": True}
-        self._call(pipeline_mocks, run_qsirecon_step=True, qsi_recon_config=cfg)
+        self._call(pipeline_mocks, run_qsirecon=True, qsi_recon_config=cfg)
         pipeline_mocks["qsirecon"].assert_called_once()
         kw = pipeline_mocks["qsirecon"].call_args
         assert kw.kwargs.get("recon_specs") == ["dipy_dki"]
@@ -295,6 +310,17 @@ class TestRunSubjectPipeline:
         pipeline_mocks["charm"].assert_called_once()
         pipeline_mocks["atlas"].assert_called_once()
 
+    def test_completed_step_reruns_when_outputs_are_gone(
+        self, pipeline_mocks, tmp_path
+    ):
+        """The scheduler state file alone never marks a step as done."""
+        state_file = str(tmp_path / "preprocess_state.json")
+        with patch(f"{STRUCTURAL}._pipeline_state_file", return_value=state_file):
+            self._call(pipeline_mocks, create_m2m=True, skip_existing_outputs=True)
+            self._call(pipeline_mocks, create_m2m=True, skip_existing_outputs=True)
+
+        assert pipeline_mocks["charm"].call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # run_pipeline — parallel_recon path (lines 298-409)
@@ -304,24 +330,9 @@ class TestRunSubjectPipeline:
 class TestRunPipelineParallelRecon:
     """Tests for the parallel_recon=True branch of run_pipeline."""
 
-    def _setup_executor(self, mock_executor_cls, mock_as_completed, n_subjects=2):
-        mock_ctx = MagicMock()
-        mock_executor_cls.return_value.__enter__ = MagicMock(return_value=mock_ctx)
-        mock_executor_cls.return_value.__exit__ = MagicMock(return_value=False)
-        mock_future = MagicMock()
-        mock_future.result.return_value = {}
-        mock_ctx.submit.return_value = mock_future
-        mock_as_completed.return_value = [mock_future] * n_subjects
-        return mock_ctx
-
-    def test_parallel_recon_dispatches_phases(self, pipeline_mocks, dummy_report):
-        """parallel_recon=True with 2 subjects uses ThreadPoolExecutor."""
-        with (
-            patch(f"{STRUCTURAL}.ThreadPoolExecutor") as mock_exec,
-            patch(f"{STRUCTURAL}.as_completed") as mock_ac,
-            patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report),
-        ):
-            self._setup_executor(mock_exec, mock_ac)
+    def test_parallel_recon_runs_every_subject(self, pipeline_mocks, dummy_report):
+        """parallel_recon=True runs single-threaded recon-all for each subject."""
+        with patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report):
             result = run_pipeline(
                 ["001", "002"],
                 run_recon=True,
@@ -329,16 +340,16 @@ class TestRunPipelineParallelRecon:
                 runner=_make_runner(),
             )
         assert result == 0
-        assert mock_exec.called
+        subjects = sorted(c.args[1] for c in pipeline_mocks["recon"].call_args_list)
+        assert subjects == ["001", "002"]
+        assert all(
+            c.kwargs["parallel"] is False
+            for c in pipeline_mocks["recon"].call_args_list
+        )
 
     def test_parallel_recon_with_tissue_analysis(self, pipeline_mocks, dummy_report):
-        """Tissue analysis runs after parallel recon."""
-        with (
-            patch(f"{STRUCTURAL}.ThreadPoolExecutor") as mock_exec,
-            patch(f"{STRUCTURAL}.as_completed") as mock_ac,
-            patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report),
-        ):
-            self._setup_executor(mock_exec, mock_ac)
+        """Tissue analysis runs alongside parallel recon."""
+        with patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report):
             result = run_pipeline(
                 ["001", "002"],
                 run_recon=True,
@@ -347,16 +358,11 @@ class TestRunPipelineParallelRecon:
                 runner=_make_runner(),
             )
         assert result == 0
-        pipeline_mocks["tissue"].assert_called()
+        assert pipeline_mocks["tissue"].call_count == 2
 
     def test_parallel_recon_with_qsi_steps(self, pipeline_mocks, dummy_report):
-        """QSI steps run after parallel recon."""
-        with (
-            patch(f"{STRUCTURAL}.ThreadPoolExecutor") as mock_exec,
-            patch(f"{STRUCTURAL}.as_completed") as mock_ac,
-            patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report),
-        ):
-            self._setup_executor(mock_exec, mock_ac)
+        """QSI steps run with parallel recon."""
+        with patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report):
             result = run_pipeline(
                 ["001", "002"],
                 run_recon=True,
@@ -372,13 +378,8 @@ class TestRunPipelineParallelRecon:
         pipeline_mocks["dti"].assert_called()
 
     def test_parallel_recon_with_subcortical(self, pipeline_mocks, dummy_report):
-        """Subcortical segmentations run after parallel recon."""
-        with (
-            patch(f"{STRUCTURAL}.ThreadPoolExecutor") as mock_exec,
-            patch(f"{STRUCTURAL}.as_completed") as mock_ac,
-            patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report),
-        ):
-            self._setup_executor(mock_exec, mock_ac)
+        """Subcortical segmentations run after recon-all."""
+        with patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report):
             result = run_pipeline(
                 ["001", "002"],
                 run_recon=True,
@@ -387,24 +388,70 @@ class TestRunPipelineParallelRecon:
                 runner=_make_runner(),
             )
         assert result == 0
-        pipeline_mocks["subcort"].assert_called()
+        assert pipeline_mocks["subcort"].call_count == 2
 
     def test_parallel_recon_uses_parallel_cores(self, pipeline_mocks, dummy_report):
-        """parallel_cores caps ThreadPoolExecutor workers."""
+        """parallel_cores is the scheduler's core budget."""
         with (
-            patch(f"{STRUCTURAL}.ThreadPoolExecutor") as mock_exec,
-            patch(f"{STRUCTURAL}.as_completed") as mock_ac,
+            patch(f"{STRUCTURAL}.StepScheduler") as mock_scheduler,
             patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report),
         ):
-            self._setup_executor(mock_exec, mock_ac)
+            mock_scheduler.return_value.run.return_value = {}
             run_pipeline(
                 ["001", "002"],
-                run_recon=True,
                 parallel_recon=True,
                 parallel_cores=2,
                 runner=_make_runner(),
             )
-        mock_exec.assert_called_once_with(max_workers=2)
+        kwargs = mock_scheduler.call_args.kwargs
+        assert kwargs["cpus"] == 2
+        assert kwargs["max_concurrent"] is None
+
+    def test_sequential_without_parallel_recon(self, pipeline_mocks, dummy_report):
+        """Without parallel_recon steps run one at a time in subject order."""
+        order = []
+        pipeline_mocks["dicom"].side_effect = lambda p, sid, **kw: order.append(
+            ("dicom", sid)
+        )
+        pipeline_mocks["recon"].side_effect = lambda p, sid, **kw: order.append(
+            ("recon", sid)
+        )
+        with patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report):
+            run_pipeline(
+                ["001", "002"],
+                convert_dicom=True,
+                run_recon=True,
+                runner=_make_runner(),
+            )
+        assert order == [
+            ("dicom", "001"),
+            ("recon", "001"),
+            ("dicom", "002"),
+            ("recon", "002"),
+        ]
+
+    def test_failed_step_blocks_only_its_dependents(
+        self, pipeline_mocks, dummy_report
+    ):
+        """A failing charm skips that subject's tissue analysis, not others."""
+        pipeline_mocks["charm"].side_effect = lambda p, sid, **kw: (
+            (_ for _ in ()).throw(PreprocessError("charm failed"))
+            if sid == "001"
+            else None
+        )
+        with (
+            patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report),
+            pytest.raises(PreprocessError, match="charm failed"),
+        ):
+            run_pipeline(
+                ["001", "002"],
+                create_m2m=True,
+                run_tissue_analysis=True,
+                parallel_recon=True,
+                runner=_make_runner(),
+            )
+        tissue_subjects = [c.args[1] for c in pipeline_mocks["tissue"].call_args_list]
+        assert tissue_subjects == ["002"]
 
 
 # ---------------------------------------------------------------------------
@@ -415,12 +462,13 @@ class TestRunPipelineParallelRecon:
 class TestRunPipelineReports:
     """Tests for report generation at the end of run_pipeline."""
 
-    @patch(f"{STRUCTURAL}._run_subject_pipeline")
+    @patch(f"{STRUCTURAL}.build_logger")
+    @patch(f"{STRUCTURAL}._subject_steps", return_value=[])
     @patch(f"{STRUCTURAL}.ensure_dataset_descriptions")
     @patch(f"{STRUCTURAL}.ensure_subject_dirs")
     @patch(f"{STRUCTURAL}.get_path_manager")
     def test_scaffolds_bidsignore_once_per_run(
-        self, mock_pm, mock_dirs, mock_datasets, mock_run_sub, dummy_report
+        self, mock_pm, mock_dirs, mock_datasets, mock_steps, mock_logger, dummy_report
     ):
         """CT output needs .bidsignore, so the pipeline must write it."""
         from tit.pre import structural
@@ -433,12 +481,13 @@ class TestRunPipelineReports:
 
         structural.ensure_bidsignore.assert_called_once()
 
-    @patch(f"{STRUCTURAL}._run_subject_pipeline")
+    @patch(f"{STRUCTURAL}.build_logger")
+    @patch(f"{STRUCTURAL}._subject_steps", return_value=[])
     @patch(f"{STRUCTURAL}.ensure_dataset_descriptions")
     @patch(f"{STRUCTURAL}.ensure_subject_dirs")
     @patch(f"{STRUCTURAL}.get_path_manager")
     def test_report_generated_for_each_subject(
-        self, mock_pm, mock_dirs, mock_datasets, mock_run_sub, dummy_report
+        self, mock_pm, mock_dirs, mock_datasets, mock_steps, mock_logger, dummy_report
     ):
         with patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report):
             result = run_pipeline(
@@ -451,26 +500,30 @@ class TestRunPipelineReports:
         assert all(inst.generated for inst in dummy_report.instances)
         assert all(inst.scanned for inst in dummy_report.instances)
 
-    @patch(f"{STRUCTURAL}._run_subject_pipeline")
+    @patch(f"{STRUCTURAL}.build_logger")
+    @patch(f"{STRUCTURAL}._subject_steps", return_value=[])
     @patch(f"{STRUCTURAL}.ensure_dataset_descriptions")
     @patch(f"{STRUCTURAL}.ensure_subject_dirs")
     @patch(f"{STRUCTURAL}.get_path_manager")
     def test_report_includes_dicom_step(
-        self, mock_pm, mock_dirs, mock_datasets, mock_run_sub, dummy_report
+        self, mock_pm, mock_dirs, mock_datasets, mock_steps, mock_logger, dummy_report
     ):
         with patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report):
             run_pipeline(["001"], convert_dicom=True, runner=_make_runner())
         step_names = [s["step_name"] for s in dummy_report.instances[0].steps]
         assert "DICOM Conversion" in step_names
 
-    @patch(f"{STRUCTURAL}._run_subject_pipeline")
+    @patch(f"{STRUCTURAL}.build_logger")
+    @patch(f"{STRUCTURAL}._subject_steps", return_value=[])
     @patch(f"{STRUCTURAL}.ensure_dataset_descriptions")
     @patch(f"{STRUCTURAL}.ensure_subject_dirs")
     @patch(f"{STRUCTURAL}.get_path_manager")
     def test_report_marks_skipped_step(
-        self, mock_pm, mock_dirs, mock_datasets, mock_run_sub, dummy_report
+        self, mock_pm, mock_dirs, mock_datasets, mock_steps, mock_logger, dummy_report
     ):
-        mock_run_sub.return_value = {"DICOM Conversion": None}
+        mock_steps.side_effect = lambda project_dir, sid, **kw: [
+            PipelineStep("DICOM Conversion", sid, lambda attempt: None)
+        ]
         with patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report):
             run_pipeline(["001"], convert_dicom=True, runner=_make_runner())
 
@@ -478,12 +531,13 @@ class TestRunPipelineReports:
         assert step["step_name"] == "DICOM Conversion"
         assert step["status"] == "skipped"
 
-    @patch(f"{STRUCTURAL}._run_subject_pipeline")
+    @patch(f"{STRUCTURAL}.build_logger")
+    @patch(f"{STRUCTURAL}._subject_steps", return_value=[])
     @patch(f"{STRUCTURAL}.ensure_dataset_descriptions")
     @patch(f"{STRUCTURAL}.ensure_subject_dirs")
     @patch(f"{STRUCTURAL}.get_path_manager")
     def test_report_includes_charm_steps(
-        self, mock_pm, mock_dirs, mock_datasets, mock_run_sub, dummy_report
+        self, mock_pm, mock_dirs, mock_datasets, mock_steps, mock_logger, dummy_report
     ):
         with patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report):
             run_pipeline(["001"], create_m2m=True, runner=_make_runner())
@@ -491,12 +545,13 @@ class TestRunPipelineReports:
         assert "SimNIBS charm" in step_names
         assert "Subject Atlas Segmentation" in step_names
 
-    @patch(f"{STRUCTURAL}._run_subject_pipeline")
+    @patch(f"{STRUCTURAL}.build_logger")
+    @patch(f"{STRUCTURAL}._subject_steps", return_value=[])
     @patch(f"{STRUCTURAL}.ensure_dataset_descriptions")
     @patch(f"{STRUCTURAL}.ensure_subject_dirs")
     @patch(f"{STRUCTURAL}.get_path_manager")
     def test_report_includes_all_steps(
-        self, mock_pm, mock_dirs, mock_datasets, mock_run_sub, dummy_report
+        self, mock_pm, mock_dirs, mock_datasets, mock_steps, mock_logger, dummy_report
     ):
         with patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report):
             run_pipeline(
@@ -522,12 +577,13 @@ class TestRunPipelineReports:
         assert "DTI Tensor Extraction" in step_names
         assert "Subcortical Segmentations" in step_names
 
-    @patch(f"{STRUCTURAL}._run_subject_pipeline")
+    @patch(f"{STRUCTURAL}.build_logger")
+    @patch(f"{STRUCTURAL}._subject_steps", return_value=[])
     @patch(f"{STRUCTURAL}.ensure_dataset_descriptions")
     @patch(f"{STRUCTURAL}.ensure_subject_dirs")
     @patch(f"{STRUCTURAL}.get_path_manager")
     def test_report_logger_callback_called(
-        self, mock_pm, mock_dirs, mock_datasets, mock_run_sub, dummy_report
+        self, mock_pm, mock_dirs, mock_datasets, mock_steps, mock_logger, dummy_report
     ):
         callback = MagicMock()
         with patch(f"{REPORTING}.PreprocessingReportGenerator", dummy_report):
@@ -549,12 +605,13 @@ class TestRunPipelineReports:
 class TestRunPipelineRunnerStopEvent:
     """Test runner stop_event handling."""
 
-    @patch(f"{STRUCTURAL}._run_subject_pipeline")
+    @patch(f"{STRUCTURAL}.build_logger")
+    @patch(f"{STRUCTURAL}._subject_steps", return_value=[])
     @patch(f"{STRUCTURAL}.ensure_dataset_descriptions")
     @patch(f"{STRUCTURAL}.ensure_subject_dirs")
     @patch(f"{STRUCTURAL}.get_path_manager")
     def test_stop_event_reassigned_to_runner(
-        self, mock_pm, mock_dirs, mock_datasets, mock_run_sub, dummy_report
+        self, mock_pm, mock_dirs, mock_datasets, mock_steps, mock_logger, dummy_report
     ):
         runner = MagicMock(spec=CommandRunner)
         runner.stop_event = MagicMock()
@@ -620,3 +677,103 @@ class TestRunPipelineValidation:
                 run_pipeline(["001"], create_m2m=True)
 
         mock_track_event.assert_not_called()
+
+
+class TestOutputStepCacheStatus:
+    """Stage-cache status overrides the existing-output policy."""
+
+    def _decide(self, tmp_path, cache_status, **policy):
+        output_dir = tmp_path / "m2m_001"
+        output_dir.mkdir(exist_ok=True)
+        output = PreprocessingOutput(
+            subject_id="001", step="charm", label="SimNIBS charm", path=output_dir
+        )
+        with patch(f"{STRUCTURAL}.existing_outputs_for_step", return_value=[output]):
+            run = _should_run_output_step(
+                str(tmp_path),
+                "001",
+                "charm",
+                logger=MagicMock(),
+                skip_existing_outputs=policy.get("skip", False),
+                replace_existing_outputs=policy.get("replace", False),
+                cache_status=cache_status,
+            )
+        return run, output_dir.exists()
+
+    def test_hit_reuses_outputs_without_skip_policy(self, tmp_path):
+        assert self._decide(tmp_path, "hit") == (False, True)
+
+    def test_changed_replaces_outputs_despite_skip_policy(self, tmp_path):
+        assert self._decide(tmp_path, "changed", skip=True) == (True, False)
+
+    def test_replace_policy_wins_over_hit(self, tmp_path):
+        assert self._decide(tmp_path, "hit", replace=True) == (True, False)
+
+    def test_unknown_outputs_follow_policy(self, tmp_path):
+        assert self._decide(tmp_path, "new", skip=True) == (False, True)
+        with pytest.raises(PreprocessError, match="already exists"):
+            self._decide(tmp_path, "new")
+
+
+# ---------------------------------------------------------------------------
+# Stage-cache products
+# ---------------------------------------------------------------------------
+
+
+class TestSubcorticalStageProducts:
+    """Subcortical segmentations are cached on their own output volumes."""
+
+    def _run(self, tmp_path, cache, segment):
+        pm = MagicMock()
+        pm.freesurfer_mri.return_value = str(tmp_path / "mri")
+        with (
+            patch(f"{STRUCTURAL}.get_path_manager", return_value=pm),
+            patch(
+                f"{STRUCTURAL}.run_subcortical_segmentations", side_effect=segment
+            ),
+        ):
+            (step,) = _subject_steps(
+                str(tmp_path),
+                "001",
+                runner=MagicMock(),
+                logger=MagicMock(),
+                run_subcortical=True,
+                cache=cache,
+            )
+            return step.run(1)
+
+    def test_records_segmentation_files(self, tmp_path):
+        from tit.pre.recon_all import SUBCORTICAL_SEGMENTATION_FILES
+        from tit.stage_cache import StageCache
+
+        mri = tmp_path / "mri"
+        mri.mkdir()
+        (mri / "aseg.mgz").write_text("aseg")
+        cache = StageCache(tmp_path / "manifest.json", root=tmp_path)
+        calls = []
+
+        def segment(*args, **kwargs):
+            calls.append(1)
+            for name in SUBCORTICAL_SEGMENTATION_FILES:
+                (mri / name).write_text("labels")
+
+        self._run(tmp_path, cache, segment)
+        assert sorted(cache.entry("subcortical")["outputs"]) == sorted(
+            f"mri/{name}" for name in SUBCORTICAL_SEGMENTATION_FILES
+        )
+        assert self._run(tmp_path, cache, segment) is None
+        assert calls == [1]
+
+        (mri / SUBCORTICAL_SEGMENTATION_FILES[0]).unlink()
+        self._run(tmp_path, cache, segment)
+        assert calls == [1, 1]
+
+    def test_failed_segmentation_is_not_cached(self, tmp_path):
+        from tit.stage_cache import StageCache
+
+        (tmp_path / "mri").mkdir()
+        (tmp_path / "mri" / "aseg.mgz").write_text("aseg")
+        cache = StageCache(tmp_path / "manifest.json", root=tmp_path)
+
+        self._run(tmp_path, cache, lambda *a, **kw: None)
+        assert cache.entry("subcortical") is None
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Tests for tit/pre/scheduler.py — dependency-graph step scheduling.
+
+Covers:
+- Dependency order derived from step inputs/outputs
+- Cross-subject overlap under a CPU budget
+- Retries, blocked dependents and error propagation
+- State file as a record, never a reason to skip a step
+- Graph validation (duplicates, cycles)
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from tit.pre.scheduler import PipelineStep, StepScheduler
+from tit.pre.utils import PreprocessCancelled, PreprocessError
+
+
+def _recorder(log, name, value=None, delay=0.0):
+    def run(attempt):
+        log.append(("start", name))
+        if delay:
+            time.sleep(delay)
+        log.append(("end", name))
+        return value
+
+    return run
+
+
+class TestDependencies:
+    def test_runs_producers_before_consumers(self):
+        log = []
+        steps = [
+            PipelineStep("tissue", "001", _recorder(log, "tissue"), inputs=("m2m",)),
+            PipelineStep(
+                "charm",
+                "001",
+                _recorder(log, "charm"),
+                inputs=("nifti",),
+                outputs=("m2m",),
+            ),
+            PipelineStep("dicom", "001", _recorder(log, "dicom"), outputs=("nifti",)),
+        ]
+        StepScheduler(steps, cpus=4).run()
+        ends = [name for event, name in log if event == "end"]
+        assert ends.index("dicom") < ends.index("charm") < ends.index("tissue")
+
+    def test_dependencies_are_per_subject(self):
+        steps = [
+            PipelineStep("charm", "001", lambda a: None, outputs=("m2m",)),
+            PipelineStep("tissue", "002", lambda a: None, inputs=("m2m",)),
+        ]
+        scheduler = StepScheduler(steps)
+        assert scheduler.dependencies["sub-002/tissue"] == set()
+
+    def test_unproduced_inputs_are_assumed_present(self):
+        steps = [PipelineStep("tissue", "001", lambda a: "ok", inputs=("m2m",))]
+        results = StepScheduler(steps).run()
+        assert results["sub-001/tissue"].status == "completed"
+        assert results["sub-001/tissue"].value == "ok"
+
+
+class TestResources:
+    def test_overlaps_subjects_within_budget(self):
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def run(attempt):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        steps = [PipelineStep("charm", sid, run, cpus=2) for sid in "ABC"]
+        StepScheduler(steps, cpus=4).run()
+        assert peak[0] == 2
+
+    def test_max_concurrent_one_runs_in_order(self):
+        log = []
+        steps = [
+            PipelineStep(name, "001", _recorder(log, name, delay=0.01))
+            for name in ("a", "b", "c")
+        ]
+        StepScheduler(steps, cpus=8, max_concurrent=1).run()
+        assert log == [
+            ("start", "a"),
+            ("end", "a"),
+            ("start", "b"),
+            ("end", "b"),
+            ("start", "c"),
+            ("end", "c"),
+        ]
+
+    def test_oversized_step_still_runs(self):
+        steps = [PipelineStep("recon", "001", lambda a: 1, cpus=16, memory_gb=64)]
+        results = StepScheduler(steps, cpus=2, memory_gb=8).run()
+        assert results["sub-001/recon"].status == "completed"
+
+
+class TestFailures:
+    def test_retries_failed_step(self):
+        attempts = []
+
+        def flaky(attempt):
+            attempts.append(attempt)
+            if attempt < 3:
+                raise RuntimeError("transient")
+            return "done"
+
+        steps = [PipelineStep("charm", "001", flaky, retries=2)]
+        result = StepScheduler(steps).run()["sub-001/charm"]
+        assert attempts == [1, 2, 3]
+        assert result.status == "completed"
+        assert result.attempts == 3
+
+    def test_failure_blocks_dependents_only(self, tmp_path):
+        log = []
+
+        def fail(attempt):
+            raise PreprocessError("charm failed")
+
+        steps = [
+            PipelineStep("charm", "001", fail, outputs=("m2m",)),
+            PipelineStep("tissue", "001", _recorder(log, "t1"), inputs=("m2m",)),
+            PipelineStep("tissue", "002", _recorder(log, "t2"), inputs=("m2m",)),
+        ]
+        state_file = tmp_path / "state.json"
+        with pytest.raises(PreprocessError, match="charm failed"):
+            StepScheduler(steps, state_file=str(state_file)).run()
+        assert ("end", "t2") in log
+        assert ("start", "t1") not in log
+        state = json.loads(state_file.read_text())["steps"]
+        assert state["sub-001/charm"]["status"] == "failed"
+        assert state["sub-001/tissue"]["status"] == "blocked"
+        assert state["sub-002/tissue"]["status"] == "completed"
+
+    def test_multiple_failures_are_listed(self):
+        def fail(attempt):
+            raise RuntimeError("boom")
+
+        steps = [PipelineStep("charm", sid, fail) for sid in ("001", "002")]
+        with pytest.raises(PreprocessError, match="2 preprocessing steps failed"):
+            StepScheduler(steps).run()
+
+    def test_stop_event_cancels(self):
+        stop = threading.Event()
+
+        def first(attempt):
+            stop.set()
+
+        log = []
+        steps = [
+            PipelineStep("a", "001", first, outputs=("x",)),
+            PipelineStep("b", "001", _recorder(log, "b"), inputs=("x",)),
+        ]
+        with pytest.raises(PreprocessCancelled):
+            StepScheduler(steps, stop_event=stop).run()
+        assert log == []
+
+
+class TestStateFile:
+    def test_completed_steps_rerun(self, tmp_path):
+        state_file = tmp_path / "state.json"
+        calls = []
+
+        def run(attempt):
+            calls.append(attempt)
+            return 12.5
+
+        steps = [PipelineStep("charm", "001", run)]
+        StepScheduler(steps, state_file=str(state_file)).run()
+        results = StepScheduler(steps, state_file=str(state_file)).run()
+
+        assert calls == [1, 1]
+        assert results["sub-001/charm"].status == "completed"
+        state = json.loads(state_file.read_text())["steps"]
+        assert state["sub-001/charm"]["value"] == 12.5
+
+
+class TestValidation:
+    def test_duplicate_step_rejected(self):
+        steps = [PipelineStep("charm", "001", lambda a: None)] * 2
+        with pytest.raises(PreprocessError, match="Duplicate"):
+            StepScheduler(steps)
+
+    def test_cycle_rejected(self):
+        steps = [
+            PipelineStep("a", "001", lambda a: None, inputs=("y",), outputs=("x",)),
+            PipelineStep("b", "001", lambda a: None, inputs=("x",), outputs=("y",)),
+        ]
+        with pytest.raises(PreprocessError, match="depend on each other"):
+            StepScheduler(steps)
@@ -303,6 +303,53 @@ class TestCreateThicknessFigure:
         # With mocked matplotlib, this should still work (returns the path)
 
 
+class TestFigureSpecs:
+    """Tests for the deferred figure specs."""
+
+    def test_thickness_spec(self, mock_nii_image, tmp_path):
+        from tit.pre.tissue_analyzer import TissueAnalyzer
+
+        analyzer = TissueAnalyzer(
+            tmp_path / "label.nii.gz", tmp_path / "out", "csf", MagicMock()
+        )
+        filtered = np.zeros((10, 10, 10), dtype=np.uint8)
+        filtered[3:7, 3:7, 3:7] = 1
+        thickness_map = np.arange(1000, dtype=float).reshape(10, 10, 10)
+        stats = {"mean": 2.0, "std": 0.5, "min": 1.0, "max": 3.0}
+
+        spec = analyzer._thickness_figure_spec(
+            filtered, {**stats, "thickness_map": thickness_map}
+        )
+
+        assert spec.output == tmp_path / "out" / "csf_thickness"
+        assert spec.arrays["axial"].shape == (10, 10)
+        assert np.isnan(spec.arrays["axial"][0, 0])
+        assert spec.arrays["axial"][3, 3] == thickness_map[3, 3, 5]
+        widths = np.diff(spec.arrays["hist_edges"])
+        assert np.sum(spec.arrays["hist_counts"] * widths) == pytest.approx(1.0)
+        assert spec.meta["voxels"] == 64
+
+    def test_methodology_spec_images(self, mock_nii_image, tmp_path):
+        from tit.pre.tissue_analyzer import TissueAnalyzer
+
+        analyzer = TissueAnalyzer(
+            tmp_path / "label.nii.gz", tmp_path / "out", "csf", MagicMock()
+        )
+        tissue = (analyzer.data == 4).astype(np.uint8)
+        brain = (analyzer.data == 3).astype(np.uint8)
+        filtered = np.zeros_like(tissue)
+
+        spec = analyzer._methodology_figure_spec(tissue, brain, filtered)
+
+        assert spec.meta["kept_pct"] == 0
+        assert spec.meta["z_threshold"] == 4 - 40
+        reference = spec.arrays["axial_reference"]
+        extraction = spec.arrays["axial_extraction"]
+        np.testing.assert_allclose(reference[3, 3], [0, 0, 1])  # CSF
+        np.testing.assert_allclose(reference[4, 4], [0.5, 0.5, 0.5])  # cortex
+        np.testing.assert_allclose(extraction[3, 3], [0, 0, 0.3])  # excluded
+
+
 class TestCreateMethodologyFigure:
     """Tests for _create_methodology_figure."""
 
@@ -502,9 +549,12 @@ class TestRunTissueAnalysis:
         with pytest.raises(PreprocessError, match="not found"):
             run_tissue_analysis("/proj", "001", logger=MagicMock())
 
+    @patch(f"{MODULE}.TissueAnalysisContext")
     @patch(f"{MODULE}.TissueAnalyzer")
     @patch(f"{MODULE}.get_path_manager")
-    def test_analyzes_all_tissues(self, mock_gpm, mock_analyzer_cls, tmp_path):
+    def test_analyzes_all_tissues(
+        self, mock_gpm, mock_analyzer_cls, mock_context_cls, tmp_path
+    ):
         from tit.pre.tissue_analyzer import run_tissue_analysis
 
         pm = MagicMock()
@@ -540,3 +590,118 @@ class TestRunTissueAnalysis:
 
         logger.warning.assert_called()
         assert result == {}
+
+    @patch(f"{MODULE}.get_path_manager")
+    def test_shares_one_context(
+        self, mock_gpm, mock_nii_image, mock_nib, tmp_path, monkeypatch
+    ):
+        from tit.pre.tissue_analyzer import run_tissue_analysis
+
+        monkeypatch.setattr(
+            f"{MODULE}.ndimage.distance_transform_edt",
+            lambda m, sampling: m.astype(float),
+        )
+
+        pm = MagicMock()
+        label_path = tmp_path / "label.nii.gz"
+        label_path.touch()
+        pm.tissue_labeling.return_value = str(label_path)
+        pm.ensure.return_value = str(tmp_path / "output")
+        mock_gpm.return_value = pm
+        mock_nib.load.reset_mock()
+
+        with patch(f"{MODULE}.render_figures") as mock_render:
+            result = run_tissue_analysis(
+                "/proj", "001", tissues=["bone", "csf"], logger=MagicMock(), n_jobs=2
+            )
+
+        mock_nib.load.assert_called_once()
+        # Figures are deferred: both csf figures rendered in one batch
+        specs, fidelity = mock_render.call_args.args
+        assert [s.output.name for s in specs] == ["csf_thickness", "csf_methodology"]
+        assert fidelity == "publication"
+        assert result["bone"]["volume_cm3"] == 0
+        assert result["csf"]["voxels"]["total"] == 64 - 8
+
+
+def _label_volume():
+    rng = np.random.default_rng(0)
+    labels = np.array([0, 3, 4, 16, 24, 42, 511, 515, 516, 520])
+    return rng.choice(labels, size=(30, 30, 30)).astype(np.float64)
+
+
+class TestTissueAnalysisContext:
+    """Tests for the shared lookup-table masks and crop."""
+
+    def _context(self, mock_nib, data, tmp_path, tissues=("bone", "csf", "skin")):
+        from tit.pre.tissue_analyzer import TissueAnalysisContext
+
+        img = MagicMock()
+        img.get_fdata.return_value = data
+        img.header.get_zooms.return_value = (1.0, 1.0, 1.0)
+        mock_nib.load.return_value = img
+        return TissueAnalysisContext(tmp_path / "label.nii.gz", MagicMock(), tissues)
+
+    def test_masks_match_label_comparisons(self, mock_nib, tmp_path):
+        from tit.pre.tissue_analyzer import TISSUE_CONFIGS
+
+        data = _label_volume()
+        context = self._context(mock_nib, data, tmp_path)
+
+        for config in TISSUE_CONFIGS.values():
+            for labels in (config["labels"], config["brain_labels"]):
+                mask = context.mask(labels)
+                assert mask.dtype == np.uint8
+                np.testing.assert_array_equal(mask, np.isin(data, labels))
+        np.testing.assert_array_equal(context.mask([24, 42]), np.isin(data, [24, 42]))
+        assert context.label_count(511) == int(np.sum(data == 511))
+        assert context.label_count(999) == 0
+
+    def test_region_matches_filter(self, mock_nib, tmp_path, monkeypatch):
+        from tit.pre.tissue_analyzer import TissueAnalyzer
+
+        monkeypatch.setattr(
+            f"{MODULE}.ndimage.distance_transform_edt",
+            lambda m, sampling: m.astype(float),
+        )
+
+        data = np.full((80, 80, 80), 515.0)
+        data[35:45, 36:42, 38:46] = 3
+        context = self._context(mock_nib, data, tmp_path, tissues=("bone",))
+
+        analyzer = TissueAnalyzer(
+            tmp_path / "label.nii.gz", tmp_path / "out", "bone", MagicMock(), context
+        )
+        tissue = analyzer._create_tissue_mask()
+        expected = analyzer._filter_to_brain_region(
+            tissue, analyzer._create_brain_mask()
+        )
+        measured = analyzer.measure()
+
+        assert context.crop[0] == slice(4, 75)
+        np.testing.assert_array_equal(measured["filtered_mask"], expected)
+        assert measured["voxels"]["filtered"] == int(expected.sum())
+        # The cropped thickness map is placed back into the full volume
+        np.testing.assert_array_equal(
+            measured["thickness_stats"]["thickness_map"], expected * 2.0
+        )
+
+    def test_crop_covers_regions_with_margin(self, mock_nib, tmp_path):
+        data = np.zeros((200, 200, 200))
+        data[80:120, 90:110, 100:140] = 3
+        context = self._context(mock_nib, data, tmp_path, tissues=("bone", "csf"))
+
+        # csf has the largest padding (40); z starts at center - padding
+        assert context.crop == (slice(39, 160), slice(49, 150), slice(78, 180))
+        assert context.region(30, [3, 42, 16]) == (
+            slice(50, 149),
+            slice(60, 139),
+            slice(89, 169),
+        )
+
+    def test_no_brain_crops_nothing(self, mock_nib, tmp_path):
+        data = np.full((8, 8, 8), 515.0)
+        context = self._context(mock_nib, data, tmp_path)
+
+        assert context.region(30, [3, 42, 16]) is None
+        assert context.crop == (slice(0, 8), slice(0, 8), slice(0, 8))
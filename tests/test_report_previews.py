@@ -66,6 +66,9 @@ def _maybe_copy_preview(report_path: Path) -> Path | None:
     preview_dir.mkdir(parents=True, exist_ok=True)
     destination = preview_dir / report_path.name
     shutil.copy2(report_path, destination)
+    assets = report_path.parent / "assets"
+    if assets.is_dir():
+        shutil.copytree(assets, preview_dir / "assets", dirs_exist_ok=True)
     print(f"Report preview written to: {destination.resolve()}")
     return destination
 
@@ -178,6 +181,8 @@ def test_generate_visualizable_simulation_report_preview(tmp_path):
     assert "Simulation Overview" in html
     assert "Machine-Readable Provenance" in html
     assert "https://doi.org/10.1016/j.cell.2017.05.024" in html
+    assert "data:image/png;base64" not in html
+    assert len(list((tmp_path / "assets").glob("*.png"))) == 2
     assert not list(tmp_path.glob("*_METHODS.md"))
     assert not list(tmp_path.glob("*_CITATION*"))
     assert not list(tmp_path.glob("*_provenance.json"))
@@ -3,11 +3,23 @@
 Unit tests for TI-Toolbox reporting system: assembler, reportlets, and protocols.
 """
 
+import base64
+import os
+from unittest.mock import patch
+
 import pytest
 from pathlib import Path
 
 from tit.reporting.core.assembler import ReportAssembler
+from tit.reporting.core.assets import AssetStore, image_tag, use_asset_store
+from tit.reporting.core.fragments import (
+    FRAGMENT_CACHE_DIR,
+    fragment_key,
+    prune_fragments,
+    render_fragments,
+)
 from tit.reporting.core.base import (
+    ImageReportlet,
     MetadataReportlet,
     TableReportlet,
     TextReportlet,
@@ -159,6 +171,146 @@ class TestReportAssemblerRendering:
         assert output_file.exists()
 
 
+@pytest.mark.unit
+class TestReportAssets:
+    """Tests for externalised image assets."""
+
+    PNG = base64.b64encode(b"\x89PNG\r\n\x1a\nfake").decode()
+
+    def _assembler(self, *images):
+        assembler = ReportAssembler(title="Assets")
+        section = assembler.add_section("s1", "Images")
+        for data in images:
+            image = ImageReportlet(title="Field")
+            image.set_base64_data(data)
+            section.add_reportlet(image)
+        return assembler
+
+    def test_image_tag_embeds_without_store(self):
+        html = image_tag(self.PNG, alt="x")
+        assert f'src="data:image/png;base64,{self.PNG}"' in html
+
+    def test_image_tag_writes_asset_once(self, tmp_path):
+        store = AssetStore(tmp_path / "assets")
+        with use_asset_store(store):
+            first = image_tag(self.PNG, alt="x")
+            second = image_tag(self.PNG, alt="y")
+        files = list((tmp_path / "assets").iterdir())
+        assert len(files) == 1 and store.written == 1
+        assert files[0].read_bytes() == base64.b64decode(self.PNG)
+        assert f'src="assets/{files[0].name}"' in first
+        assert 'loading="lazy"' in first and "data:" not in second
+
+    def test_undecodable_data_stays_inline(self, tmp_path):
+        with use_asset_store(AssetStore(tmp_path / "assets")):
+            html = image_tag("not base64!")
+        assert 'src="data:image/png;base64,not base64!"' in html
+        assert not (tmp_path / "assets").exists()
+
+    def test_save_self_contained_by_default(self, tmp_path):
+        self._assembler(self.PNG).save(tmp_path / "report.html")
+        assert "data:image/png;base64," in (tmp_path / "report.html").read_text()
+        assert not (tmp_path / "assets").exists()
+
+    def test_save_with_assets_shares_directory(self, tmp_path):
+        other = base64.b64encode(b"\x89PNG\r\n\x1a\nother").decode()
+        self._assembler(self.PNG).save(tmp_path / "a.html", self_contained=False)
+        self._assembler(self.PNG, other).save(
+            tmp_path / "b.html", self_contained=False
+        )
+        html = (tmp_path / "b.html").read_text()
+        assert "data:image" not in html
+        assert html.count('src="assets/') == 2
+        assert len(list((tmp_path / "assets").iterdir())) == 2
+
+
+@pytest.mark.unit
+class TestReportFragments:
+    """Tests for parallel, cached fragment rendering."""
+
+    def _assembler(self, *texts):
+        assembler = ReportAssembler(title="Fragments")
+        section = assembler.add_section("s1", "Text")
+        for text in texts:
+            section.add_reportlet(TextReportlet(text, copyable=True))
+        return assembler
+
+    def test_key_ignores_id_and_follows_data(self):
+        a, b = TextReportlet("same"), TextReportlet("same")
+        assert a.reportlet_id != b.reportlet_id
+        assert fragment_key(a) == fragment_key(b)
+        assert fragment_key(TextReportlet("other")) != fragment_key(a)
+        assert fragment_key(a, AssetStore("assets")) != fragment_key(a)
+
+    def test_incremental_save_reuses_unchanged_fragments(self, tmp_path):
+        self._assembler("one", "two").save(tmp_path / "a.html", incremental=True)
+        assert len(list((tmp_path / FRAGMENT_CACHE_DIR).iterdir())) == 2
+
+        assembler = self._assembler("one", "three")
+        with patch.object(
+            TextReportlet, "render_html", autospec=True, return_value="<p>new</p>"
+        ) as render:
+            assembler.save(tmp_path / "b.html", incremental=True)
+        assert [c.args[0].content for c in render.call_args_list] == ["three"]
+
+        html = (tmp_path / "b.html").read_text()
+        first = assembler.sections[0].reportlets[0]
+        assert f'id="{first.reportlet_id}-content"' in html
+        assert "<p>new</p>" in html
+
+    def test_parallel_matches_serial(self):
+        assembler = self._assembler(*(f"text {i}" for i in range(4)))
+        assert assembler.render_sections(workers=2) == assembler.render_sections()
+
+    def test_missing_asset_forces_rerender(self, tmp_path):
+        png = base64.b64encode(b"\x89PNG\r\n\x1a\nfake").decode()
+        image = ImageReportlet(title="Field")
+        image.set_base64_data(png)
+        cache, store = tmp_path / "cache", AssetStore(tmp_path / "assets")
+        render_fragments([image], cache_dir=cache, asset_store=store)
+        for path in (tmp_path / "assets").iterdir():
+            path.unlink()
+
+        store = AssetStore(tmp_path / "assets")
+        render_fragments([image], cache_dir=cache, asset_store=store)
+        assert store.written == 1 and store.used
+
+    def test_unpicklable_reportlet_renders_locally(self, tmp_path):
+        reportlet = TextReportlet("local")
+        reportlet.callback = lambda: None
+        assert fragment_key(reportlet) is None
+        html = render_fragments([reportlet], cache_dir=tmp_path, workers=2)
+        assert "local" in html[0]
+        assert not list(tmp_path.iterdir())
+
+    def test_worker_pool_does_not_fork(self, tmp_path, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from tit.reporting.core import fragments
+
+        contexts = []
+
+        def pool(max_workers, mp_context=None):
+            contexts.append(mp_context)
+            return ThreadPoolExecutor(max_workers)
+
+        monkeypatch.setattr(fragments, "ProcessPoolExecutor", pool)
+        reportlets = [TextReportlet(f"text {i}") for i in range(3)]
+        html = render_fragments(reportlets, cache_dir=tmp_path, workers=2)
+
+        assert [f"text {i}" in html[i] for i in range(3)] == [True] * 3
+        (context,) = contexts
+        assert context.get_start_method() in ("forkserver", "spawn")
+
+    def test_prune_removes_stale_fragments(self, tmp_path):
+        stale, fresh = tmp_path / "stale.json", tmp_path / "fresh.json"
+        stale.write_text("{}")
+        fresh.write_text("{}")
+        os.utime(stale, (0, 0))
+        assert prune_fragments(tmp_path, max_age_days=1) == 1
+        assert [p.name for p in tmp_path.iterdir()] == ["fresh.json"]
+
+
 @pytest.mark.unit
 class TestReportAssemblerSerialization:
     """Tests for to_dict / from_dict round-trip."""
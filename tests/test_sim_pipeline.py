@@ -543,7 +543,7 @@ class TestRunSimulation:
     so we patch them on their home modules which is where the import resolves.
     """
 
-    def _patch_run_sim(self):
+    def _patch_run_sim(self, cache=None):
         """Return context manager stack that patches TI/mTI classes."""
         import contextlib
 
@@ -551,6 +551,7 @@ class TestRunSimulation:
         def _ctx():
             with (
                 patch.object(_utils_mod, "get_path_manager") as mock_pm,
+                patch.object(_utils_mod, "subject_stage_cache", return_value=cache),
                 patch.object(_utils_mod.os.path, "isdir", return_value=True),
                 patch.object(_utils_mod.os.path, "isfile", return_value=True),
                 patch(
@@ -587,7 +588,7 @@ class TestRunSimulation:
 
             assert len(results) == 1
             assert results[0]["montage_type"] == "TI"
-            mock_ti_cls.assert_called_once_with(config, montage, logger)
+            mock_ti_cls.assert_called_once_with(config, montage, logger, cache=None)
             mock_mti_cls.assert_not_called()
 
     def test_dispatches_mti_montage(self):
@@ -610,7 +611,7 @@ class TestRunSimulation:
 
             assert len(results) == 1
             assert results[0]["montage_type"] == "mTI"
-            mock_mti_cls.assert_called_once_with(config, montage, logger)
+            mock_mti_cls.assert_called_once_with(config, montage, logger, cache=None)
             mock_ti_cls.assert_not_called()
 
     def test_returns_list_of_results(self):
@@ -710,6 +711,39 @@ class TestRunSimulation:
             mock_ti_cls.assert_called_once()
             mock_mti_cls.assert_not_called()
 
+    def test_unchanged_montage_is_served_from_stage_cache(self, tmp_path):
+        from tit.stage_cache import StageCache
+
+        cache = StageCache(tmp_path / "manifest.json")
+        mesh = tmp_path / "test_xyz" / "TI" / "mesh" / "test_xyz_TI.msh"
+        mesh.parent.mkdir(parents=True)
+        mesh.write_text("mesh")
+        with self._patch_run_sim(cache) as (mock_pm, mock_ti_cls, mock_mti_cls):
+            mock_ti_cls.return_value.run.return_value = {
+                "montage_name": "test_xyz",
+                "montage_type": "TI",
+                "status": "completed",
+                "output_mesh": str(mesh),
+            }
+            config = _make_sim_config(
+                montages=[_make_xyz_montage()], map_to_fsavg=False
+            )
+            logger = MagicMock()
+
+            first = _utils_mod.run_simulation(config, logger=logger)
+            second = _utils_mod.run_simulation(config, logger=logger)
+            config.force = True
+            forced = _utils_mod.run_simulation(config, logger=logger)
+            config.force = False
+            config.intensities = [2.0, 2.0]
+            third = _utils_mod.run_simulation(config, logger=logger)
+
+        assert "cached" not in first[0]
+        assert second[0] == {**first[0], "cached": True}
+        assert "cached" not in forced[0]
+        assert "cached" not in third[0]
+        assert mock_ti_cls.call_count == 3
+
 
 # ============================================================================
 # Output-field selection
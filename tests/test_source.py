@@ -231,18 +231,143 @@ class TestFsavgHelpers:
         import sys
         from types import SimpleNamespace
 
-        sys.modules["simnibs.utils.file_finder"].SubjectFiles = lambda **kw: _MagicMock(
-            hemispheres=("lh",)
+        surfaces = {
+            "lh": SimpleNamespace(nodes=SimpleNamespace(nr=1)),
+            "rh": SimpleNamespace(nodes=SimpleNamespace(nr=0)),
+        }
+        monkeypatch.setitem(
+            sys.modules,
+            "simnibs.utils.file_finder",
+            _MagicMock(SubjectFiles=lambda **kw: _MagicMock(hemispheres=("lh",))),
         )
-        sys.modules["simnibs.utils.transformations"].cross_subject_map = (
-            lambda *a, **kw: {}
+        monkeypatch.setitem(
+            sys.modules,
+            "simnibs.utils.transformations",
+            _MagicMock(cross_subject_map=lambda *a, **kw: {}),
         )
-        sys.modules["simnibs.mesh_tools"].mesh_io.load_subject_surfaces = (
-            lambda sf, kind: {
-                "lh": SimpleNamespace(nodes=SimpleNamespace(nr=1)),
-                "rh": SimpleNamespace(nodes=SimpleNamespace(nr=0)),
-            }
+        monkeypatch.setitem(
+            sys.modules,
+            "simnibs.mesh_tools",
+            _MagicMock(
+                mesh_io=_MagicMock(load_subject_surfaces=lambda sf, kind: surfaces)
+            ),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Persisted subject -> fsaverage morph operator
+# ---------------------------------------------------------------------------
+
+
+class TestMorphCache:
+    @staticmethod
+    def _m2m(tmp_path):
+        surfaces = tmp_path / "m2m_001" / "surfaces"
+        surfaces.mkdir(parents=True)
+        (surfaces / "lh.central.gii").write_bytes(b"lh-central")
+        (surfaces / "lh.sphere.reg.gii").write_bytes(b"lh-sphere")
+        return tmp_path / "m2m_001"
+
+    def test_surface_key_tracks_content_and_spacing(self, tmp_path):
+        from tit.source import fsaverage
+
+        m2m = self._m2m(tmp_path)
+        key = fsaverage._surface_key(m2m, 5)
+        assert key == fsaverage._surface_key(m2m, 5)
+        assert key != fsaverage._surface_key(m2m, 6)
+        (m2m / "surfaces" / "lh.sphere.reg.gii").write_bytes(b"re-registered")
+        assert key != fsaverage._surface_key(m2m, 5)
+
+    def test_surface_key_hashes_each_file_once(self, tmp_path, monkeypatch):
+        from tit.source import fsaverage
+
+        m2m = self._m2m(tmp_path)
+        monkeypatch.setattr(fsaverage, "_FILE_DIGESTS", {})
+        key = fsaverage._surface_key(m2m, 5)
+        assert len(fsaverage._FILE_DIGESTS) == 2
+
+        def _no_read(*a, **kw):
+            raise AssertionError("surface file re-read")
+
+        monkeypatch.setattr(fsaverage, "open", _no_read, raising=False)
+        assert fsaverage._surface_key(m2m, 5) == key
+        assert fsaverage._surface_key(m2m, 6) != key
+
+    def test_surface_key_none_without_surfaces(self, tmp_path):
+        from tit.source import fsaverage
+
+        assert fsaverage._surface_key(tmp_path, 5) is None
+
+    @staticmethod
+    def _morph_mat(dense):
+        """Minimal stand-in for a scipy sparse ``morph_mat`` (only ``tocoo``)."""
+        from types import SimpleNamespace
+
+        import numpy as np
+
+        dense = np.asarray(dense, dtype=float)
+        row, col = np.nonzero(dense)
+        coo = SimpleNamespace(row=row, col=col, data=dense[row, col], shape=dense.shape)
+        return SimpleNamespace(tocoo=lambda: coo)
+
+    def test_save_read_roundtrip(self, tmp_path):
+        import numpy as np
+
+        from tit.source import fsaverage
+
+        mat = self._morph_mat([[0.5, 0.5, 0.0], [0.0, 0.0, 1.0]])
+        morph = {"lh": _MagicMock(morph_mat=mat)}
+        path = tmp_path / "morph.npz"
+        assert fsaverage._save_morph(path, "k1", morph, ("lh",))
+
+        loaded, hemis = fsaverage._read_morph(path, "k1")
+        assert hemis == ("lh",)
+        out = loaded["lh"].resample(np.array([2.0, 4.0, 6.0]))
+        assert out == pytest.approx([3.0, 6.0])
+        # A different surface key means the cached operator is stale.
+        assert fsaverage._read_morph(path, "k2") is None
+
+    def test_morph_built_once_per_subject(self, tmp_path, monkeypatch):
+        import sys
+
+        import numpy as np
+
+        from tit.source import fsaverage
+
+        m2m = self._m2m(tmp_path)
+        forward = tmp_path / "forward"
+        pm = _MagicMock()
+        pm.m2m.return_value = str(m2m)
+        pm.forward.return_value = str(forward)
+
+        builds = []
+
+        def _cross_subject_map(*a, **kw):
+            builds.append(a)
+            return {"lh": _MagicMock(morph_mat=self._morph_mat(np.eye(2)))}
+
+        monkeypatch.setitem(
+            sys.modules,
+            "simnibs.utils.file_finder",
+            _MagicMock(SubjectFiles=lambda **kw: _MagicMock(hemispheres=("lh",))),
+        )
+        monkeypatch.setitem(
+            sys.modules,
+            "simnibs.utils.transformations",
+            _MagicMock(cross_subject_map=_cross_subject_map),
+        )
+        monkeypatch.setattr(fsaverage, "_MORPH_MEMO", {})
+
+        first = fsaverage._subject_morph(pm, "001", 5)
+        assert fsaverage._subject_morph(pm, "001", 5) is first
+        # A fresh process (empty memo) reloads the persisted operator.
+        monkeypatch.setattr(fsaverage, "_MORPH_MEMO", {})
+        again = fsaverage._subject_morph(pm, "001", 5)
+        assert len(builds) == 1
+        assert again.morph["lh"].resample(np.array([1.0, 2.0])) == pytest.approx(
+            [1.0, 2.0]
         )
+        assert (forward / "sub-001_space-fsaverage5_morph.npz").exists()
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Tests for tit/stage_cache.py — content-addressed stage cache.
+
+Covers:
+- Fingerprints: stability, and changes on file content, config and env
+- Stage status (new, hit, changed, missing) and invalidation
+- Stages without outputs on disk or with non-JSON results are not recorded
+- Hash memo by size/mtime and project-relative manifest paths
+- run_stage hit/miss and downstream invalidation through content
+- Cached mesh-to-NIfTI conversion
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from tit.stage_cache import StageCache, run_stage, tool_versions
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return StageCache(tmp_path / "cache" / "manifest.json", root=tmp_path)
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+@pytest.mark.unit
+class TestFingerprint:
+    def test_stable_for_same_inputs(self, cache, tmp_path):
+        f = _write(tmp_path / "in.txt", "a")
+        assert cache.fingerprint(files=[f], config={"x": 1}) == cache.fingerprint(
+            files=[f], config={"x": 1}
+        )
+
+    def test_changes_with_file_content(self, cache, tmp_path):
+        f = _write(tmp_path / "in.txt", "a")
+        before = cache.fingerprint(files=[f])
+        _write(f, "b")
+        assert cache.fingerprint(files=[f]) != before
+
+    def test_changes_with_config_and_env(self, cache):
+        base = cache.fingerprint(config={"x": 1})
+        assert cache.fingerprint(config={"x": 2}) != base
+        assert cache.fingerprint(config={"x": 1}, env={"TISSUE_COND_1": "0.1"}) != base
+
+    def test_missing_file_hashes_to_marker(self, cache, tmp_path):
+        missing = tmp_path / "later.txt"
+        before = cache.fingerprint(files=[missing])
+        _write(missing, "")
+        assert cache.fingerprint(files=[missing]) != before
+
+    def test_directory_digest_covers_names(self, cache, tmp_path):
+        _write(tmp_path / "d" / "a.txt", "x")
+        before = cache.digest(tmp_path / "d")
+        os.rename(tmp_path / "d" / "a.txt", tmp_path / "d" / "b.txt")
+        assert cache.digest(tmp_path / "d") != before
+
+    def test_unknown_tool_rejected(self):
+        with pytest.raises(ValueError, match="Unknown tool"):
+            tool_versions("matlab")
+
+
+@pytest.mark.unit
+class TestStatus:
+    def test_new_hit_changed(self, cache, tmp_path):
+        out = _write(tmp_path / "out.txt", "result")
+        assert cache.status("s", "fp1") == "new"
+        cache.record("s", "fp1", [out])
+        assert cache.status("s", "fp1") == "hit"
+        assert cache.status("s", "fp2") == "changed"
+
+    def test_missing_when_outputs_removed(self, cache, tmp_path):
+        out = _write(tmp_path / "out" / "f.txt", "result")
+        cache.record("s", "fp", [out.parent])
+        out.unlink()
+        assert cache.status("s", "fp") == "missing"
+
+    def test_record_persists_and_invalidate_forgets(self, cache, tmp_path):
+        out = _write(tmp_path / "out.txt", "result")
+        cache.record("s", "fp", [out], value={"n": 3})
+        reloaded = StageCache(cache.manifest_path, root=tmp_path)
+        assert reloaded.status("s", "fp") == "hit"
+        assert reloaded.value("s") == {"n": 3}
+        reloaded.invalidate("s")
+        assert StageCache(cache.manifest_path).status("s", "fp") == "new"
+
+    def test_non_json_value_not_cached(self, cache, tmp_path):
+        out = _write(tmp_path / "out.txt", "result")
+        cache.record("s", "fp", [out], value={"n": 3})
+        cache.record("s", "fp", [out], value=object())
+        assert cache.status("s", "fp") == "new"
+
+    def test_stage_without_outputs_not_cached(self, cache, tmp_path):
+        cache.record("s", "fp", value={"n": 3})
+        cache.record("t", "fp", [tmp_path / "never-written.txt"])
+        assert cache.status("s", "fp") == "new"
+        assert cache.status("t", "fp") == "new"
+
+    def test_paths_stored_relative_to_root(self, cache, tmp_path):
+        out = _write(tmp_path / "derivatives" / "out.txt", "x")
+        cache.fingerprint(files=[out])
+        cache.record("s", "fp", [out])
+        manifest = json.loads(cache.manifest_path.read_text())
+        assert manifest["stages"]["s"]["outputs"] == ["derivatives/out.txt"]
+        assert "derivatives/out.txt" in manifest["files"]
+
+    def test_unchanged_files_are_not_rehashed(self, cache, tmp_path):
+        f = _write(tmp_path / "in.txt", "a")
+        cache.fingerprint(files=[f])
+        with patch("tit.stage_cache._file_sha256") as mock_hash:
+            cache.fingerprint(files=[f])
+        mock_hash.assert_not_called()
+
+
+@pytest.mark.unit
+class TestRunStage:
+    def test_second_run_is_a_hit(self, cache, tmp_path):
+        calls = []
+
+        def work():
+            calls.append(1)
+            _write(tmp_path / "out.txt", "r")
+            return {"ok": True}
+
+        kwargs = dict(config={"p": 1}, outputs=[tmp_path / "out.txt"])
+        assert run_stage(cache, "s", work, **kwargs) == ({"ok": True}, False)
+        assert run_stage(cache, "s", work, **kwargs) == ({"ok": True}, True)
+        assert run_stage(cache, "s", work, force=True, **kwargs)[1] is False
+        assert len(calls) == 2
+
+    def test_outputs_from_value(self, cache, tmp_path):
+        out = _write(tmp_path / "mesh.msh", "m")
+        run_stage(cache, "s", lambda: str(out), outputs=lambda v: [v])
+        assert cache.entry("s")["outputs"] == ["mesh.msh"]
+
+    def test_without_cache_always_runs(self):
+        assert run_stage(None, "s", lambda: 5) == (5, False)
+
+    def test_downstream_follows_upstream_content(self, cache, tmp_path):
+        src = _write(tmp_path / "src.txt", "1")
+        mid, end = tmp_path / "mid.txt", tmp_path / "end.txt"
+        runs = []
+
+        def upstream():
+            runs.append("up")
+            mid.write_text(src.read_text().strip())
+
+        def downstream():
+            runs.append("down")
+            end.write_text(mid.read_text())
+
+        def pipeline():
+            run_stage(cache, "up", upstream, files=[src], outputs=[mid])
+            run_stage(cache, "down", downstream, files=[mid], outputs=[end])
+
+        pipeline()
+        pipeline()
+        assert runs == ["up", "down"]
+
+        # Upstream re-runs but reproduces the same output: downstream is cached.
+        src.write_text("1\n")
+        pipeline()
+        assert runs == ["up", "down", "up"]
+
+        src.write_text("2")
+        pipeline()
+        assert runs == ["up", "down", "up", "up", "down"]
+
+
+@pytest.mark.unit
+class TestCachedNiftiConversion:
+    def test_up_to_date_directory_is_skipped(self, cache, tmp_path):
+        from tit.tools import mesh2nii
+
+        mesh_dir, out_dir = tmp_path / "mesh", tmp_path / "niftis"
+        _write(mesh_dir / "sim_TI.msh", "mesh")
+        _write(mesh_dir / "sim_normal.msh", "surface")
+        spec = {"mesh_dir": str(mesh_dir), "output_dir": str(out_dir)}
+
+        def fake_run(tasks, m2m_dir, temp_paths, max_workers):
+            _write(out_dir / "sim_TI_subject_TI_max.nii.gz", "nii")
+
+        with (
+            patch.object(mesh2nii, "_collect_tasks", return_value=([("t",)], [])),
+            patch.object(mesh2nii, "_run_tasks", side_effect=fake_run) as run,
+        ):
+            mesh2nii.convert_mesh_dirs([spec], str(tmp_path / "m2m"), cache=cache)
+            mesh2nii.convert_mesh_dirs([spec], str(tmp_path / "m2m"), cache=cache)
+            assert run.call_count == 1
+
+            entry = cache.entry("nifti/niftis")
+            assert entry["outputs"] == ["niftis/sim_TI_subject_TI_max.nii.gz"]
+
+            _write(mesh_dir / "sim_TI.msh", "new mesh")
+            mesh2nii.convert_mesh_dirs([spec], str(tmp_path / "m2m"), cache=cache)
+            assert run.call_count == 2
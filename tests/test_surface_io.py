@@ -0,0 +1,191 @@
+"""Unit tests for tit/tools/surface_io.py and slab-wise meshing.
+
+Covers:
+- Binary STL record layout and first-appearance vertex numbering
+- Gmsh 2.2 ASCII / binary and 4.1 binary layout
+- Vectorised ASCII PLY body
+- Seam merging of slab-wise marching cubes (tit/tools/nifti_to_mesh.py)
+"""
+
+import numpy as np
+import pytest
+
+from tit.tools.surface_io import (
+    face_normals,
+    read_binary_stl,
+    write_binary_stl,
+    write_gmsh_surface,
+    write_ply_with_scalars,
+)
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def tetra_surface():
+    vertices = np.array(
+        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    )
+    faces = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+    return vertices, faces
+
+
+# ---------------------------------------------------------------------------
+# STL
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestBinaryStl:
+    def test_roundtrip_preserves_topology(self, tmp_path, tetra_surface):
+        vertices, faces = tetra_surface
+        path = str(tmp_path / "t.stl")
+        write_binary_stl(path, vertices, faces)
+
+        v_out, f_out = read_binary_stl(path)
+
+        # Vertices are numbered in order of first appearance.
+        np.testing.assert_allclose(v_out, vertices[[0, 2, 1, 3]])
+        np.testing.assert_allclose(v_out[f_out], vertices[faces])
+
+    def test_normals_written_per_face(self, tmp_path, tetra_surface):
+        vertices, faces = tetra_surface
+        path = tmp_path / "t.stl"
+        write_binary_stl(str(path), vertices, faces)
+
+        records = np.frombuffer(
+            path.read_bytes()[84:],
+            dtype=[("n", "<f4", (3,)), ("v", "<f4", (3, 3)), ("a", "<u2")],
+        )
+        np.testing.assert_allclose(
+            records["n"], face_normals(vertices, faces), atol=1e-6
+        )
+
+    def test_degenerate_normal(self):
+        normals = face_normals(np.zeros((3, 3)), np.array([[0, 1, 2]]))
+        np.testing.assert_array_equal(normals, [[0.0, 0.0, 1.0]])
+
+
+# ---------------------------------------------------------------------------
+# Gmsh
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestGmsh:
+    def test_ascii_22(self, tmp_path, tetra_surface):
+        vertices, faces = tetra_surface
+        path = tmp_path / "t.msh"
+        write_gmsh_surface(str(path), vertices, faces, binary=False, tag=5)
+
+        lines = path.read_text().splitlines()
+        assert lines[:3] == ["$MeshFormat", "2.2 0 8", "$EndMeshFormat"]
+        assert lines[4] == "4"
+        assert lines[6] == "2 1.0 0.0 0.0"
+        elements = lines[lines.index("$Elements") + 2 :][:4]
+        assert elements[0] == "1 2 2 5 5 1 3 2"
+
+    def test_binary_22_layout(self, tmp_path, tetra_surface):
+        vertices, faces = tetra_surface
+        path = tmp_path / "t.msh"
+        write_gmsh_surface(str(path), vertices, faces)
+
+        data = path.read_bytes()
+        assert data.startswith(b"$MeshFormat\n2.2 1 8\n")
+        start = data.index(b"$Nodes\n4\n") + len(b"$Nodes\n4\n")
+        nodes = np.frombuffer(
+            data, dtype=[("id", "<i4"), ("xyz", "<f8", (3,))], count=4, offset=start
+        )
+        np.testing.assert_array_equal(nodes["id"], [1, 2, 3, 4])
+        np.testing.assert_array_equal(nodes["xyz"], vertices)
+
+        start = data.index(b"$Elements\n4\n") + len(b"$Elements\n4\n")
+        header = np.frombuffer(data, dtype="<i4", count=3, offset=start)
+        elms = np.frombuffer(data, dtype="<i4", count=24, offset=start + 12)
+        np.testing.assert_array_equal(header, [2, 4, 2])
+        np.testing.assert_array_equal(elms.reshape(4, 6)[:, 3:], faces + 1)
+        assert data.endswith(b"\n$EndElements\n")
+
+    def test_binary_41_header(self, tmp_path, tetra_surface):
+        path = tmp_path / "t.msh"
+        write_gmsh_surface(str(path), *tetra_surface, version="4.1")
+
+        data = path.read_bytes()
+        assert data.startswith(b"$MeshFormat\n4.1 1 8\n")
+        for section in (b"$Entities", b"$Nodes", b"$Elements"):
+            assert section in data
+
+    def test_rejects_ascii_41(self, tmp_path, tetra_surface):
+        with pytest.raises(ValueError, match="4.1"):
+            write_gmsh_surface(
+                str(tmp_path / "t.msh"), *tetra_surface, version="4.1", binary=False
+            )
+
+
+# ---------------------------------------------------------------------------
+# PLY
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_ply_scalars_body(tmp_path, tetra_surface):
+    vertices, faces = tetra_surface
+    path = tmp_path / "t.ply"
+    write_ply_with_scalars(str(path), vertices, faces, np.arange(4) / 4.0)
+
+    lines = path.read_text().splitlines()
+    body = lines[lines.index("end_header") + 1 :]
+    assert body[1] == "1.000000 0.000000 0.000000 0.250000"
+    assert body[4:] == ["3 0 2 1", "3 0 1 3", "3 0 3 2", "3 1 2 3"]
+
+
+# ---------------------------------------------------------------------------
+# Slab-wise marching cubes
+# ---------------------------------------------------------------------------
+
+
+def _fake_marching_cubes(volume, level):
+    """Deterministic stand-in: one vertex per voxel above *level*."""
+    verts = np.argwhere(volume > level).astype(float)
+    faces = np.array([[i, i + 1, i + 2] for i in range(len(verts) - 2)])
+    return verts, faces.reshape(-1, 3), None, None
+
+
+@pytest.mark.unit
+class TestSlabMarchingCubes:
+    def test_seams_are_merged(self):
+        from tit.tools.nifti_to_mesh import _marching_cubes_slabs
+
+        mask = np.random.default_rng(0).random((11, 4, 4)) > 0.5
+        slab_faces = []
+
+        def mc(volume, level):
+            verts, faces, *_ = _fake_marching_cubes(volume, level)
+            slab_faces.append(verts[faces])
+            return verts, faces, None, None
+
+        verts, faces = _marching_cubes_slabs(
+            lambda a, b: mask[a:b], len(mask), 3, mc
+        )
+
+        expected = np.argwhere(mask).astype(float)
+        assert len(verts) == len(expected)
+        assert {tuple(v) for v in verts} == {tuple(v) for v in expected}
+        # Faces still reference the same coordinates after offsets/merging.
+        shifted = []
+        for start, tri in zip(range(0, 10, 3), slab_faces):
+            tri = tri.copy()
+            tri[..., 0] += start
+            shifted.append(tri)
+        np.testing.assert_array_equal(verts[faces], np.concatenate(shifted))
+
+    def test_empty_mask_raises(self):
+        from tit.tools.nifti_to_mesh import _marching_cubes_slabs
+
+        mask = np.zeros((5, 3, 3), dtype=bool)
+        with pytest.raises(ValueError, match="no surface"):
+            _marching_cubes_slabs(
+                lambda a, b: mask[a:b], 5, 2, _fake_marching_cubes
+            )
@@ -0,0 +1,169 @@
+"""
+Unit tests for tit/tracing.py — per-stage spans and trace summaries.
+
+Covers:
+- Span nesting, parent ids and recorded fields
+- Nothing is written without an active trace
+- Nested runs keep their parent's trace
+- A run's trace ends with its root span, restoring any outer trace
+- Errors are recorded on the span that raised
+- Flame-style summaries and the ``python -m tit.tracing`` entry point
+"""
+
+import pytest
+
+from tit import tracing
+from tit.tracing import (
+    load_trace,
+    span,
+    start_trace,
+    stop_trace,
+    summarize,
+    trace_path,
+    traced,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_trace():
+    stop_trace()
+    yield
+    stop_trace()
+
+
+@pytest.mark.unit
+class TestSpan:
+    def test_nested_spans_record_parent(self, tmp_path):
+        tracer = start_trace(tmp_path / "run.log")
+        with span("outer", subject="001") as outer:
+            with span("inner") as inner:
+                pass
+        records = {r["name"]: r for r in load_trace(tracer.path)}
+        assert tracer.path == tmp_path / "run.trace.jsonl"
+        assert records["outer"]["id"] == outer and records["outer"]["parent"] is None
+        assert records["inner"]["id"] == inner
+        assert records["inner"]["parent"] == outer
+        assert records["outer"]["attrs"] == {"subject": "001"}
+        for key in ("wall_s", "cpu_s", "pid", "start"):
+            assert key in records["inner"]
+
+    def test_nothing_written_without_trace(self, tmp_path):
+        with span("untraced"):
+            pass
+        assert tracing.active_trace() is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_error_is_recorded_and_reraised(self, tmp_path):
+        tracer = start_trace(tmp_path / "run.log")
+        with pytest.raises(ValueError):
+            with span("failing"):
+                raise ValueError("boom")
+        (record,) = load_trace(tracer.path)
+        assert record["error"] == "ValueError"
+
+    def test_traced_decorator(self, tmp_path):
+        tracer = start_trace(tmp_path / "run.log")
+
+        @traced("work")
+        def work(x):
+            return x * 2
+
+        assert work(3) == 6
+        assert [r["name"] for r in load_trace(tracer.path)] == ["work"]
+
+
+@pytest.mark.unit
+class TestStartTrace:
+    def test_trace_path_beside_log(self, tmp_path):
+        assert trace_path(tmp_path / "sim_1.log") == tmp_path / "sim_1.trace.jsonl"
+        path = tmp_path / "sim_1.trace.jsonl"
+        assert trace_path(path) == path
+
+    def test_nested_run_keeps_parent_trace(self, tmp_path):
+        with span("group"):
+            group = start_trace(tmp_path / "group.log")
+            with span("subject"):
+                assert start_trace(tmp_path / "sub-01.log") is group
+        with span("subject"):
+            other = start_trace(tmp_path / "sub-02.log")
+        assert other is not group
+        assert other.path == tmp_path / "sub-02.trace.jsonl"
+
+    def test_same_log_keeps_trace(self, tmp_path):
+        first = start_trace(tmp_path / "run.log")
+        assert start_trace(tmp_path / "run.log") is first
+
+    def test_trace_ends_with_run(self, tmp_path):
+        with span("run"):
+            tracer = start_trace(tmp_path / "run.log")
+            with span("step"):
+                pass
+            assert tracing.active_trace() is tracer
+        assert tracing.active_trace() is None
+
+        with span("later"):
+            pass
+        assert [r["name"] for r in load_trace(tracer.path)] == ["step", "run"]
+
+    def test_run_restores_outer_trace(self, tmp_path):
+        outer = start_trace(tmp_path / "session.log")
+        with span("run"):
+            inner = start_trace(tmp_path / "run.log")
+            assert inner is not outer
+        assert tracing.active_trace() is outer
+
+        with span("later"):
+            pass
+        assert [r["name"] for r in load_trace(inner.path)] == ["run"]
+        assert [r["name"] for r in load_trace(outer.path)] == ["later"]
+
+    def test_track_operation_ends_trace(self, tmp_path, monkeypatch):
+        from tit import telemetry
+
+        monkeypatch.setattr(telemetry, "track_event", lambda *a, **kw: None)
+        with telemetry.track_operation("sim_ti"):
+            tracer = start_trace(tmp_path / "sim.log")
+        assert tracing.active_trace() is None
+        assert [r["name"] for r in load_trace(tracer.path)] == ["sim_ti"]
+
+
+@pytest.mark.unit
+class TestSummarize:
+    def _records(self):
+        return [
+            {"id": "a", "parent": None, "name": "run", "start": 0, "wall_s": 10.0},
+            {"id": "b", "parent": "a", "name": "step", "start": 1, "wall_s": 3.0},
+            {"id": "c", "parent": "a", "name": "step", "start": 4, "wall_s": 5.0},
+            {
+                "id": "d",
+                "parent": "a",
+                "name": "load",
+                "start": 9,
+                "wall_s": 1.0,
+                "cpu_s": 0.5,
+                "child_cpu_s": 0.25,
+                "peak_rss_mb": 512.0,
+            },
+        ]
+
+    def test_siblings_merged_and_sorted(self):
+        lines = summarize(self._records(), width=10).splitlines()
+        assert lines[1].split()[:4] == ["10.00", "0.00", "0.0", "1"]
+        assert lines[1].split()[4] == "run"
+        assert lines[2].split()[:5] == ["8.00", "0.00", "0.0", "2", "step"]
+        assert lines[3].split()[:5] == ["1.00", "0.75", "512.0", "1", "load"]
+        assert lines[1].count("█") == 10
+
+    def test_orphans_become_roots(self):
+        records = [{"id": "x", "parent": "gone", "name": "worker", "wall_s": 1.0}]
+        assert "worker" in summarize(records)
+
+    def test_main_prints_summary(self, tmp_path, capsys):
+        tracer = start_trace(tmp_path / "run.log")
+        with span("stage"):
+            pass
+        stop_trace()
+        with open(tracer.path, "a") as f:
+            f.write("not json\n")
+        assert tracing.main([str(tracer.path)]) == 0
+        assert "stage" in capsys.readouterr().out
@@ -49,23 +49,29 @@ Examples
 
 Notes
 -----
-Importing this package auto-initializes logging (with stream output at
-INFO level) and exposes ``get_path_manager`` for BIDS path resolution.
-No additional setup is required for typical usage.
+Importing this package is cheap: subpackages and their heavy dependencies
+(NumPy, SimNIBS, nibabel, matplotlib) load on first use, and so do
+``paths`` and ``constants``.  Logging is set to INFO with a console handler
+that binds stdout when the first message is logged, so scripts need no
+additional setup; set ``TIT_LOG_CONSOLE=0`` to import without it.
 """
 
 __version__ = "2.4.0"
 __author__ = "TI-Toolbox Team"
 
-from . import paths, constants
+from ._lazy import lazy_exports
+from .logger import install_default_console
 
-from .logger import setup_logging, add_file_handler, add_stream_handler
-from .paths import get_path_manager
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".logger": ["setup_logging", "add_file_handler", "add_stream_handler"],
+        ".paths": ["get_path_manager"],
+    },
+)
 
-# Auto-initialize logging with terminal output on import.
-# Scripts need no explicit setup — just ``from tit.sim import ...`` and go.
-setup_logging("INFO")
-add_stream_handler("tit", "INFO")
+# Scripts need no explicit setup -- just ``from tit.sim import ...`` and go.
+install_default_console("INFO")
 
 __all__ = [
     "setup_logging",
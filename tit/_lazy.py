@@ -0,0 +1,80 @@
+"""Lazy re-exports for package ``__init__`` modules.
+
+Package ``__init__`` files re-export their public API from submodules, and
+those submodules import NumPy, SciPy, nibabel, matplotlib or SimNIBS.
+Importing them eagerly makes ``import tit.opt`` -- and with it every
+``python -m tit.*`` entry point, GUI tab and spawned worker -- pay for the
+whole package.  :func:`lazy_exports` builds a module-level ``__getattr__``
+(PEP 562) that imports a re-exported name's submodule on first access
+instead::
+
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "tit.opt.config": ["ExConfig", "ExResult"],
+            "tit.opt.ex.ex": ["run_ex_search"],
+        },
+    )
+
+``from tit.opt import ExConfig`` then imports only ``tit.opt.config``.
+Attribute access to a submodule (``tit.opt.leadfield``) imports it as well,
+as an eager ``__init__`` would have.
+
+Public API
+----------
+lazy_exports
+    Module ``__getattr__`` and ``__dir__`` for lazily re-exported names.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, list[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """``__getattr__`` and ``__dir__`` for a package with lazy re-exports.
+
+    Parameters
+    ----------
+    package : str
+        The package's ``__name__``.
+    exports : dict
+        Module name (absolute, or relative to *package*) to the names
+        re-exported from it.
+
+    Returns
+    -------
+    tuple of callable
+        Assign to the package's ``__getattr__`` and ``__dir__``.
+    """
+    origin = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module_name = origin.get(name)
+        if module_name is not None:
+            value = getattr(importlib.import_module(module_name, package), name)
+        elif name.startswith("__"):
+            # Probes such as __wrapped__ or __path__ from inspect and pytest.
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        else:
+            submodule = f"{package}.{name}"
+            try:
+                value = importlib.import_module(submodule)
+            except ModuleNotFoundError as exc:
+                if exc.name != submodule:
+                    raise
+                raise AttributeError(
+                    f"module {package!r} has no attribute {name!r}"
+                ) from None
+        # Cache on the package so later lookups skip __getattr__.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(origin))
+
+    return __getattr__, __dir__
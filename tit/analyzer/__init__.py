@@ -23,9 +23,16 @@ tit.stats : Cluster-based permutation testing for group-level inference.
 tit.sim : TI/mTI simulation engine that produces the field files analyzed here.
 """
 
-from tit.analyzer.analyzer import Analyzer, AnalysisResult
-from tit.analyzer.field_selector import select_field_file
-from tit.analyzer.group import GroupResult, run_group_analysis
+from tit._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "tit.analyzer.analyzer": ["Analyzer", "AnalysisResult"],
+        "tit.analyzer.field_selector": ["select_field_file"],
+        "tit.analyzer.group": ["GroupResult", "run_group_analysis"],
+    },
+)
 
 __all__ = [
     "Analyzer",
@@ -70,6 +70,7 @@ def _run_group(data: dict) -> None:
 def _run_single(data: dict) -> None:
     """Dispatch single-subject analysis from parsed config dict."""
     from tit.analyzer import Analyzer
+    from tit.stage_cache import subject_stage_cache
 
     analysis_type = data.pop("analysis_type")
     visualize = data.get("visualize", True)
@@ -87,6 +88,7 @@ def _run_single(data: dict) -> None:
         space=data.get("space", "mesh"),
         tissue_type=data.get("tissue_type", "GM"),
         output_dir=data.get("output_dir"),
+        cache=subject_stage_cache(data["subject_id"]),
     )
 
     if analysis_type == "spherical":
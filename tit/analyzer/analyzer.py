@@ -15,8 +15,11 @@ See Also
 --------
 tit.analyzer.group : Multi-subject group analysis.
 tit.analyzer.field_selector : Automatic field file resolution.
+tit.stage_cache : Cache that lets unchanged analyses be skipped.
 """
 
+import hashlib
+import json
 import logging
 import subprocess
 import tempfile
@@ -36,6 +39,8 @@ from tit.analyzer.visualizer import (
 )
 from tit.logger import add_file_handler
 from tit.paths import get_path_manager
+from tit.stage_cache import StageCache
+from tit.tracing import span, start_trace
 
 logger = logging.getLogger(__name__)
 
@@ -157,6 +162,12 @@ class Analyzer:
         mesh analyses always use the GM cortical surface. Default ``"GM"``.
     output_dir : str or None, optional
         Override output directory. If ``None``, derived from PathManager.
+    cache : StageCache or None, optional
+        Stage cache of the subject (see
+        :func:`tit.stage_cache.subject_stage_cache`).  An analysis whose
+        field, surfaces, atlas and parameters are unchanged since it last
+        ran, and whose output directory still exists, returns the recorded
+        result without recomputing.  ``None`` (default) always computes.
 
     Attributes
     ----------
@@ -176,6 +187,8 @@ class Analyzer:
         Path to the subject's ``m2m_*`` directory.
     output_dir : str or None
         Output directory override, or ``None``.
+    cache : StageCache or None
+        Stage cache consulted by the ``analyze_*`` methods.
 
     Examples
     --------
@@ -199,6 +212,7 @@ class Analyzer:
         space: str = "mesh",
         tissue_type: str = "GM",
         output_dir: str | None = None,
+        cache: StageCache | None = None,
     ) -> None:
         self.subject_id = subject_id
         self.simulation = simulation
@@ -219,6 +233,7 @@ class Analyzer:
         pm = get_path_manager()
         self.m2m_path = pm.m2m(subject_id)
         self.output_dir = output_dir
+        self.cache = cache
         self._pm = pm
 
         # Attach a file handler so every log message is persisted to disk
@@ -227,6 +242,7 @@ class Analyzer:
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         log_file = Path(logs_dir) / f"analyzer_{simulation}_{timestamp}.log"
         self._log_handler = add_file_handler(log_file)
+        self._log_file = log_file
 
         logger.info(
             "Analyzer initialised: subject=%s sim=%s space=%s tissue=%s",
@@ -239,6 +255,7 @@ class Analyzer:
         # Cached lazily
         self._surface_mesh = None
         self._surface_mesh_path: Path | None = None
+        self._last_output_dir: str | None = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -284,8 +301,21 @@ class Analyzer:
         from tit import constants as const
 
         with track_operation(const.TELEMETRY_OP_ANALYSIS):
-            dispatch = {"mesh": self._sphere_mesh, "voxel": self._sphere_voxel}
-            return dispatch[self.space](center, radius, coordinate_space, visualize)
+            start_trace(self._log_file)
+            with span("spherical", subject=self.subject_id, space=self.space):
+                dispatch = {"mesh": self._sphere_mesh, "voxel": self._sphere_voxel}
+                return self._cached(
+                    "spherical",
+                    {
+                        "center": list(center),
+                        "radius": radius,
+                        "coordinate_space": coordinate_space,
+                        "visualize": visualize,
+                    },
+                    lambda: dispatch[self.space](
+                        center, radius, coordinate_space, visualize
+                    ),
+                )
 
     def analyze_cortex(
         self,
@@ -329,8 +359,78 @@ class Analyzer:
         from tit import constants as const
 
         with track_operation(const.TELEMETRY_OP_ANALYSIS):
-            dispatch = {"mesh": self._cortex_mesh, "voxel": self._cortex_voxel}
-            return dispatch[self.space](atlas, region, visualize)
+            start_trace(self._log_file)
+            with span("cortical", subject=self.subject_id, space=self.space):
+                dispatch = {"mesh": self._cortex_mesh, "voxel": self._cortex_voxel}
+                return self._cached(
+                    "cortical",
+                    {"atlas": atlas, "region": region, "visualize": visualize},
+                    lambda: dispatch[self.space](atlas, region, visualize),
+                )
+
+    # ------------------------------------------------------------------
+    # Stage cache
+    # ------------------------------------------------------------------
+
+    def _cached(self, analysis_type: str, params: dict, compute) -> AnalysisResult:
+        """Return the recorded result of an unchanged analysis, else *compute*."""
+        if self.cache is None:
+            return compute()
+
+        config = {
+            **params,
+            "field_name": self.field_name,
+            "tissue_type": self.tissue_type,
+            "output_dir": self.output_dir,
+        }
+        key = hashlib.sha256(
+            json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        stage = f"analysis/{self.simulation}/{self.space}/{analysis_type}/{key}"
+        fingerprint = self.cache.fingerprint(
+            files=self._stage_files(analysis_type, params),
+            config=config,
+            tools=["ti-toolbox"],
+        )
+        value = self.cache.value(stage)
+        if self.cache.status(stage, fingerprint) == "hit" and value is not None:
+            logger.info("%s: inputs unchanged since the last run, reusing", stage)
+            return AnalysisResult(**value)
+
+        self._last_output_dir = None
+        result = compute()
+        outputs = [self._last_output_dir] if self._last_output_dir else []
+        # NumPy scalars (e.g. an np.int64 element count) are not JSON; store
+        # them as Python numbers so the recorded result is complete.
+        value = {
+            k: v.item() if isinstance(v, np.generic) else v
+            for k, v in asdict(result).items()
+        }
+        self.cache.record(stage, fingerprint, outputs, value)
+        return result
+
+    def _stage_files(self, analysis_type: str, params: dict) -> list[Path]:
+        """Files an analysis reads besides its parameters."""
+        files = [self.field_path]
+        if self.space == "mesh":
+            files.append(
+                Path(self._pm.ti_central_surface(self.subject_id, self.simulation))
+            )
+            normal_path = self._normal_mesh_path()
+            if normal_path is not None:
+                files.append(normal_path)
+            if analysis_type == "cortical":
+                files.append(Path(self.m2m_path) / "surfaces")
+        else:
+            # Tissue masks are read from the grey_/white_ sibling NIfTIs.
+            name = self.field_path.name.removeprefix("grey_").removeprefix("white_")
+            parent = self.field_path.parent
+            files += [parent / f"grey_{name}", parent / f"white_{name}"]
+            if analysis_type == "cortical":
+                files.append(self._resolve_voxel_atlas(params["atlas"]))
+        if params.get("coordinate_space", "subject").upper() == "MNI":
+            files.append(Path(self.m2m_path) / "toMNI")
+        return files
 
     # ------------------------------------------------------------------
     # Mesh: spherical
@@ -967,6 +1067,7 @@ class Analyzer:
     ) -> str:
         if self.output_dir is not None:
             self._pm.ensure(self.output_dir)
+            self._last_output_dir = self.output_dir
             return self.output_dir
 
         pm_kwargs: dict = {
@@ -987,6 +1088,7 @@ class Analyzer:
 
         out = self._pm.analysis_output_dir(**pm_kwargs)
         self._pm.ensure(out)
+        self._last_output_dir = out
         return out
 
     # ------------------------------------------------------------------
@@ -32,6 +32,8 @@ from matplotlib.lines import Line2D
 from tit.analyzer.analyzer import Analyzer, AnalysisResult
 from tit.logger import add_file_handler
 from tit.paths import get_path_manager
+from tit.stage_cache import subject_stage_cache
+from tit.tracing import start_trace
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +151,7 @@ def run_group_analysis(
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         log_file = out / f"group_analysis_{timestamp}.log"
         add_file_handler(log_file)
+        start_trace(log_file)
 
         logger.info(
             "Group analysis started: %d subjects, space=%s, type=%s",
@@ -175,7 +178,10 @@ def run_group_analysis(
         results: dict[str, AnalysisResult] = {}
         for sid in subject_ids:
             logger.info("Analyzing subject %s", sid)
-            results[sid] = analyze_fn(Analyzer(sid, simulation, space, tissue_type))
+            analyzer = Analyzer(
+                sid, simulation, space, tissue_type, cache=subject_stage_cache(sid)
+            )
+            results[sid] = analyze_fn(analyzer)
 
         df = _build_summary_df(results)
         csv_path = out / "group_summary.csv"
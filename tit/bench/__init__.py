@@ -0,0 +1,55 @@
+"""Benchmarks on synthetic data.
+
+Times TI-Toolbox's numerical kernels -- and, in later modules, whole
+pipeline stages -- on reproducible synthetic inputs, so performance can be
+tracked on any machine without SimNIBS or subject data.  Results are saved
+as a JSON baseline and later runs are compared against it::
+
+    python -m tit.bench --scale small --save bench-baseline.json
+    python -m tit.bench --scale small --baseline bench-baseline.json
+
+Baselines are only comparable on the same machine and environment.
+
+Public API
+----------
+KERNELS
+    Benchmarks of the core numerical kernels.
+SCALES
+    Built-in problem sizes.
+Benchmark
+    A named benchmark with per-scale setup.
+BenchResult
+    Timings, throughput and peak memory of one benchmark at one scale.
+run_benchmarks
+    Run benchmarks across scales.
+compare
+    Check results against a baseline.
+
+See Also
+--------
+tit.bench.search : End-to-end benchmark of the exhaustive searches.
+tit.tracing : Per-stage timing of real runs.
+"""
+
+from tit.bench.kernels import KERNELS
+from tit.bench.runner import (
+    Benchmark,
+    BenchResult,
+    compare,
+    load_baseline,
+    run_benchmarks,
+    save_results,
+)
+from tit.bench.synthetic import SCALES, Scale
+
+__all__ = [
+    "KERNELS",
+    "SCALES",
+    "Scale",
+    "Benchmark",
+    "BenchResult",
+    "run_benchmarks",
+    "compare",
+    "load_baseline",
+    "save_results",
+]
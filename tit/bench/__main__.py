@@ -0,0 +1,83 @@
+"""Entry point: python -m tit.bench [--scale small] [--baseline FILE]"""
+
+import argparse
+import sys
+
+from tit.bench.kernels import KERNELS, select
+from tit.bench.runner import (
+    DEFAULT_THRESHOLD,
+    compare,
+    format_results,
+    load_baseline,
+    run_benchmarks,
+    save_results,
+)
+from tit.bench.synthetic import SCALES
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks; exit status 1 when any regressed."""
+    parser = argparse.ArgumentParser(
+        prog="python -m tit.bench",
+        description="Benchmark TI-Toolbox kernels on synthetic data.",
+    )
+    parser.add_argument(
+        "-k",
+        "--select",
+        nargs="+",
+        metavar="PATTERN",
+        help="Run only benchmarks matching these globs or name prefixes.",
+    )
+    parser.add_argument(
+        "--scale",
+        nargs="+",
+        choices=sorted(SCALES),
+        default=["small"],
+        help="Problem sizes to run (default: small).",
+    )
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs.")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slow-down or memory growth reported as a regression.",
+    )
+    parser.add_argument("--save", metavar="FILE", help="Write results as JSON.")
+    parser.add_argument(
+        "--list", action="store_true", help="List benchmarks and exit."
+    )
+    args = parser.parse_args(argv)
+
+    benchmarks = select(KERNELS, args.select)
+    if args.list:
+        for bench in benchmarks:
+            print(bench.name)
+        return 0
+    if not benchmarks:
+        parser.error(f"no benchmark matches {args.select}")
+
+    baseline = load_baseline(args.baseline) if args.baseline else {}
+    scales = [SCALES[name] for name in args.scale]
+    results = run_benchmarks(
+        benchmarks,
+        scales,
+        warmup=args.warmup,
+        repeat=args.repeat,
+        progress=lambda r: print(f"  {r.key}", file=sys.stderr, flush=True),
+    )
+    comparisons = compare(results, baseline, args.threshold)
+    print(format_results(results, comparisons))
+
+    if args.save:
+        print(f"Saved {save_results(results, args.save)}")
+    regressions = [c for c in comparisons if c.regressed]
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
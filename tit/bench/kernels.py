@@ -0,0 +1,199 @@
+"""Benchmarks of the core numerical kernels.
+
+Covers the TI/mTI envelope (:mod:`tit.calc`), the carrier safety metrics
+(:mod:`tit.fields`), the analyzer's focality metrics and the statistics
+engine, each on synthetic inputs from :mod:`tit.bench.synthetic`.  Modules
+are imported inside each setup, so a benchmark whose dependencies are
+missing (e.g. nibabel for the analyzer) is reported as skipped rather than
+failing the suite.
+
+Public API
+----------
+KERNELS
+    All kernel benchmarks, in run order.
+select
+    Benchmarks whose names match any of a set of patterns.
+
+See Also
+--------
+tit.bench.runner : Runs these and compares them against a baseline.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import logging
+from typing import Iterable
+
+import numpy as np
+
+from tit.bench.runner import Benchmark
+from tit.bench.synthetic import (
+    Scale,
+    field_set,
+    tet_mesh,
+    triangle_mesh,
+    volume_stack,
+)
+
+# Keeps the engine's per-call INFO logging out of the timings and the output.
+_QUIET = logging.getLogger("tit.bench.quiet")
+_QUIET.setLevel(logging.WARNING)
+
+
+# ── tit.calc ──────────────────────────────────────────────────────────────
+
+
+def _ti_vectors(scale: Scale):
+    from tit.calc import get_TI_vectors
+
+    e1, e2 = field_set(scale.n_elements, 2)
+    return lambda: get_TI_vectors(e1, e2), scale.n_elements
+
+
+def _mti_vectors(scale: Scale):
+    from tit.calc import get_mTI_vectors
+
+    fields = field_set(scale.n_elements, 4)
+    return lambda: get_mTI_vectors(fields), scale.n_elements
+
+
+def _mti_depth_sweep(scale: Scale):
+    from tit.calc import _mti_modulation_depth
+
+    fields = field_set(scale.n_elements, 4)
+    return lambda: _mti_modulation_depth(fields, refine=False), scale.n_elements
+
+
+# ── tit.fields ────────────────────────────────────────────────────────────
+
+
+def _hf_peak(n_fields: int):
+    def setup(scale: Scale):
+        from tit.fields import hf_peak
+
+        fields = field_set(scale.n_elements, n_fields)
+        return lambda: hf_peak(*fields), scale.n_elements
+
+    return setup
+
+
+def _hf_sar(scale: Scale):
+    from tit.fields import hf_sar
+
+    fields = field_set(scale.n_elements, 2)
+    return lambda: hf_sar(*fields), scale.n_elements
+
+
+# ── tit.analyzer ──────────────────────────────────────────────────────────
+
+
+def _focality(sizes: np.ndarray):
+    from tit.analyzer.analyzer import Analyzer
+
+    # _compute_focality_metrics reads no instance state.
+    analyzer = Analyzer.__new__(Analyzer)
+    e1, e2 = field_set(len(sizes), 2)
+    values = np.linalg.norm(e1 + e2, axis=1)
+    values[:: max(1, len(values) // 100)] = np.nan  # elements outside the ROI
+    return lambda: analyzer._compute_focality_metrics(values, sizes), len(sizes)
+
+
+def _focality_surface(scale: Scale):
+    return _focality(triangle_mesh(scale.surface_side)[2])
+
+
+def _focality_volume(scale: Scale):
+    return _focality(tet_mesh(scale.mesh_side)[2])
+
+
+# ── tit.stats ─────────────────────────────────────────────────────────────
+
+
+def _groups(scale: Scale):
+    data, _ = volume_stack(scale.volume_shape, scale.n_subjects, effect=0.5)
+    half = scale.n_subjects // 2
+    return data[..., :half], data[..., half:]
+
+
+def _ttest(scale: Scale):
+    from tit.stats.engine import ttest_voxelwise
+
+    responders, non_responders = _groups(scale)
+    n_voxels = int(np.prod(scale.volume_shape))
+    return (
+        lambda: ttest_voxelwise(responders, non_responders, log=_QUIET),
+        n_voxels,
+    )
+
+
+def _correlation(scale: Scale):
+    from tit.stats.engine import correlation_voxelwise
+
+    data, _ = volume_stack(scale.volume_shape, scale.n_subjects, effect=0.5)
+    effect_sizes = np.random.default_rng(0).uniform(0, 1, scale.n_subjects)
+    n_voxels = int(np.prod(scale.volume_shape))
+    return (
+        lambda: correlation_voxelwise(data, effect_sizes, log=_QUIET),
+        n_voxels,
+    )
+
+
+def _permutation(scale: Scale):
+    from tit.stats.engine import PermutationEngine, ttest_voxelwise
+
+    responders, non_responders = _groups(scale)
+    p_values, t_statistics, valid_mask = ttest_voxelwise(
+        responders, non_responders, log=_QUIET
+    )
+    engine = PermutationEngine(
+        cluster_threshold=0.05,
+        n_permutations=scale.n_permutations,
+        n_jobs=1,
+        log=_QUIET,
+    )
+
+    def run():
+        np.random.seed(0)
+        return engine.correct_groups(
+            responders,
+            non_responders,
+            p_values=p_values,
+            t_statistics=t_statistics,
+            valid_mask=valid_mask,
+        )
+
+    return run, scale.n_permutations
+
+
+KERNELS: list[Benchmark] = [
+    Benchmark("calc.get_TI_vectors", _ti_vectors),
+    Benchmark("calc.get_mTI_vectors", _mti_vectors),
+    Benchmark("calc.mti_depth_sweep", _mti_depth_sweep),
+    Benchmark("fields.hf_peak", _hf_peak(2)),
+    Benchmark("fields.hf_peak_4pair", _hf_peak(4)),
+    Benchmark("fields.hf_sar", _hf_sar),
+    Benchmark("analyzer.focality_surface", _focality_surface),
+    Benchmark("analyzer.focality_volume", _focality_volume),
+    Benchmark("stats.ttest_voxelwise", _ttest, unit="voxels"),
+    Benchmark("stats.correlation_voxelwise", _correlation, unit="voxels"),
+    Benchmark("stats.permutation", _permutation, unit="permutations"),
+]
+
+
+def select(
+    benchmarks: Iterable[Benchmark], patterns: Iterable[str] | None
+) -> list[Benchmark]:
+    """Benchmarks whose name matches any glob or prefix in *patterns*.
+
+    ``None`` or an empty list selects everything.
+    """
+    benchmarks = list(benchmarks)
+    patterns = list(patterns or [])
+    if not patterns:
+        return benchmarks
+    return [
+        b
+        for b in benchmarks
+        if any(fnmatch.fnmatch(b.name, p) or b.name.startswith(p) for p in patterns)
+    ]
@@ -0,0 +1,338 @@
+"""Benchmark timing, baselines and regression checks.
+
+A :class:`Benchmark` prepares its inputs once per scale and returns a
+callable; :func:`measure` runs that callable for warm-up rounds, then times
+a number of repetitions and measures peak memory in one further, separately
+traced run (allocation tracing slows the code it watches, so it is kept out
+of the timings).  Results are stored as JSON and compared against a
+baseline from an earlier run on the same machine.
+
+Public API
+----------
+Benchmark
+    A named benchmark with per-scale setup.
+BenchResult
+    Timings, throughput and peak memory of one benchmark at one scale.
+measure
+    Time a callable with warm-up and repetition control.
+run_benchmarks
+    Run benchmarks across scales.
+save_results
+    Write results as a JSON baseline.
+load_baseline
+    Read a baseline written by :func:`save_results`.
+compare
+    Find results slower (or larger) than the baseline beyond a threshold.
+Comparison
+    One result against its baseline entry.
+format_results
+    Text table of results and their baseline comparison.
+
+See Also
+--------
+tit.bench.kernels : The numerical-kernel suite.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+from tit.bench.synthetic import Scale
+
+#: Default relative slow-down reported as a regression.
+DEFAULT_THRESHOLD = 0.20
+BASELINE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A named benchmark.
+
+    Attributes
+    ----------
+    name : str
+        Dotted name, ``<area>.<kernel>`` (e.g. ``calc.get_TI_vectors``).
+    setup : callable
+        ``setup(scale) -> (func, n_items)``: builds the inputs for *scale*
+        and returns the zero-argument callable to time and the number of
+        items (elements, voxels, permutations...) it processes.  Raising
+        ``ImportError`` marks the benchmark as skipped.
+    unit : str
+        What an item is, for throughput reporting.
+    """
+
+    name: str
+    setup: Callable[[Scale], tuple[Callable[[], Any], int]]
+    unit: str = "elements"
+
+
+@dataclass
+class BenchResult:
+    """Outcome of one benchmark at one scale."""
+
+    name: str
+    scale: str
+    unit: str
+    n_items: int = 0
+    times_s: list[float] = field(default_factory=list)
+    peak_mb: float = 0.0
+    skipped: str | None = None
+
+    @property
+    def key(self) -> str:
+        """Baseline key, ``<name>[<scale>]``."""
+        return f"{self.name}[{self.scale}]"
+
+    @property
+    def median_s(self) -> float:
+        return statistics.median(self.times_s) if self.times_s else 0.0
+
+    @property
+    def min_s(self) -> float:
+        return min(self.times_s) if self.times_s else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Items per second at the median time."""
+        return self.n_items / self.median_s if self.median_s else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.update(
+            median_s=self.median_s, min_s=self.min_s, throughput=self.throughput
+        )
+        return data
+
+
+def measure(
+    func: Callable[[], Any], *, warmup: int = 1, repeat: int = 5
+) -> tuple[list[float], float]:
+    """Time *func* after *warmup* untimed calls.
+
+    Returns
+    -------
+    times : list of float
+        Wall time of each of the *repeat* timed calls [s].
+    peak_mb : float
+        Peak memory allocated during one traced call [MiB]; NumPy reports
+        its array buffers to :mod:`tracemalloc`, so this covers temporaries.
+    """
+    for _ in range(warmup):
+        func()
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    if not tracing:
+        tracemalloc.stop()
+    return times, (peak - base) / (1024 * 1024)
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    scales: Iterable[Scale],
+    *,
+    warmup: int = 1,
+    repeat: int = 5,
+    progress: Callable[[BenchResult], None] | None = None,
+) -> list[BenchResult]:
+    """Run every benchmark at every scale.
+
+    Parameters
+    ----------
+    benchmarks : iterable of Benchmark
+        Benchmarks to run.
+    scales : iterable of Scale
+        Problem sizes; see :data:`tit.bench.synthetic.SCALES`.
+    warmup, repeat : int, optional
+        Passed to :func:`measure`.
+    progress : callable, optional
+        Called with each result as it completes.
+
+    Returns
+    -------
+    list of BenchResult
+        One result per benchmark and scale, skipped ones included.
+    """
+    benchmarks = list(benchmarks)
+    results = []
+    for scale in scales:
+        for bench in benchmarks:
+            result = BenchResult(bench.name, scale.name, bench.unit)
+            try:
+                func, result.n_items = bench.setup(scale)
+            except ImportError as exc:
+                result.skipped = f"missing dependency: {exc.name or exc}"
+            else:
+                result.times_s, result.peak_mb = measure(
+                    func, warmup=warmup, repeat=repeat
+                )
+                del func
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return results
+
+
+def _environment() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "node": platform.node(),
+    }
+
+
+def save_results(results: Iterable[BenchResult], path: str | Path) -> Path:
+    """Write *results* to *path* as a JSON baseline (atomically)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": BASELINE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": _environment(),
+        "results": {
+            r.key: r.to_dict() for r in results if r.skipped is None and r.times_s
+        },
+    }
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def load_baseline(path: str | Path) -> dict[str, dict[str, Any]]:
+    """Results of a baseline file by key.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a baseline written by :func:`save_results`.
+    """
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(payload, dict) or payload.get("version") != BASELINE_VERSION:
+        raise ValueError(f"{path} is not a benchmark baseline")
+    return payload["results"]
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """A result compared with its baseline entry."""
+
+    key: str
+    baseline_s: float
+    current_s: float
+    baseline_mb: float
+    current_mb: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        """Current median time over baseline median time."""
+        return self.current_s / self.baseline_s if self.baseline_s else 1.0
+
+    @property
+    def slower(self) -> bool:
+        return self.ratio > 1.0 + self.threshold
+
+    @property
+    def larger(self) -> bool:
+        # Ignore a few MiB of noise on kernels that barely allocate.
+        return (
+            self.current_mb > self.baseline_mb * (1.0 + self.threshold)
+            and self.current_mb - self.baseline_mb > 1.0
+        )
+
+    @property
+    def regressed(self) -> bool:
+        return self.slower or self.larger
+
+
+def compare(
+    results: Iterable[BenchResult],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """Compare *results* with *baseline* entries of the same key.
+
+    A result regresses when its median time exceeds the baseline's by more
+    than *threshold* (relative), or its peak memory does.  Results without
+    a baseline entry are left out.
+    """
+    comparisons = []
+    for result in results:
+        entry = baseline.get(result.key)
+        if entry is None or result.skipped is not None or not result.times_s:
+            continue
+        comparisons.append(
+            Comparison(
+                key=result.key,
+                baseline_s=entry["median_s"],
+                current_s=result.median_s,
+                baseline_mb=entry.get("peak_mb", 0.0),
+                current_mb=result.peak_mb,
+                threshold=threshold,
+            )
+        )
+    return comparisons
+
+
+def _si(value: float) -> str:
+    for factor, suffix in ((1e9, "G"), (1e6, "M"), (1e3, "k")):
+        if value >= factor:
+            return f"{value / factor:.2f}{suffix}"
+    return f"{value:.1f}"
+
+
+def format_results(
+    results: Iterable[BenchResult], comparisons: Iterable[Comparison] = ()
+) -> str:
+    """Text table of *results*, with baseline ratios where compared."""
+    by_key = {c.key: c for c in comparisons}
+    lines = [
+        f"{'benchmark':<44} {'median':>9} {'min':>9} {'throughput':>16} "
+        f"{'peak MB':>9}  vs baseline"
+    ]
+    for r in results:
+        if r.skipped is not None:
+            lines.append(f"{r.key:<44} skipped ({r.skipped})")
+            continue
+        note = ""
+        c = by_key.get(r.key)
+        if c is not None:
+            note = f"x{c.ratio:.2f}"
+            if c.slower:
+                note += "  SLOWER"
+            if c.larger:
+                note += f"  MEMORY {c.baseline_mb:.1f}->{c.current_mb:.1f}"
+        rate = f"{_si(r.throughput)} {r.unit}/s"
+        line = (
+            f"{r.key:<44} {r.median_s * 1e3:>7.1f}ms {r.min_s * 1e3:>7.1f}ms "
+            f"{rate:>16} {r.peak_mb:>9.1f}  {note}"
+        )
+        lines.append(line.rstrip())
+    return "\n".join(lines)
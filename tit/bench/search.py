@@ -0,0 +1,472 @@
+"""End-to-end benchmark of the exhaustive searches on a synthetic leadfield.
+
+Fabricates a leadfield of configurable size -- a layered spherical head
+(:func:`~tit.bench.synthetic.head_elements`), scalp electrodes and
+dipole-like electrode fields -- and writes it as a leadfield store
+(:mod:`tit.opt.leadfield_store`), together with a spherical ROI CSV in grey
+matter.  The real :class:`~tit.opt.ex.engine.ExSearchEngine` and
+:class:`~tit.opt.mex.engine.MExSearchEngine` are then initialised from that
+store and their ``run()`` loops driven in bucket or pool mode, exactly as
+``run_ex_search`` / ``run_mex_search`` do after resolving a subject.
+
+No subject, leadfield or ``LeadfieldGenerator`` run is needed.  The engines
+still score candidates with SimNIBS's ``TI_utils``, so the ``simnibs``
+package must be importable.
+
+Each case reports candidates evaluated per second, time to the first
+scored candidate and the process's peak resident memory.  From the command
+line every case runs in a fresh process, so peak memory is per case::
+
+    python -m tit.bench.search --engine ex mex --mode bucket pool
+
+Public API
+----------
+SearchCase
+    Problem size and search mode of one benchmark case.
+SearchResult
+    Timings, throughput and memory of one case.
+write_leadfield_store
+    Write a synthetic leadfield store and ROI for a case.
+run_search_case
+    Run one case in the current process.
+
+See Also
+--------
+tit.bench.kernels : Benchmarks of the numerical kernels.
+tit.opt.ex.engine.ExSearchEngine : Two-pair search engine.
+tit.opt.mex.engine.MExSearchEngine : Four-pair search engine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import csv
+import json
+import logging
+import multiprocessing
+import signal
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from tit.bench.synthetic import HEAD_RADII, electrode_positions, head_elements
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ENGINES = ("ex", "mex")
+MODES = ("bucket", "pool")
+ROI_NAME = "bench_roi"
+
+
+@dataclass(frozen=True)
+class SearchCase:
+    """Problem size and search mode of one benchmark case.
+
+    Attributes
+    ----------
+    engine : str
+        ``"ex"`` (two pairs) or ``"mex"`` (four pairs).
+    mode : str
+        ``"bucket"`` (one electrode bucket per pair pole) or ``"pool"``
+        (all combinations of one electrode pool).
+    n_elements : int
+        Leadfield mesh elements.
+    n_electrodes : int
+        Electrodes in the leadfield, reference included.
+    bucket_size : int
+        Electrodes per bucket in bucket mode.
+    pool_size : int
+        Electrodes in the pool in pool mode.
+    roi_radius : float
+        Spherical ROI radius [mm].
+    total_current, current_step : float
+        Current split of the two-pair search [mA]; the four-pair search
+        drives every pair at *total_current* / 2.
+    dtype : str
+        Leadfield store dtype, ``"float32"`` or ``"float16"``.
+    deduplicate : bool
+        Evaluate one candidate per symmetry class.
+    max_candidates : int
+        Stop the search after this many candidates, through the engine's
+        own interrupt handling (``0``: run to completion).  Four-pair
+        candidates cost far more than two-pair ones, and complete searches
+        run to tens of thousands of them.
+    seed : int
+        Seed of the synthetic head.
+    """
+
+    engine: str = "ex"
+    mode: str = "bucket"
+    n_elements: int = 200_000
+    n_electrodes: int = 64
+    bucket_size: int = 4
+    pool_size: int = 8
+    roi_radius: float = 10.0
+    total_current: float = 2.0
+    current_step: float = 0.5
+    dtype: str = "float32"
+    deduplicate: bool = True
+    max_candidates: int = 1000
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}, got {self.engine!r}")
+        if self.mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {self.mode!r}")
+        n_pairs = 2 if self.engine == "ex" else 4
+        needed = (
+            2 * n_pairs * self.bucket_size if self.mode == "bucket" else self.pool_size
+        )
+        if needed > self.n_electrodes - 1:
+            raise ValueError(
+                f"{self.engine} {self.mode} search needs {needed} electrodes "
+                f"besides the reference; the leadfield has {self.n_electrodes - 1}"
+            )
+
+    @property
+    def name(self) -> str:
+        return f"{self.engine}.{self.mode}"
+
+
+@dataclass
+class SearchResult:
+    """Outcome of one :class:`SearchCase`.
+
+    Times are wall-clock seconds; ``first_result_s`` is measured from the
+    start of ``run()`` (enumeration, symmetry reduction and the first field
+    computation).
+    """
+
+    case: SearchCase
+    n_roi: int = 0
+    n_gm: int = 0
+    leadfield_mb: float = 0.0
+    candidates: int = 0
+    reported: int = 0
+    write_s: float = 0.0
+    init_s: float = 0.0
+    run_s: float = 0.0
+    first_result_s: float | None = None
+    peak_rss_mb: float | None = None
+    skipped: str | None = None
+    top: dict = field(default_factory=dict)
+
+    @property
+    def candidates_per_s(self) -> float:
+        return self.candidates / self.run_s if self.run_s else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["candidates_per_s"] = self.candidates_per_s
+        return data
+
+
+def _field(baricenters: np.ndarray, position: np.ndarray) -> np.ndarray:
+    """Dipole-like field of a scalp electrode at *baricenters* (float32)."""
+    d = (baricenters - position) / 1000.0  # mm -> m
+    return (d / np.linalg.norm(d, axis=1, keepdims=True) ** 3 * 1e-3).astype(
+        np.float32
+    )
+
+
+def write_leadfield_store(case: SearchCase, directory: str | Path) -> dict:
+    """Write the synthetic leadfield store and ROI CSV for *case*.
+
+    Leadfield rows are the field of each electrode minus that of the
+    reference (the first electrode), as in a SimNIBS leadfield, generated
+    and written one element block at a time.
+
+    Returns
+    -------
+    dict
+        ``store`` (path), ``roi_csv`` (path), ``electrodes`` (names,
+        reference excluded) and ``leadfield_mb``.
+    """
+    from tit.opt.leadfield_store import write_store
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    tags, baricenters, volumes = head_elements(case.n_elements, case.seed)
+    positions = electrode_positions(case.n_electrodes)
+    names = [f"E{i:03d}" for i in range(case.n_electrodes)]
+
+    def read_block(start: int, stop: int) -> np.ndarray:
+        block = baricenters[start:stop]
+        reference = _field(block, positions[0])
+        return np.stack([_field(block, p) - reference for p in positions[1:]])
+
+    store = write_store(
+        directory / "synthetic.lfstore",
+        read_block,
+        n_elements=case.n_elements,
+        electrode_names=names[1:],
+        reference=names[0],
+        tags=tags,
+        baricenters=baricenters,
+        volumes=volumes,
+        dtype=case.dtype,
+    )
+
+    # ROI centre in grey matter under the upper scalp.
+    depth = (HEAD_RADII[0] + HEAD_RADII[1]) / 2
+    roi_csv = directory / f"{ROI_NAME}.csv"
+    with open(roi_csv, "w", newline="") as f:
+        csv.writer(f).writerow(list(depth * np.array([0.0, 0.6, 0.8])))
+
+    n_values = case.n_elements * (case.n_electrodes - 1) * 3
+    return {
+        "store": store,
+        "roi_csv": roi_csv,
+        "electrodes": names[1:],
+        "leadfield_mb": n_values * np.dtype(case.dtype).itemsize / 2**20,
+    }
+
+
+def _quiet_logger(log_file: str | None) -> logging.Logger:
+    """Engine logger: records are created as in a real run, but not printed."""
+    logger = logging.getLogger("tit.bench.search")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+    if log_file:
+        from tit.logger import add_file_handler
+
+        add_file_handler(log_file, logger_name=logger.name)
+    return logger
+
+
+def _peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20
+
+
+def run_search_case(
+    case: SearchCase,
+    workdir: str | Path | None = None,
+    log_file: str | None = None,
+) -> SearchResult:
+    """Run one benchmark case in the current process.
+
+    Parameters
+    ----------
+    case : SearchCase
+        What to run.
+    workdir : str or Path, optional
+        Where the synthetic store is written; a temporary directory that
+        is removed afterwards by default.
+    log_file : str, optional
+        Also write the engine's log here, to include logging I/O in the
+        timings as in a real run.
+
+    Returns
+    -------
+    SearchResult
+        Skipped (with the reason) when an engine dependency is missing.
+    """
+    result = SearchResult(case)
+    try:
+        if case.engine == "ex":
+            from tit.opt.ex.engine import ExSearchEngine as engine_cls
+        else:
+            from tit.opt.mex.engine import MExSearchEngine as engine_cls
+    except ImportError as exc:
+        result.skipped = f"missing dependency: {exc.name or exc}"
+        return result
+
+    with tempfile.TemporaryDirectory(prefix="tit-bench-") as tmp:
+        directory = Path(workdir or tmp)
+        start = time.perf_counter()
+        synthetic = write_leadfield_store(case, directory)
+        result.write_s = time.perf_counter() - start
+        result.leadfield_mb = synthetic["leadfield_mb"]
+
+        logger = _quiet_logger(log_file)
+        engine = engine_cls(
+            str(synthetic["store"]), str(synthetic["roi_csv"]), ROI_NAME, logger
+        )
+        start = time.perf_counter()
+        engine.initialize(roi_radius=case.roi_radius)
+        result.init_s = time.perf_counter() - start
+        result.n_roi = len(engine.roi_indices)
+        result.n_gm = len(engine.gm_indices)
+
+        # Count and time candidates by wrapping the engine's scoring method.
+        method = "compute_ti_field" if case.engine == "ex" else "compute_mti_field"
+        compute = getattr(engine, method)
+
+        def counted(*args, **kwargs):
+            data = compute(*args, **kwargs)
+            result.candidates += 1
+            if result.first_result_s is None:
+                result.first_result_s = time.perf_counter() - run_start
+            if result.candidates == case.max_candidates:
+                # run() stops before the next candidate, as on Ctrl-C.
+                signal.raise_signal(signal.SIGINT)
+            return data
+
+        setattr(engine, method, counted)
+
+        handlers = {s: signal.getsignal(s) for s in (signal.SIGINT, signal.SIGTERM)}
+        run_start = time.perf_counter()
+        try:
+            results = _run(engine, case, synthetic["electrodes"], str(directory))
+        finally:
+            result.run_s = time.perf_counter() - run_start
+            for sig, handler in handlers.items():
+                signal.signal(sig, handler)
+
+    result.reported = len(results)
+    result.peak_rss_mb = _peak_rss_mb()
+    if results:
+        key = f"{ROI_NAME}_TImean_ROI"
+        best = max(results, key=lambda name: results[name][key])
+        result.top = {"montage": best, **results[best]}
+    return result
+
+
+def _buckets(electrodes: list[str], n_buckets: int, size: int) -> list[list[str]]:
+    return [electrodes[i * size : (i + 1) * size] for i in range(n_buckets)]
+
+
+def _run(engine, case: SearchCase, electrodes: list[str], output_dir: str) -> dict:
+    """Call the engine's ``run()`` with the inputs ``run_*_search`` would pass."""
+    pool = case.mode == "pool"
+    if case.engine == "ex":
+        from tit.opt.ex.logic import generate_current_ratios
+
+        ratios = generate_current_ratios(
+            case.total_current,
+            case.current_step,
+            case.total_current - case.current_step,
+        )
+        if pool:
+            buckets = [electrodes[: case.pool_size]] * 4
+        else:
+            buckets = _buckets(electrodes, 4, case.bucket_size)
+        return engine.run(
+            *buckets,
+            ratios,
+            pool,
+            output_dir,
+            deduplicate=case.deduplicate,
+        )
+
+    if pool:
+        buckets_or_pool = electrodes[: case.pool_size]
+    else:
+        keys = [f"e{i}_{pole}" for i in range(1, 5) for pole in ("plus", "minus")]
+        buckets_or_pool = dict(zip(keys, _buckets(electrodes, 8, case.bucket_size)))
+    return engine.run(
+        buckets_or_pool,
+        pool,
+        output_dir,
+        current_mA=case.total_current / 2,
+        deduplicate=case.deduplicate,
+    )
+
+
+def _run_isolated(case: SearchCase) -> SearchResult:
+    """Run *case* in a fresh process so its peak memory is its own."""
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=1, mp_context=context
+    ) as pool:
+        return pool.submit(run_search_case, case).result()
+
+
+def format_result(result: SearchResult) -> str:
+    """One-line summary of *result*."""
+    name = f"{result.case.name}[{result.case.n_elements} el]"
+    if result.skipped is not None:
+        return f"{name:<26} skipped ({result.skipped})"
+    first = (
+        f"{result.first_result_s * 1e3:.0f}ms"
+        if result.first_result_s is not None
+        else "-"
+    )
+    peak = f"{result.peak_rss_mb:.0f}MB" if result.peak_rss_mb is not None else "-"
+    return (
+        f"{name:<26} {result.candidates:>8} cand  {result.candidates_per_s:>9.1f}/s  "
+        f"first {first:>7}  init {result.init_s:>6.2f}s  peak {peak:>7}  "
+        f"ROI {result.n_roi} / GM {result.n_gm}"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the search benchmark cases given on the command line."""
+    defaults = SearchCase()
+    parser = argparse.ArgumentParser(
+        prog="python -m tit.bench.search",
+        description="Benchmark the exhaustive searches on a synthetic leadfield.",
+    )
+    parser.add_argument("--engine", nargs="+", choices=ENGINES, default=["ex"])
+    parser.add_argument("--mode", nargs="+", choices=MODES, default=["bucket"])
+    parser.add_argument("--elements", type=int, default=defaults.n_elements)
+    parser.add_argument("--electrodes", type=int, default=defaults.n_electrodes)
+    parser.add_argument("--bucket-size", type=int, default=defaults.bucket_size)
+    parser.add_argument("--pool-size", type=int, default=defaults.pool_size)
+    parser.add_argument("--roi-radius", type=float, default=defaults.roi_radius)
+    parser.add_argument(
+        "--dtype", choices=("float32", "float16"), default=defaults.dtype
+    )
+    parser.add_argument(
+        "--no-dedup", action="store_true", help="Evaluate every candidate."
+    )
+    parser.add_argument(
+        "--max-candidates",
+        type=int,
+        default=defaults.max_candidates,
+        help="Stop each search after this many candidates (0: no limit).",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run cases in this process (peak memory is then cumulative).",
+    )
+    parser.add_argument("--json", metavar="FILE", help="Write results as JSON.")
+    args = parser.parse_args(argv)
+
+    cases = [
+        SearchCase(
+            engine=engine,
+            mode=mode,
+            n_elements=args.elements,
+            n_electrodes=args.electrodes,
+            bucket_size=args.bucket_size,
+            pool_size=args.pool_size,
+            roi_radius=args.roi_radius,
+            dtype=args.dtype,
+            deduplicate=not args.no_dedup,
+            max_candidates=args.max_candidates,
+        )
+        for engine in args.engine
+        for mode in args.mode
+    ]
+    run = run_search_case if args.in_process else _run_isolated
+    results = []
+    for case in cases:
+        result = run(case)
+        results.append(result)
+        print(format_result(result), flush=True)
+
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps([r.to_dict() for r in results], indent=2, default=str) + "\n"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""Reproducible synthetic inputs for benchmarks.
+
+Everything here is generated from a seed with NumPy alone, so benchmarks run
+on any machine without SimNIBS, subject data or a leadfield.  Sizes are
+taken from a :class:`Scale`; the three built-in scales span a quick laptop
+check to a full-head problem.
+
+Public API
+----------
+Scale
+    Problem sizes for one benchmark scale.
+SCALES
+    Built-in scales by name (``small``, ``medium``, ``large``).
+field_set
+    Per-pair carrier E-field arrays on N elements.
+tet_mesh
+    Tetrahedral mesh of a jittered cube with element volumes.
+triangle_mesh
+    Triangulated curved surface with element areas.
+volume_stack
+    4-D subject volumes with a brain-shaped mask and an affine.
+head_elements
+    Tissue tags, barycenters and volumes of a spherical head mesh.
+electrode_positions
+    Electrode coordinates spread over the upper half of the scalp.
+
+See Also
+--------
+tit.bench.kernels : Benchmarks built on these inputs.
+tit.bench.search : Exhaustive-search harness on a synthetic leadfield.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Problem sizes for one benchmark scale.
+
+    Attributes
+    ----------
+    name : str
+        Scale name, used in result keys.
+    n_elements : int
+        Elements per field array (a GM mesh has ~200k-1M).
+    mesh_side : int
+        Cubes per side of :func:`tet_mesh` (``6 * mesh_side**3`` tets).
+    surface_side : int
+        Squares per side of :func:`triangle_mesh` (``2 * surface_side**2``
+        triangles).
+    volume_shape : tuple of int
+        Voxel grid of :func:`volume_stack`.
+    n_subjects : int
+        Subjects in :func:`volume_stack`.
+    n_permutations : int
+        Permutations run by the permutation-test benchmark.
+    """
+
+    name: str
+    n_elements: int
+    mesh_side: int
+    surface_side: int
+    volume_shape: tuple[int, int, int]
+    n_subjects: int
+    n_permutations: int
+
+
+SCALES: dict[str, Scale] = {
+    "small": Scale("small", 20_000, 16, 100, (32, 38, 32), 12, 10),
+    "medium": Scale("medium", 200_000, 32, 300, (64, 76, 64), 20, 20),
+    "large": Scale("large", 1_000_000, 56, 700, (91, 109, 91), 30, 20),
+}
+
+
+def field_set(n_elements: int, n_fields: int = 2, seed: int = 0) -> list[np.ndarray]:
+    """Carrier E-field vectors for *n_fields* electrode pairs.
+
+    Directions are uniform on the sphere and magnitudes log-normal around
+    0.2 V/m, roughly the spread of a 1 mA pair in grey matter.
+
+    Returns
+    -------
+    list of np.ndarray
+        *n_fields* float64 arrays of shape ``(n_elements, 3)``.
+    """
+    rng = np.random.default_rng(seed)
+    fields = []
+    for _ in range(n_fields):
+        vectors = rng.standard_normal((n_elements, 3))
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        magnitude = rng.lognormal(np.log(0.2), 0.6, size=n_elements)
+        fields.append(vectors * magnitude[:, None])
+    return fields
+
+
+def tet_mesh(side: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Tetrahedral mesh of a ``side``-cube grid with 1 mm spacing.
+
+    Every cube is split into six tetrahedra around its main diagonal and the
+    interior nodes are jittered, so element volumes vary as in a real head
+    mesh.
+
+    Returns
+    -------
+    nodes : np.ndarray, shape (n_nodes, 3)
+        Node coordinates [mm].
+    elements : np.ndarray, shape (6 * side**3, 4)
+        Node indices of each tetrahedron.
+    volumes : np.ndarray, shape (6 * side**3,)
+        Element volumes [mm^3].
+    """
+    rng = np.random.default_rng(seed)
+    n = side + 1
+    grid = np.stack(np.meshgrid(*(np.arange(n),) * 3, indexing="ij"), axis=-1)
+    nodes = grid.reshape(-1, 3).astype(float)
+    interior = np.all((grid > 0) & (grid < side), axis=-1).ravel()
+    nodes[interior] += rng.uniform(-0.2, 0.2, size=(interior.sum(), 3))
+
+    i, j, k = (a.ravel() for a in np.meshgrid(*(np.arange(side),) * 3, indexing="ij"))
+    corner = [
+        ((i + di) * n + (j + dj)) * n + (k + dk)
+        for di, dj, dk in np.ndindex(2, 2, 2)
+    ]
+    # Kuhn triangulation: paths from corner 000 to 111 along the cube edges.
+    paths = [
+        (0, 1, 3, 7),
+        (0, 1, 5, 7),
+        (0, 2, 3, 7),
+        (0, 2, 6, 7),
+        (0, 4, 5, 7),
+        (0, 4, 6, 7),
+    ]
+    elements = np.concatenate(
+        [np.stack([corner[c] for c in path], axis=1) for path in paths]
+    )
+    p = nodes[elements]
+    edges = p[:, 1:] - p[:, :1]
+    volumes = np.abs(np.linalg.det(edges)) / 6.0
+    return nodes, elements, volumes
+
+
+def triangle_mesh(
+    side: int, seed: int = 0
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Triangulated, gently folded surface with 1 mm grid spacing.
+
+    Returns
+    -------
+    nodes : np.ndarray, shape (n_nodes, 3)
+        Node coordinates [mm].
+    triangles : np.ndarray, shape (2 * side**2, 3)
+        Node indices of each triangle.
+    areas : np.ndarray, shape (2 * side**2,)
+        Element areas [mm^2].
+    """
+    rng = np.random.default_rng(seed)
+    n = side + 1
+    x, y = np.meshgrid(np.arange(n, dtype=float), np.arange(n, dtype=float))
+    phase = rng.uniform(0, 2 * np.pi, size=2)
+    z = 3.0 * np.sin(x / 6.0 + phase[0]) * np.cos(y / 9.0 + phase[1])
+    nodes = np.stack([x.ravel(), y.ravel(), z.ravel()], axis=1)
+
+    i, j = (a.ravel() for a in np.meshgrid(np.arange(side), np.arange(side)))
+    a = i * n + j
+    b, c, d = a + 1, a + n, a + n + 1
+    triangles = np.concatenate(
+        [np.stack([a, b, d], axis=1), np.stack([a, d, c], axis=1)]
+    )
+    p = nodes[triangles]
+    areas = 0.5 * np.linalg.norm(np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0]), axis=1)
+    return nodes, triangles, areas
+
+
+def volume_stack(
+    shape: tuple[int, int, int],
+    n_subjects: int,
+    effect: float = 0.0,
+    seed: int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Subject field volumes as loaded from NIfTI for group statistics.
+
+    Each subject has a smooth field inside an ellipsoidal brain mask (zero
+    outside, like a masked grey-matter NIfTI) plus noise; *effect* adds a
+    focal blob of that relative strength, so permutation tests find
+    clusters.
+
+    Returns
+    -------
+    data : np.ndarray, shape (*shape, n_subjects)
+        float32 volumes.
+    affine : np.ndarray, shape (4, 4)
+        2 mm MNI-like voxel-to-world affine.
+    """
+    rng = np.random.default_rng(seed)
+    axes = [np.linspace(-1, 1, s) for s in shape]
+    x, y, z = np.meshgrid(*axes, indexing="ij")
+    mask = x**2 + y**2 + z**2 < 0.9
+    base = np.exp(-((x - 0.2) ** 2 + y**2 + (z - 0.3) ** 2) / 0.3)
+    blob = np.exp(-((x + 0.3) ** 2 + (y - 0.2) ** 2 + z**2) / 0.02)
+
+    gain = rng.lognormal(0.0, 0.2, size=n_subjects)
+    noise = rng.standard_normal((*shape, n_subjects)).astype(np.float32)
+    data = (base[..., None] * gain) * (1.0 + 0.3 * noise)
+    data += effect * blob[..., None] * rng.uniform(0.5, 1.5, size=n_subjects)
+    data = np.where(mask[..., None], np.abs(data), 0.0).astype(np.float32)
+
+    affine = np.diag([2.0, 2.0, 2.0, 1.0])
+    affine[:3, 3] = -np.asarray(shape) + 1.0
+    return data, affine
+
+
+#: Tissue tags of :func:`head_elements`, as in SimNIBS head meshes.
+WM_TAG, GM_TAG, CSF_TAG = 1, 2, 3
+#: Outer radii of the white-matter, grey-matter and CSF shells [mm].
+HEAD_RADII = (60.0, 75.0, 80.0)
+
+
+def head_elements(
+    n_elements: int, seed: int = 0
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Elements of a layered spherical head, without connectivity.
+
+    Barycenters are uniform in an 80 mm ball and tagged white matter, grey
+    matter or CSF by radius (:data:`HEAD_RADII`); volumes are log-normal
+    around 1 mm^3.
+
+    Returns
+    -------
+    tags : np.ndarray, shape (n_elements,)
+        Tissue tags (:data:`WM_TAG`, :data:`GM_TAG`, :data:`CSF_TAG`).
+    baricenters : np.ndarray, shape (n_elements, 3)
+        Element barycenters [mm].
+    volumes : np.ndarray, shape (n_elements,)
+        Element volumes [mm^3].
+    """
+    rng = np.random.default_rng(seed)
+    directions = rng.standard_normal((n_elements, 3))
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    radius = HEAD_RADII[-1] * rng.uniform(0, 1, n_elements) ** (1 / 3)
+    baricenters = directions * radius[:, None]
+    tags = np.select(
+        [radius < HEAD_RADII[0], radius < HEAD_RADII[1]], [WM_TAG, GM_TAG], CSF_TAG
+    ).astype(np.int32)
+    volumes = rng.lognormal(0.0, 0.4, n_elements)
+    return tags, baricenters, volumes
+
+
+def electrode_positions(n_electrodes: int, radius: float = 95.0) -> np.ndarray:
+    """*n_electrodes* scalp positions on a Fibonacci spiral over the upper half.
+
+    Returns
+    -------
+    np.ndarray, shape (n_electrodes, 3)
+        Electrode coordinates [mm], ordered from the vertex down.
+    """
+    i = np.arange(n_electrodes) + 0.5
+    z = 1.0 - i / n_electrodes  # upper hemisphere only
+    r = np.sqrt(1.0 - z**2)
+    theta = np.pi * (3.0 - np.sqrt(5.0)) * i
+    return radius * np.stack([r * np.cos(theta), r * np.sin(theta), z], axis=1)
@@ -2,215 +2,25 @@
 Low-level mesh I/O, colormap, and vertex-processing utilities.
 
 This module is the single source of truth for:
-- Binary STL reading and writing
-- PLY writing (with per-vertex colors or scalars)
-- Scalar-to-color mapping (simple blue-red and matplotlib colormaps)
+- Binary STL reading and writing, and PLY writing (re-exported from
+  :mod:`tit.tools.surface_io`, shared with the standalone mesh tools)
+- Scalar-to-color mapping (piecewise-linear ramps, simple blue-red and
+  matplotlib colormaps)
 - Vertex deduplication / face remapping
 """
 
 from __future__ import annotations
 
-import struct
 from typing import Optional
 
 import numpy as np
 
-# ---------------------------------------------------------------------------
-# Binary STL
-# ---------------------------------------------------------------------------
-
-
-def read_binary_stl(path: str) -> tuple[np.ndarray, np.ndarray]:
-    """Read vertices and faces from a binary STL file.
-
-    Duplicate vertices (common in STL) are merged so the returned arrays
-    use shared vertex indices.
-
-    Args:
-        path: Path to the binary STL file.
-
-    Returns:
-        Tuple of (vertices, faces) where vertices is [N, 3] float64 and
-        faces is [M, 3] int64 with indices into the vertex array.
-    """
-    vertices: list[tuple[float, float, float]] = []
-    faces: list[tuple[int, int, int]] = []
-    vertex_map: dict[tuple[float, float, float], int] = {}
-
-    with open(path, "rb") as f:
-        # Skip 80-byte header
-        f.read(80)
-        num_triangles = struct.unpack("<I", f.read(4))[0]
-
-        for _ in range(num_triangles):
-            # Skip normal vector (3 floats = 12 bytes)
-            f.read(12)
-
-            face_indices: list[int] = []
-            for _ in range(3):
-                v = struct.unpack("<fff", f.read(12))
-                if v not in vertex_map:
-                    vertex_map[v] = len(vertices)
-                    vertices.append(v)
-                face_indices.append(vertex_map[v])
-
-            faces.append((face_indices[0], face_indices[1], face_indices[2]))
-
-            # Skip attribute byte count (2 bytes)
-            f.read(2)
-
-    return np.array(vertices, dtype=np.float64), np.array(faces, dtype=np.int64)
-
-
-def write_binary_stl(
-    path: str,
-    vertices: np.ndarray,
-    faces: np.ndarray,
-    normals: Optional[np.ndarray] = None,
-    header_text: str = "TI-Toolbox Mesh",
-) -> None:
-    """Write a binary STL file from vertices and faces.
-
-    Args:
-        path: Output file path.
-        vertices: Array of shape [N, 3] with vertex coordinates.
-        faces: Array of shape [M, 3] with vertex indices for each triangle.
-        normals: Optional array of shape [M, 3] with per-face normals.
-            If *None*, normals are computed from the triangle edges.
-        header_text: ASCII text written into the 80-byte STL header.
-    """
-    vertices = np.asarray(vertices, dtype=np.float64)
-    faces = np.asarray(faces, dtype=np.int64)
-    n_faces = len(faces)
-
-    with open(path, "wb") as f:
-        # 80-byte header
-        header = header_text.encode("ascii")[:80].ljust(80, b"\x00")
-        f.write(header)
-
-        # Number of triangles
-        f.write(struct.pack("<I", n_faces))
-
-        for i, face in enumerate(faces):
-            v0 = vertices[face[0]]
-            v1 = vertices[face[1]]
-            v2 = vertices[face[2]]
-
-            if normals is not None:
-                normal = normals[i]
-            else:
-                edge1 = v1 - v0
-                edge2 = v2 - v0
-                normal = np.cross(edge1, edge2)
-                length = np.linalg.norm(normal)
-                if length > 1e-12:
-                    normal = normal / length
-                else:
-                    normal = np.array([0.0, 0.0, 1.0])
-
-            f.write(
-                struct.pack(
-                    "<fff", float(normal[0]), float(normal[1]), float(normal[2])
-                )
-            )
-            f.write(struct.pack("<fff", float(v0[0]), float(v0[1]), float(v0[2])))
-            f.write(struct.pack("<fff", float(v1[0]), float(v1[1]), float(v1[2])))
-            f.write(struct.pack("<fff", float(v2[0]), float(v2[1]), float(v2[2])))
-            f.write(struct.pack("<H", 0))
-
-
-# ---------------------------------------------------------------------------
-# PLY Writers
-# ---------------------------------------------------------------------------
-
-
-def write_ply_with_colors(
-    path: str,
-    vertices: np.ndarray,
-    faces: np.ndarray,
-    colors: np.ndarray,
-    comment: str = "",
-) -> None:
-    """Write an ASCII PLY file with per-vertex RGB colors.
-
-    Args:
-        path: Output file path.
-        vertices: Array of shape [N, 3] vertex coordinates.
-        faces: Array of shape [M, 3] face indices.
-        colors: Array of shape [N, 3] RGB values in 0-255 range.
-        comment: Optional comment line written into the header.
-    """
-    n_vertices = len(vertices)
-    n_faces = len(faces)
-
-    with open(path, "w") as f:
-        f.write("ply\n")
-        f.write("format ascii 1.0\n")
-        if comment:
-            f.write(f"comment {comment}\n")
-        f.write(f"element vertex {n_vertices}\n")
-        f.write("property float x\n")
-        f.write("property float y\n")
-        f.write("property float z\n")
-        f.write("property uchar red\n")
-        f.write("property uchar green\n")
-        f.write("property uchar blue\n")
-        f.write(f"element face {n_faces}\n")
-        f.write("property list uchar int vertex_indices\n")
-        f.write("end_header\n")
-
-        for i in range(n_vertices):
-            x, y, z = vertices[i]
-            r, g, b = colors[i].astype(int)
-            f.write(f"{x:.6f} {y:.6f} {z:.6f} {r} {g} {b}\n")
-
-        for face in faces:
-            f.write(f"3 {face[0]} {face[1]} {face[2]}\n")
-
-
-def write_ply_with_scalars(
-    path: str,
-    vertices: np.ndarray,
-    faces: np.ndarray,
-    scalars: np.ndarray,
-    scalar_name: str = "scalar",
-    comment: str = "",
-) -> None:
-    """Write an ASCII PLY file with a per-vertex scalar property.
-
-    Args:
-        path: Output file path.
-        vertices: Array of shape [N, 3] vertex coordinates.
-        faces: Array of shape [M, 3] face indices.
-        scalars: Array of shape [N] scalar values.
-        scalar_name: Name for the scalar property in the PLY header.
-        comment: Optional comment line written into the header.
-    """
-    n_vertices = len(vertices)
-    n_faces = len(faces)
-
-    with open(path, "w") as f:
-        f.write("ply\n")
-        f.write("format ascii 1.0\n")
-        if comment:
-            f.write(f"comment {comment}\n")
-        f.write(f"element vertex {n_vertices}\n")
-        f.write("property float x\n")
-        f.write("property float y\n")
-        f.write("property float z\n")
-        f.write(f"property float {scalar_name}\n")
-        f.write(f"element face {n_faces}\n")
-        f.write("property list uchar int vertex_indices\n")
-        f.write("end_header\n")
-
-        for i in range(n_vertices):
-            x, y, z = vertices[i]
-            s = scalars[i]
-            f.write(f"{x:.6f} {y:.6f} {z:.6f} {s:.6f}\n")
-
-        for face in faces:
-            f.write(f"3 {face[0]} {face[1]} {face[2]}\n")
-
+from tit.tools.surface_io import (  # noqa: F401 -- re-exported
+    read_binary_stl,
+    write_binary_stl,
+    write_ply_with_colors,
+    write_ply_with_scalars,
+)
 
 # ---------------------------------------------------------------------------
 # Color-mapping
@@ -242,14 +52,47 @@ def simple_colormap(
         colors[:, 2] = 255  # All blue
         return colors
 
-    normalized = (values - vmin) / (vmax - vmin)
-    normalized = np.clip(normalized, 0, 1)
+    return piecewise_colormap(
+        values, [vmin, vmax], [[0, 0, 255], [255, 0, 0]]  # blue -> red
+    )
+
+
+def piecewise_colormap(
+    values: np.ndarray,
+    breakpoints,
+    colors,
+) -> np.ndarray:
+    """Map scalar values through a piecewise-linear colour ramp.
+
+    Values at or below ``breakpoints[0]`` get ``colors[0]``, values above
+    ``breakpoints[-1]`` get ``colors[-1]``, and values in between are
+    interpolated linearly between the colours of the enclosing breakpoints.
+    Coincident breakpoints are allowed (the ramp then jumps).
 
-    colors = np.zeros((len(values), 3), dtype=np.uint8)
-    colors[:, 0] = (normalized * 255).astype(np.uint8)  # Red channel
-    colors[:, 2] = ((1 - normalized) * 255).astype(np.uint8)  # Blue channel
+    Args:
+        values: 1-D array of scalar values.
+        breakpoints: Non-decreasing sequence of K scalar breakpoints.
+        colors: Array of shape [K, C] with the colour at each breakpoint
+            (0-255, any number of channels).
 
-    return colors
+    Returns:
+        Array of shape [N, C] with uint8 colours.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    bp = np.asarray(breakpoints, dtype=np.float64)
+    colors = np.asarray(colors, dtype=np.float64)
+
+    # First breakpoint >= value; a value strictly above bp[i-1] and at most
+    # bp[i] lies in a segment of positive width.
+    upper = np.clip(np.searchsorted(bp, values, side="left"), 1, len(bp) - 1)
+    lower = upper - 1
+    width = bp[upper] - bp[lower]
+    t = np.divide(
+        values - bp[lower], width, out=np.zeros_like(values), where=width > 0
+    )
+    t = np.where(values > bp[upper], 1.0, np.clip(t, 0.0, 1.0))[:, None]
+    out = colors[lower] * (1.0 - t) + colors[upper] * t
+    return out.astype(np.uint8)
 
 
 def field_to_colormap(
@@ -17,7 +17,6 @@ from __future__ import annotations
 
 import logging
 import os
-import tempfile
 
 import numpy as np
 from simnibs import read_msh
@@ -30,7 +29,12 @@ from tit.blender.io import (
     write_ply_with_colors,
     write_ply_with_scalars,
 )
-from tit.blender.utils import create_roi_mesh, extract_roi_region_no_zeros
+from tit.blender.utils import (
+    mesh_from_arrays,
+    partition_roi_regions,
+    surface_tag,
+    write_mesh_with_opt,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -129,9 +133,12 @@ def _mesh_vertices_faces_and_field(mesh, field_name="TI_max"):
 
 
 def _export_region_stl(
-    surface_mesh, atlas, region_name, field_name, regions_dir, temp_dir
+    surface_mesh, atlas, region_name, field_name, regions_dir, extracted
 ) -> bool:
-    """Export a single atlas region as a binary STL file."""
+    """Export a single atlas region as a binary STL file.
+
+    *extracted* is the region's entry from :func:`partition_roi_regions`.
+    """
 
     roi_mask = atlas[region_name]
     if np.sum(roi_mask) == 0:
@@ -141,14 +148,7 @@ def _export_region_stl(
     if np.sum(field_values[roi_mask] > 0) == 0:
         return False
 
-    temp_mesh_path = create_roi_mesh(
-        surface_mesh, roi_mask, field_values, field_name, region_name, temp_dir
-    )
-    roi_mesh = read_msh(temp_mesh_path)
-    roi_field = roi_mesh.field[field_name].value
-    vertices, faces = extract_roi_region_no_zeros(
-        roi_mesh, roi_field, return_field_values=False
-    )
+    vertices, faces, _ = extracted
     if vertices is None or faces is None:
         return False
 
@@ -156,8 +156,6 @@ def _export_region_stl(
     write_binary_stl(
         stl_path, vertices, faces, header_text="Generated from SimNIBS ROI mesh"
     )
-
-    os.remove(temp_mesh_path)
     return True
 
 
@@ -169,9 +167,8 @@ def _export_whole_gm_stl(surface_mesh, cortical_dir):
     if triangle_nodes.ndim == 1:
         triangle_nodes = triangle_nodes.reshape(-1, 3)
 
-    unique_verts = np.unique(triangle_nodes.flatten())
-    vert_map = {old: new for new, old in enumerate(unique_verts)}
-    remapped = np.array([[vert_map[idx] for idx in tri] for tri in triangle_nodes])
+    unique_verts, remapped = np.unique(triangle_nodes, return_inverse=True)
+    remapped = remapped.reshape(triangle_nodes.shape)
     vertices = surface_mesh.nodes.node_coord[unique_verts]
 
     stl_path = os.path.join(cortical_dir, "whole_gm.stl")
@@ -209,19 +206,24 @@ def _run_stl_export(config: RegionConfig, mesh_path: str) -> int:
     )
 
     if not config.skip_regions:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            for region_name in atlas.keys():
-                if selected and region_name not in selected:
-                    continue
-                if _export_region_stl(
-                    surface_mesh,
-                    atlas,
-                    region_name,
-                    config.field_name,
-                    regions_dir,
-                    temp_dir,
-                ):
-                    converted += 1
+        regions = {
+            name: mask
+            for name, mask in atlas.items()
+            if not selected or name in selected
+        }
+        extracted = partition_roi_regions(
+            surface_mesh, regions, surface_mesh.field[config.field_name].value
+        )
+        for region_name in regions:
+            if _export_region_stl(
+                surface_mesh,
+                atlas,
+                region_name,
+                config.field_name,
+                regions_dir,
+                extracted[region_name],
+            ):
+                converted += 1
         logger.info("Converted %d cortical regions (STL)", converted)
 
     if not config.skip_whole_gm:
@@ -277,14 +279,17 @@ def _export_region_ply(
     region_name,
     field_name,
     regions_dir,
-    temp_dir,
     use_colors,
     colormap,
     field_range,
     keep_meshes,
     meshes_dir,
+    extracted,
 ) -> bool:
-    """Export a single atlas region as a PLY file."""
+    """Export a single atlas region as a PLY file.
+
+    *extracted* is the region's entry from :func:`partition_roi_regions`.
+    """
     region_mask = atlas[region_name]
     if np.sum(region_mask) == 0:
         return False
@@ -293,22 +298,7 @@ def _export_region_ply(
     if np.sum(field_values[region_mask] > 0) == 0:
         return False
 
-    temp_mesh_path = create_roi_mesh(
-        mesh,
-        region_mask,
-        field_values,
-        field_name,
-        region_name,
-        temp_dir,
-    )
-    roi_mesh = read_msh(temp_mesh_path)
-    roi_field = roi_mesh.field[field_name].value
-
-    vertices, faces, vertex_field = extract_roi_region_no_zeros(
-        roi_mesh,
-        roi_field,
-        return_field_values=True,
-    )
+    vertices, faces, vertex_field = extracted
     if vertices is None or faces is None:
         return False
 
@@ -325,11 +315,12 @@ def _export_region_ply(
     )
 
     if keep_meshes and meshes_dir:
+        roi_mesh = mesh_from_arrays(
+            vertices, faces, {field_name: vertex_field}, tag=surface_tag(mesh)
+        )
         msh_path = os.path.join(meshes_dir, f"{region_name}_region.msh")
-        roi_mesh.write(msh_path)
-        _write_opt_file(roi_mesh, msh_path, field_name)
+        write_mesh_with_opt(roi_mesh, msh_path, field_name)
 
-    os.remove(temp_mesh_path)
     return ok
 
 
@@ -366,24 +357,7 @@ def _export_whole_gm_ply(
 
     if keep_meshes:
         whole_msh = os.path.join(output_dir, "whole_gm.msh")
-        mesh.write(whole_msh)
-        _write_opt_file(mesh, whole_msh, field_name)
-
-
-def _write_opt_file(mesh, msh_path, field_name):
-    """Create a Gmsh .opt visualization file for a mesh."""
-    from tit.tools.gmsh_opt import create_mesh_opt_file
-
-    field_values = mesh.field[field_name].value
-    positive = field_values[field_values > 0]
-    max_value = float(np.max(positive)) if len(positive) > 0 else 1.0
-
-    field_info = {
-        "fields": [field_name],
-        "max_values": {field_name: max_value},
-        "field_type": "node",
-    }
-    create_mesh_opt_file(msh_path, field_info)
+        write_mesh_with_opt(mesh, whole_msh, field_name)
 
 
 def _effective_field_range(config, mesh, mesh_path):
@@ -441,24 +415,29 @@ def _run_ply_export(config: RegionConfig, mesh_path: str) -> int:
     )
 
     if not config.skip_regions:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            for region_name, region_mask in atlas.items():
-                if selected and region_name not in selected:
-                    continue
-                if _export_region_ply(
-                    mesh,
-                    atlas,
-                    region_name,
-                    config.field_name,
-                    regions_dir,
-                    temp_dir,
-                    use_colors,
-                    config.colormap,
-                    fr,
-                    config.keep_meshes,
-                    meshes_dir,
-                ):
-                    converted += 1
+        regions = {
+            name: mask
+            for name, mask in atlas.items()
+            if not selected or name in selected
+        }
+        extracted = partition_roi_regions(
+            mesh, regions, mesh.field[config.field_name].value
+        )
+        for region_name in regions:
+            if _export_region_ply(
+                mesh,
+                atlas,
+                region_name,
+                config.field_name,
+                regions_dir,
+                use_colors,
+                config.colormap,
+                fr,
+                config.keep_meshes,
+                meshes_dir,
+                extracted[region_name],
+            ):
+                converted += 1
         logger.info("Converted %d cortical regions (PLY)", converted)
 
     if not config.skip_whole_gm:
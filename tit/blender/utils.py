@@ -132,61 +132,100 @@ def get_eeg_net_from_config(subject_id: str, simulation_name: str) -> str | None
     return config.get("eeg_net")
 
 
+def surface_tag(mesh, default=1):
+    """Return the tissue tag of a surface mesh's triangles."""
+    tags = mesh.elm.tag1[mesh.elm.elm_type == 2]
+    return int(tags[0]) if len(tags) else default
+
+
+def mesh_from_arrays(vertices, faces, node_fields=None, tag=1):
+    """Build an in-memory SimNIBS triangle surface mesh from arrays.
+
+    Args:
+        vertices: Array of shape [N, 3] with node coordinates
+        faces: Array of shape [M, 3] with 0-based node indices
+        node_fields: Optional mapping of field name to [N] node values
+        tag: Tissue tag assigned to every triangle
+
+    Returns:
+        simnibs Msh object
+    """
+    from simnibs.mesh_tools import mesh_io
+
+    faces = np.asarray(faces, dtype=int)
+    mesh = mesh_io.Msh(
+        nodes=mesh_io.Nodes(np.asarray(vertices, dtype=float)),
+        elements=mesh_io.Elements(triangles=faces + 1),
+    )
+    mesh.elm.tag1 = np.full(len(faces), tag, dtype=int)
+    mesh.elm.tag2 = np.full(len(faces), tag, dtype=int)
+    for name, values in (node_fields or {}).items():
+        mesh.add_node_field(np.asarray(values), name)
+    return mesh
+
+
+def write_mesh_with_opt(mesh, msh_path, field_name):
+    """Write *mesh* and a Gmsh ``.opt`` file showing its node field."""
+    from tit.tools.gmsh_opt import create_mesh_opt_file
+
+    mesh.write(msh_path)
+    field_values = mesh.field[field_name].value
+    positive = field_values[field_values > 0]
+    max_value = float(np.max(positive)) if len(positive) > 0 else 1.0
+
+    field_info = {
+        "fields": [field_name],
+        "max_values": {field_name: max_value},
+        "field_type": "node",
+    }
+    create_mesh_opt_file(msh_path, field_info)
+
+
 def create_roi_mesh(
     surface_mesh, roi_mask, field_values, field_name, region_name, temp_dir
 ):
     """
     Create a ROI mesh with preserved field values for the specified region.
 
+    The mesh keeps every node and triangle of the surface; the field is zero
+    outside the ROI.  It is built from arrays and written once, together
+    with its Gmsh ``.opt`` file.
+
     Args:
         surface_mesh: The surface mesh object
         roi_mask: Boolean mask for the ROI
         field_values: Original field values
         field_name: Name of the field
         region_name: Name of the region
-        temp_dir: Temporary directory for intermediate files
+        temp_dir: Directory the mesh is written to
 
     Returns:
-        str: Path to the temporary ROI mesh file
+        str: Path to the ROI mesh file
     """
-    # Create new field values array initialized to zeros
     roi_field_values = np.zeros_like(field_values)
-
-    # Preserve original field values only for ROI nodes
     roi_field_values[roi_mask] = field_values[roi_mask]
 
-    # Create a new mesh by reading the original mesh file and modifying it
-    # This avoids the copy() method issues
-    temp_mesh_path = os.path.join(temp_dir, f"{region_name}_roi.msh")
-
-    # Write the original mesh to temp file first
-    surface_mesh.write(temp_mesh_path)
-
-    # Read it back and modify the field
-    roi_mesh = simnibs.read_msh(temp_mesh_path)
-
-    # Replace the field with our ROI version
-    roi_mesh.field[field_name].value = roi_field_values
+    roi_mesh = mesh_from_arrays(
+        surface_mesh.nodes.node_coord,
+        _surface_triangles(surface_mesh),
+        {field_name: roi_field_values},
+        tag=surface_tag(surface_mesh),
+    )
+    roi_mesh_path = os.path.join(temp_dir, f"{region_name}_roi.msh")
+    write_mesh_with_opt(roi_mesh, roi_mesh_path, field_name)
+    return roi_mesh_path
 
-    # Write the modified mesh
-    roi_mesh.write(temp_mesh_path)
 
-    # Create .opt file for Gmsh visualization
-    from tit.tools.gmsh_opt import create_mesh_opt_file
-
-    if len(roi_field_values[roi_mask]) > 0:
-        max_value = np.max(roi_field_values[roi_mask])
-    else:
-        max_value = 1.0
+def _surface_triangles(mesh):
+    """Return the 0-based node indices of a mesh's triangles as [M, 3]."""
+    triangular_elements = mesh.elm.elm_type == 2
+    return mesh.elm.node_number_list[triangular_elements][:, :3] - 1
 
-    field_info = {
-        "fields": [field_name],
-        "max_values": {field_name: max_value},
-        "field_type": "node",
-    }
-    create_mesh_opt_file(temp_mesh_path, field_info)
 
-    return temp_mesh_path
+def _compact_triangles(triangles):
+    """Drop unused nodes: return (used_node_indices, remapped_triangles)."""
+    unique_vertices, inverse = np.unique(triangles, return_inverse=True)
+    return unique_vertices, inverse.reshape(triangles.shape)
 
 
 def extract_roi_region_no_zeros(
@@ -203,64 +242,90 @@ def extract_roi_region_no_zeros(
     Returns:
         tuple: (vertices, faces) or (vertices, faces, field_values) depending on return_field_values
     """
+    empty = (None, None, None) if return_field_values else (None, None)
+    roi_values = np.asarray(roi_values)
+
     # Find nodes with non-zero values
-    roi_nodes = np.where(roi_values > 0)[0]
-    roi_node_set = set(roi_nodes)
+    roi_nodes = roi_values > 0
+    if not np.any(roi_nodes):
+        return empty
 
-    if len(roi_nodes) == 0:
-        if return_field_values:
-            return None, None, None
-        else:
-            return None, None
+    # Triangles where at least 2 out of 3 vertices are in the ROI
+    triangle_nodes = _surface_triangles(mesh)
+    in_roi = np.count_nonzero(roi_nodes[triangle_nodes], axis=1) >= 2
+    if np.count_nonzero(in_roi) < min_triangles:
+        return empty
 
-    # Get triangular elements
-    triangular_elements = mesh.elm.elm_type == 2
-    triangle_indices = np.where(triangular_elements)[0]
-    triangle_nodes = (
-        mesh.elm.node_number_list[triangular_elements] - 1
-    )  # Convert to 0-based
-
-    # Find triangles where at least 2 out of 3 vertices are in the ROI
-    triangles_in_roi = []
-    for i, triangle in enumerate(triangle_nodes):
-        vertices_in_roi = sum(1 for node_idx in triangle if node_idx in roi_node_set)
-        if vertices_in_roi >= 2:  # At least 2 out of 3 vertices in ROI
-            triangles_in_roi.append(i)
-
-    if len(triangles_in_roi) < min_triangles:
-        if return_field_values:
-            return None, None, None
-        else:
-            return None, None
+    unique_vertices, remapped_triangles = _compact_triangles(triangle_nodes[in_roi])
+    vertices = mesh.nodes.node_coord[unique_vertices]
 
-    # Get the triangles that are in the ROI
-    roi_triangles = triangle_nodes[triangles_in_roi]
+    if return_field_values:
+        return vertices, remapped_triangles, roi_values[unique_vertices]
+    return vertices, remapped_triangles
 
-    # Get unique vertices used in these triangles
-    unique_vertices = np.unique(roi_triangles.flatten())
 
-    # Create vertex mapping (old index -> new index)
-    vertex_mapping = {
-        old_idx: new_idx for new_idx, old_idx in enumerate(unique_vertices)
-    }
+def partition_roi_regions(mesh, region_masks, field_values, min_triangles=10):
+    """Extract every region of a surface mesh in a single pass.
 
-    # Remap triangle indices to new vertex indices
-    remapped_triangles = np.array(
-        [
-            [vertex_mapping[face[0]], vertex_mapping[face[1]], vertex_mapping[face[2]]]
-            for face in roi_triangles
-        ]
-    )
+    Equivalent to calling :func:`extract_roi_region_no_zeros` (with field
+    values) once per region on the field zeroed outside that region, but
+    the triangles are labelled and grouped once instead of per region.
 
-    # Extract vertex coordinates
-    vertices = mesh.nodes.node_coord[unique_vertices]
+    Args:
+        mesh: SimNIBS surface mesh object
+        region_masks: Mapping of region name to boolean node mask
+        field_values: Node field values
+        min_triangles: Minimum number of triangles required per region
 
-    if return_field_values:
-        # Extract field values for the unique vertices
-        vertex_field_values = roi_values[unique_vertices]
-        return vertices, remapped_triangles, vertex_field_values
-    else:
-        return vertices, remapped_triangles
+    Returns:
+        dict: region name -> (vertices, faces, field_values), or
+        (None, None, None) for regions with too few triangles
+    """
+    field_values = np.asarray(field_values)
+    names = list(region_masks)
+    labels = np.full(len(field_values), -1, dtype=np.int64)
+    for k, name in enumerate(names):
+        mask = np.asarray(region_masks[name], dtype=bool)
+        if np.any(labels[mask] >= 0):
+            # Overlapping regions cannot share one label array.
+            return {
+                n: extract_roi_region_no_zeros(
+                    mesh,
+                    np.where(region_masks[n], field_values, 0),
+                    min_triangles=min_triangles,
+                    return_field_values=True,
+                )
+                for n in names
+            }
+        labels[mask] = k
+
+    # A triangle belongs to the region holding at least 2 of its
+    # positive-field vertices; with 3 vertices that region is unique.
+    active = np.where(field_values > 0, labels, -1)
+    triangle_nodes = _surface_triangles(mesh)
+    tl = active[triangle_nodes]
+    region = np.where(
+        (tl[:, 0] == tl[:, 1]) | (tl[:, 0] == tl[:, 2]),
+        tl[:, 0],
+        np.where(tl[:, 1] == tl[:, 2], tl[:, 1], -1),
+    )
+
+    keep = np.flatnonzero(region >= 0)
+    keep = keep[np.argsort(region[keep], kind="stable")]
+    bounds = np.searchsorted(region[keep], np.arange(len(names) + 1))
+
+    out = {}
+    for k, name in enumerate(names):
+        rows = keep[bounds[k] : bounds[k + 1]]
+        if len(rows) < min_triangles:
+            out[name] = (None, None, None)
+            continue
+        unique_vertices, faces = _compact_triangles(triangle_nodes[rows])
+        vertex_field = np.where(
+            labels[unique_vertices] == k, field_values[unique_vertices], 0
+        )
+        out[name] = (mesh.nodes.node_coord[unique_vertices], faces, vertex_field)
+    return out
 
 
 def parse_electrode_csv(csv_path: str) -> list[tuple[str, float, float, float]]:
@@ -17,6 +17,7 @@ import trimesh
 from scipy.spatial.transform import Rotation
 
 from tit.blender.config import VectorConfig
+from tit.blender.io import piecewise_colormap
 from tit.calc import get_TI_vectors, get_mTI_vectors
 
 logger = logging.getLogger(__name__)
@@ -119,6 +120,112 @@ def create_arrow(
     return arrow
 
 
+# Arrow glyph geometry at unit length: the shaft spans z in [-0.4, 0.4] and the
+# head z in [0.4, 0.6], so an arrow of length L is the template with z scaled
+# by L (radii do not depend on length, exactly as in ``create_arrow``).
+_SHAFT_FRACTION = 0.8
+_HEAD_FRACTION = 0.2
+_ARROW_SECTIONS = 32
+# Arrows transformed per batch, bounding peak memory for large exports.
+_ARROW_BATCH = 16384
+
+_PLY_VERTEX_DTYPE = np.dtype(
+    [
+        ("x", "<f4"),
+        ("y", "<f4"),
+        ("z", "<f4"),
+        ("red", "u1"),
+        ("green", "u1"),
+        ("blue", "u1"),
+        ("alpha", "u1"),
+    ]
+)
+_PLY_FACE_DTYPE = np.dtype([("n", "u1"), ("vertex_indices", "<i4", (3,))])
+
+
+def _arrow_template(shaft_width, sections=_ARROW_SECTIONS):
+    """Return ``(vertices, faces)`` of a unit-length arrow along +Z.
+
+    Closed shaft cylinder plus cone head with outward-facing triangles; the
+    geometry matches ``create_arrow`` with ``scaled_length=1`` and
+    ``vector_scale=1``.
+    """
+    half = _SHAFT_FRACTION / 2.0
+    theta = np.linspace(0.0, 2.0 * np.pi, sections, endpoint=False)
+    ring = np.column_stack([np.cos(theta), np.sin(theta), np.zeros(sections)])
+    r_shaft = shaft_width * 0.5
+    r_head = shaft_width * 1.5
+
+    # Layout: shaft bottom centre, top centre, bottom ring, top ring,
+    # head base centre, apex, base ring.
+    vertices = np.vstack(
+        [
+            [[0.0, 0.0, -half], [0.0, 0.0, half]],
+            ring * r_shaft + [0.0, 0.0, -half],
+            ring * r_shaft + [0.0, 0.0, half],
+            [[0.0, 0.0, half], [0.0, 0.0, half + _HEAD_FRACTION]],
+            ring * r_head + [0.0, 0.0, half],
+        ]
+    )
+
+    j = np.arange(sections)
+    k = (j + 1) % sections
+    bottom, top = 2 + j, 2 + sections + j
+    bottom_k, top_k = 2 + k, 2 + sections + k
+    base_c, apex = 2 + 2 * sections, 3 + 2 * sections
+    base, base_k = 4 + 2 * sections + j, 4 + 2 * sections + k
+    faces = np.vstack(
+        [
+            np.column_stack([np.zeros_like(j), bottom_k, bottom]),
+            np.column_stack([np.ones_like(j), top, top_k]),
+            np.column_stack([bottom, bottom_k, top_k]),
+            np.column_stack([bottom, top_k, top]),
+            np.column_stack([np.full_like(j, base_c), base_k, base]),
+            np.column_stack([base, base_k, np.full_like(j, apex)]),
+        ]
+    )
+    return vertices, faces
+
+
+def _arrow_rotations(directions):
+    """Batched rotation matrices taking +Z onto each direction.
+
+    Mirrors ``create_arrow``: zero vectors and vectors parallel to Z are left
+    unrotated.  Returns ``(rotations, unit_directions)``.
+    """
+    norms = np.linalg.norm(directions, axis=1)
+    valid = norms > 1e-12
+    ndir = np.tile([0.0, 0.0, 1.0], (len(directions), 1))
+    ndir[valid] = directions[valid] / norms[valid, None]
+
+    axis = np.column_stack([-ndir[:, 1], ndir[:, 0], np.zeros(len(ndir))])
+    axis_norm = np.linalg.norm(axis, axis=1)
+    rotate = axis_norm > 1e-12
+    axis[rotate] /= axis_norm[rotate, None]
+    axis[~rotate] = 0.0
+    angle = np.where(rotate, np.arccos(np.clip(ndir[:, 2], -1.0, 1.0)), 0.0)
+
+    # Rodrigues: R = I + sin(a) K + (1 - cos(a)) K^2
+    K = np.zeros((len(ndir), 3, 3))
+    K[:, 0, 1], K[:, 0, 2] = -axis[:, 2], axis[:, 1]
+    K[:, 1, 0], K[:, 1, 2] = axis[:, 2], -axis[:, 0]
+    K[:, 2, 0], K[:, 2, 1] = -axis[:, 1], axis[:, 0]
+    R = (
+        np.eye(3)
+        + np.sin(angle)[:, None, None] * K
+        + (1.0 - np.cos(angle))[:, None, None] * (K @ K)
+    )
+    return R, ndir
+
+
+def _arrow_lengths(magnitudes, length_mode, length_scale, base_length):
+    """Per-arrow length before ``vector_scale`` (see ``create_arrow``)."""
+    magnitudes = np.asarray(magnitudes, dtype=float)
+    if length_mode == "linear":
+        return np.maximum(1e-9, float(length_scale) * magnitudes)
+    return base_length * (1.0 + 0.005 * magnitudes)
+
+
 def write_ply_arrows(
     output_file,
     positions,
@@ -133,57 +240,73 @@ def write_ply_arrows(
     base_length: float = 1.0,
     shaft_width: float = 0.05,
 ):
-    """Write multiple arrows as a colored PLY file (ASCII, RGBA)."""
+    """Write multiple arrows as a colored binary PLY file (RGBA).
+
+    One arrow template is built and instanced for every sample with batched
+    length scaling, rotation and translation; vertices and faces are written
+    as little-endian structured arrays.
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
     total = len(positions)
     if total == 0:
         return
+    vectors = np.asarray(vectors, dtype=float).reshape(-1, 3)
+    colors = np.asarray(colors).reshape(total, -1)
+    lengths = _arrow_lengths(magnitudes, length_mode, length_scale, base_length)
+
+    template, template_faces = _arrow_template(shaft_width)
+    n_v, n_f = len(template), len(template_faces)
+
+    header = (
+        "ply\n"
+        "format binary_little_endian 1.0\n"
+        f"element vertex {total * n_v}\n"
+        "property float x\n"
+        "property float y\n"
+        "property float z\n"
+        "property uchar red\n"
+        "property uchar green\n"
+        "property uchar blue\n"
+        "property uchar alpha\n"
+        f"element face {total * n_f}\n"
+        "property list uchar int vertex_indices\n"
+        "end_header\n"
+    )
 
-    all_vertices = []
-    all_faces = []
-    all_colors = []
-
-    for i in range(total):
-        arrow = create_arrow(
-            positions[i],
-            vectors[i],
-            magnitudes[i],
-            vector_scale=vector_scale,
-            base_length=base_length,
-            shaft_width=shaft_width,
-            length_mode=length_mode,
-            length_scale=length_scale,
-            anchor=anchor,
-        )
-        start = len(all_vertices)
-        all_vertices.extend(arrow.vertices)
-        for f in arrow.faces:
-            all_faces.append([start + int(f[0]), start + int(f[1]), start + int(f[2])])
-        for _ in range(len(arrow.vertices)):
-            all_colors.append(colors[i])
-
-    if not all_vertices:
-        return
+    with open(output_file, "wb") as f:
+        f.write(header.encode("ascii"))
 
-    with open(output_file, "w") as f:
-        f.write("ply\n")
-        f.write("format ascii 1.0\n")
-        f.write(f"element vertex {len(all_vertices)}\n")
-        f.write("property float x\n")
-        f.write("property float y\n")
-        f.write("property float z\n")
-        f.write("property uchar red\n")
-        f.write("property uchar green\n")
-        f.write("property uchar blue\n")
-        f.write("property uchar alpha\n")
-        f.write(f"element face {len(all_faces)}\n")
-        f.write("property list uchar int vertex_indices\n")
-        f.write("end_header\n")
-        for v, c in zip(all_vertices, all_colors):
-            f.write(
-                f"{v[0]:.6f} {v[1]:.6f} {v[2]:.6f} {int(c[0])} {int(c[1])} {int(c[2])} {int(c[3])}\n"
-            )
-        for face in all_faces:
-            f.write(f"3 {face[0]} {face[1]} {face[2]}\n")
+        for start in range(0, total, _ARROW_BATCH):
+            stop = min(start + _ARROW_BATCH, total)
+            scale = lengths[start:stop] * vector_scale
+            R, ndir = _arrow_rotations(vectors[start:stop])
+
+            local = np.broadcast_to(template, (stop - start, n_v, 3)).copy()
+            local[:, :, :2] *= vector_scale
+            local[:, :, 2] *= scale[:, None]
+            if anchor == "head":
+                shift = -(_SHAFT_FRACTION / 2.0 + _HEAD_FRACTION) * scale
+            else:
+                shift = (_SHAFT_FRACTION / 2.0) * scale
+            offset = positions[start:stop] + ndir * shift[:, None]
+            world = np.einsum("nij,nvj->nvi", R, local) + offset[:, None, :]
+
+            block = np.empty((stop - start) * n_v, dtype=_PLY_VERTEX_DTYPE)
+            xyz = world.reshape(-1, 3)
+            rgba = np.repeat(colors[start:stop, :4], n_v, axis=0)
+            for c, name in enumerate(("x", "y", "z")):
+                block[name] = xyz[:, c]
+            for c, name in enumerate(("red", "green", "blue", "alpha")):
+                block[name] = rgba[:, c]
+            f.write(block.tobytes())
+
+        for start in range(0, total, _ARROW_BATCH):
+            stop = min(start + _ARROW_BATCH, total)
+            offsets = np.arange(start, stop, dtype=np.int64)[:, None, None] * n_v
+            block = np.empty((stop - start) * n_f, dtype=_PLY_FACE_DTYPE)
+            block["n"] = 3
+            block["vertex_indices"] = (template_faces[None] + offsets).reshape(-1, 3)
+            f.write(block.tobytes())
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -237,40 +360,66 @@ def _get_surface_face_barycenters(surface_mesh):
     return np.mean(node_coords[triangle_nodes], axis=1)
 
 
-def _interpolate_field_to_surface(volumetric_mesh, target_positions, field_name="E"):
+class _NodeInterpolator:
+    """Nearest-node field lookup from one mesh geometry to fixed targets.
+
+    Building the KD-tree and ``elm2node_matrix`` dominates interpolation
+    cost, and the carrier meshes of a TI/mTI run share their geometry, so
+    one instance is built and reused for every mesh that :meth:`matches`.
+    Only the ``elm2node`` rows of the nearest nodes are kept, which turns
+    each field lookup into a single small sparse product.
+    """
+
+    def __init__(self, mesh, target_positions):
+        from scipy.spatial import cKDTree
+
+        self._nodes = mesh.nodes.node_coord
+        self._elements = mesh.elm.node_number_list
+        self._rows = None
+        self._indices = None
+        try:
+            M = mesh.elm2node_matrix()
+            _, nearest = cKDTree(self._nodes).query(target_positions)
+            self._rows = M[nearest]
+        except Exception:
+            # Fall back to nearest-element interpolation.
+            tree = cKDTree(_barycenters_for_mesh(mesh))
+            _, self._indices = tree.query(target_positions)
+
+    def matches(self, mesh) -> bool:
+        """True when *mesh* has the same nodes and elements."""
+        return np.array_equal(self._nodes, mesh.nodes.node_coord) and np.array_equal(
+            self._elements, mesh.elm.node_number_list
+        )
+
+    def __call__(self, field_elm):
+        if self._rows is not None:
+            return np.asarray(self._rows @ field_elm)
+        return np.asarray(field_elm)[self._indices]
+
+
+def _interpolate_field_to_surface(
+    volumetric_mesh, target_positions, field_name="E", interpolator=None
+):
     """Interpolate a field from a volumetric mesh to target positions.
 
     Uses node-based interpolation via elm2node_matrix when available,
-    falls back to nearest-element interpolation.
+    falls back to nearest-element interpolation.  Pass an *interpolator*
+    built for the same geometry and targets to skip rebuilding it.
     """
     if field_name not in volumetric_mesh.field:
         raise ValueError(f"Field '{field_name}' not found in volumetric mesh")
 
     field_elm = volumetric_mesh.field[field_name].value
+    if interpolator is None:
+        interpolator = _NodeInterpolator(volumetric_mesh, target_positions)
+    return interpolator(field_elm)
 
-    try:
-        from scipy.spatial import cKDTree
-
-        M = volumetric_mesh.elm2node_matrix()
-        vol_field_nodes = np.zeros((M.shape[0], 3))
-        for i in range(3):
-            vol_field_nodes[:, i] = M.dot(field_elm[:, i])
-
-        vol_node_positions = volumetric_mesh.nodes.node_coord
-        tree = cKDTree(vol_node_positions)
-        _, indices = tree.query(target_positions)
-        return vol_field_nodes[indices]
-    except Exception:
-        from scipy.spatial import cKDTree
 
-        elm_positions = _barycenters_for_mesh(volumetric_mesh)
-        tree = cKDTree(elm_positions)
-        _, indices = tree.query(target_positions)
-
-        field_values = np.zeros((len(target_positions), 3))
-        for i in range(len(target_positions)):
-            field_values[i] = field_elm[indices[i]]
-        return field_values
+# Blue -> green -> red ramp used by the magnitude colour scale.
+_MAGSCALE_COLORS = np.array(
+    [[0, 0, 255, 255], [0, 255, 0, 255], [255, 0, 0, 255]], dtype=np.uint8
+)
 
 
 def _map_magnitude_to_colors_magscale(
@@ -290,26 +439,8 @@ def _map_magnitude_to_colors_magscale(
     if red_pct < green_pct:
         red_pct = green_pct
 
-    mag_blue = np.percentile(all_magnitudes_full, blue_pct)
-    mag_green = np.percentile(all_magnitudes_full, green_pct)
-    mag_red = np.percentile(all_magnitudes_full, red_pct)
-
-    def map_one(mag):
-        if mag <= mag_blue:
-            return np.array([0, 0, 255, 255], dtype=np.uint8)
-        if mag <= mag_green:
-            denom = mag_green - mag_blue
-            t = 0.0 if denom <= 0 else float((mag - mag_blue) / denom)
-            r, g, b = 0, int(255 * t), int(255 * (1.0 - t))
-            return np.array([r, g, b, 255], dtype=np.uint8)
-        if mag <= mag_red:
-            denom = mag_red - mag_green
-            t = 1.0 if denom <= 0 else float((mag - mag_green) / denom)
-            r, g, b = int(255 * t), int(255 * (1.0 - t)), 0
-            return np.array([r, g, b, 255], dtype=np.uint8)
-        return np.array([255, 0, 0, 255], dtype=np.uint8)
-
-    return np.array([map_one(m) for m in magnitudes])
+    breakpoints = np.percentile(all_magnitudes_full, [blue_pct, green_pct, red_pct])
+    return piecewise_colormap(magnitudes, breakpoints, _MAGSCALE_COLORS)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -369,12 +500,21 @@ def _compute_fields(config, m1, m2, m3, m4, positions):
     logger.info(
         "Interpolating E fields to %d surface face barycenters...", len(positions)
     )
-    E1 = _interpolate_field_to_surface(m1, positions, "E")
-    E2 = _interpolate_field_to_surface(m2, positions, "E")
+    interpolators: list[_NodeInterpolator] = []
+
+    def interpolate(mesh):
+        reuse = next((i for i in interpolators if i.matches(mesh)), None)
+        if reuse is None:
+            reuse = _NodeInterpolator(mesh, positions)
+            interpolators.append(reuse)
+        return _interpolate_field_to_surface(mesh, positions, "E", reuse)
+
+    E1 = interpolate(m1)
+    E2 = interpolate(m2)
     E3 = E4 = None
     if config.is_mti:
-        E3 = _interpolate_field_to_surface(m3, positions, "E")
-        E4 = _interpolate_field_to_surface(m4, positions, "E")
+        E3 = interpolate(m3)
+        E4 = interpolate(m4)
 
     # Align sizes
     arrays = [positions, E1, E2]
@@ -92,6 +92,7 @@ FILE_MONTAGE_LIST = "montage_list.json"
 FILE_ANALYZER_CONFIG = "analyzer.json"
 FILE_SIMULATOR_CONFIG = "simulator.json"
 FILE_PREPROCESS_CONFIG = "preprocess.json"
+FILE_PREPROCESS_STATE = "preprocess_state.json"
 
 # Template files
 FILE_EGI_TEMPLATE = "GSN-HydroCel-185.csv"
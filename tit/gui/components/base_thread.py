@@ -14,6 +14,9 @@ Key Features:
 - Support for all TI-Toolbox scripts and external tools (SimNIBS, FSL, etc.)
 - Cross-platform process management (Windows, Linux, macOS)
 - Real-time output streaming with ANSI code stripping
+- Block reads and time-bounded output batches, so chatty tools (charm,
+  recon-all) cannot flood the GUI event loop
+- Optional asynchronous mirroring of the full output to a log file
 - Proper process group handling for clean termination
 
 Message Type Detection:
@@ -52,10 +55,20 @@ This base class is designed to be reusable across all TI-Toolbox tabs and script
 """
 
 import os
+import queue
 import signal
 import subprocess
+from collections import deque
+
 from PyQt5 import QtCore
 
+from tit.gui.components.log_stream import (
+    OUTPUT_HISTORY_LINES,
+    AsyncLogWriter,
+    BlockReader,
+    LineSplitter,
+    OutputBatcher,
+)
 from tit.gui.utils import strip_ansi_codes as _strip_ansi_codes_util
 
 
@@ -117,13 +130,22 @@ class BaseProcessThread(QtCore.QThread):
     - DEBUG (gray): [DEBUG] tags, debug: prefix
     - DEFAULT (white): All other informational messages
 
+    Output Batching:
+    Subprocess output is read in blocks and delivered every
+    ``OUTPUT_BATCH_INTERVAL`` seconds.  Receivers connected to
+    output_batch_signal get one list per batch; when nothing is connected to
+    it, the batch is replayed line by line on output_signal.
+
     Attributes:
         output_signal: PyQt signal emitting (message: str, type: str)
+        output_batch_signal: PyQt signal emitting [(message, type), ...]
         error_signal: PyQt signal emitting (error_message: str)
         cmd: Command list to execute
         env: Environment variables dict
         process: subprocess.Popen instance
         terminated: Flag indicating if termination was requested
+        output_history: Most recent ``OUTPUT_HISTORY_LINES`` output lines
+        log_path: If set, the full output is appended to this file
 
     Note:
         The QThread's built-in 'finished' signal is used for completion notification.
@@ -136,10 +158,11 @@ class BaseProcessThread(QtCore.QThread):
 
     # Common signals for all threads
     output_signal = QtCore.pyqtSignal(str, str)  # message, type
+    output_batch_signal = QtCore.pyqtSignal(list)  # [(message, type), ...]
     error_signal = QtCore.pyqtSignal(str)
     process_finished = QtCore.pyqtSignal(bool, int)  # success, returncode
 
-    def __init__(self, cmd=None, env=None, cwd=None, parent=None):
+    def __init__(self, cmd=None, env=None, cwd=None, parent=None, log_path=None):
         """
         Initialize the base process thread.
 
@@ -148,6 +171,7 @@ class BaseProcessThread(QtCore.QThread):
             env: Environment variables dict (defaults to os.environ.copy())
             cwd: Working directory for the subprocess (None = inherit)
             parent: Parent QObject
+            log_path: File the full output is appended to (None = no log)
         """
         super(BaseProcessThread, self).__init__(parent)
         self.cmd = cmd
@@ -156,7 +180,9 @@ class BaseProcessThread(QtCore.QThread):
         self.process = None
         self.terminated = False
         self.returncode = None
-        self.last_output_lines = []
+        self.last_output_lines = deque(maxlen=50)
+        self.output_history = deque(maxlen=OUTPUT_HISTORY_LINES)
+        self.log_path = log_path
         self.input_data = None  # Optional stdin lines (list[str])
 
     def run(self):
@@ -189,12 +215,14 @@ class BaseProcessThread(QtCore.QThread):
         This method:
         - Creates subprocess with proper process group
         - Optionally writes ``self.input_data`` to stdin
-        - Streams output in real-time with ANSI stripping
+        - Streams output in time-bounded batches with ANSI stripping
         - Detects message types automatically
+        - Mirrors the output to ``self.log_path`` when set
         - Handles process completion and errors
         - Emits appropriate signals
         """
         success = False
+        log_writer = None
         try:
             # Ensure Python output is unbuffered for real-time display
             self.env["PYTHONUNBUFFERED"] = "1"
@@ -209,8 +237,7 @@ class BaseProcessThread(QtCore.QThread):
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
                     stdin=subprocess.PIPE if use_stdin else None,
-                    universal_newlines=True,
-                    bufsize=1,
+                    bufsize=0,
                     creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
                     env=self.env,
                     cwd=self.cwd,
@@ -221,8 +248,7 @@ class BaseProcessThread(QtCore.QThread):
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
                     stdin=subprocess.PIPE if use_stdin else None,
-                    universal_newlines=True,
-                    bufsize=1,
+                    bufsize=0,
                     preexec_fn=os.setsid,
                     env=self.env,
                     cwd=self.cwd,
@@ -232,7 +258,7 @@ class BaseProcessThread(QtCore.QThread):
             if use_stdin:
                 input_string = "\n".join(self.input_data) + "\n"
                 try:
-                    self.process.stdin.write(input_string)
+                    self.process.stdin.write(input_string.encode())
                     self.process.stdin.flush()
                 except (BrokenPipeError, OSError):
                     pass
@@ -242,31 +268,12 @@ class BaseProcessThread(QtCore.QThread):
                     except (BrokenPipeError, OSError):
                         pass
 
-            # Stream output in real-time
+            if self.log_path:
+                log_writer = AsyncLogWriter(self.log_path)
+
+            # Stream output in time-bounded batches
             if self.process.stdout:
-                for line in iter(self.process.stdout.readline, ""):
-                    if self.terminated:
-                        break
-
-                    if line:
-                        # Clean and process the line
-                        raw_line = line.rstrip("\n")
-                        line_clean = self._strip_ansi_codes(raw_line)
-                        line_stripped = line_clean.strip()
-
-                        if line_stripped:
-                            self.last_output_lines.append(line_stripped)
-                            if len(self.last_output_lines) > 50:
-                                self.last_output_lines.pop(0)
-
-                            # Detect message type
-                            line_lower = line_stripped.lower()
-                            message_type = self._detect_message_type(
-                                line_stripped, line_lower
-                            )
-
-                            # Emit to GUI
-                            self.output_signal.emit(line_stripped, message_type)
+                self._stream_output(self.process.stdout, log_writer)
 
             # Wait for process completion if not terminated
             if not self.terminated:
@@ -284,6 +291,9 @@ class BaseProcessThread(QtCore.QThread):
             self.returncode = -1
             self.error_signal.emit(f"Error running process: {str(e)}")
         finally:
+            if log_writer is not None:
+                log_writer.close()
+
             # Ensure file descriptors are cleaned up
             if self.process:
                 try:
@@ -300,6 +310,53 @@ class BaseProcessThread(QtCore.QThread):
             returncode = self.returncode if self.returncode is not None else -1
             self.process_finished.emit(success, int(returncode))
 
+    def _stream_output(self, stdout, log_writer=None):
+        """Read *stdout* until EOF (or termination), emitting batched lines.
+
+        Blocks are read on a helper thread; this thread splits, cleans and
+        classifies the lines and delivers a batch whenever one is due, so a
+        quiet process still shows its last line within one interval.
+        """
+        reader = BlockReader(stdout).start()
+        splitter = LineSplitter()
+        batcher = OutputBatcher()
+
+        while not self.terminated:
+            try:
+                chunk = reader.queue.get(timeout=batcher.time_left())
+            except queue.Empty:
+                chunk = ""
+            lines = splitter.flush() if chunk is None else splitter.feed(chunk)
+            for raw_line in lines:
+                self._add_output_line(raw_line, batcher, log_writer)
+            if batcher.due() or (chunk is None and len(batcher)):
+                self._emit_output_batch(batcher.take())
+            if chunk is None:
+                break
+
+        if len(batcher):
+            self._emit_output_batch(batcher.take())
+
+    def _add_output_line(self, raw_line, batcher, log_writer=None):
+        """Clean and classify one output line and queue it for the GUI."""
+        line_stripped = self._strip_ansi_codes(raw_line).strip()
+        if not line_stripped:
+            return
+        self.last_output_lines.append(line_stripped)
+        self.output_history.append(line_stripped)
+        if log_writer is not None:
+            log_writer.write(line_stripped)
+        message_type = self._detect_message_type(line_stripped, line_stripped.lower())
+        batcher.add(line_stripped, message_type)
+
+    def _emit_output_batch(self, batch):
+        """Deliver *batch* as one signal, or per line to legacy receivers."""
+        if self.receivers(self.output_batch_signal) > 0:
+            self.output_batch_signal.emit(batch)
+            return
+        for message, message_type in batch:
+            self.output_signal.emit(message, message_type)
+
     def _format_failure_message(self, returncode):
         """Build an actionable subprocess failure message."""
         cmd_preview = " ".join(str(part) for part in (self.cmd or [])[:8])
@@ -317,7 +374,7 @@ class BaseProcessThread(QtCore.QThread):
             "m2m folder, simulation TI/mTI outputs, atlas/ROI files, and Docker/X11 setup."
         )
         if self.last_output_lines:
-            tail = " | ".join(self.last_output_lines[-3:])
+            tail = " | ".join(list(self.last_output_lines)[-3:])
             message += f" Last output: {tail}"
         return message
 
@@ -8,7 +8,7 @@ Reusable console output widget with associated controls for TI-Toolbox GUI
 
 from PyQt5 import QtWidgets, QtCore
 
-from tit.gui.style import COLOR_CONSOLE_WHITE
+from tit.gui.style import COLOR_CONSOLE_WHITE, CONSOLE_MAX_LINES
 from tit.gui.utils import strip_ansi_codes
 
 
@@ -54,6 +54,44 @@ def append_with_autoscroll(text_edit, html_text: str, process_events: bool = Tru
         QtWidgets.QApplication.processEvents()
 
 
+def append_lines_with_autoscroll(text_edit, html_lines, process_events=False):
+    """
+    Append several pre-formatted HTML lines in one update.
+
+    Used for batched process output: the scroll position is saved and
+    restored once and the widget repaints once for the whole batch instead
+    of once per line.
+
+    Args:
+        text_edit: A QTextEdit (or compatible) widget.
+        html_lines: Iterable of pre-formatted HTML strings, one per line.
+        process_events: Whether to call ``QApplication.processEvents()``
+                        after the append (default False).
+    """
+    html_lines = list(html_lines)
+    if not html_lines:
+        return
+
+    scrollbar = text_edit.verticalScrollBar()
+    at_bottom = scrollbar.value() >= scrollbar.maximum() - 5
+    saved_value = scrollbar.value()
+
+    text_edit.setUpdatesEnabled(False)
+    try:
+        for html_text in html_lines:
+            text_edit.append(html_text)
+    finally:
+        text_edit.setUpdatesEnabled(True)
+
+    if at_bottom:
+        scrollbar.setValue(scrollbar.maximum())
+    else:
+        scrollbar.setValue(saved_value)
+
+    if process_events:
+        QtWidgets.QApplication.processEvents()
+
+
 class ConsoleWidget(QtWidgets.QWidget):
     """
     Reusable console widget with output display and optional controls.
@@ -62,6 +100,7 @@ class ConsoleWidget(QtWidgets.QWidget):
     - Dark-themed console output (QTextEdit)
     - Optional Clear Console button
     - Auto-scrolling when user is at bottom
+    - History capped at ``CONSOLE_MAX_LINES`` lines (oldest dropped first)
     - Colored output based on message type
     - ANSI escape sequence handling
     """
@@ -163,6 +202,8 @@ class ConsoleWidget(QtWidgets.QWidget):
             }}
         """)
         self.console.setAcceptRichText(True)
+        # Ring buffer: Qt drops the oldest blocks beyond this count.
+        self.console.document().setMaximumBlockCount(CONSOLE_MAX_LINES)
         # stretch=1 ensures the QTextEdit fills all remaining vertical space
         # within whatever height the outer ConsoleWidget is given.
         layout.addWidget(self.console, 1)
@@ -190,6 +231,24 @@ class ConsoleWidget(QtWidgets.QWidget):
         formatted_text = format_message(text, message_type)
         append_with_autoscroll(self.console, formatted_text, process_events=False)
 
+    def update_console_batch(self, batch):
+        """
+        Append a batch of ``(text, message_type)`` pairs in one update.
+
+        Connect ``BaseProcessThread.output_batch_signal`` here.
+
+        Args:
+            batch: List of ``(text, message_type)`` tuples
+        """
+        append_lines_with_autoscroll(
+            self.console,
+            (
+                format_message(strip_ansi_codes(text), message_type)
+                for text, message_type in batch
+                if text.strip()
+            ),
+        )
+
     def append_html(self, html_text):
         """
         Append raw HTML to the console (for custom formatted messages).
@@ -0,0 +1,232 @@
+#!/usr/bin/env simnibs_python
+# -*- coding: utf-8 -*-
+
+"""
+Log streaming helpers for GUI process threads.
+
+Tools such as SimNIBS ``charm`` and FreeSurfer ``recon-all`` can print
+thousands of lines per second.  Emitting one Qt signal per line floods the
+GUI event loop, so :class:`~tit.gui.components.base_thread.BaseProcessThread`
+reads subprocess output in blocks on a helper thread, classifies lines on
+its own thread, and hands the GUI time-bounded batches instead.  The full
+output can be mirrored to disk by a background writer so the console can
+keep only a bounded history.
+
+This module has no Qt dependency.
+
+Public API
+----------
+BlockReader
+    Read a pipe in blocks on a daemon thread and queue the decoded text.
+LineSplitter
+    Split streamed text into complete lines.
+OutputBatcher
+    Collect classified lines and release them in time-bounded batches.
+AsyncLogWriter
+    Append lines to a log file from a background thread.
+OUTPUT_BATCH_INTERVAL, OUTPUT_BATCH_MAX_LINES, OUTPUT_HISTORY_LINES
+    Default batching and history limits.
+
+See Also
+--------
+tit.gui.components.base_thread.BaseProcessThread : Uses these helpers.
+tit.gui.components.console.append_lines_with_autoscroll : Batch display.
+"""
+
+import codecs
+import os
+import queue
+import threading
+import time
+
+# Seconds between batches delivered to the GUI.
+OUTPUT_BATCH_INTERVAL = 0.075
+# A batch is delivered early once it holds this many lines.
+OUTPUT_BATCH_MAX_LINES = 1000
+# Recent lines kept in memory by a process thread.
+OUTPUT_HISTORY_LINES = 5000
+# Bytes requested per read from a subprocess pipe.
+OUTPUT_BLOCK_SIZE = 64 * 1024
+
+
+class BlockReader:
+    """Read a binary pipe in blocks on a daemon thread.
+
+    Decoded text chunks are put on :attr:`queue`; ``None`` marks the end of
+    the stream.
+
+    Args:
+        stream: Binary file object (e.g. ``Popen.stdout``).
+        block_size: Maximum bytes per read.
+        encoding: Text encoding of the stream; undecodable bytes are replaced.
+    """
+
+    def __init__(self, stream, block_size=OUTPUT_BLOCK_SIZE, encoding="utf-8"):
+        self.queue = queue.SimpleQueue()
+        self._stream = stream
+        self._block_size = block_size
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._thread = threading.Thread(
+            target=self._run, name="tit-output-reader", daemon=True
+        )
+
+    def start(self):
+        """Start reading; returns ``self`` for chaining."""
+        self._thread.start()
+        return self
+
+    def join(self, timeout=None):
+        """Wait for the reader thread to finish."""
+        self._thread.join(timeout)
+
+    def _read(self):
+        try:
+            return os.read(self._stream.fileno(), self._block_size)
+        except (AttributeError, OSError, ValueError):
+            # Not a real file descriptor (or already closed): fall back.
+            read = getattr(self._stream, "read1", self._stream.read)
+            return read(self._block_size)
+
+    def _run(self):
+        try:
+            while True:
+                block = self._read()
+                if not block:
+                    break
+                text = self._decoder.decode(block)
+                if text:
+                    self.queue.put(text)
+            tail = self._decoder.decode(b"", final=True)
+            if tail:
+                self.queue.put(tail)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.queue.put(None)
+
+
+class LineSplitter:
+    """Split streamed text into complete lines.
+
+    ``\\n``, ``\\r\\n`` and bare ``\\r`` (progress-bar redraws) all end a
+    line; a ``\\r\\n`` split across two blocks yields an extra empty line,
+    which callers skip like any other blank line.  An incomplete trailing
+    line is held until more text arrives or :meth:`flush` is called.
+    """
+
+    def __init__(self):
+        self._partial = ""
+
+    def feed(self, text):
+        """Add *text* and return the lines it completes."""
+        lines = (self._partial + text).splitlines(keepends=True)
+        if lines and not lines[-1].endswith(("\n", "\r")):
+            self._partial = lines.pop()
+        else:
+            self._partial = ""
+        return [line.rstrip("\r\n") for line in lines]
+
+    def flush(self):
+        """Return the held incomplete line, if any, as a list."""
+        partial, self._partial = self._partial.rstrip("\r\n"), ""
+        return [partial] if partial else []
+
+
+class OutputBatcher:
+    """Collect ``(message, type)`` pairs and release them in batches.
+
+    Args:
+        interval: Seconds a batch may stay open before it is due.
+        max_lines: A batch with this many lines is due immediately.
+        clock: Monotonic time source (for tests).
+    """
+
+    def __init__(
+        self,
+        interval=OUTPUT_BATCH_INTERVAL,
+        max_lines=OUTPUT_BATCH_MAX_LINES,
+        clock=time.monotonic,
+    ):
+        self.interval = interval
+        self.max_lines = max_lines
+        self._clock = clock
+        self._pending = []
+        self._opened = None
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, message, message_type):
+        """Queue one classified line."""
+        if not self._pending:
+            self._opened = self._clock()
+        self._pending.append((message, message_type))
+
+    def time_left(self):
+        """Seconds until the open batch is due (``None`` if nothing is queued)."""
+        if not self._pending:
+            return None
+        return max(0.0, self._opened + self.interval - self._clock())
+
+    def due(self):
+        """True when the open batch should be delivered."""
+        if not self._pending:
+            return False
+        return len(self._pending) >= self.max_lines or self.time_left() == 0.0
+
+    def take(self):
+        """Return and clear the queued lines."""
+        batch, self._pending = self._pending, []
+        self._opened = None
+        return batch
+
+
+class AsyncLogWriter:
+    """Append lines to *path* from a background thread.
+
+    Writes never block the caller; :meth:`close` drains the queue and
+    closes the file.  I/O errors disable the writer instead of raising.
+
+    Args:
+        path: Log file path; parent directories are created.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.error = None
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name="tit-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, line):
+        """Queue *line* (without newline) for writing."""
+        self._queue.put(line)
+
+    def close(self, timeout=5.0):
+        """Flush queued lines and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                while True:
+                    lines = [self._queue.get()]
+                    while True:
+                        try:
+                            lines.append(self._queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    done = None in lines
+                    f.write("".join(f"{line}\n" for line in lines if line is not None))
+                    f.flush()
+                    if done:
+                        return
+        except OSError as exc:
+            self.error = exc
+            # Keep draining so writers never block on a dead thread.
+            while self._queue.get() is not None:
+                pass
@@ -231,14 +231,25 @@ class FlexSearchTab(QtWidgets.QWidget):
         self.sweep_preview_label = QtWidgets.QLabel("\u2192 3 combinations will be run")
         self.sweep_preview_label.setStyleSheet("color: gray; font-style: italic;")
 
+        self.sweep_parallel_input = QtWidgets.QSpinBox()
+        self.sweep_parallel_input.setRange(1, 16)
+        self.sweep_parallel_input.setValue(2)
+        self.sweep_parallel_input.setToolTip(
+            "Number of sweep combinations optimized at the same time. The "
+            "solver CPUs are split between them; later combinations start "
+            "from the solutions of finished neighbours."
+        )
+
         # Focality orchestration state (shared by adaptive & pareto modes)
         self._focality_state = {}
         self.achievable_intensity = None
         # Pareto sweep state variables
         self._sweep_points = []
-        self._sweep_queue = None  # deque, set before sweep starts
+        self._sweep_pending = []  # points not launched yet
+        self._sweep_threads = {}  # running FlexSearchThread -> SweepPoint
+        self._sweep_scores = {}  # run_index -> score parsed from its output
+        self._sweep_parallel = 1
         self._sweep_result = None
-        self._current_sweep_point = None
 
         self.nonroi_percentage_input = QtWidgets.QDoubleSpinBox()
         self.nonroi_percentage_input.setRange(1, 99)
@@ -504,6 +515,9 @@ class FlexSearchTab(QtWidgets.QWidget):
         pareto_layout.addRow(
             QtWidgets.QLabel("Non-ROI thresholds (%):"), self.nonroi_pcts_input
         )
+        pareto_layout.addRow(
+            QtWidgets.QLabel("Parallel runs:"), self.sweep_parallel_input
+        )
         pareto_layout.addRow(self.sweep_preview_label)
         focality_layout.addRow(self.pareto_widget)
         self.pareto_widget.setVisible(False)
@@ -1285,6 +1299,10 @@ class FlexSearchTab(QtWidgets.QWidget):
                 self.output_text.append("Optimization stopped.")
             else:
                 self.output_text.append("Failed to stop optimization.")
+        # Pareto sweep points still running; no further points are launched
+        # once optimization_running is cleared below.
+        for thread in list(self._sweep_threads):
+            thread.terminate_process()
 
         # Reset multi-subject state if applicable
         if self.selected_subjects is not None and len(self.selected_subjects) > 1:
@@ -1398,6 +1416,7 @@ class FlexSearchTab(QtWidgets.QWidget):
             self.mode_manual_radio.setEnabled(enabled)
             self.mode_adaptive_radio.setEnabled(enabled)
             self.mode_pareto_radio.setEnabled(enabled)
+            self.sweep_parallel_input.setEnabled(enabled)
             self.nonroi_percentage_input.setEnabled(enabled)
             self.roi_percentage_input.setEnabled(enabled)
             self.threshold_input.setEnabled(enabled)
@@ -1485,8 +1504,6 @@ class FlexSearchTab(QtWidgets.QWidget):
         For pareto mode, *roi_pcts* and *nonroi_pcts* are required.
         On completion, delegates to ``_on_mean_optimization_finished``.
         """
-        from collections import deque
-
         pm = get_path_manager()
         project_dir = pm.project_dir
 
@@ -1509,9 +1526,10 @@ class FlexSearchTab(QtWidgets.QWidget):
 
         # Reset pareto sweep state for a fresh run
         self._sweep_points = []
-        self._sweep_queue = deque()
+        self._sweep_pending = []
+        self._sweep_threads = {}
+        self._sweep_scores = {}
         self._sweep_result = None
-        self._current_sweep_point = None
 
         # Build mean FlexConfig for step 1
         mean_config = self._build_flex_config(
@@ -1634,13 +1652,12 @@ class FlexSearchTab(QtWidgets.QWidget):
     # ------------------------------------------------------------------ #
 
     def _run_pareto_sweep_step2(self):
-        """Build sweep grid and start sequential focality runs."""
+        """Build sweep grid and start the focality runs, several at a time."""
         from tit.opt.flex.pareto import (
             compute_sweep_grid,
             ParetoSweepConfig,
             ParetoSweepResult,
         )
-        from collections import deque
 
         state = self._focality_state
 
@@ -1670,27 +1687,47 @@ class FlexSearchTab(QtWidgets.QWidget):
             base_output_folder=base_folder,
         )
         self._sweep_result = ParetoSweepResult(config=cfg, points=self._sweep_points)
-        self._sweep_queue = deque(self._sweep_points)
+        self._sweep_pending = list(self._sweep_points)
+        self._sweep_parallel = min(
+            self.sweep_parallel_input.value(), len(self._sweep_points)
+        )
 
         self._print_progress_table()
-        self._run_next_sweep_point()
+        self._launch_sweep_points()
+
+    def _launch_sweep_points(self):
+        """Start pending sweep points until ``_sweep_parallel`` are running.
 
-    def _run_next_sweep_point(self):
-        """Pop the next SweepPoint from the queue and launch a focality run for it."""
-        import os as _os
+        Scheduling follows :func:`tit.opt.flex.pareto.next_point`: points
+        with finished neighbours go first and are warm-started from them, so
+        the sweep spreads out from the first finished point.
+        """
+        from tit.opt.flex.pareto import next_point
 
-        if not self._sweep_queue:
+        if not self.optimization_running:
+            return  # stopped by the user
+        while len(self._sweep_threads) < self._sweep_parallel:
+            point = next_point(
+                self._sweep_result,
+                self._sweep_pending,
+                warm_start=True,
+                busy=bool(self._sweep_threads),
+            )
+            if point is None:
+                break
+            self._sweep_pending.remove(point)
+            self._start_sweep_point(point)
+        if not self._sweep_threads and not self._sweep_pending:
             self._finalize_pareto_sweep()
-            return
 
-        point = self._sweep_queue.popleft()
-        self._current_sweep_point = point
-        point.status = "running"
+    def _start_sweep_point(self, point):
+        """Launch a focality run for one SweepPoint in its own subprocess."""
+        from tit.opt.flex.multistart import split_cpus
+        from tit.opt.flex.pareto import neighbour_seeds
 
+        point.status = "running"
         state = self._focality_state
-        pm = get_path_manager()
-        project_dir = pm.project_dir
-        _os.makedirs(point.output_folder, exist_ok=True)
+        os.makedirs(point.output_folder, exist_ok=True)
 
         # Build a focality FlexConfig for this sweep point
         sweep_thresholds = f"{point.nonroi_threshold:.3f},{point.roi_threshold:.3f}"
@@ -1709,47 +1746,64 @@ class FlexSearchTab(QtWidgets.QWidget):
             thresholds=sweep_thresholds,
             output_folder=point.output_folder,
         )
+        # Warm-start from already finished neighbouring grid points
+        sweep_config.seed_solutions = (
+            neighbour_seeds(self._sweep_result, point) or None
+        )
+        if self._sweep_parallel > 1:
+            sweep_config.cpus = split_cpus(sweep_config.cpus, self._sweep_parallel)
 
         focality_cmd, _ = self._launch_flex_config(sweep_config)
 
         n_total = len(self._sweep_points)
-        n_done = sum(1 for p in self._sweep_points if p.status in ("done", "failed"))
+        n_started = n_total - len(self._sweep_pending)
         self.update_output(
-            f"\n\u25b6 Running combination {n_done + 1}/{n_total}: "
+            f"\n\u25b6 Running combination {n_started}/{n_total}: "
             f"ROI={int(point.roi_pct)}%, NonROI={int(point.nonroi_pct)}% "
             f"(thresholds: ROI={point.roi_threshold:.3f} V/m, "
             f"NonROI={point.nonroi_threshold:.3f} V/m)"
         )
 
-        self.optimization_thread = FlexSearchThread(focality_cmd)
-        self.optimization_thread.output_signal.connect(self._process_sweep_point_output)
-        self.optimization_thread.error_signal.connect(
-            lambda msg: self.update_output(msg, "error")
+        thread = FlexSearchThread(focality_cmd)
+        thread.output_signal.connect(
+            lambda line, message_type, p=point: self._process_sweep_point_output(
+                p, line, message_type
+            )
         )
-        self.optimization_thread.finished.connect(self._on_sweep_point_finished)
-        self.optimization_thread.start()
+        thread.error_signal.connect(lambda msg: self.update_output(msg, "error"))
+        thread.finished.connect(
+            lambda t=thread: self._on_sweep_point_finished(t)
+        )
+        self._sweep_threads[thread] = point
+        self.optimization_thread = thread
+        thread.start()
 
-    def _process_sweep_point_output(self, line: str, message_type: str):
-        """Forward output and extract focality_score when available."""
+    def _process_sweep_point_output(self, point, line: str, message_type: str):
+        """Forward output and extract the point's focality_score when available."""
         from tit.opt.flex.utils import parse_optimization_output
 
+        if self._sweep_parallel > 1:
+            line = f"[{int(point.roi_pct)}/{int(point.nonroi_pct)}] {line}"
         self.update_output(line, message_type)
-        if self._current_sweep_point is not None:
-            value = parse_optimization_output(line)
-            if value is not None:
-                self._current_sweep_point.focality_score = value
-
-    def _on_sweep_point_finished(self):
-        """Mark current sweep point done/failed, reprint table, start next."""
-        if self._current_sweep_point is not None:
-            if self._current_sweep_point.focality_score is not None:
-                self._current_sweep_point.status = "done"
-            else:
-                self._current_sweep_point.status = "failed"
-            self._current_sweep_point = None
-
+        value = parse_optimization_output(line)
+        if value is not None:
+            self._sweep_scores[point.run_index] = value
+
+    def _on_sweep_point_finished(self, thread):
+        """Record a finished sweep point, reprint table, start more points."""
+        from tit.opt.flex.pareto import complete_point
+
+        point = self._sweep_threads.pop(thread, None)
+        if point is not None and self._sweep_result is not None:
+            complete_point(
+                self._sweep_result,
+                point,
+                self._sweep_scores.pop(point.run_index, None),
+            )
+        if not self.optimization_running:
+            return  # stopped by the user
         self._print_progress_table()
-        self._run_next_sweep_point()
+        self._launch_sweep_points()
 
     def _print_progress_table(self):
         """Append the current sweep progress table to the output console."""
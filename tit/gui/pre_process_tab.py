@@ -21,6 +21,7 @@ from tit.gui.components.console import (
     ConsoleWidget,
     format_message,
     append_with_autoscroll,
+    append_lines_with_autoscroll,
 )
 from tit.gui.components.action_buttons import RunStopButtons
 from tit.gui.components.base_thread import BaseProcessThread
@@ -45,8 +46,8 @@ class PreProcessThread(BaseProcessThread):
     ``BaseProcessThread`` signals.
     """
 
-    def __init__(self, cmd, env=None):
-        super().__init__(cmd=cmd, env=env)
+    def __init__(self, cmd, env=None, log_path=None):
+        super().__init__(cmd=cmd, env=env, log_path=log_path)
 
     def run(self):
         self.execute_process()
@@ -681,8 +682,13 @@ class PreProcessTab(QtWidgets.QWidget):
 
         cmd = ["simnibs_python", "-m", "tit.pre", config_path]
 
-        self.processing_thread = PreProcessThread(cmd)
-        self.processing_thread.output_signal.connect(self.update_output)
+        log_path = os.path.join(
+            self.pm.ti_toolbox(),
+            "logs",
+            f"pre_process_gui_{time.strftime('%Y%m%d_%H%M%S')}.log",
+        )
+        self.processing_thread = PreProcessThread(cmd, log_path=log_path)
+        self.processing_thread.output_batch_signal.connect(self.update_output_batch)
         self.processing_thread.error_signal.connect(self._handle_process_error)
         self.processing_thread.process_finished.connect(self.preprocessing_finished)
         self.processing_thread.start()
@@ -733,6 +739,13 @@ class PreProcessTab(QtWidgets.QWidget):
         formatted_text = format_message(text)
         append_with_autoscroll(self.output_text, formatted_text)
 
+    def update_output_batch(self, batch):
+        """Append a batch of ``(text, message_type)`` process output lines."""
+        append_lines_with_autoscroll(
+            self.output_text,
+            (format_message(text) for text, _message_type in batch if text.strip()),
+        )
+
     def select_all_subjects(self):
         """Select all subjects in the subject list."""
         self.subject_list.selectAll()
@@ -1,16 +1,36 @@
 """Process utilities for TI-Toolbox GUI.
 
 Provides safe child-process discovery via ``psutil``, used by the
-system monitor and process termination helpers.
+system monitor and process termination helpers, and a low-overhead
+sampler of the toolbox's own process tree.
+
+Public API
+----------
+get_child_pids
+    Direct child PIDs of a process.
+ProcessSampler
+    Sample CPU, memory and I/O of a process tree into bounded time series.
 
 See Also
 --------
 tit.gui.system_monitor_tab.ProcessMonitorThread : Uses this for tree walking.
 """
 
+import csv
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
 import psutil
 
-__all__ = ["get_child_pids"]
+__all__ = ["ProcessSampler", "get_child_pids"]
+
+# Samples kept per process (30 minutes at the monitor's 0.5 s tick).
+SAMPLE_HISTORY = 3600
+# Exited processes whose series are kept for export.
+MAX_EXITED_PROCESSES = 256
 
 
 def get_child_pids(parent_pid: int) -> list:
@@ -29,3 +49,214 @@ def get_child_pids(parent_pid: int) -> list:
     parent = psutil.Process(parent_pid)
     children = parent.children(recursive=False)
     return [child.pid for child in children]
+
+
+def _proc_children(pid: int) -> list[int] | None:
+    """Children of *pid* from ``/proc/<pid>/task/*/children``, if available.
+
+    Reads only the queried process's entries, unlike ``psutil``, which
+    scans every process on the machine to build a parent map.  Returns
+    ``None`` where the interface is missing (non-Linux, old kernels).
+    """
+    task_dir = f"/proc/{pid}/task"
+    try:
+        tids = os.listdir(task_dir)
+    except FileNotFoundError:
+        return [] if os.path.isdir("/proc/self/task") else None
+    except OSError:
+        return None
+    children: list[int] = []
+    for tid in tids:
+        try:
+            with open(f"{task_dir}/{tid}/children") as f:
+                children.extend(int(p) for p in f.read().split())
+        except FileNotFoundError:
+            if not os.path.exists(f"{task_dir}/{tid}"):
+                continue  # thread exited
+            return None
+        except OSError:
+            continue
+    return children
+
+
+class ProcessSampler:
+    """Sample the descendants of one process into bounded time series.
+
+    Only the tree below *root_pid* is walked, so each tick costs time in
+    proportion to the toolbox's own jobs rather than to every process on a
+    shared server.  ``psutil.Process`` handles are kept between ticks, which
+    makes per-process CPU percentages interval-accurate without sleeping
+    and reads names and command lines only once per process.  Sampling and
+    export may run on different threads.
+
+    Parameters
+    ----------
+    root_pid : int or None, optional
+        Root of the tree (default: the current process).  The root itself
+        is not reported.
+    history : int, optional
+        Samples kept per process; older samples are discarded.
+
+    Attributes
+    ----------
+    series : dict[int, dict]
+        Per-PID ``{"name", "cmdline", "started", "exited", "samples"}``,
+        where ``samples`` is a deque of ``(time, cpu_percent, rss_bytes,
+        read_bytes, write_bytes)`` tuples (I/O is ``None`` when the platform
+        does not report it).
+    """
+
+    def __init__(self, root_pid: int | None = None, history: int = SAMPLE_HISTORY):
+        self.root_pid = root_pid if root_pid is not None else os.getpid()
+        self.history = history
+        self.series: dict[int, dict] = {}
+        self._handles: dict[int, psutil.Process] = {}
+        self._exited: deque[int] = deque()
+        self._lock = threading.Lock()
+
+    def descendant_pids(self) -> list[int]:
+        """PIDs below the root, breadth first."""
+        pending, found = [self.root_pid], []
+        while pending:
+            pid = pending.pop(0)
+            children = _proc_children(pid)
+            if children is None:
+                try:
+                    children = [p.pid for p in psutil.Process(pid).children()]
+                except psutil.Error:
+                    children = []
+            found.extend(children)
+            pending.extend(children)
+        return found
+
+    def _handle(self, pid: int) -> psutil.Process | None:
+        proc = self._handles.get(pid)
+        if proc is not None and proc.is_running():
+            return proc
+        if proc is not None:
+            self._mark_exited(pid)  # PID reused by a new process
+        try:
+            proc = psutil.Process(pid)
+            with proc.oneshot():
+                name = proc.name()
+                cmdline = " ".join(proc.cmdline())
+                started = proc.create_time()
+            proc.cpu_percent(None)  # prime the interval counter
+        except psutil.Error:
+            return None
+        self._handles[pid] = proc
+        self.series[pid] = {
+            "name": name,
+            "cmdline": cmdline,
+            "started": started,
+            "exited": None,
+            "samples": deque(maxlen=self.history),
+        }
+        return proc
+
+    def _mark_exited(self, pid: int) -> None:
+        self._handles.pop(pid, None)
+        entry = self.series.get(pid)
+        if entry is None or entry["exited"] is not None:
+            return
+        entry["exited"] = time.time()
+        self._exited.append(pid)
+        while len(self._exited) > MAX_EXITED_PROCESSES:
+            old = self._exited.popleft()
+            if self.series.get(old, {}).get("exited") is not None:
+                self.series.pop(old)
+
+    def sample(self) -> list[dict]:
+        """Take one sample of every live descendant.
+
+        Returns
+        -------
+        list of dict
+            One row per live process with ``pid``, ``name``, ``cmdline``,
+            ``cpu_percent``, ``memory_percent``, ``memory_mb``, ``runtime``
+            (seconds) and ``status``, sorted by CPU usage.
+        """
+        with self._lock:
+            return self._sample()
+
+    def _sample(self) -> list[dict]:
+        now = time.time()
+        live = set()
+        rows = []
+        for pid in self.descendant_pids():
+            proc = self._handle(pid)
+            if proc is None:
+                continue
+            try:
+                with proc.oneshot():
+                    cpu = proc.cpu_percent(None)
+                    mem = proc.memory_info()
+                    mem_percent = proc.memory_percent()
+                    status = proc.status()
+                    try:
+                        io = proc.io_counters()
+                        read_bytes, write_bytes = io.read_bytes, io.write_bytes
+                    except (psutil.AccessDenied, AttributeError):
+                        read_bytes = write_bytes = None
+            except psutil.Error:
+                continue
+            live.add(pid)
+            entry = self.series[pid]
+            entry["samples"].append((now, cpu, mem.rss, read_bytes, write_bytes))
+            rows.append(
+                {
+                    "pid": pid,
+                    "name": entry["name"],
+                    "cmdline": entry["cmdline"],
+                    "cpu_percent": cpu,
+                    "memory_percent": mem_percent,
+                    "memory_mb": mem.rss / (1024 * 1024),
+                    "runtime": now - entry["started"],
+                    "status": status,
+                }
+            )
+
+        for pid in list(self._handles):
+            if pid not in live:
+                self._mark_exited(pid)
+
+        rows.sort(key=lambda row: row["cpu_percent"], reverse=True)
+        return rows
+
+    def export_csv(self, path: str | Path) -> Path:
+        """Write every recorded sample to *path* as CSV and return the path.
+
+        Columns: ``pid, name, cmdline, time, cpu_percent, rss_mb,
+        read_bytes, write_bytes``.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    "pid",
+                    "name",
+                    "cmdline",
+                    "time",
+                    "cpu_percent",
+                    "rss_mb",
+                    "read_bytes",
+                    "write_bytes",
+                ]
+            )
+            for pid, entry in sorted(self.series.items()):
+                for t, cpu, rss, read_bytes, write_bytes in entry["samples"]:
+                    writer.writerow(
+                        [
+                            pid,
+                            entry["name"],
+                            entry["cmdline"],
+                            f"{t:.3f}",
+                            f"{cpu:.1f}",
+                            f"{rss / (1024 * 1024):.1f}",
+                            "" if read_bytes is None else read_bytes,
+                            "" if write_bytes is None else write_bytes,
+                        ]
+                    )
+        return path
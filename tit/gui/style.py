@@ -100,6 +100,7 @@ WINDOW_WIDTH = 1000
 WINDOW_HEIGHT = 800
 CONSOLE_MIN_HEIGHT = 200
 CONSOLE_MAX_HEIGHT = 600
+CONSOLE_MAX_LINES = 20000  # older console lines are discarded beyond this
 CONFIG_PANEL_MAX_HEIGHT = 600
 
 # ---------------------------------------------------------------------------
@@ -4,8 +4,8 @@
 """System monitor tab for the TI-Toolbox GUI.
 
 Provides real-time CPU and memory usage graphs (matplotlib) and a process
-table filtered to toolbox-related operations (SimNIBS, FreeSurfer, QSI,
-optimization, etc.).
+table of the jobs the toolbox launched (SimNIBS, FreeSurfer, QSI,
+optimization, etc.), sampled from the GUI's own process tree.
 """
 
 import logging
@@ -24,6 +24,7 @@ from PyQt5 import QtWidgets, QtCore, QtGui
 from PyQt5.QtCore import QTimer, QThread, pyqtSignal
 from PyQt5.QtWidgets import QHeaderView
 from tit.gui.style import FONT_MD, FONT_SECTION  # graphics tokens
+from tit.gui.process import ProcessSampler
 
 import matplotlib
 
@@ -38,8 +39,11 @@ plt.style.use("dark_background")  # Use dark theme for graphs
 class ProcessMonitorThread(QThread):
     """Background thread that polls system processes via ``psutil``.
 
-    Emits CPU/memory statistics and a filtered list of toolbox-related
-    processes at a configurable interval.
+    Emits CPU/memory statistics and the toolbox's own processes at a
+    configurable interval.  The process tree below the GUI is sampled more
+    often than the display updates (``sample_interval``), so short-lived
+    child processes still show up in the recorded time series; the legacy
+    keyword scan over every process remains as ``get_relevant_processes``.
 
     Signals
     -------
@@ -56,6 +60,8 @@ class ProcessMonitorThread(QThread):
         super().__init__()
         self.running = True
         self.update_interval = 2.0  # Update every 2 seconds
+        self.sample_interval = 0.5  # Sample the process tree every 0.5 s
+        self.sampler = ProcessSampler()
 
         self.relevant_keywords = [
             "charm",
@@ -105,23 +111,41 @@ class ProcessMonitorThread(QThread):
 
     def run(self):
         """Main monitoring loop."""
+        psutil.cpu_percent(interval=None)  # prime; later calls are non-blocking
+        next_update = time.monotonic()
         while self.running:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
+            rows = self.sampler.sample()
+            if time.monotonic() < next_update:
+                time.sleep(self.sample_interval)
+                continue
+            next_update = time.monotonic() + self.update_interval
 
+            memory = psutil.virtual_memory()
             system_stats = {
-                "cpu_percent": cpu_percent,
+                "cpu_percent": psutil.cpu_percent(interval=None),
                 "memory_percent": memory.percent,
                 "memory_used": memory.used,
                 "memory_total": memory.total,
                 "timestamp": datetime.now().strftime("%H:%M:%S"),
             }
             self.system_stats_signal.emit(system_stats)
-
-            relevant_processes = self.get_relevant_processes()
-            self.process_data_signal.emit(relevant_processes)
-
-            time.sleep(self.update_interval)
+            self.process_data_signal.emit(self.format_sampled_processes(rows))
+
+            time.sleep(self.sample_interval)
+
+    def format_sampled_processes(self, rows):
+        """Convert :meth:`ProcessSampler.sample` rows for the process table."""
+        processes = []
+        for row in rows:
+            cmdline = row["cmdline"]
+            processes.append(
+                {
+                    **row,
+                    "cmdline": cmdline[:100] + "..." if len(cmdline) > 100 else cmdline,
+                    "runtime": self.format_runtime(row["runtime"]),
+                }
+            )
+        return processes
 
     def get_relevant_processes(self):
         """Get processes relevant to the toolbox using psutil."""
@@ -367,6 +391,13 @@ class SystemMonitorTab(QtWidgets.QWidget):
         self.clear_graphs_btn.clicked.connect(self.clear_graph_data)
         self.clear_graphs_btn.setStyleSheet("background-color: #555; color: white;")
 
+        self.export_btn = QtWidgets.QPushButton("Export Samples")
+        self.export_btn.setToolTip(
+            "Save the recorded CPU, memory and I/O samples of toolbox processes "
+            "as CSV in the project's log directory"
+        )
+        self.export_btn.clicked.connect(self.export_samples)
+
         self.kill_btn = QtWidgets.QPushButton("Terminate Selected Process")
         self.kill_btn.clicked.connect(self.terminate_selected_process)
         self.kill_btn.setStyleSheet("background-color: #f44336; color: white;")
@@ -374,6 +405,7 @@ class SystemMonitorTab(QtWidgets.QWidget):
         controls_layout.addWidget(self.refresh_btn)
         controls_layout.addWidget(self.pause_btn)
         controls_layout.addWidget(self.clear_graphs_btn)
+        controls_layout.addWidget(self.export_btn)
         controls_layout.addStretch()
         controls_layout.addWidget(self.kill_btn)
 
@@ -486,6 +518,30 @@ class SystemMonitorTab(QtWidgets.QWidget):
                 1000, lambda: self.status_label.setText("Monitoring active...")
             )
 
+    def export_samples(self):
+        """Write the sampled process time series next to the run logs."""
+        if self.monitor_thread is None:
+            return
+        from tit.paths import get_path_manager
+
+        pm = get_path_manager()
+        log_dir = (
+            os.path.join(pm.ti_toolbox(), "logs")
+            if pm.project_dir
+            else os.path.expanduser("~")
+        )
+        path = os.path.join(
+            log_dir, f"process_samples_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+        )
+        try:
+            self.monitor_thread.sampler.export_csv(path)
+        except OSError as e:
+            QtWidgets.QMessageBox.warning(
+                self, "Export Failed", f"Could not write {path}:\n{e}"
+            )
+            return
+        self.status_label.setText(f"Samples exported to {path}")
+
     def update_system_stats(self, stats):
         """Update system-wide statistics display."""
         self.cpu_label.setText(f"CPU: {stats['cpu_percent']:.1f}%")
@@ -6,6 +6,12 @@ loggers, but attaches **no** handlers.  Handlers are added on demand via
 :func:`add_file_handler`, :func:`add_stream_handler`, or the Qt signal
 bridge in the GUI.
 
+``import tit`` attaches a deferred console handler to the ``tit`` logger
+(:func:`install_default_console`): it binds ``sys.stdout`` and its
+formatter on the first record, so importing the package costs nothing
+beyond :mod:`logging` itself, and entry points that call
+:func:`setup_logging` replace it before it is ever used.
+
 Public API
 ----------
 setup_logging
@@ -16,6 +22,8 @@ add_stream_handler
     Attach a :class:`~logging.StreamHandler` (stdout) to a named logger.
 get_file_only_logger
     Return a logger that writes **only** to a file (no console).
+install_default_console
+    Give the ``tit`` logger a console handler bound on first use.
 
 Module Attributes
 -----------------
@@ -26,6 +34,8 @@ DATE_FORMAT : str
 """
 
 import logging
+import os
+import sys
 from pathlib import Path
 
 LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
@@ -129,8 +139,6 @@ def add_stream_handler(
     setup_logging : Set the package-wide log level.
     add_file_handler : Attach a file handler.
     """
-    import sys
-
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(getattr(logging, level.upper(), logging.INFO))
     handler.setFormatter(logging.Formatter("%(message)s"))
@@ -174,3 +182,47 @@ def get_file_only_logger(
     logger.propagate = False  # never bubble to root/terminal
     add_file_handler(log_file, level=level, logger_name=name)
     return logger
+
+
+class _DeferredStdoutHandler(logging.StreamHandler):
+    """stdout handler that resolves its stream and formatter on first use.
+
+    Binding late also follows a ``sys.stdout`` replaced after import (GUI
+    capture, pytest), which a handler created at import time would miss.
+    """
+
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        logging.Handler.__init__(self, level)
+        self.stream = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = sys.stdout
+            self.setFormatter(logging.Formatter("%(message)s"))
+        super().emit(record)
+
+
+def install_default_console(level: str = "INFO") -> None:
+    """Give the ``tit`` logger terminal output without an explicit setup.
+
+    Called by ``import tit`` so scripts print INFO messages out of the box.
+    Sets the level like :func:`setup_logging` and attaches a stdout handler
+    at the same level that is only bound when the first record arrives.
+    Entry points that call :func:`setup_logging` drop it again.  Setting
+    ``TIT_LOG_CONSOLE=0`` skips the handler, e.g. for library use or worker
+    processes.
+
+    Parameters
+    ----------
+    level : str, optional
+        Logging level name.  Default is ``"INFO"``.
+    """
+    logger = logging.getLogger("tit")
+    logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    logger.propagate = False
+    if os.environ.get("TIT_LOG_CONSOLE", "1") == "0":
+        return
+    if not any(isinstance(h, _DeferredStdoutHandler) for h in logger.handlers):
+        logger.addHandler(
+            _DeferredStdoutHandler(getattr(logging, level.upper(), logging.INFO))
+        )
@@ -40,19 +40,28 @@ tit.opt.flex : Flex-search subpackage with builder, manifest, and pareto utiliti
 tit.opt.ex : Exhaustive-search subpackage with engine and result handling.
 tit.opt.mex : Multipolar exhaustive-search subpackage.
 tit.opt.leadfield : Leadfield matrix generation via SimNIBS.
+tit.opt.leadfield_store : Memory-mapped, ROI-sliceable leadfield store.
+tit.opt.leadfield_catalog : Per-subject leadfield catalogue and converter CLI.
 """
 
-from tit.opt.config import (
-    FlexConfig,
-    FlexResult,
-    ExConfig,
-    ExResult,
-    MExConfig,
-    MExResult,
+from tit._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "tit.opt.config": [
+            "FlexConfig",
+            "FlexResult",
+            "ExConfig",
+            "ExResult",
+            "MExConfig",
+            "MExResult",
+        ],
+        "tit.opt.ex.ex": ["run_ex_search"],
+        "tit.opt.flex.flex": ["run_flex_search"],
+        "tit.opt.mex.mex": ["run_m_ex_search"],
+    },
 )
-from tit.opt.ex.ex import run_ex_search
-from tit.opt.flex.flex import run_flex_search
-from tit.opt.mex.mex import run_m_ex_search
 
 __all__ = [
     # Config classes
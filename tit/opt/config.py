@@ -145,6 +145,22 @@ class FlexConfig:
     n_multistart : int
         Number of independent DE restarts.  Higher values reduce
         sensitivity to local optima.
+    parallel_restarts : int
+        How many restarts run concurrently, each in its own process with
+        an equal share of *cpus*.  ``1`` (default) runs them one after
+        another in-process.
+    early_stop_agree : int or None
+        Stop launching further restarts once this many finished restarts
+        reach the best objective value within *early_stop_rtol*.
+        ``None`` always runs all *n_multistart* restarts.
+    early_stop_rtol : float
+        Relative tolerance used by *early_stop_agree* to decide that two
+        restarts found the same optimum.
+    reuse_preparation : bool
+        If True, restarts and sweep points that run in the same process
+        reuse the head mesh, valid skin region, ROI and FEM solver
+        prepared by the first run with matching settings (see
+        :mod:`tit.opt.flex.prepared`).
     max_iterations : int or None
         Maximum DE generations per restart.  ``None`` for solver default.
     population_size : int or None
@@ -155,6 +171,11 @@ class FlexConfig:
         DE mutation strategy string.  ``None`` for solver default.
     recombination : float or None
         DE crossover probability.  ``None`` for solver default.
+    seed_solutions : list of list of float or None
+        Optimizer parameter vectors (``optim_x`` from earlier runs'
+        ``electrode_positions.json``) inserted into the initial DE
+        population.  Used by the Pareto sweep to warm-start a grid point
+        from its finished neighbours.
     cpus : int or None
         Number of parallel workers.  ``None`` for auto-detect.
     min_electrode_distance : float
@@ -475,11 +496,16 @@ class FlexConfig:
 
     # ── solver ──
     n_multistart: int = 1
+    parallel_restarts: int = 1
+    early_stop_agree: int | None = None
+    early_stop_rtol: float = 0.01
+    reuse_preparation: bool = True
     max_iterations: int | None = None
     population_size: int | None = None
     tolerance: float | None = None
     mutation: str | None = None
     recombination: float | None = None
+    seed_solutions: list[list[float]] | None = None
     cpus: int | None = None
     min_electrode_distance: float = 5.0
 
@@ -672,6 +698,17 @@ class ExConfig:
         Spherical ROI radius in mm for the target region.
     run_name : str or None
         Optional name for this run.  Defaults to a datetime stamp.
+    deduplicate_symmetric : bool
+        Simulate one montage per class of montages with identical fields
+        (channel polarity reversal and channel swap with swapped currents)
+        and report its metrics for the whole class.  Default ``True``.
+    midline_roi : bool
+        Also treat left/right mirrored montages as equivalent.  Only valid
+        for a target on the midline of a roughly symmetric head; default
+        ``False``.  Requires an EEG-position CSV (see *symmetry_eeg_csv*).
+    symmetry_eeg_csv : str or None
+        EEG-position CSV used to build the left/right mirror map for
+        *midline_roi*.  Inferred from the leadfield's net name when unset.
 
     Raises
     ------
@@ -760,6 +797,11 @@ class ExConfig:
     # ── Output naming (defaults to datetime stamp) ─────────────────────
     run_name: str | None = None
 
+    # ── Symmetry reduction ─────────────────────────────────────────────
+    deduplicate_symmetric: bool = True
+    midline_roi: bool = False
+    symmetry_eeg_csv: str | None = None
+
     def __post_init__(self):
         if isinstance(self.electrodes, dict):
             if "electrodes" in self.electrodes:
@@ -894,6 +936,12 @@ class MExConfig:
         is True.  ``"within_pairs"`` mirrors each pair's plus/minus
         electrodes independently; ``"cross_pairs"`` additionally mirrors
         pair 1<->3 and pair 2<->4.
+    deduplicate_symmetric : bool
+        With the default two-channel *channels* grouping, simulate one
+        candidate per class of candidates with identical fields (pair order
+        within and across channels, and an even number of pair polarity
+        reversals) and report its metrics for the whole class.  Ignored for
+        an explicit *channels* grouping.  Default ``True``.
 
     Raises
     ------
@@ -985,6 +1033,7 @@ class MExConfig:
     symmetric_bucket: bool = False
     symmetry_eeg_csv: str | None = None
     symmetry_pairing: str = "within_pairs"
+    deduplicate_symmetric: bool = True
 
     def __post_init__(self):
         if isinstance(self.electrodes, dict):
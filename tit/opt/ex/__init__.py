@@ -1,8 +1,15 @@
 """TI Exhaustive Search Module."""
 
-from tit.opt.config import ExConfig, ExResult
-from tit.opt.ex.engine import ExSearchEngine
-from tit.opt.ex.ex import run_ex_search
+from tit._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "tit.opt.config": ["ExConfig", "ExResult"],
+        "tit.opt.ex.engine": ["ExSearchEngine"],
+        "tit.opt.ex.ex": ["run_ex_search"],
+    },
+)
 
 __all__ = [
     "ExConfig",
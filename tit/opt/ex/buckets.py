@@ -245,6 +245,21 @@ def canonical_template_coord_path(eeg_net_name: str | Path | None) -> Path | Non
     return path if path.is_file() else None
 
 
+def infer_eeg_positions_csv(
+    leadfield_hdf: str | Path, eeg_positions_dir: str | Path
+) -> Path | None:
+    """Guess the EEG-position CSV of the net a leadfield was computed for."""
+    leadfield_name = Path(leadfield_hdf).name
+    net_name = leadfield_name.removesuffix(".hdf5").removesuffix("_leadfield")
+    if not net_name:
+        return None
+    canonical = canonical_template_coord_path(net_name)
+    if canonical is not None:
+        return canonical
+    candidate = Path(eeg_positions_dir) / f"{net_name}.csv"
+    return candidate if candidate.is_file() else None
+
+
 def build_electrode_mirror_map(
     eeg_csv_path: str | Path,
     *,
@@ -14,13 +14,22 @@ from pathlib import Path
 import numpy as np
 from simnibs.utils import TI_utils as TI
 
+from tit.opt.leadfield_store import LeadfieldStore, find_store
+from tit.tracing import span
+
 from .logic import (
     count_combinations,
+    generate_canonical_montages,
     generate_current_ratios,
     generate_montage_combinations,
 )
 
 
+def _montage_name(ep1, em1, ep2, em2, ratio) -> str:
+    ch1, ch2 = ratio
+    return f"{ep1}_{em1}_and_{ep2}_{em2}_I1-{ch1:.1f}mA_I2-{ch2:.1f}mA"
+
+
 class ExSearchEngine:
     """Exhaustive TI electrode search engine.
 
@@ -49,22 +58,60 @@ class ExSearchEngine:
         self.roi_volumes = None
         self.gm_indices = None
         self.gm_volumes = None
+        # Set when the leadfield comes from a toolbox leadfield store: the
+        # mesh element of each loaded leadfield row (roi_indices/gm_indices
+        # then index these rows rather than the whole mesh).
+        self.element_rows = None
+        self._store = None
 
     # ── Initialization ────────────────────────────────────────────────────
 
     def initialize(self, roi_radius: float = 3.0) -> None:
         """Load leadfield, resolve the ROI (CSV/mask/atlas), find ROI + GM elements."""
-        self._load_leadfield()
-        self._load_roi_coordinates()
-        self._find_roi_elements(roi_radius)
-        self._find_gm_elements()
+        with span("load_leadfield"):
+            self._load_leadfield()
+        with span("find_elements"):
+            self._load_roi_coordinates()
+            self._find_roi_elements(roi_radius)
+            self._find_gm_elements()
+        with span("slice_leadfield"):
+            self._slice_leadfield()
 
     def _load_leadfield(self) -> None:
+        """Load the leadfield, or only open its store for later slicing.
+
+        With an up-to-date ``.lfstore`` (see :mod:`tit.opt.leadfield_store`)
+        only the element index is read here; the leadfield rows are read in
+        :meth:`_slice_leadfield` once the ROI and GM elements are known.
+        """
+        store_path = find_store(self.leadfield_hdf)
+        if store_path is not None:
+            self.logger.info(f"Opening leadfield store: {store_path}")
+            self._store = LeadfieldStore(store_path)
+            self.mesh = self._store.elements
+            self.idx_lf = self._store.idx_lf
+            return
+
         self.logger.info(f"Loading leadfield: {self.leadfield_hdf}")
         start = time.time()
         self.leadfield, self.mesh, self.idx_lf = TI.load_leadfield(self.leadfield_hdf)
         self.logger.info(f"Loaded in {time.time() - start:.1f}s")
 
+    def _slice_leadfield(self) -> None:
+        """Read only the ROI and GM rows from the leadfield store."""
+        if self._store is None:
+            return
+        start = time.time()
+        rows = np.union1d(self.roi_indices, self.gm_indices)
+        self.leadfield = self._store.load(rows)
+        self.roi_indices = np.searchsorted(rows, self.roi_indices)
+        self.gm_indices = np.searchsorted(rows, self.gm_indices)
+        self.element_rows = rows
+        self.logger.info(
+            f"Loaded {len(rows)}/{self._store.n_elements} leadfield elements "
+            f"({self._store.dtype}) in {time.time() - start:.1f}s"
+        )
+
     def _roi_entries(self) -> list:
         """Normalize ``roi_file`` to a list of entries.
 
@@ -259,8 +306,17 @@ class ExSearchEngine:
         current_ratios: list[tuple[float, float]],
         all_combinations: bool,
         output_dir: str,
+        deduplicate: bool = True,
+        mirror_map: dict[str, str] | None = None,
     ) -> dict[str, dict[str, float]]:
-        """Run the full simulation loop. Returns {mesh_key: metrics}."""
+        """Run the full simulation loop. Returns {mesh_key: metrics}.
+
+        With *deduplicate*, only one montage per symmetry class is simulated
+        (see :func:`~tit.opt.ex.logic.generate_canonical_montages`) and its
+        metrics are reported under every montage of the class, with the
+        channel currents of each.  *mirror_map* additionally merges
+        left/right reflections; pass it only for midline ROIs.
+        """
         stop = False
 
         def _on_signal(sig, frame):
@@ -270,9 +326,24 @@ class ExSearchEngine:
         signal.signal(signal.SIGINT, _on_signal)
         signal.signal(signal.SIGTERM, _on_signal)
 
-        total = count_combinations(
-            e1_plus, e1_minus, e2_plus, e2_minus, current_ratios, all_combinations
-        )
+        electrode_args = (e1_plus, e1_minus, e2_plus, e2_minus, current_ratios)
+        n_montages = count_combinations(*electrode_args, all_combinations)
+        if deduplicate:
+            # Materialise the classes once so the total needs no second pass.
+            classes = list(
+                generate_canonical_montages(
+                    *electrode_args, all_combinations, mirror_map
+                )
+            )
+            total = len(classes)
+        else:
+            total = n_montages
+            classes = (
+                (montage, [montage])
+                for montage in generate_montage_combinations(
+                    *electrode_args, all_combinations
+                )
+            )
         self._log_config_summary(
             e1_plus,
             e1_minus,
@@ -282,22 +353,23 @@ class ExSearchEngine:
             all_combinations,
             total,
         )
+        if total != n_montages:
+            self.logger.info(
+                f"Symmetry reduction: {n_montages} montages -> {total} evaluated "
+                f"({n_montages / max(total, 1):.1f}x)"
+            )
 
         results: dict[str, dict[str, float]] = {}
+        evaluated = 0
         start_time = time.time()
 
-        for i, (ep1, em1, ep2, em2, (ch1, ch2)) in enumerate(
-            generate_montage_combinations(
-                e1_plus, e1_minus, e2_plus, e2_minus, current_ratios, all_combinations
-            ),
-            1,
-        ):
+        for i, (montage, members) in enumerate(classes, 1):
             if stop:
                 self.logger.warning("Interrupted")
                 break
 
-            name = f"{ep1}_{em1}_and_{ep2}_{em2}_I1-{ch1:.1f}mA_I2-{ch2:.1f}mA"
-            key = f"TI_field_{name}.msh"
+            ep1, em1, ep2, em2, (ch1, ch2) = montage
+            name = _montage_name(*montage)
 
             elapsed = time.time() - start_time
             rate = i / elapsed if elapsed > 0 else 0
@@ -310,7 +382,14 @@ class ExSearchEngine:
 
             sim_start = time.time()
             data = self.compute_ti_field(ep1, em1, ch1, ep2, em2, ch2)
-            results[key] = data
+            evaluated = i
+            for member in members:
+                m_ch1, m_ch2 = member[4]
+                results[f"TI_field_{_montage_name(*member)}.msh"] = {
+                    **data,
+                    "current_ch1_mA": m_ch1,
+                    "current_ch2_mA": m_ch2,
+                }
 
             self.logger.info(
                 f"  {time.time() - sim_start:.2f}s | "
@@ -323,8 +402,8 @@ class ExSearchEngine:
             t = time.time() - start_time
             self.logger.info(f"\n{'=' * 60}")
             self.logger.info(
-                f"Done: {len(results)}/{total} in {t / 60:.1f}min "
-                f"({t / len(results):.2f}s each)"
+                f"Done: {evaluated}/{total} in {t / 60:.1f}min "
+                f"({t / evaluated:.2f}s each, {len(results)} montages reported)"
             )
             self.logger.info(f"Output: {output_dir}")
 
@@ -6,12 +6,15 @@ Public API: ``run_ex_search(config) -> ExResult``
 import logging
 import os
 import time
+from pathlib import Path
 
 
 from tit.opt.config import ExConfig, ExResult
 from tit.paths import get_path_manager
 from tit.logger import add_file_handler
+from tit.tracing import start_trace
 
+from .buckets import build_electrode_mirror_map, infer_eeg_positions_csv
 from .engine import ExSearchEngine
 from .logic import generate_current_ratios
 from .results import process_and_save
@@ -37,6 +40,7 @@ def _run_ex_search_inner(config: ExConfig) -> ExResult:
     logger_name = f"tit.opt.ex_search.{config.subject_id}"
     add_file_handler(log_file, logger_name=logger_name)
     add_file_handler(log_file, logger_name="simnibs")
+    start_trace(log_file)
     logger = logging.getLogger(logger_name)
 
     logger.info(f"{'=' * 60}\nTI Exhaustive Search\n{'=' * 60}")
@@ -91,7 +95,15 @@ def _run_ex_search_inner(config: ExConfig) -> ExResult:
     logger.info(f"Generated {len(ratios)} current ratio combinations")
 
     results = engine.run(
-        e1_plus, e1_minus, e2_plus, e2_minus, ratios, all_combinations, output_dir
+        e1_plus,
+        e1_minus,
+        e2_plus,
+        e2_minus,
+        ratios,
+        all_combinations,
+        output_dir,
+        deduplicate=config.deduplicate_symmetric,
+        mirror_map=_build_mirror_map(config, pm, logger),
     )
 
     output_info = process_and_save(results, config, output_dir, logger)
@@ -105,3 +117,23 @@ def _run_ex_search_inner(config: ExConfig) -> ExResult:
         results_csv=output_info.get("csv_path"),
         config_json=output_info.get("config_json_path"),
     )
+
+
+def _build_mirror_map(config: ExConfig, pm, logger) -> dict[str, str] | None:
+    """Left/right mirror map for midline-ROI deduplication, if requested."""
+    if not (config.deduplicate_symmetric and config.midline_roi):
+        return None
+
+    eeg_csv = Path(config.symmetry_eeg_csv) if config.symmetry_eeg_csv else None
+    if eeg_csv is None or not eeg_csv.is_file():
+        eeg_csv = infer_eeg_positions_csv(
+            config.leadfield_hdf, pm.eeg_positions(config.subject_id)
+        )
+    if eeg_csv is None or not eeg_csv.is_file():
+        raise ValueError(
+            "midline_roi requires a valid symmetry_eeg_csv or an inferable "
+            "EEG-position CSV from the selected leadfield."
+        )
+
+    logger.info(f"Midline ROI: merging mirrored montages using {eeg_csv}")
+    return build_electrode_mirror_map(eeg_csv)
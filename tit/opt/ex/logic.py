@@ -3,6 +3,15 @@
 This module generates the full Cartesian product of electrode placements
 and current-ratio splits that the exhaustive-search optimizer evaluates.
 
+``TI_max`` is exactly invariant under reversing the polarity of either
+channel and under swapping the two channels together with their currents,
+so a montage shares its field with up to seven others.  The canonical
+enumerator groups those into classes, yields the first-enumerated member of
+each as its representative, and lists the rest so a single evaluation can be
+reported for all of them.  An optional left/right electrode mirror map adds
+hemispheric reflection, which is only a valid equivalence for midline ROIs
+on a roughly symmetric head.
+
 Public API
 ----------
 generate_current_ratios
@@ -11,6 +20,9 @@ generate_montage_combinations
     Yield ``(e1+, e1-, e2+, e2-, (ch1_mA, ch2_mA))`` tuples.
 count_combinations
     Count total montage combinations without materializing them.
+generate_canonical_montages
+    Yield one representative per class of equivalent montages, with the
+    montages it stands for.
 
 See Also
 --------
@@ -127,3 +139,123 @@ def count_combinations(
         )
     )
     return n_electrodes * len(current_ratios)
+
+
+def _ratio_swap_index(current_ratios):
+    """Map each ratio index to the index of its ``(ch2, ch1)`` counterpart."""
+    lookup = {
+        (round(ch1, 9), round(ch2, 9)): idx
+        for idx, (ch1, ch2) in enumerate(current_ratios)
+    }
+    return [lookup.get((round(ch2, 9), round(ch1, 9))) for ch1, ch2 in current_ratios]
+
+
+def _mutual_mirror(mirror_map):
+    """Keep only reciprocal mirror pairs so the reflection is an involution."""
+    if not mirror_map:
+        return None
+    return {a: b for a, b in mirror_map.items() if mirror_map.get(b) == a}
+
+
+def _montage_ranker(e1_plus, e1_minus, e2_plus, e2_minus, all_combinations):
+    """Return ``rank(electrodes)``: enumeration position, or None if not enumerated."""
+    if all_combinations:
+        pool = {}
+        for idx, name in enumerate(e1_plus):
+            pool.setdefault(name, idx)
+
+        def rank(electrodes):
+            if len(set(electrodes)) != 4 or not all(e in pool for e in electrodes):
+                return None
+            return tuple(pool[e] for e in electrodes)
+
+        return rank
+
+    buckets = []
+    for bucket in (e1_plus, e1_minus, e2_plus, e2_minus):
+        positions = {}
+        for idx, name in enumerate(bucket):
+            positions.setdefault(name, idx)
+        buckets.append(positions)
+
+    def rank(electrodes):
+        if not all(e in pos for e, pos in zip(electrodes, buckets)):
+            return None
+        return tuple(pos[e] for e, pos in zip(electrodes, buckets))
+
+    return rank
+
+
+def _montage_orbit(electrodes, ratio_idx, ratio_swap, mirror):
+    """Yield ``(electrodes, ratio_idx)`` images under the montage symmetries."""
+    images = [electrodes]
+    if mirror:
+        images.append(tuple(mirror.get(e, e) for e in electrodes))
+    for e1p, e1m, e2p, e2m in images:
+        channel_orders = [((e1p, e1m), (e2p, e2m), ratio_idx)]
+        if ratio_swap[ratio_idx] is not None:
+            channel_orders.append(((e2p, e2m), (e1p, e1m), ratio_swap[ratio_idx]))
+        for pair1, pair2, idx in channel_orders:
+            for a in (pair1, pair1[::-1]):
+                for b in (pair2, pair2[::-1]):
+                    yield (*a, *b), idx
+
+
+def generate_canonical_montages(
+    e1_plus,
+    e1_minus,
+    e2_plus,
+    e2_minus,
+    current_ratios,
+    all_combinations,
+    mirror_map=None,
+):
+    """Yield one representative per class of equivalent montages.
+
+    Two montages are equivalent when one maps onto the other by reversing
+    a channel's polarity, by swapping the channels along with their
+    currents, or -- when *mirror_map* is given -- by left/right reflection.
+    Only images that :func:`generate_montage_combinations` would itself
+    enumerate are included, so the classes partition exactly that set.
+
+    Parameters
+    ----------
+    e1_plus, e1_minus, e2_plus, e2_minus : list of str
+        Electrode name lists for each bucket position.
+    current_ratios : list of tuple of (float, float)
+        Valid current splits from :func:`generate_current_ratios`.
+    all_combinations : bool
+        Pool mode flag (see :func:`generate_montage_combinations`).
+    mirror_map : dict of str to str, optional
+        Electrode mirror map from
+        :func:`tit.opt.ex.buckets.build_electrode_mirror_map`.  Only
+        reciprocal pairs are used.  Leave unset unless the ROI lies on the
+        midline.
+
+    Yields
+    ------
+    tuple
+        ``(representative, members)``, where *representative* is the
+        first-enumerated montage of the class and *members* lists every
+        montage of the class in enumeration order (representative first),
+        all in the ``(e1p, e1m, e2p, e2m, (ch1_mA, ch2_mA))`` layout.
+    """
+    rank = _montage_ranker(e1_plus, e1_minus, e2_plus, e2_minus, all_combinations)
+    ratio_swap = _ratio_swap_index(current_ratios)
+    mirror = _mutual_mirror(mirror_map)
+
+    for electrodes in _electrode_combinations(
+        e1_plus, e1_minus, e2_plus, e2_minus, all_combinations
+    ):
+        for ratio_idx, ratio in enumerate(current_ratios):
+            members = {}
+            for image, idx in _montage_orbit(electrodes, ratio_idx, ratio_swap, mirror):
+                position = rank(image)
+                if position is not None:
+                    members.setdefault((position, idx), image)
+            first = min(members)
+            if first[1] != ratio_idx or members[first] != electrodes:
+                continue
+            yield (*electrodes, ratio), [
+                (*members[key], current_ratios[key[1]]) for key in sorted(members)
+            ]
@@ -17,8 +17,12 @@ builder
     SimNIBS object construction and HTML report generation.
 manifest
     Read/write ``flex_meta.json`` run manifests.
+multistart
+    Sequential or process-parallel execution of the DE restarts.
 pareto
     Pareto-front sweep over focality threshold grids.
+prepared
+    Reuse of prepared head-model/ROI/FEM state across runs.
 utils
     ROI configuration, output naming, and log-line parsing.
 
@@ -28,6 +32,13 @@ tit.opt.config.FlexConfig : Configuration dataclass for flex-search.
 tit.opt.config.FlexResult : Result container.
 """
 
-from tit.opt.flex.flex import run_flex_search
+from tit._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "tit.opt.flex.flex": ["run_flex_search"],
+    },
+)
 
 __all__ = ["run_flex_search"]
@@ -262,6 +262,14 @@ def configure_optimizer_options(
         opt._optimizer_options_std["recombination"] = config.recombination
         logger.debug(f"Set recombination to {config.recombination}")
 
+    if config.seed_solutions:
+        opt.seed_population = [
+            np.asarray(x, dtype=float) for x in config.seed_solutions
+        ]
+        logger.debug(
+            f"Seeding DE population with {len(config.seed_solutions)} solutions"
+        )
+
 
 # ---------------------------------------------------------------------------
 # HTML report generation
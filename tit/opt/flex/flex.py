@@ -27,7 +27,9 @@ import numpy as np
 from tit.opt.config import FlexConfig, FlexResult
 from tit.logger import add_file_handler
 from tit.paths import get_path_manager
-from . import builder, utils
+from tit.tracing import start_trace
+from . import builder, multistart, utils
+from .prepared import get_preparation_cache, preparation_scope
 from .skin_visualization import create_valid_skin_region_visualization
 
 
@@ -39,8 +41,11 @@ def run_flex_search(config: FlexConfig) -> FlexResult:
     field strength, peak intensity, or focality in a target ROI.
 
     Multiple independent restarts (controlled by
-    ``config.n_multistart``) are executed sequentially; the best run's
-    output is promoted to the base output folder.
+    ``config.n_multistart``) are executed sequentially, or concurrently
+    when ``config.parallel_restarts > 1``; the best run's output is
+    promoted to the base output folder.  Restarts share the prepared head
+    model, skin region and FEM system, which is released when the search
+    returns (see :func:`~tit.opt.flex.prepared.preparation_scope`).
 
     Parameters
     ----------
@@ -64,7 +69,7 @@ def run_flex_search(config: FlexConfig) -> FlexResult:
     from tit import constants as const
 
     _validate_flex_inputs(config)
-    with track_operation(const.TELEMETRY_OP_FLEX_SEARCH):
+    with track_operation(const.TELEMETRY_OP_FLEX_SEARCH), preparation_scope():
         return _run_flex_search_inner(config)
 
 
@@ -85,6 +90,12 @@ def _validate_flex_inputs(config: FlexConfig) -> None:
         raise ValueError("Flex-search cpus must be >= 1.")
     if config.n_multistart < 1:
         raise ValueError("Flex-search n_multistart must be >= 1.")
+    if config.parallel_restarts < 1:
+        raise ValueError("Flex-search parallel_restarts must be >= 1.")
+    if config.early_stop_agree is not None and config.early_stop_agree < 2:
+        raise ValueError("Flex-search early_stop_agree must be >= 2 when set.")
+    if config.early_stop_rtol < 0:
+        raise ValueError("Flex-search early_stop_rtol must be >= 0.")
     if config.min_electrode_distance <= 0:
         raise ValueError("min_electrode_distance must be positive.")
     if config.enable_mapping and not config.eeg_net:
@@ -121,6 +132,29 @@ def _validate_roi_input(label: str, roi) -> None:
     _require_file(Path(atlas_path), f"{label} atlas")
 
 
+def _run_restart(
+    config: FlexConfig, folder: str, cpus: int | None
+) -> tuple[float, tuple[float, float] | None]:
+    """Build, configure and run one DE restart into *folder*.
+
+    Module-level so :mod:`~tit.opt.flex.multistart` can ship it to worker
+    processes.  Returns ``(optim_funvalue, current_split)``.
+    """
+    logger = logging.getLogger(f"tit.opt.flex.{config.subject_id}")
+    opt = builder.build_optimization(config)
+    opt.output_folder = folder
+    os.makedirs(opt.output_folder, exist_ok=True)
+    builder.configure_optimizer_options(opt, config, logger)
+
+    cache = get_preparation_cache() if config.reuse_preparation else None
+    if cache is not None:
+        cache.attach(opt, config, cpus)
+    opt.run(cpus=cpus)
+    if cache is not None:
+        cache.remember(opt, config, cpus)
+    return opt.optim_funvalue, getattr(opt, "_best_current_split", None)
+
+
 def _run_flex_search_inner(config: FlexConfig) -> FlexResult:
     """Inner implementation of :func:`run_flex_search` (unwrapped)."""
     from .manifest import write_manifest
@@ -137,6 +171,7 @@ def _run_flex_search_inner(config: FlexConfig) -> FlexResult:
     logger_name = f"tit.opt.flex.{config.subject_id}"
     add_file_handler(log_file, logger_name=logger_name)
     add_file_handler(log_file, logger_name="simnibs")
+    start_trace(log_file)
     logger = logging.getLogger(logger_name)
 
     n = config.n_multistart
@@ -151,23 +186,13 @@ def _run_flex_search_inner(config: FlexConfig) -> FlexResult:
         base_folder = os.path.join(flex_root, dirname)
 
     os.makedirs(base_folder, exist_ok=True)
-    fvals = np.full(n, float("inf"))
 
     folders = [os.path.join(base_folder, f"{i:02d}") for i in range(n)]
-    # Winning channel current split per restart; stays None unless the
-    # optional current-ratio search ran (see objectives.install_ratio_search).
-    splits: list[tuple[float, float] | None] = [None] * n
 
     # -- Run optimizations --
-    for i in range(n):
-        opt = builder.build_optimization(config)
-        opt.output_folder = folders[i]
-        os.makedirs(opt.output_folder, exist_ok=True)
-        builder.configure_optimizer_options(opt, config, logger)
-
-        opt.run(cpus=config.cpus)
-        fvals[i] = opt.optim_funvalue
-        splits[i] = getattr(opt, "_best_current_split", None)
+    # Winning channel current split per restart; stays None unless the
+    # optional current-ratio search ran (see objectives.install_ratio_search).
+    fvals, splits = multistart.run_restarts(config, folders, _run_restart, logger)
 
     # -- Select best --
     valid_mask = fvals < float("inf")
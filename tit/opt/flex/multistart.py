@@ -0,0 +1,166 @@
+"""Multi-start execution for flex-search.
+
+Runs the ``n_multistart`` independent differential-evolution restarts of a
+flex-search either one after another (the default) or concurrently in
+separate worker processes, each with an equal share of the CPU budget.  Every
+restart's objective value is logged as soon as it finishes, and the run can
+stop launching further restarts once enough of them agree on the optimum.
+
+Public API
+----------
+run_restarts
+    Execute all restarts and return their objective values and splits.
+split_cpus
+    Divide a CPU budget between concurrent restarts.
+restarts_agree
+    Decide whether enough finished restarts found the same optimum.
+pool_context
+    Multiprocessing context for flex-search worker pools.
+
+See Also
+--------
+tit.opt.flex.flex.run_flex_search : Calls :func:`run_restarts`.
+tit.opt.config.FlexConfig : ``parallel_restarts`` / ``early_stop_*`` fields.
+"""
+
+import logging
+import multiprocessing as mp
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from tit.opt.config import FlexConfig
+
+from .prepared import clear_preparation_cache
+
+#: Signature of a single restart: ``(config, folder, cpus) -> (value, split)``.
+RestartFn = Callable[
+    [FlexConfig, str, int | None], tuple[float, tuple[float, float] | None]
+]
+
+
+def split_cpus(total: int | None, n_parallel: int) -> int:
+    """Return the per-restart CPU count when *n_parallel* restarts share *total*.
+
+    ``None`` means "all cores on this machine".  Every restart gets at least
+    one CPU.
+    """
+    total = total or os.cpu_count() or 1
+    return max(1, total // max(1, n_parallel))
+
+
+def restarts_agree(values: Sequence[float], n_agree: int | None, rtol: float) -> bool:
+    """True when at least *n_agree* finite *values* lie within *rtol* of the best.
+
+    Objective values are minimised, so "best" is the smallest finite value.
+    The tolerance is relative to ``|best|`` (absolute when the best is 0).
+    """
+    if not n_agree:
+        return False
+    finite = np.asarray([v for v in values if np.isfinite(v)], dtype=float)
+    if finite.size < n_agree:
+        return False
+    best = finite.min()
+    scale = abs(best) if best != 0 else 1.0
+    return int(np.count_nonzero(finite - best <= rtol * scale)) >= n_agree
+
+
+def pool_context():
+    """Multiprocessing context for flex-search worker pools.
+
+    ``fork`` where available, so workers inherit the run's file handlers;
+    shared by the restart pool and the Pareto sweep pool.
+    """
+    if "fork" in mp.get_all_start_methods():
+        return mp.get_context("fork")
+    return None  # pragma: no cover - non-POSIX platforms
+
+
+def run_restarts(
+    config: FlexConfig,
+    folders: Sequence[str],
+    run_one: RestartFn,
+    logger: logging.Logger,
+) -> tuple[np.ndarray, list[tuple[float, float] | None]]:
+    """Execute one restart per entry of *folders* and collect the outcomes.
+
+    Parameters
+    ----------
+    config : FlexConfig
+        Flex-search configuration; ``parallel_restarts``, ``cpus``,
+        ``early_stop_agree`` and ``early_stop_rtol`` control execution.
+    folders : sequence of str
+        Output folder for each restart (its length is the restart count).
+    run_one : callable
+        ``run_one(config, folder, cpus) -> (value, current_split)``.  Must be
+        a picklable module-level function when restarts run in parallel.
+    logger : logging.Logger
+        Receives one line per finished restart.
+
+    Returns
+    -------
+    tuple
+        ``(values, splits)`` -- an array of objective values (``inf`` for
+        restarts that were skipped by early stopping) and the per-restart
+        current split (``None`` unless the ratio search ran).
+    """
+    n = len(folders)
+    values = np.full(n, float("inf"))
+    splits: list[tuple[float, float] | None] = [None] * n
+    n_parallel = max(1, min(config.parallel_restarts, n))
+
+    def _record(idx: int, value: float, split) -> bool:
+        values[idx] = value
+        splits[idx] = split
+        done = int(np.count_nonzero(np.isfinite(values)))
+        logger.info(
+            f"Restart {idx + 1}/{n} finished: value={value:.6f} "
+            f"(best so far {np.min(values):.6f}, {done} finished)"
+        )
+        return restarts_agree(values, config.early_stop_agree, config.early_stop_rtol)
+
+    def _log_stop() -> None:
+        logger.info(
+            f"{config.early_stop_agree} restarts agree within "
+            f"rtol={config.early_stop_rtol}; skipping remaining restarts"
+        )
+
+    if n_parallel == 1:
+        for i, folder in enumerate(folders):
+            value, split = run_one(config, folder, config.cpus)
+            if _record(i, value, split):
+                if i + 1 < n:
+                    _log_stop()
+                break
+        return values, splits
+
+    cpus = split_cpus(config.cpus, n_parallel)
+    logger.info(
+        f"Running {n} restarts, {n_parallel} at a time with {cpus} CPU(s) each"
+    )
+    pending = list(range(n))
+    pool = ProcessPoolExecutor(
+        max_workers=n_parallel,
+        mp_context=pool_context(),
+        initializer=clear_preparation_cache,
+    )
+    with pool:
+        running = {}
+        stop = False
+        while pending or running:
+            while pending and not stop and len(running) < n_parallel:
+                idx = pending.pop(0)
+                running[pool.submit(run_one, config, folders[idx], cpus)] = idx
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                idx = running.pop(future)
+                value, split = future.result()
+                if _record(idx, value, split) and not stop:
+                    stop = True
+                    if pending:
+                        _log_stop()
+    return values, splits
@@ -484,6 +484,10 @@ def install_ratio_search(
     -----
     The chosen split of the most recent evaluation is recorded on the
     optimization object as ``opt._best_current_split`` so callers can report it.
+    When *opt* caches goal evaluations (``cache_goal_evaluations``), candidates
+    whose electrode footprint was already scored return the cached value without
+    a FEM solve, exactly as in SimNIBS's own ``goal_fun``; a cache hit can never
+    beat the value it repeats, so the recorded split is unaffected.
     Progress is logged to the ``"simnibs"`` logger in SimNIBS's own goal-line
     format, keeping live log monitoring functional.
     """
@@ -520,7 +524,29 @@ def install_ratio_search(
         # Mirror SimNIBS's own goal_fun preamble.
         opt.n_test += 1
         opt.electrode_pos = opt.get_electrode_pos_from_array(parameters)
-        e = opt.update_field(electrode_pos=opt.electrode_pos, plot=False)
+        cache = (
+            opt._goal_cache if getattr(opt, "cache_goal_evaluations", False) else None
+        )
+        cache_key = None
+        if cache is None:
+            e = opt.update_field(electrode_pos=opt.electrode_pos, plot=False)
+        else:
+            # Same order as the vendored goal_fun: assign the skin nodes, then
+            # look the footprint up before paying for the FEM solve.
+            node_idx_dict = opt.get_nodes_electrode(electrode_pos=opt.electrode_pos)
+            if isinstance(node_idx_dict[0], str):
+                e = None
+            else:
+                cache_key = opt._goal_cache_key()
+                if cache_key in cache:
+                    value = cache[cache_key][0]
+                    opt.n_cache_hits += 1
+                    logger.info(
+                        f"Goal (ratio): {value:.3f} "
+                        f"(cached, n_sim: {opt.n_sim}, n_test: {opt.n_test})"
+                    )
+                    return value
+                e = opt._solve_fields(plot=False)
         if e is None:
             # Electrode arrays overlap; SimNIBS's own penalty for this case.
             logger.info(
@@ -586,6 +612,10 @@ def install_ratio_search(
             state["best_value"] = value
             state["best_split"] = (i1, i2)
             opt._best_current_split = (i1, i2)
+        if cache_key is not None:
+            # Same (goal, tracking, ROI means) layout as the vendored entries;
+            # the ratio search tracks neither.
+            cache[cache_key] = (value, None, None)
 
         logger.info(
             f"Goal (ratio): {value:.3f} "
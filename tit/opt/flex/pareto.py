@@ -23,6 +23,18 @@ validate_grid
     Check that all combinations are valid.
 build_focality_config
     Produce a :class:`~tit.opt.config.FlexConfig` for one sweep point.
+run_sweep
+    Run pending sweep points, warm-started from neighbours and in parallel.
+neighbour_seeds
+    Warm-start vectors for a point from its finished grid neighbours.
+next_point
+    Pick the next pending point to launch in a warm-started sweep.
+complete_point
+    Record a finished point's outcome and rewrite the live archive.
+pareto_front
+    Non-dominated subset of the finished sweep points.
+write_archive
+    Write the live ``pareto_archive.json`` while a sweep is running.
 build_pareto_manifest_data
     Build the ``pareto`` section for ``flex_meta.json``.
 generate_pareto_plot
@@ -40,8 +52,10 @@ tit.opt.flex.manifest.write_manifest : Consumes the pareto manifest data.
 
 import copy
 import json
+import logging
 import os
 import shutil
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
 from itertools import product
 
@@ -83,6 +97,12 @@ class SweepPoint:
         completes successfully.
     status : str
         One of ``"pending"``, ``"running"``, ``"done"``, ``"failed"``.
+    roi_field : float or None
+        Mean field in the ROI (V/m) achieved by the run's optimum, read from
+        its ``electrode_positions.json``.  ``None`` until the run completes
+        or when the optimizer did not record it.
+    nonroi_field : float or None
+        Mean field in the non-ROI (V/m) achieved by the run's optimum.
     """
 
     roi_pct: float
@@ -93,6 +113,8 @@ class SweepPoint:
     output_folder: str
     focality_score: float | None = None
     status: str = "pending"
+    roi_field: float | None = None
+    nonroi_field: float | None = None
 
 
 @dataclass
@@ -233,6 +255,332 @@ def build_focality_config(base_config: FlexConfig, point: SweepPoint) -> FlexCon
     return cfg
 
 
+# ---------------------------------------------------------------------------
+# Sweep scheduler
+# ---------------------------------------------------------------------------
+
+
+def _grid_neighbours(result: ParetoSweepResult, point: SweepPoint) -> list:
+    """Return the points adjacent to *point* (8-neighbourhood) in the sweep grid."""
+    n_cols = len(result.config.nonroi_pcts)
+    row, col = divmod(point.run_index, n_cols)
+    neighbours = []
+    for p in result.points:
+        p_row, p_col = divmod(p.run_index, n_cols)
+        if max(abs(p_row - row), abs(p_col - col)) == 1:
+            neighbours.append(p)
+    return neighbours
+
+
+ARCHIVE_NAME = "pareto_archive.json"
+
+
+def _load_positions(folder: str) -> dict:
+    """Return a finished run's ``electrode_positions.json`` (empty if unreadable)."""
+    path = os.path.join(folder, "electrode_positions.json")
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _load_solution(folder: str) -> list | None:
+    """Return the optimizer parameter vector stored in a finished run's folder."""
+    optim_x = _load_positions(folder).get("optim_x")
+    return [float(v) for v in optim_x] if optim_x else None
+
+
+def _load_achieved_fields(folder: str) -> tuple:
+    """Return the (ROI, non-ROI) mean fields recorded by a finished run."""
+    fields = _load_positions(folder).get("roi_mean_fields") or []
+    if len(fields) < 2:
+        return None, None
+    return float(fields[0]), float(fields[1])
+
+
+def neighbour_seeds(
+    result: ParetoSweepResult, point: SweepPoint, n_seeds: int = 3
+) -> list:
+    """Return warm-start vectors for *point* from its finished grid neighbours.
+
+    Reads ``optim_x`` from each finished neighbour's
+    ``electrode_positions.json``; the result is suitable for
+    ``FlexConfig.seed_solutions``.
+
+    Args:
+        result: The sweep containing *point*.
+        point: The point about to be run.
+        n_seeds: Maximum number of vectors returned.
+
+    Returns:
+        Up to *n_seeds* parameter vectors, best neighbour score first.
+    """
+    done = [
+        p
+        for p in _grid_neighbours(result, point)
+        if p.status == "done" and p.focality_score is not None
+    ]
+    done.sort(key=lambda p: p.focality_score)
+    seeds = []
+    for p in done:
+        x = _load_solution(p.output_folder)
+        if x is not None:
+            seeds.append(x)
+        if len(seeds) == n_seeds:
+            break
+    return seeds
+
+
+def next_point(result: ParetoSweepResult, pending: list, warm_start: bool, busy: bool):
+    """Pick the next pending point to launch, or ``None`` to wait.
+
+    Without warm starts every point is independent.  With warm starts the
+    point with the most finished neighbours goes first; a point without any
+    finished neighbour is only started cold when nothing else is running,
+    so the sweep spreads out from the first finished point as a wavefront.
+
+    Args:
+        result: The sweep being run.
+        pending: Points not yet launched.
+        warm_start: Whether points are seeded from finished neighbours.
+        busy: Whether any point is currently running.
+
+    Returns:
+        The point to launch next, or ``None`` to wait for a running point.
+    """
+    if not pending:
+        return None
+    if not warm_start:
+        return pending[0]
+    ranked = sorted(
+        pending,
+        key=lambda p: -sum(q.status == "done" for q in _grid_neighbours(result, p)),
+    )
+    best = ranked[0]
+    if any(q.status == "done" for q in _grid_neighbours(result, best)) or not busy:
+        return best
+    return None
+
+
+def complete_point(
+    result: ParetoSweepResult,
+    point: SweepPoint,
+    focality_score: float | None,
+    archive_path: str | None = None,
+) -> None:
+    """Record the outcome of a finished point and rewrite the live archive.
+
+    A point with a score is marked ``"done"`` and picks up the ROI and
+    non-ROI fields its run achieved; without one it is marked ``"failed"``.
+
+    Args:
+        result: The sweep containing *point*.
+        point: The point whose run finished.
+        focality_score: The run's objective value, or ``None`` on failure.
+        archive_path: Live archive location (default
+            ``<base_output_folder>/pareto_archive.json``).
+    """
+    if focality_score is None:
+        point.status = "failed"
+    else:
+        point.focality_score = focality_score
+        point.roi_field, point.nonroi_field = _load_achieved_fields(
+            point.output_folder
+        )
+        point.status = "done"
+    if archive_path is None:
+        archive_path = os.path.join(result.config.base_output_folder, ARCHIVE_NAME)
+    write_archive(result, archive_path)
+
+
+def pareto_front(points: list) -> list:
+    """Return the non-dominated finished points.
+
+    Points are compared on the fields their runs achieved, not on the
+    requested thresholds (every grid point has its own threshold pair, so
+    those would leave almost the whole grid non-dominated).  A point
+    dominates another when its ROI field is at least as high and its
+    non-ROI field at least as low, with at least one strictly better.
+
+    Args:
+        points: Sweep points; only ``status == "done"`` points with both
+            achieved fields recorded are considered.
+
+    Returns:
+        Non-dominated points in their original order.
+    """
+    done = [
+        p
+        for p in points
+        if p.status == "done" and p.roi_field is not None and p.nonroi_field is not None
+    ]
+
+    def dominates(a, b):
+        no_worse = a.roi_field >= b.roi_field and a.nonroi_field <= b.nonroi_field
+        better = a.roi_field > b.roi_field or a.nonroi_field < b.nonroi_field
+        return no_worse and better
+
+    return [p for p in done if not any(dominates(q, p) for q in done)]
+
+
+def write_archive(result: ParetoSweepResult, path: str) -> None:
+    """Atomically write the live sweep archive (all points plus current front).
+
+    Args:
+        result: Sweep in any state of completion.
+        path: Destination JSON file.
+    """
+    front = pareto_front(result.points)
+    data = {
+        "achievable_roi_mean_vm": result.config.achievable_roi_mean,
+        "n_done": sum(p.status == "done" for p in result.points),
+        "n_total": len(result.points),
+        "front": [p.run_index for p in front],
+        "points": [
+            {
+                "run_index": p.run_index,
+                "roi_pct": p.roi_pct,
+                "nonroi_pct": p.nonroi_pct,
+                "roi_threshold_vm": p.roi_threshold,
+                "nonroi_threshold_vm": p.nonroi_threshold,
+                "focality_score": p.focality_score,
+                "roi_field_vm": p.roi_field,
+                "nonroi_field_vm": p.nonroi_field,
+                "status": p.status,
+            }
+            for p in result.points
+        ],
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _run_point(config: FlexConfig) -> tuple:
+    """Run one sweep point; module-level so it can execute in a worker process."""
+    from tit.opt.flex.flex import run_flex_search
+
+    flex_result = run_flex_search(config)
+    return getattr(flex_result, "success", True), flex_result.best_value
+
+
+def run_sweep(
+    base_config: FlexConfig,
+    result: ParetoSweepResult,
+    logger=None,
+    n_parallel: int = 1,
+    warm_start: bool = True,
+    n_seeds: int = 3,
+    archive_path: str | None = None,
+) -> ParetoSweepResult:
+    """Run every pending point of *result*, warm-started and optionally in parallel.
+
+    With *warm_start*, each point's initial DE population is seeded with the
+    best solutions of up to *n_seeds* finished neighbouring grid points
+    (``FlexConfig.seed_solutions``), so points are scheduled as a wavefront
+    from the first finished one.  Up to *n_parallel* points run at once in
+    worker processes that split ``base_config.cpus``; with ``n_parallel=1``
+    points run in the current process and share its prepared head model
+    through :mod:`tit.opt.flex.prepared` until the sweep returns.  After
+    every finished point the live archive at *archive_path* (default
+    ``<base_output_folder>/pareto_archive.json``) is rewritten.
+
+    Each point's ``status`` and ``focality_score`` are updated in place.  A
+    failing point is marked ``"failed"`` and the sweep continues.
+
+    Args:
+        base_config: Template FlexConfig shared by all points.
+        result: Sweep whose pending points are run.
+        logger: Optional logger for per-point progress.
+        n_parallel: Maximum number of points running concurrently.
+        warm_start: Seed points from finished neighbours.
+        n_seeds: Maximum number of neighbour solutions per point.
+        archive_path: Live archive location.
+
+    Returns:
+        The same *result*, for chaining into :func:`save_results`.
+    """
+    from .multistart import pool_context, split_cpus
+    from .prepared import clear_preparation_cache, preparation_scope
+    n_parallel = max(1, n_parallel)
+    pending = [p for p in result.points if p.status == "pending"]
+    n_total = len(pending)
+
+    def _log(level, msg):
+        if logger is not None:
+            logger.log(level, msg)
+
+    def _launch(point):
+        cfg = build_focality_config(base_config, point)
+        if warm_start:
+            seeds = neighbour_seeds(result, point, n_seeds)
+            cfg.seed_solutions = seeds or None
+        else:
+            seeds = []
+        if n_parallel > 1:
+            cfg.cpus = split_cpus(base_config.cpus, n_parallel)
+        pending.remove(point)
+        point.status = "running"
+        _log(
+            logging.INFO,
+            f"Sweep point {n_total - len(pending)}/{n_total}: "
+            f"ROI {point.roi_pct:.0f}% / non-ROI {point.nonroi_pct:.0f}%"
+            + (f" (seeded from {len(seeds)} neighbour(s))" if seeds else ""),
+        )
+        return cfg
+
+    def _finish(point, outcome=None, exc=None):
+        if exc is not None or not outcome[0]:
+            _log(
+                logging.ERROR,
+                f"Sweep point {point.run_index + 1} failed: {exc or 'no result'}",
+            )
+            complete_point(result, point, None, archive_path)
+        else:
+            complete_point(result, point, outcome[1], archive_path)
+
+    if n_parallel == 1:
+        with preparation_scope():
+            while pending:
+                point = next_point(result, pending, warm_start, busy=False)
+                cfg = _launch(point)
+                try:
+                    outcome = _run_point(cfg)
+                except Exception as exc:
+                    _finish(point, exc=exc)
+                else:
+                    _finish(point, outcome)
+        return result
+
+    pool = ProcessPoolExecutor(
+        max_workers=n_parallel,
+        mp_context=pool_context(),
+        initializer=clear_preparation_cache,
+    )
+    with pool:
+        running = {}
+        while pending or running:
+            while len(running) < n_parallel:
+                point = next_point(result, pending, warm_start, busy=bool(running))
+                if point is None:
+                    break
+                running[pool.submit(_run_point, _launch(point))] = point
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                point = running.pop(future)
+                try:
+                    outcome = future.result()
+                except Exception as exc:
+                    _finish(point, exc=exc)
+                else:
+                    _finish(point, outcome)
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Manifest data builder
 # ---------------------------------------------------------------------------
@@ -271,6 +619,8 @@ def build_pareto_manifest_data(result: ParetoSweepResult) -> dict:
                 "roi_threshold_vm": p.roi_threshold,
                 "nonroi_threshold_vm": p.nonroi_threshold,
                 "focality_score": p.focality_score,
+                "roi_field_vm": p.roi_field,
+                "nonroi_field_vm": p.nonroi_field,
                 "status": p.status,
             }
             for p in result.points
@@ -452,6 +802,8 @@ def save_results(result: ParetoSweepResult, output_folder: str) -> tuple:
                 "roi_threshold_vm": p.roi_threshold,
                 "nonroi_threshold_vm": p.nonroi_threshold,
                 "focality_score": p.focality_score,
+                "roi_field_vm": p.roi_field,
+                "nonroi_field_vm": p.nonroi_field,
                 "status": p.status,
             }
             for p in result.points
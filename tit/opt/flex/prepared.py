@@ -0,0 +1,199 @@
+"""Process-local cache of prepared flex-optimisation state.
+
+SimNIBS ``TesFlexOptimization`` spends a large, fixed amount of time in its
+preparation phase: reading the head mesh, computing the valid skin region,
+building the ROI point clouds and factorising the online FEM system.  None of
+that depends on the DE hyperparameters, focality thresholds or output folder,
+so every restart of a flex-search and every point of a Pareto sweep would
+otherwise redo identical work.
+
+:class:`PreparationCache` keeps the state exported by the first run for a
+given (subject, ROI, electrode geometry, conductivity, skin-region, FEM
+solver) key and hands it to later runs, which then skip straight to the
+optimisation.  The cache lives in the current process only: worker processes
+started for parallel restarts begin empty and build their own state once.
+Entries are held only inside a :func:`preparation_scope` -- one flex-search or
+one Pareto sweep -- so a long-lived process such as the GUI does not keep a
+head mesh and FEM factorisation alive between runs.
+
+Public API
+----------
+PreparationCache
+    Bounded key -> prepared-state store.
+preparation_key
+    Stable hash of the config fields that determine the prepared state.
+get_preparation_cache
+    Return the process-wide cache used by :func:`~tit.opt.flex.run_flex_search`.
+clear_preparation_cache
+    Drop every cached entry (e.g. in a freshly forked worker).
+preparation_scope
+    Keep cached state for the duration of a run or sweep, then drop it.
+
+See Also
+--------
+tit.opt.flex.flex._run_restart : Attaches and remembers prepared state.
+tit.opt.flex.pareto.run_sweep : Shares one scope across all sweep points.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator
+
+from tit.opt.config import FlexConfig
+
+logger = logging.getLogger(__name__)
+
+
+def preparation_key(
+    config: FlexConfig, cpus: int | None = None, solver_options=None
+) -> str:
+    """Return a stable key for the state SimNIBS builds in ``_prepare()``.
+
+    Only settings that change the head model, valid skin region, ROI/non-ROI
+    point clouds, electrode geometry, FEM conductivities or the FEM solver
+    itself are included, so runs that differ only in goal thresholds, DE
+    hyperparameters or output folder share one key.  The cached ``OnlineFEM``
+    keeps the solver options and CPU count it was built with, so both are part
+    of the key.
+
+    Parameters
+    ----------
+    config : FlexConfig
+        Flex-search configuration of the run.
+    cpus : int or None, optional
+        CPU count the run passes to ``opt.run()``.
+    solver_options : optional
+        ``solver_options`` of the optimization object the state belongs to.
+    """
+
+    def _plain(value):
+        if dataclasses.is_dataclass(value):
+            return {"_type": type(value).__name__, **dataclasses.asdict(value)}
+        return value
+
+    payload = {
+        "subject_id": config.subject_id,
+        "roi": _plain(config.roi),
+        "is_focality": config.is_focality,
+        "non_roi_method": config.non_roi_method,
+        "non_roi": _plain(config.non_roi) if config.is_focality else None,
+        "electrode": _plain(config.electrode),
+        "anisotropy_type": config.anisotropy_type,
+        "aniso_maxratio": config.aniso_maxratio,
+        "aniso_maxcond": config.aniso_maxcond,
+        "skin_region_margin_mm": config.skin_region_margin_mm,
+        "avoid_landmark_regions": config.avoid_landmark_regions,
+        "cpus": cpus,
+        "solver_options": solver_options,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+class PreparationCache:
+    """Bounded, least-recently-used store of prepared optimisation state.
+
+    Each entry holds a full head mesh and a factorised FEM system, so the
+    default keeps a single entry -- enough for restarts and sweeps, which
+    all share one key.
+
+    Parameters
+    ----------
+    max_entries : int
+        Number of distinct preparation keys kept alive at once.
+
+    Attributes
+    ----------
+    hits : int
+        Runs that reused cached state.
+    misses : int
+        Runs that had to prepare from scratch.
+    """
+
+    def __init__(self, max_entries: int = 1):
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def attach(self, opt, config: FlexConfig, cpus: int | None = None) -> bool:
+        """Hand cached state for *config* to *opt*; True on a cache hit."""
+        key = preparation_key(config, cpus, getattr(opt, "solver_options", None))
+        state = self._entries.get(key)
+        if state is None:
+            self.misses += 1
+            return False
+        self._entries.move_to_end(key)
+        opt.prepared_state = state
+        self.hits += 1
+        logger.info(f"Reusing prepared head model/ROI/FEM state ({key})")
+        return True
+
+    def remember(self, opt, config: FlexConfig, cpus: int | None = None) -> None:
+        """Store the state *opt* prepared, if it supports exporting it."""
+        export = getattr(opt, "export_prepared_state", None)
+        if export is None:
+            return
+        state = export()
+        if not isinstance(state, dict):
+            return
+        key = preparation_key(config, cpus, getattr(opt, "solver_options", None))
+        self._entries[key] = state
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+
+_cache = PreparationCache()
+
+
+def get_preparation_cache() -> PreparationCache:
+    """Return the process-wide :class:`PreparationCache`."""
+    return _cache
+
+
+def clear_preparation_cache() -> None:
+    """Empty the process-wide cache.
+
+    Used as the worker initializer for parallel restarts: a forked worker
+    must not reuse a FEM factorisation inherited from its parent process.
+    """
+    _cache.clear()
+
+
+_scope_depth = 0
+
+
+@contextmanager
+def preparation_scope() -> Iterator[PreparationCache]:
+    """Keep prepared state cached for the enclosed run, then drop it.
+
+    Scopes nest: a Pareto sweep opens one around all of its points, and the
+    :func:`~tit.opt.flex.run_flex_search` call of each point opens an inner
+    one that leaves the cache alone.  Leaving the outermost scope clears the
+    process-wide cache, even if the run raised.
+
+    Yields
+    ------
+    PreparationCache
+        The process-wide cache.
+    """
+    global _scope_depth
+    _scope_depth += 1
+    try:
+        yield _cache
+    finally:
+        _scope_depth -= 1
+        if _scope_depth == 0:
+            _cache.clear()
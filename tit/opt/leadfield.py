@@ -11,11 +11,14 @@ Public API
 LeadfieldGenerator
     Object-oriented interface for leadfield generation, listing, and
     electrode-name extraction.
+leadfield_net_name
+    EEG-net name encoded in a leadfield file name.
 
 See Also
 --------
 tit.opt.flex.flex.run_flex_search : Uses the leadfield indirectly via SimNIBS.
 tit.opt.ex.engine.ExSearchEngine : Loads the leadfield for exhaustive search.
+tit.opt.leadfield_store : Memory-mapped leadfield store for ROI slicing.
 """
 
 import glob
@@ -30,6 +33,27 @@ from tit.paths import get_path_manager
 log = logging.getLogger(__name__)
 
 
+def leadfield_net_name(stem: str, subject_id: str) -> str:
+    """Return the EEG-net name encoded in a leadfield file stem.
+
+    Handles the SimNIBS ``<sid>_leadfield_<net>`` layout as well as
+    ``<net>_leadfield`` and bare names.
+    """
+    if "_leadfield_" in stem:
+        net_name = stem.split("_leadfield_", 1)[-1]
+    elif stem.endswith("_leadfield"):
+        net_name = stem[: -len("_leadfield")]
+    else:
+        net_name = stem
+
+    for prefix in (f"{subject_id}_", subject_id):
+        if net_name.startswith(prefix):
+            net_name = net_name[len(prefix) :]
+            break
+
+    return net_name.strip("_") or "unknown"
+
+
 class LeadfieldGenerator:
     """Generate and list leadfield matrices for TI optimization.
 
@@ -91,6 +115,7 @@ class LeadfieldGenerator:
         output_dir: str | Path | None = None,
         tissues: list[int] | None = None,
         cleanup: bool = True,
+        store_dtype: str | None = None,
     ) -> Path:
         """Generate a leadfield matrix via SimNIBS.
 
@@ -103,6 +128,10 @@ class LeadfieldGenerator:
             Tissue tags (1 = WM, 2 = GM).  Default: ``[1, 2]``.
         cleanup : bool
             Remove stale SimNIBS artefacts before running.
+        store_dtype : str or None
+            If set (``"float32"`` or ``"float16"``), also write a
+            memory-mapped leadfield store next to the HDF5 file (see
+            :mod:`tit.opt.leadfield_store`).
 
         Returns
         -------
@@ -150,17 +179,34 @@ class LeadfieldGenerator:
 
         hdf5_path = next(output_dir.glob("*.hdf5"))
         self._log(f"Leadfield ready: {hdf5_path}")
+
+        if store_dtype is not None:
+            from tit.opt.leadfield_store import convert_leadfield
+
+            store = convert_leadfield(hdf5_path, dtype=store_dtype)
+            self._log(f"Leadfield store ready: {store}")
         return hdf5_path
 
     # ------------------------------------------------------------------
     # Query helpers
     # ------------------------------------------------------------------
 
+    def _catalog(self, subject_id: str):
+        """Refreshed leadfield catalogue of *subject_id* (mesh not read)."""
+        from tit.opt.leadfield_catalog import LeadfieldCatalog
+
+        catalog = LeadfieldCatalog(subject_id, self.pm.leadfields(subject_id))
+        catalog.refresh(read_mesh=False)
+        return catalog
+
     def list_leadfields(
         self, subject_id: str | None = None
     ) -> list[tuple[str, str, float]]:
         """List available leadfield HDF5 files for a subject.
 
+        Read from the subject's leadfield catalogue, which only opens new or
+        changed files.
+
         Parameters
         ----------
         subject_id : str or None
@@ -172,36 +218,17 @@ class LeadfieldGenerator:
             Sorted list of ``(net_name, hdf5_path, size_gb)`` tuples.
         """
         sid = subject_id or self.subject_id
-        leadfields_dir = Path(self.pm.leadfields(sid))
-
-        out: list[tuple[str, str, float]] = []
-        if not leadfields_dir.is_dir():
-            return out
-
-        for item in leadfields_dir.iterdir():
-            if item.suffix != ".hdf5":
-                continue
-
-            stem = item.stem
-            if "_leadfield_" in stem:
-                net_name = stem.split("_leadfield_", 1)[-1]
-            elif stem.endswith("_leadfield"):
-                net_name = stem[: -len("_leadfield")]
-            else:
-                net_name = stem
-
-            for prefix in (f"{sid}_", sid):
-                if net_name.startswith(prefix):
-                    net_name = net_name[len(prefix) :]
-                    break
-
-            net_name = net_name.strip("_") or "unknown"
-            out.append((net_name, str(item), item.stat().st_size / (1024**3)))
-
-        return sorted(out)
+        return sorted(
+            (e.net_name, e.path, e.size_gb)
+            for e in self._catalog(sid).entries()
+            if e.format == "hdf5"
+        )
 
     def get_electrode_names(self, cap_name: str | None = None) -> list[str]:
-        """Extract electrode labels from an EEG cap via SimNIBS.
+        """Extract electrode labels from an EEG cap.
+
+        Taken from the leadfield catalogue when a leadfield exists for the
+        cap, otherwise from the cap file via SimNIBS.
 
         Parameters
         ----------
@@ -214,8 +241,12 @@ class LeadfieldGenerator:
         list of str
             Sorted list of electrode label strings.
         """
+        cap_name = cap_name or self.electrode_cap
+        entry = self._catalog(self.subject_id).get(cap_name)
+        if entry is not None and entry.electrode_names:
+            return sorted([*entry.electrode_names, entry.reference])
+
         from simnibs.utils.csv_reader import eeg_positions
 
-        cap_name = cap_name or self.electrode_cap
         eeg_pos = eeg_positions(str(self.pm.m2m(self.subject_id)), cap_name=cap_name)
         return sorted(eeg_pos.keys())
@@ -0,0 +1,412 @@
+"""Per-subject leadfield catalogue.
+
+Leadfields are multi-GB files, and answering simple questions about them
+(which cap, which electrodes, how many elements, which tissues) used to mean
+opening each HDF5 file.  The catalogue keeps those facts in a small
+``leadfield_catalog.json`` in the subject's leadfield directory and only
+re-describes files whose size or modification time changed.
+
+It also drives conversion of SimNIBS HDF5 leadfields into checksummed
+leadfield stores (:mod:`tit.opt.leadfield_store`) and their validation.
+
+Public API
+----------
+LeadfieldEntry
+    Catalogue record describing one leadfield.
+LeadfieldCatalog
+    Load, refresh, validate and convert a subject's leadfields.
+CATALOG_FILE
+    File name of the catalogue inside the leadfield directory.
+
+Usage
+-----
+$ python -m tit.opt.leadfield_catalog 101
+$ python -m tit.opt.leadfield_catalog 101 --convert --dtype float16 --verify
+
+See Also
+--------
+tit.opt.leadfield.LeadfieldGenerator : Generates the HDF5 leadfields.
+tit.opt.leadfield_store : Store format, conversion and checksums.
+"""
+
+import argparse
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from tit.opt.leadfield import leadfield_net_name
+from tit.opt.leadfield_store import (
+    HDF5_LEADFIELD,
+    HDF5_MESH,
+    STORE_SUFFIX,
+    LeadfieldStore,
+    convert_leadfield,
+    find_store,
+    mesh_hash,
+    store_path_for,
+)
+
+log = logging.getLogger(__name__)
+
+CATALOG_FILE = "leadfield_catalog.json"
+_CATALOG_VERSION = 1
+
+
+@dataclass
+class LeadfieldEntry:
+    """Catalogue record describing one leadfield.
+
+    Attributes
+    ----------
+    name : str
+        File or directory name inside the leadfield directory.
+    net_name : str
+        EEG cap the leadfield was computed for.
+    path : str
+        Absolute path of the HDF5 file or store.
+    format : str
+        ``"hdf5"`` (SimNIBS) or ``"store"`` (:mod:`tit.opt.leadfield_store`).
+    electrode_names : list of str
+        Electrodes in leadfield row order (reference excluded).
+    reference : str
+        Reference electrode.
+    n_elements : int
+        Mesh elements covered by the leadfield.
+    tissues : list of int
+        Tissue tags of those elements.
+    mesh_hash : str or None
+        Hash of element tags and barycenters; equal hashes mean
+        interchangeable element indices.
+    dtype : str
+        Leadfield value dtype.
+    size_bytes : int
+        Size on disk.
+    mtime_ns : int
+        Modification time used to detect changes.
+    store : str or None
+        Up-to-date store converted from this HDF5 file, if any.
+    """
+
+    name: str
+    net_name: str
+    path: str
+    format: str
+    electrode_names: list[str] = field(default_factory=list)
+    reference: str = ""
+    n_elements: int = 0
+    tissues: list[int] = field(default_factory=list)
+    mesh_hash: str | None = None
+    dtype: str = ""
+    size_bytes: int = 0
+    mtime_ns: int = 0
+    store: str | None = None
+
+    @property
+    def n_electrodes(self) -> int:
+        """Electrode count including the reference."""
+        return len(self.electrode_names) + 1
+
+    @property
+    def size_gb(self) -> float:
+        return self.size_bytes / (1024**3)
+
+
+def _stat(path: Path) -> tuple[int, int]:
+    """``(size_bytes, mtime_ns)``; a store's size is the sum of its files."""
+    if path.is_dir():
+        files = [p for p in path.iterdir() if p.is_file()]
+        return (
+            sum(p.stat().st_size for p in files),
+            max((p.stat().st_mtime_ns for p in files), default=0),
+        )
+    st = path.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def _describe_store(
+    path: Path, subject_id: str, read_mesh: bool = True
+) -> LeadfieldEntry:
+    store = LeadfieldStore(path)
+    index = store.index
+    size, mtime = _stat(path)
+    return LeadfieldEntry(
+        name=path.name,
+        net_name=leadfield_net_name(path.stem, subject_id),
+        path=str(path),
+        format="store",
+        electrode_names=store.electrode_names,
+        reference=store.reference,
+        n_elements=store.n_elements,
+        tissues=list(index.get("tissues", [])),
+        mesh_hash=index.get("mesh_hash"),
+        dtype=store.dtype,
+        size_bytes=size,
+        mtime_ns=mtime,
+    )
+
+
+def _describe_hdf5(
+    path: Path, subject_id: str, read_mesh: bool = True
+) -> LeadfieldEntry:
+    """Read electrode attributes and mesh element data of a SimNIBS leadfield.
+
+    The element data is taken from an up-to-date store when one exists, so
+    the mesh is only read for leadfields that were never converted, and not
+    at all with ``read_mesh=False`` (``tissues`` and ``mesh_hash`` are then
+    left empty).
+    """
+    import h5py
+
+    with h5py.File(path, "r") as f:
+        dset = f[HDF5_LEADFIELD]
+        names = [
+            n.decode() if isinstance(n, bytes) else str(n)
+            for n in dset.attrs["electrode_names"]
+        ]
+        reference = dset.attrs["reference_electrode"]
+        if isinstance(reference, bytes):
+            reference = reference.decode()
+        n_elements = int(dset.shape[1])
+        dtype = str(dset.dtype)
+
+    store_path = find_store(path)
+    if store_path is not None:
+        index = LeadfieldStore(store_path).index
+        tissues, digest = list(index.get("tissues", [])), index.get("mesh_hash")
+    elif not read_mesh:
+        tissues, digest = [], None
+    else:
+        import numpy as np
+        from simnibs.mesh_tools import mesh_io
+
+        mesh = mesh_io.Msh.read_hdf5(str(path), HDF5_MESH)
+        tags = mesh.elm.tag1
+        tissues = sorted(int(t) for t in np.unique(tags))
+        digest = mesh_hash(tags, mesh.elements_baricenters().value)
+
+    size, mtime = _stat(path)
+    return LeadfieldEntry(
+        name=path.name,
+        net_name=leadfield_net_name(path.stem, subject_id),
+        path=str(path),
+        format="hdf5",
+        electrode_names=names,
+        reference=str(reference),
+        n_elements=n_elements,
+        tissues=tissues,
+        mesh_hash=digest,
+        dtype=dtype,
+        size_bytes=size,
+        mtime_ns=mtime,
+        store=str(store_path) if store_path is not None else None,
+    )
+
+
+class LeadfieldCatalog:
+    """Catalogue of one subject's leadfields.
+
+    Parameters
+    ----------
+    subject_id : str
+        Subject identifier.
+    leadfields_dir : str or Path or None
+        Leadfield directory.  Defaults to ``pm.leadfields(subject_id)``.
+    """
+
+    def __init__(self, subject_id: str, leadfields_dir: str | Path | None = None):
+        if leadfields_dir is None:
+            from tit.paths import get_path_manager
+
+            leadfields_dir = get_path_manager().leadfields(subject_id)
+        self.subject_id = subject_id
+        self.directory = Path(leadfields_dir)
+        self.path = self.directory / CATALOG_FILE
+        self._entries: dict[str, LeadfieldEntry] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != _CATALOG_VERSION:
+            return
+        self._entries = {
+            e["name"]: LeadfieldEntry(**e) for e in data.get("leadfields", [])
+        }
+
+    def save(self) -> None:
+        """Atomically write the catalogue file."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": _CATALOG_VERSION,
+            "subject_id": self.subject_id,
+            "leadfields": [asdict(e) for e in self.entries()],
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def entries(self) -> list[LeadfieldEntry]:
+        """Catalogued leadfields, sorted by net name then file name."""
+        return sorted(self._entries.values(), key=lambda e: (e.net_name, e.name))
+
+    def get(self, net_name: str) -> LeadfieldEntry | None:
+        """Return the entry for *net_name*, preferring SimNIBS HDF5 files."""
+        matches = [e for e in self.entries() if e.net_name == net_name]
+        matches.sort(key=lambda e: e.format != "hdf5")
+        return matches[0] if matches else None
+
+    def refresh(self, read_mesh: bool = True) -> list[LeadfieldEntry]:
+        """Re-scan the directory, describing only new or changed leadfields.
+
+        Stores that belong to an HDF5 file in the same directory are
+        recorded on that file's entry rather than listed separately.
+
+        Parameters
+        ----------
+        read_mesh : bool
+            Read the mesh of unconverted HDF5 leadfields for their tissues
+            and mesh hash.  Pass ``False`` when only names, electrodes and
+            sizes are needed (GUI pickers); such entries are completed by
+            the next refresh with ``read_mesh=True``.
+
+        Returns
+        -------
+        list of LeadfieldEntry
+            The updated entries (also written to the catalogue file).
+        """
+        if not self.directory.is_dir():
+            self._entries = {}
+            return []
+
+        hdf5 = sorted(self.directory.glob("*.hdf5"))
+        owned = {store_path_for(p).name for p in hdf5}
+        stores = [
+            p
+            for p in sorted(self.directory.glob(f"*{STORE_SUFFIX}"))
+            if p.is_dir() and p.name not in owned
+        ]
+
+        entries: dict[str, LeadfieldEntry] = {}
+        for path, describe in [(p, _describe_hdf5) for p in hdf5] + [
+            (p, _describe_store) for p in stores
+        ]:
+            cached = self._entries.get(path.name)
+            size, mtime = _stat(path)
+            store = find_store(path) if describe is _describe_hdf5 else None
+            if (
+                cached is not None
+                and (cached.size_bytes, cached.mtime_ns) == (size, mtime)
+                and cached.store == (str(store) if store is not None else None)
+                and (cached.mesh_hash is not None or not read_mesh)
+            ):
+                entries[path.name] = cached
+                continue
+            try:
+                entries[path.name] = describe(path, self.subject_id, read_mesh)
+            except Exception as exc:
+                log.warning(f"Could not describe leadfield {path}: {exc}")
+        self._entries = entries
+        self.save()
+        return self.entries()
+
+    def validate(self) -> dict[str, list[str]]:
+        """Check every entry; return ``{name: [problems]}`` for failing ones.
+
+        HDF5 files are checked for presence and unchanged size; stores (and
+        stores attached to HDF5 entries) also have every block checksum
+        recomputed.
+        """
+        problems: dict[str, list[str]] = {}
+        for entry in self.entries():
+            issues = []
+            path = Path(entry.path)
+            if not path.exists():
+                issues.append("missing")
+            elif _stat(path)[0] != entry.size_bytes:
+                issues.append("size changed since cataloguing")
+            store = entry.path if entry.format == "store" else entry.store
+            if store and Path(store).exists():
+                bad = LeadfieldStore(store).verify()
+                if bad:
+                    issues.append(f"checksum mismatch in block(s) {bad}")
+            if issues:
+                problems[entry.name] = issues
+        return problems
+
+    def convert(self, dtype: str = "float32", block_elements: int = 65536) -> list:
+        """Convert every HDF5 leadfield without an up-to-date store.
+
+        Returns
+        -------
+        list of Path
+            Stores written by this call.
+        """
+        written = []
+        for entry in self.entries():
+            if entry.format != "hdf5" or entry.store:
+                continue
+            log.info(f"Converting {entry.name} ({entry.size_gb:.1f} GB)")
+            written.append(
+                convert_leadfield(
+                    entry.path, dtype=dtype, block_elements=block_elements
+                )
+            )
+        if written:
+            self.refresh()
+        return written
+
+
+def main(argv=None) -> int:
+    """Command-line entry point: list, convert and verify leadfields."""
+    parser = argparse.ArgumentParser(
+        description="List, convert and verify a subject's leadfields."
+    )
+    parser.add_argument("subject_id", help="Subject ID (e.g. 101)")
+    parser.add_argument(
+        "--convert",
+        action="store_true",
+        help="Convert HDF5 leadfields without a store into leadfield stores",
+    )
+    parser.add_argument(
+        "--dtype",
+        choices=("float32", "float16"),
+        default="float32",
+        help="Store dtype used by --convert (default: float32)",
+    )
+    parser.add_argument(
+        "--verify", action="store_true", help="Recompute store checksums"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    catalog = LeadfieldCatalog(args.subject_id)
+    catalog.refresh()
+    if args.convert:
+        catalog.convert(dtype=args.dtype)
+
+    for e in catalog.entries():
+        store = f" store={Path(e.store).name}" if e.store else ""
+        print(
+            f"{e.net_name:<24} {e.format:<5} {e.n_electrodes:>4} electrodes "
+            f"{e.n_elements:>9} elements tissues={e.tissues} {e.dtype:<8} "
+            f"{e.size_gb:6.2f} GB{store}"
+        )
+
+    if args.verify:
+        problems = catalog.validate()
+        for name, issues in problems.items():
+            print(f"FAILED {name}: {'; '.join(issues)}")
+        if problems:
+            return 1
+        print("All leadfields verified.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
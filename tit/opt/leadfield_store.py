@@ -0,0 +1,451 @@
+"""Memory-mapped, ROI-sliceable leadfield store.
+
+SimNIBS writes leadfields as one HDF5 dataset of shape
+``(n_electrodes - 1, n_elements, 3)`` plus the full leadfield mesh, and
+``TI_utils.load_leadfield`` reads both completely into RAM.  The exhaustive
+searches only ever evaluate the ROI and grey-matter elements, so for large
+caps most of that memory (and load time) is wasted.
+
+A *leadfield store* is a directory ``<leadfield>.lfstore`` next to the HDF5
+file holding:
+
+``leadfield.npy``
+    Element-major array ``(n_elements, n_electrodes - 1, 3)`` in
+    ``float32`` or ``float16``, written block by block and memory-mapped on
+    read, so selecting an element subset only touches those rows.
+``elements.npz``
+    Sidecar element index: tissue tags, barycenters and volumes -- all the
+    mesh information the search engines need to resolve ROIs.
+``index.json``
+    Electrode names, reference electrode, dtype, per-electrode scale
+    (``float16`` stores values divided by the electrode's peak magnitude),
+    tissue tags, a hash of the element geometry, a SHA-256 checksum per
+    element block and the size/mtime of the HDF5 file it was converted
+    from.
+
+Public API
+----------
+LeadfieldStore
+    Read-only view of a store; slices the leadfield to an element subset.
+ElementIndex
+    Mesh stand-in exposing the element tags, barycenters and volumes.
+write_store
+    Write a store from element blocks of an in-memory or on-disk leadfield.
+convert_leadfield
+    Convert a SimNIBS leadfield HDF5 file into a store.
+find_store
+    Locate an up-to-date store for a leadfield path.
+mesh_hash
+    Stable hash of a leadfield mesh's element tags and barycenters.
+HDF5_LEADFIELD, HDF5_MESH
+    Dataset and mesh locations inside a SimNIBS leadfield HDF5 file.
+
+See Also
+--------
+tit.opt.leadfield.LeadfieldGenerator : Generates the SimNIBS HDF5 leadfield.
+tit.opt.ex.engine.ExSearchEngine : Loads ROI/GM rows from a store when present.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+#: Directory suffix of a leadfield store.
+STORE_SUFFIX = ".lfstore"
+#: On-disk layout version written to ``index.json``.
+STORE_FORMAT = 1
+#: Supported storage dtypes.
+STORE_DTYPES = ("float32", "float16")
+
+_LEADFIELD_FILE = "leadfield.npy"
+_ELEMENTS_FILE = "elements.npz"
+_INDEX_FILE = "index.json"
+
+#: SimNIBS HDF5 dataset holding the leadfield (read by ``TI_utils.load_leadfield``).
+HDF5_LEADFIELD = "/mesh_leadfield/leadfields/tdcs_leadfield"
+#: SimNIBS HDF5 group holding the leadfield mesh.
+HDF5_MESH = "/mesh_leadfield/"
+
+
+def store_path_for(leadfield_path: str | os.PathLike) -> Path:
+    """Return the store directory that belongs to *leadfield_path*."""
+    path = Path(leadfield_path)
+    if path.suffix == STORE_SUFFIX:
+        return path
+    return path.with_name(path.stem + STORE_SUFFIX)
+
+
+def mesh_hash(tags: np.ndarray, baricenters: np.ndarray) -> str:
+    """Return a short SHA-256 of element tags and (float32) barycenters.
+
+    Two leadfields with the same hash were computed on the same mesh
+    elements, so their element indices are interchangeable.
+    """
+    h = hashlib.sha256()
+    h.update(np.ascontiguousarray(tags, dtype=np.int32).tobytes())
+    h.update(np.ascontiguousarray(baricenters, dtype=np.float32).tobytes())
+    return h.hexdigest()[:16]
+
+
+def _block_checksum(block: np.ndarray) -> str:
+    return hashlib.sha256(np.ascontiguousarray(block).tobytes()).hexdigest()
+
+
+def _source_stamp(path: Path) -> dict | None:
+    """Size and mtime of the source HDF5 file, used to detect stale stores."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+class ElementIndex:
+    """Element tags, barycenters and volumes of a leadfield mesh.
+
+    Mirrors the small part of the SimNIBS ``Msh`` interface used to
+    resolve ROI and grey-matter elements (``elm.tag1``,
+    ``elements_baricenters().value``, ``elements_volumes_and_areas().value``)
+    so that callers do not have to read the mesh itself.
+    """
+
+    def __init__(self, tags: np.ndarray, baricenters: np.ndarray, volumes: np.ndarray):
+        self.elm = SimpleNamespace(tag1=np.asarray(tags))
+        self._baricenters = np.asarray(baricenters)
+        self._volumes = np.asarray(volumes)
+
+    def __len__(self) -> int:
+        return len(self._volumes)
+
+    def elements_baricenters(self) -> SimpleNamespace:
+        return SimpleNamespace(value=self._baricenters)
+
+    def elements_volumes_and_areas(self) -> SimpleNamespace:
+        return SimpleNamespace(value=self._volumes)
+
+
+class LeadfieldStore:
+    """Read-only, memory-mapped leadfield store.
+
+    Parameters
+    ----------
+    path : str or Path
+        The ``.lfstore`` directory.
+
+    Attributes
+    ----------
+    electrode_names : list of str
+        Electrodes in leadfield row order (reference excluded).
+    reference : str
+        Reference electrode name.
+    n_elements : int
+        Number of mesh elements covered by the leadfield.
+    dtype : str
+        Storage dtype (``"float32"`` or ``"float16"``).
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+        with open(self.path / _INDEX_FILE) as f:
+            self.index = json.load(f)
+        if self.index.get("format") != STORE_FORMAT:
+            raise ValueError(
+                f"Unsupported leadfield store format {self.index.get('format')!r} "
+                f"in {self.path}"
+            )
+        self.electrode_names = list(self.index["electrode_names"])
+        self.reference = self.index["reference"]
+        self.n_elements = int(self.index["n_elements"])
+        self.dtype = self.index["dtype"]
+        self._scale = np.asarray(self.index["scale"], dtype=np.float32)
+        self._elements: ElementIndex | None = None
+
+    @property
+    def idx_lf(self) -> dict:
+        """Electrode name -> leadfield row, as returned by ``TI.load_leadfield``."""
+        idx = {name: i for i, name in enumerate(self.electrode_names)}
+        idx[self.reference] = None
+        return idx
+
+    @property
+    def elements(self) -> ElementIndex:
+        """Element index (tags, barycenters, volumes), loaded on first use."""
+        if self._elements is None:
+            with np.load(self.path / _ELEMENTS_FILE) as data:
+                self._elements = ElementIndex(
+                    data["tags"], data["baricenters"], data["volumes"]
+                )
+        return self._elements
+
+    def memmap(self) -> np.ndarray:
+        """Return the raw element-major array, memory-mapped read-only."""
+        return np.load(self.path / _LEADFIELD_FILE, mmap_mode="r")
+
+    def load(self, elements: Sequence[int] | np.ndarray | None = None) -> np.ndarray:
+        """Return the leadfield for *elements* as ``(n_electrodes - 1, n, 3)``.
+
+        Parameters
+        ----------
+        elements : array-like of int or None
+            Mesh element indices to read, in the order they should appear.
+            ``None`` reads every element.
+
+        Returns
+        -------
+        np.ndarray
+            ``float32`` leadfield in SimNIBS axis order, rescaled to the
+            original units.
+        """
+        mm = self.memmap()
+        if elements is None:
+            rows = np.asarray(mm, dtype=np.float32)
+        else:
+            elements = np.asarray(elements, dtype=np.intp)
+            # Read in ascending order so the memmap is scanned front to back.
+            order = np.argsort(elements, kind="stable")
+            rows = np.empty((len(elements),) + mm.shape[1:], dtype=np.float32)
+            rows[order] = mm[elements[order]]
+        if self.dtype != "float32":
+            rows *= self._scale[np.newaxis, :, np.newaxis]
+        return np.ascontiguousarray(rows.transpose(1, 0, 2))
+
+    def verify(self) -> list[int]:
+        """Recompute block checksums; return the indices of corrupt blocks.
+
+        Stores written without checksums verify as intact.
+        """
+        checksums = self.index.get("block_checksums") or []
+        block = int(self.index.get("block_elements", 0)) or self.n_elements
+        mm = self.memmap()
+        return [
+            i
+            for i, expected in enumerate(checksums)
+            if _block_checksum(mm[i * block : (i + 1) * block]) != expected
+        ]
+
+    def is_current(self, source: str | os.PathLike | None = None) -> bool:
+        """True unless *source* (default: recorded source) changed since conversion."""
+        recorded = self.index.get("source")
+        if source is None:
+            if not recorded:
+                return True
+            source = recorded.get("path")
+        stamp = _source_stamp(Path(source))
+        if stamp is None or not recorded:
+            return True
+        return (
+            stamp["size"] == recorded.get("size")
+            and stamp["mtime_ns"] == recorded.get("mtime_ns")
+        )
+
+
+def write_store(
+    path: str | os.PathLike,
+    read_block: Callable[[int, int], np.ndarray],
+    n_elements: int,
+    electrode_names: Sequence[str],
+    reference: str,
+    tags: np.ndarray,
+    baricenters: np.ndarray,
+    volumes: np.ndarray,
+    dtype: str = "float32",
+    block_elements: int = 65536,
+    source: str | os.PathLike | None = None,
+) -> Path:
+    """Write a leadfield store, reading the source one element block at a time.
+
+    Parameters
+    ----------
+    path : str or Path
+        Destination ``.lfstore`` directory (replaced if it exists).
+    read_block : callable
+        ``read_block(start, stop)`` returns the source leadfield for
+        elements ``start:stop`` in SimNIBS order ``(n_electrodes - 1, n, 3)``.
+    n_elements : int
+        Number of mesh elements.
+    electrode_names : sequence of str
+        Electrode names in leadfield row order (reference excluded).
+    reference : str
+        Reference electrode name.
+    tags, baricenters, volumes : np.ndarray
+        Per-element tissue tags, barycenters ``(n, 3)`` and volumes.
+    dtype : str
+        ``"float32"`` or ``"float16"``.
+    block_elements : int
+        Elements converted per block; bounds peak memory.
+    source : str or Path or None
+        Source HDF5 file, recorded to detect stale stores.
+
+    Returns
+    -------
+    Path
+        The written store directory.
+    """
+    if dtype not in STORE_DTYPES:
+        raise ValueError(f"dtype must be one of {STORE_DTYPES}, got {dtype!r}")
+    n_electrodes = len(electrode_names)
+    blocks = [
+        (start, min(start + block_elements, n_elements))
+        for start in range(0, n_elements, block_elements)
+    ]
+
+    scale = np.ones(n_electrodes, dtype=np.float32)
+    if dtype == "float16":
+        peak = np.zeros(n_electrodes, dtype=np.float64)
+        for start, stop in blocks:
+            block = np.abs(read_block(start, stop))
+            peak = np.maximum(peak, block.reshape(n_electrodes, -1).max(axis=1))
+        scale = np.where(peak > 0, peak, 1.0).astype(np.float32)
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    out = np.lib.format.open_memmap(
+        tmp / _LEADFIELD_FILE,
+        mode="w+",
+        dtype=dtype,
+        shape=(n_elements, n_electrodes, 3),
+    )
+    checksums = []
+    for start, stop in blocks:
+        block = np.asarray(read_block(start, stop), dtype=np.float32)
+        if dtype != "float32":
+            block = block / scale[:, np.newaxis, np.newaxis]
+        out[start:stop] = block.transpose(1, 0, 2)
+        checksums.append(_block_checksum(out[start:stop]))
+    out.flush()
+    del out
+
+    tags = np.asarray(tags)
+    baricenters = np.asarray(baricenters, dtype=np.float32)
+    np.savez_compressed(
+        tmp / _ELEMENTS_FILE,
+        tags=tags,
+        baricenters=baricenters,
+        volumes=np.asarray(volumes, dtype=np.float64),
+    )
+
+    index = {
+        "format": STORE_FORMAT,
+        "electrode_names": list(electrode_names),
+        "reference": reference,
+        "n_elements": int(n_elements),
+        "dtype": dtype,
+        "block_elements": int(block_elements),
+        "scale": scale.tolist(),
+        "tissues": sorted(int(t) for t in np.unique(tags)),
+        "mesh_hash": mesh_hash(tags, baricenters),
+        "block_checksums": checksums,
+        "source": None,
+    }
+    if source is not None:
+        stamp = _source_stamp(Path(source))
+        index["source"] = {"path": str(Path(source).resolve()), **(stamp or {})}
+    with open(tmp / _INDEX_FILE, "w") as f:
+        json.dump(index, f, indent=2)
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp, path)
+    return path
+
+
+def convert_leadfield(
+    leadfield_hdf: str | os.PathLike,
+    output: str | os.PathLike | None = None,
+    dtype: str = "float32",
+    block_elements: int = 65536,
+) -> Path:
+    """Convert a SimNIBS leadfield HDF5 file into a leadfield store.
+
+    The leadfield dataset is read one element block at a time, so peak
+    memory stays at one block plus the leadfield mesh.
+
+    Parameters
+    ----------
+    leadfield_hdf : str or Path
+        SimNIBS ``*_leadfield_*.hdf5`` file.
+    output : str or Path or None
+        Store directory.  Defaults to :func:`store_path_for`.
+    dtype : str
+        ``"float32"`` (default) or ``"float16"``.
+    block_elements : int
+        Elements converted per block.
+
+    Returns
+    -------
+    Path
+        The written store directory.
+    """
+    import h5py
+    from simnibs.mesh_tools import mesh_io
+
+    leadfield_hdf = Path(leadfield_hdf)
+    output = Path(output) if output is not None else store_path_for(leadfield_hdf)
+
+    mesh = mesh_io.Msh.read_hdf5(str(leadfield_hdf), HDF5_MESH)
+    volumes = mesh.elements_volumes_and_areas().value
+    if volumes.ndim > 1:
+        volumes = volumes[:, 0]
+
+    with h5py.File(leadfield_hdf, "r") as f:
+        dset = f[HDF5_LEADFIELD]
+        names = [
+            n.decode() if isinstance(n, bytes) else str(n)
+            for n in dset.attrs["electrode_names"]
+        ]
+        reference = dset.attrs["reference_electrode"]
+        if isinstance(reference, bytes):
+            reference = reference.decode()
+        log.info(
+            f"Converting {leadfield_hdf.name}: {dset.shape[0]} electrodes x "
+            f"{dset.shape[1]} elements -> {dtype}"
+        )
+        path = write_store(
+            output,
+            lambda start, stop: dset[:, start:stop, :],
+            n_elements=dset.shape[1],
+            electrode_names=names,
+            reference=str(reference),
+            tags=mesh.elm.tag1,
+            baricenters=mesh.elements_baricenters().value,
+            volumes=volumes,
+            dtype=dtype,
+            block_elements=block_elements,
+            source=leadfield_hdf,
+        )
+    log.info(f"Leadfield store written: {path}")
+    return path
+
+
+def find_store(leadfield_path: str | os.PathLike) -> Path | None:
+    """Return the up-to-date store for *leadfield_path*, or ``None``.
+
+    *leadfield_path* may name a store directly or the SimNIBS HDF5 file;
+    in the latter case the sibling ``.lfstore`` is used only if it was
+    converted from the current version of that file.
+    """
+    path = Path(leadfield_path)
+    store = store_path_for(path)
+    if not (store / _INDEX_FILE).is_file():
+        return None
+    if path == store or not path.exists():
+        return store
+    try:
+        current = LeadfieldStore(store).is_current(path)
+    except (OSError, ValueError, KeyError):
+        current = False
+    if not current:
+        log.warning(f"Ignoring stale leadfield store {store}")
+        return None
+    return store
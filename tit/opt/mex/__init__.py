@@ -1,8 +1,15 @@
 """TI Multipolar (4-pair) Exhaustive Search Module."""
 
-from tit.opt.config import MExConfig, MExResult
-from tit.opt.mex.engine import MExSearchEngine
-from tit.opt.mex.mex import run_m_ex_search
+from tit._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "tit.opt.config": ["MExConfig", "MExResult"],
+        "tit.opt.mex.engine": ["MExSearchEngine"],
+        "tit.opt.mex.mex": ["run_m_ex_search"],
+    },
+)
 
 __all__ = [
     "MExConfig",
@@ -10,7 +10,16 @@ from simnibs.utils import TI_utils as TI
 from tit.calc import get_mTI_vectors
 from tit.opt.ex.engine import ExSearchEngine
 
-from .logic import count_multipolar_combinations, generate_multipolar_combinations
+from .logic import (
+    count_multipolar_combinations,
+    generate_canonical_multipolar_combinations,
+    generate_multipolar_combinations,
+)
+
+
+def _candidate_name(electrodes, current_mA: float) -> str:
+    pair_names = [f"{electrodes[idx]}_{electrodes[idx + 1]}" for idx in range(0, 8, 2)]
+    return "_and_".join(pair_names) + f"_I-{current_mA:.1f}mA"
 
 
 class MExSearchEngine(ExSearchEngine):
@@ -85,8 +94,15 @@ class MExSearchEngine(ExSearchEngine):
         current_mA: float,
         symmetry_mirror_map: dict[str, str] | None = None,
         symmetry_pairing: str = "within_pairs",
+        deduplicate: bool = True,
     ) -> dict[str, dict[str, float]]:
-        """Run the full multipolar search loop."""
+        """Run the full multipolar search loop.
+
+        With *deduplicate* and the default carrier grouping, only one
+        candidate per symmetry class is simulated (see
+        :func:`~tit.opt.mex.logic.generate_canonical_multipolar_combinations`)
+        and its metrics are reported under every candidate of the class.
+        """
         stop = False
 
         def _on_signal(sig, frame):
@@ -96,12 +112,28 @@ class MExSearchEngine(ExSearchEngine):
         signal.signal(signal.SIGINT, _on_signal)
         signal.signal(signal.SIGTERM, _on_signal)
 
-        total = count_multipolar_combinations(
-            buckets_or_pool,
+        combo_kwargs = dict(
             all_combinations=all_combinations,
             symmetry_mirror_map=symmetry_mirror_map,
             symmetry_pairing=symmetry_pairing,
         )
+        n_candidates = count_multipolar_combinations(buckets_or_pool, **combo_kwargs)
+        if deduplicate and self.channels is None:
+            # Materialise the classes once so the total needs no second pass.
+            classes = list(
+                generate_canonical_multipolar_combinations(
+                    buckets_or_pool, **combo_kwargs
+                )
+            )
+            total = len(classes)
+        else:
+            total = n_candidates
+            classes = (
+                (electrodes, [electrodes])
+                for electrodes in generate_multipolar_combinations(
+                    buckets_or_pool, **combo_kwargs
+                )
+            )
         self.logger.info("%s", "\n" + "=" * 60)
         mode = "All Combinations" if all_combinations else "Bucketed"
         if symmetry_mirror_map is not None:
@@ -110,29 +142,25 @@ class MExSearchEngine(ExSearchEngine):
         self.logger.info("Current per pair: %.3f mA", current_mA)
         self.logger.info("Channels: %s", self.channels or "consecutive pairing")
         self.logger.info("Total combinations: %d", total)
+        if total != n_candidates:
+            self.logger.info(
+                "Symmetry reduction: %d candidates -> %d evaluated (%.1fx)",
+                n_candidates,
+                total,
+                n_candidates / max(total, 1),
+            )
         self.logger.info("%s", "=" * 60 + "\n")
 
         results: dict[str, dict[str, float]] = {}
+        evaluated = 0
         start_time = time.time()
 
-        for i, electrodes in enumerate(
-            generate_multipolar_combinations(
-                buckets_or_pool,
-                all_combinations=all_combinations,
-                symmetry_mirror_map=symmetry_mirror_map,
-                symmetry_pairing=symmetry_pairing,
-            ),
-            1,
-        ):
+        for i, (electrodes, members) in enumerate(classes, 1):
             if stop:
                 self.logger.warning("Interrupted")
                 break
 
-            pair_names = [
-                f"{electrodes[idx]}_{electrodes[idx + 1]}" for idx in range(0, 8, 2)
-            ]
-            name = "_and_".join(pair_names) + f"_I-{current_mA:.1f}mA"
-            key = f"TI_field_{name}.msh"
+            name = _candidate_name(electrodes, current_mA)
 
             elapsed = time.time() - start_time
             rate = i / elapsed if elapsed > 0 else 0
@@ -149,7 +177,9 @@ class MExSearchEngine(ExSearchEngine):
 
             sim_start = time.time()
             data = self.compute_mti_field(electrodes, current_mA)
-            results[key] = data
+            evaluated = i
+            for member in members:
+                results[f"TI_field_{_candidate_name(member, current_mA)}.msh"] = data
             self.logger.info(
                 "  %.2fs | Max=%.4f Mean=%.4f Foc=%.4f",
                 time.time() - sim_start,
@@ -162,11 +192,12 @@ class MExSearchEngine(ExSearchEngine):
         if results:
             elapsed = time.time() - start_time
             self.logger.info(
-                "Done: %d/%d in %.1fmin (%.2fs each)",
-                len(results),
+                "Done: %d/%d in %.1fmin (%.2fs each, %d candidates reported)",
+                evaluated,
                 total,
                 elapsed / 60,
-                elapsed / len(results),
+                elapsed / evaluated,
+                len(results),
             )
             self.logger.info("Output: %s", output_dir)
 
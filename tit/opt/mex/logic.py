@@ -1,10 +1,13 @@
 """Combination helpers for multipolar exhaustive search.
 
 Pure Python, no ``tit`` dependencies -- ported from collaborator Larissa
-Albantakis's branch ``alba/ex-search-multipolar`` as-is.
+Albantakis's branch ``alba/ex-search-multipolar`` as-is, plus a canonical
+enumerator that folds candidates with identical two-channel mTI fields into
+one evaluation.
 """
 
-from itertools import permutations, product
+from itertools import combinations, permutations, product
+from operator import itemgetter
 
 MEX_BUCKET_KEYS = (
     "e1_plus",
@@ -141,3 +144,102 @@ def count_multipolar_combinations(
             symmetry_pairing=symmetry_pairing,
         )
     )
+
+
+# Pair orders that leave the two-channel mTI envelope unchanged: swapping
+# the pairs of either channel and swapping the channels themselves.
+_CHANNEL_PAIR_ORDERS = (
+    (0, 1, 2, 3),
+    (1, 0, 2, 3),
+    (0, 1, 3, 2),
+    (1, 0, 3, 2),
+    (2, 3, 0, 1),
+    (3, 2, 0, 1),
+    (2, 3, 1, 0),
+    (3, 2, 1, 0),
+)
+
+# Reversing an even number of pairs negates the same number of carrier
+# fields in each channel's cross term, so the envelope is unchanged.
+_EVEN_PAIR_REVERSALS = tuple(
+    frozenset(flipped) for n in (0, 2, 4) for flipped in combinations(range(4), n)
+)
+
+# The 64 resulting electrode-position permutations, as fast tuple getters.
+_MTI_SYMMETRY_GETTERS = tuple(
+    itemgetter(
+        *(
+            2 * pair + (1 - side if pair in flipped else side)
+            for pair in order
+            for side in (0, 1)
+        )
+    )
+    for flipped in _EVEN_PAIR_REVERSALS
+    for order in _CHANNEL_PAIR_ORDERS
+)
+
+
+def _multipolar_orbit(electrodes):
+    """Return the images of an 8-electrode candidate under the mTI symmetries."""
+    return {getter(electrodes) for getter in _MTI_SYMMETRY_GETTERS}
+
+
+def _multipolar_member_check(
+    buckets_or_pool,
+    all_combinations,
+    symmetry_mirror_map,
+    symmetry_pairing,
+):
+    """Return a predicate telling whether a candidate would be enumerated."""
+    if all_combinations:
+        pool = set(buckets_or_pool)
+        return lambda combo: _valid_multipolar_tuple(combo) and pool.issuperset(combo)
+
+    buckets = [set(buckets_or_pool[key]) for key in MEX_BUCKET_KEYS]
+    if symmetry_mirror_map is None:
+        mirrored = ()
+    elif symmetry_pairing == SYMMETRY_PAIRING_CROSS_PAIRS:
+        mirrored = ((0, 4), (1, 5), (2, 6), (3, 7))
+    else:
+        mirrored = ((0, 1), (2, 3), (4, 5), (6, 7))
+
+    def is_member(combo):
+        return (
+            _valid_multipolar_tuple(combo)
+            and all(e in bucket for e, bucket in zip(combo, buckets))
+            and all(symmetry_mirror_map.get(combo[a]) == combo[b] for a, b in mirrored)
+        )
+
+    return is_member
+
+
+def generate_canonical_multipolar_combinations(
+    buckets_or_pool,
+    all_combinations=False,
+    symmetry_mirror_map=None,
+    symmetry_pairing=SYMMETRY_PAIRING_WITHIN_PAIRS,
+):
+    """Yield one representative per class of equivalent multipolar candidates.
+
+    Only valid for the default carrier grouping (pairs 1+2 and 3+4 as two
+    independent channels, ``channels=None``), whose envelope is unchanged
+    by swapping the pairs of a channel, swapping the channels, and reversing
+    an even number of pairs.  Classes are restricted to candidates that
+    :func:`generate_multipolar_combinations` itself enumerates.
+
+    Yields ``(representative, members)``: the lexicographically smallest
+    candidate of each class and every candidate of the class, sorted.
+    """
+    is_member = _multipolar_member_check(
+        buckets_or_pool, all_combinations, symmetry_mirror_map, symmetry_pairing
+    )
+    for electrodes in generate_multipolar_combinations(
+        buckets_or_pool,
+        all_combinations=all_combinations,
+        symmetry_mirror_map=symmetry_mirror_map,
+        symmetry_pairing=symmetry_pairing,
+    ):
+        images = _multipolar_orbit(electrodes)
+        if any(image < electrodes and is_member(image) for image in images):
+            continue
+        yield electrodes, sorted(image for image in images if is_member(image))
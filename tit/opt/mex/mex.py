@@ -12,17 +12,20 @@ from pathlib import Path
 
 from tit.logger import add_file_handler
 from tit.opt.config import MExConfig, MExResult
-from tit.opt.ex.buckets import build_electrode_mirror_map, canonical_template_coord_path
+from tit.opt.ex.buckets import build_electrode_mirror_map, infer_eeg_positions_csv
 from tit.opt.ex.results import process_and_save
 from tit.opt.ex.roi import atlas_roi_entries, mni_roi_files_to_subject_space
 from tit.paths import get_path_manager
+from tit.tracing import span, start_trace
 
 from .engine import MExSearchEngine
 
 
 def run_m_ex_search(config: MExConfig) -> MExResult:
     """Run multipolar exhaustive search from a typed config object."""
-    return _run_m_ex_search_inner(config)
+    # Root span of the run: the trace started inside it ends with it.
+    with span("m_ex_search"):
+        return _run_m_ex_search_inner(config)
 
 
 def _run_m_ex_search_inner(config: MExConfig) -> MExResult:
@@ -36,6 +39,7 @@ def _run_m_ex_search_inner(config: MExConfig) -> MExResult:
     logger_name = f"tit.opt.m_ex_search.{config.subject_id}"
     add_file_handler(log_file, logger_name=logger_name)
     add_file_handler(log_file, logger_name="simnibs")
+    start_trace(log_file)
     logger = logging.getLogger(logger_name)
 
     logger.info("%s\nmTI Multipolar Exhaustive Search\n%s", "=" * 60, "=" * 60)
@@ -100,6 +104,7 @@ def _run_m_ex_search_inner(config: MExConfig) -> MExResult:
         current_mA=config.current_mA,
         symmetry_mirror_map=symmetry_mirror_map,
         symmetry_pairing=config.symmetry_pairing,
+        deduplicate=config.deduplicate_symmetric,
     )
 
     output_info = process_and_save(results, config, output_dir, logger)
@@ -117,15 +122,9 @@ def _run_m_ex_search_inner(config: MExConfig) -> MExResult:
 
 def _infer_symmetry_eeg_csv(config: MExConfig, pm) -> Path | None:
     """Guess the EEG-position CSV for symmetric bucket mode from the leadfield name."""
-    leadfield_name = Path(config.leadfield_hdf).name
-    net_name = leadfield_name.removesuffix(".hdf5").removesuffix("_leadfield")
-    if not net_name:
-        return None
-    canonical = canonical_template_coord_path(net_name)
-    if canonical is not None:
-        return canonical
-    candidate = Path(pm.eeg_positions(config.subject_id)) / f"{net_name}.csv"
-    return candidate if candidate.is_file() else None
+    return infer_eeg_positions_csv(
+        config.leadfield_hdf, pm.eeg_positions(config.subject_id)
+    )
 
 
 def _build_symmetry_mirror_map(config: MExConfig, pm, logger) -> dict[str, str] | None:
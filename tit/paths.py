@@ -330,6 +330,10 @@ class PathManager:
         """Path to tissue-analysis output directory for *sid*."""
         return os.path.join(self.ti_toolbox(), "tissue_analysis", f"sub-{sid}")
 
+    def stage_manifest(self, sid: str) -> str:
+        """Path to the stage-cache manifest for *sid* (see :mod:`tit.stage_cache`)."""
+        return os.path.join(self.ti_toolbox(), "stage_cache", f"sub-{sid}.json")
+
     def bids_subject(self, sid: str) -> str:
         """Path to ``<project>/sub-{sid}/`` (raw BIDS subject root)."""
         return os.path.join(self._root(), f"sub-{sid}")
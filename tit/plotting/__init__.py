@@ -2,25 +2,47 @@
 
 Non-Blender visualization and figure-generation helpers including focality
 histograms, intensity-vs-focality scatter plots, permutation null
-distributions, static overlay images, and montage distribution plots.
+distributions, static overlay images, and montage distribution plots, plus
+a deferred, cached renderer for figures described as ``FigureSpec`` objects.
 
 Most functions use lazy imports so ``import tit.plotting`` does not pull
 in matplotlib unless a plot function is actually called.
 """
 
-from ._common import SaveFigOptions, ensure_headless_matplotlib_backend, savefig_close
-from .focality import plot_whole_head_roi_histogram
-from .static_overlay import generate_static_overlay_images
-from .stats import (
-    plot_cluster_size_mass_correlation,
-    plot_permutation_null_distribution,
+from tit._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "._common": [
+            "SaveFigOptions",
+            "ensure_headless_matplotlib_backend",
+            "savefig_close",
+        ],
+        ".figure_service": [
+            "FIDELITY",
+            "FigureSpec",
+            "render_figure",
+            "render_figures",
+        ],
+        ".focality": ["plot_whole_head_roi_histogram"],
+        ".static_overlay": ["generate_static_overlay_images"],
+        ".stats": [
+            "plot_cluster_size_mass_correlation",
+            "plot_permutation_null_distribution",
+        ],
+        ".ti_metrics": ["plot_intensity_vs_focality", "plot_montage_distributions"],
+    },
 )
-from .ti_metrics import plot_intensity_vs_focality, plot_montage_distributions
 
 __all__ = [
     "SaveFigOptions",
     "ensure_headless_matplotlib_backend",
     "savefig_close",
+    "FIDELITY",
+    "FigureSpec",
+    "render_figure",
+    "render_figures",
     "plot_whole_head_roi_histogram",
     "generate_static_overlay_images",
     "plot_permutation_null_distribution",
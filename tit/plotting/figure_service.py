@@ -0,0 +1,284 @@
+"""
+Deferred figure rendering.
+
+Analysis code describes a figure as a :class:`FigureSpec` -- the few slice
+arrays and numbers it shows plus a module-level render function -- instead
+of drawing it inline.  :func:`render_figures` then draws a batch of specs in
+a process pool once the numeric work is done, at a chosen fidelity, and
+skips figures whose spec is unchanged since the last render.
+
+Public API
+----------
+FigureSpec
+    Lightweight, picklable description of one figure.
+FigureFidelity
+    Resolution and output formats used when saving.
+FIDELITY
+    Named fidelity presets (``"preview"``, ``"publication"``).
+render_figure
+    Render one spec in the current process.
+render_figures
+    Render many specs in parallel with an on-disk skip cache.
+pool_context
+    Non-forking multiprocessing context for rendering workers.
+
+See Also
+--------
+tit.pre.tissue_analyzer : Produces tissue QC figure specs.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+from ._common import ensure_headless_matplotlib_backend
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = ".figure_cache.json"
+
+
+@dataclass(frozen=True, slots=True)
+class FigureFidelity:
+    """Resolution and formats a figure is saved in.
+
+    Attributes
+    ----------
+    dpi : int
+        Raster resolution in dots per inch.
+    formats : tuple of str
+        File extensions written, the first one being the primary output.
+    """
+
+    dpi: int
+    formats: tuple[str, ...]
+
+
+FIDELITY = {
+    "preview": FigureFidelity(dpi=100, formats=("png",)),
+    "publication": FigureFidelity(dpi=300, formats=("png", "pdf")),
+}
+
+
+@dataclass
+class FigureSpec:
+    """Everything needed to draw one figure, without the source volumes.
+
+    Attributes
+    ----------
+    render : callable
+        Module-level function ``render(spec, plt) -> Figure``.  It must be
+        importable by name so the spec can be sent to worker processes.
+    output : pathlib.Path
+        Output path without extension; one file per fidelity format.
+    arrays : dict of str to numpy.ndarray
+        Slices, images and histograms the figure draws.
+    meta : dict
+        JSON-serialisable scalars and labels.
+    rc : dict
+        ``matplotlib.rcParams`` overrides applied while rendering.
+    """
+
+    render: Callable[["FigureSpec", Any], Any]
+    output: Path
+    arrays: dict[str, np.ndarray] = field(default_factory=dict)
+    meta: dict = field(default_factory=dict)
+    rc: dict = field(default_factory=dict)
+
+    def paths(self, fidelity: FigureFidelity) -> list[Path]:
+        """Files written for *fidelity*."""
+        name = self.output.name
+        return [self.output.with_name(f"{name}.{fmt}") for fmt in fidelity.formats]
+
+    def key(self, fidelity: FigureFidelity) -> str:
+        """Hash of the renderer, fidelity and spec contents."""
+        h = hashlib.sha256()
+        h.update(f"{self.render.__module__}.{self.render.__qualname__}".encode())
+        h.update(
+            json.dumps(
+                [fidelity.dpi, fidelity.formats, self.meta, self.rc],
+                sort_keys=True,
+                default=str,
+            ).encode()
+        )
+        for name in sorted(self.arrays):
+            arr = np.ascontiguousarray(self.arrays[name])
+            h.update(f"{name}:{arr.dtype}:{arr.shape}".encode())
+            h.update(arr.tobytes())
+        return h.hexdigest()
+
+
+def _fidelity(fidelity: str | FigureFidelity) -> FigureFidelity:
+    if isinstance(fidelity, FigureFidelity):
+        return fidelity
+    try:
+        return FIDELITY[fidelity]
+    except KeyError:
+        raise ValueError(
+            f"Unknown figure fidelity {fidelity!r}; expected one of {sorted(FIDELITY)}"
+        ) from None
+
+
+def render_figure(
+    spec: FigureSpec,
+    fidelity: str | FigureFidelity = "publication",
+    plt: Any = None,
+) -> list[Path]:
+    """Draw *spec* and save it in every format of *fidelity*.
+
+    Parameters
+    ----------
+    spec : FigureSpec
+        Figure to draw.
+    fidelity : str or FigureFidelity, optional
+        Preset name or explicit fidelity.
+    plt : module, optional
+        ``matplotlib.pyplot``; imported when omitted.
+
+    Returns
+    -------
+    list of pathlib.Path
+        Written files, primary format first.
+    """
+    fidelity = _fidelity(fidelity)
+    if plt is None:
+        import matplotlib.pyplot as plt
+
+    paths = spec.paths(fidelity)
+    with plt.style.context("default"), plt.rc_context(spec.rc):
+        fig = spec.render(spec, plt)
+        try:
+            for path in paths:
+                fig.savefig(
+                    path, dpi=fidelity.dpi, bbox_inches="tight", facecolor="white"
+                )
+        finally:
+            plt.close(fig)
+    return paths
+
+
+def pool_context():
+    """Multiprocessing context for figure and report-fragment workers.
+
+    ``forkserver`` where available, else ``spawn``: callers such as the GUI
+    may hold Qt and an interactive matplotlib backend, and the preprocessing
+    pipeline may still have scheduler threads alive, neither of which a
+    forked worker may inherit.  Workers select the headless backend
+    themselves.
+    """
+    if "forkserver" in mp.get_all_start_methods():
+        return mp.get_context("forkserver")
+    return mp.get_context("spawn")
+
+
+def _render_in_worker(spec: FigureSpec, fidelity: FigureFidelity) -> list[Path]:
+    ensure_headless_matplotlib_backend()
+    return render_figure(spec, fidelity)
+
+
+def _load_cache(directory: Path) -> dict:
+    try:
+        with open(directory / CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(directory: Path, cache: dict) -> None:
+    tmp = directory / f"{CACHE_FILE}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp, directory / CACHE_FILE)
+
+
+def render_figures(
+    specs: Iterable[FigureSpec],
+    fidelity: str | FigureFidelity = "publication",
+    *,
+    workers: int | None = None,
+    force: bool = False,
+) -> dict[Path, list[Path]]:
+    """Render *specs*, in parallel, skipping those already up to date.
+
+    A spec is up to date when its output files exist and its
+    :meth:`FigureSpec.key` matches the one recorded in ``.figure_cache.json``
+    next to the output at the last render.
+
+    Parameters
+    ----------
+    specs : iterable of FigureSpec
+        Figures to render.
+    fidelity : str or FigureFidelity, optional
+        Preset name or explicit fidelity (default ``"publication"``).
+    workers : int or None, optional
+        Worker processes.  Defaults to one per pending figure, capped at the
+        CPU count; ``1`` renders in the current process.
+    force : bool, optional
+        Re-render even when the cache says the outputs are current.
+
+    Returns
+    -------
+    dict
+        Output stem to written (or reused) files, for every spec.
+    """
+    fidelity = _fidelity(fidelity)
+    specs = list(specs)
+    caches: dict[Path, dict] = {}
+    keys: dict[Path, str] = {}
+    results: dict[Path, list[Path]] = {}
+    pending: list[FigureSpec] = []
+
+    for spec in specs:
+        directory = spec.output.parent
+        cache = caches.setdefault(directory, _load_cache(directory))
+        key = keys[spec.output] = spec.key(fidelity)
+        paths = spec.paths(fidelity)
+        if (
+            not force
+            and cache.get(spec.output.name) == key
+            and all(p.exists() for p in paths)
+        ):
+            results[spec.output] = paths
+        else:
+            pending.append(spec)
+
+    if specs:
+        logger.debug(
+            f"Rendering {len(pending)} of {len(specs)} figure(s) "
+            f"({len(specs) - len(pending)} unchanged)"
+        )
+
+    def _done(spec: FigureSpec, paths: list[Path]) -> None:
+        results[spec.output] = paths
+        caches[spec.output.parent][spec.output.name] = keys[spec.output]
+
+    if workers is None:
+        workers = min(len(pending), os.cpu_count() or 1)
+    try:
+        if workers <= 1:
+            for spec in pending:
+                _done(spec, render_figure(spec, fidelity))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=pool_context()
+            ) as pool:
+                futures = {
+                    pool.submit(_render_in_worker, spec, fidelity): spec
+                    for spec in pending
+                }
+                for future in as_completed(futures):
+                    _done(futures[future], future.result())
+    finally:
+        for directory, cache in caches.items():
+            if directory.is_dir():
+                _save_cache(directory, cache)
+
+    return results
@@ -41,19 +41,26 @@ tit.pre.qsi : QSI subpackage for DWI preprocessing and reconstruction.
 tit.sim : Simulation engine that consumes preprocessing outputs.
 """
 
-from .structural import run_pipeline
-from .dicom2nifti import run_dicom_to_nifti
-from .recon_all import run_recon_all, run_subcortical_segmentations
-from .charm import run_charm
-from .tissue_analyzer import run_tissue_analysis
-from .qsi import run_qsiprep, run_qsirecon, extract_dti_tensor
-from .utils import discover_subjects, check_m2m_exists
-from .preflight import (
-    PreprocessingInputProblem,
-    PreprocessingOutput,
-    find_existing_preprocessing_outputs,
-    find_missing_preprocessing_inputs,
-    selected_preprocessing_steps,
+from tit._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".structural": ["run_pipeline"],
+        ".dicom2nifti": ["run_dicom_to_nifti"],
+        ".recon_all": ["run_recon_all", "run_subcortical_segmentations"],
+        ".charm": ["run_charm"],
+        ".tissue_analyzer": ["run_tissue_analysis"],
+        ".qsi": ["run_qsiprep", "run_qsirecon", "extract_dti_tensor"],
+        ".utils": ["discover_subjects", "check_m2m_exists"],
+        ".preflight": [
+            "PreprocessingInputProblem",
+            "PreprocessingOutput",
+            "find_existing_preprocessing_outputs",
+            "find_missing_preprocessing_inputs",
+            "selected_preprocessing_steps",
+        ],
+    },
 )
 
 __all__ = [
@@ -58,6 +58,7 @@ def main() -> None:
         run_subcortical_segmentations=data.get("run_subcortical_segmentations", False),
         skip_existing_outputs=data.get("skip_existing_outputs", False),
         replace_existing_outputs=data.get("replace_existing_outputs", False),
+        step_retries=data.get("step_retries", 0),
     )
 
     sys.exit(exit_code)
@@ -13,6 +13,9 @@ run_recon_all
     Run FreeSurfer ``recon-all`` for a subject.
 run_subcortical_segmentations
     Run thalamic-nuclei and hippocampal-subfield segmentations standalone.
+SUBCORTICAL_SEGMENTATION_FILES
+    Volumes the subcortical segmentations write into the FreeSurfer
+    ``mri`` directory.
 
 See Also
 --------
@@ -28,6 +31,14 @@ from pathlib import Path
 from tit.paths import get_path_manager
 from .utils import CommandRunner, PreprocessError, _find_anat_files
 
+#: Volumes written to ``<fs_subject>/mri`` by the subcortical segmentations
+#: (the same files :data:`tit.atlas.constants.VOXEL_ATLASES` offers).
+SUBCORTICAL_SEGMENTATION_FILES = (
+    "ThalamicNuclei.v13.T1.mgz",
+    "lh.hippoAmygLabels-T1.v22.mgz",
+    "rh.hippoAmygLabels-T1.v22.mgz",
+)
+
 
 def _run_subcortical_segmentations(
     subject_id: str,
@@ -0,0 +1,335 @@
+"""
+Dependency-graph scheduler for multi-subject preprocessing.
+
+Each :class:`PipelineStep` is one unit of work for one subject.  It names
+the artefacts it reads and writes (``"nifti"``, ``"m2m"``, ...) and the CPU
+and memory it needs.  :class:`StepScheduler` derives the dependency graph
+from those declarations -- a step waits for the steps of the same subject
+that produce its inputs -- and starts every ready step, for any subject, as
+soon as the CPU/memory budget allows.  Charm for one subject can therefore
+run while recon-all runs for another instead of waiting for a phase barrier.
+
+Public API
+----------
+PipelineStep
+    One schedulable step with its data dependencies and resource demand.
+StepResult
+    Outcome of one step after scheduling.
+StepScheduler
+    Run a set of steps under a CPU/memory budget with retries and a
+    state file recording each run.
+total_memory_gb
+    Physical memory of this machine, the default memory budget.
+
+See Also
+--------
+tit.pre.structural.run_pipeline : Builds the preprocessing step graph.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from .utils import PreprocessCancelled, PreprocessError
+
+logger = logging.getLogger(__name__)
+
+_SUCCESSFUL = ("completed",)
+_UNSUCCESSFUL = ("failed", "blocked", "cancelled")
+
+
+@dataclass
+class PipelineStep:
+    """One preprocessing step for one subject.
+
+    Attributes
+    ----------
+    name : str
+        Step name, unique per subject (e.g. ``"SimNIBS charm"``).
+    subject_id : str
+        Subject the step belongs to.
+    run : callable
+        ``run(attempt) -> value``; *attempt* is 1-based so a retry can
+        clean up partial outputs first.  The return value is kept in the
+        step's :class:`StepResult` and should be JSON-serialisable.
+    inputs : tuple of str
+        Artefacts the step reads.  An artefact no step in the graph
+        produces is assumed to exist already.
+    outputs : tuple of str
+        Artefacts the step writes.
+    cpus : int
+        Cores the step keeps busy.
+    memory_gb : float
+        Peak memory the step needs.
+    retries : int
+        Extra attempts after a failure before giving up.
+    """
+
+    name: str
+    subject_id: str
+    run: Callable[[int], Any]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    cpus: int = 1
+    memory_gb: float = 0.0
+    retries: int = 0
+
+    @property
+    def key(self) -> str:
+        return f"sub-{self.subject_id}/{self.name}"
+
+
+@dataclass
+class StepResult:
+    """Outcome of one scheduled step.
+
+    Attributes
+    ----------
+    status : str
+        ``"completed"``, ``"failed"``, ``"blocked"`` (a dependency failed)
+        or ``"cancelled"``.
+    attempts : int
+        Number of times the step was started.
+    elapsed : float
+        Wall-clock seconds over all attempts.
+    value : Any
+        Return value of the step's ``run``.
+    error : str or None
+        Message of the last failure.
+    """
+
+    status: str
+    attempts: int = 0
+    elapsed: float = 0.0
+    value: Any = None
+    error: str | None = None
+
+
+def total_memory_gb() -> float | None:
+    """Physical memory of this machine in GB, or ``None`` if unknown."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 1024**3
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class StepScheduler:
+    """Run :class:`PipelineStep` objects as dependencies and resources allow.
+
+    Parameters
+    ----------
+    steps : iterable of PipelineStep
+        Steps to run.  Among ready steps, earlier ones start first.
+    cpus : int or None, optional
+        Core budget.  Defaults to the CPU count.  A step asking for more
+        than the whole budget runs alone.
+    memory_gb : float or None, optional
+        Memory budget; ``None`` leaves memory unconstrained.
+    max_concurrent : int or None, optional
+        Cap on simultaneously running steps (``1`` runs strictly in order).
+    state_file : str or None, optional
+        JSON file recording every finished step, rewritten as steps finish.
+        It is a record only: a step completed in an earlier run may since
+        have lost its outputs, so whether to skip a step is up to the step
+        itself (see :mod:`tit.stage_cache`).
+    stop_event : threading.Event or None, optional
+        When set, no further steps start and :class:`PreprocessCancelled`
+        is raised once running steps return.
+
+    Raises
+    ------
+    PreprocessError
+        If step names repeat within a subject or the graph has a cycle.
+    """
+
+    def __init__(
+        self,
+        steps: Iterable[PipelineStep],
+        *,
+        cpus: int | None = None,
+        memory_gb: float | None = None,
+        max_concurrent: int | None = None,
+        state_file: str | None = None,
+        stop_event: threading.Event | None = None,
+    ):
+        self.steps = {}
+        for step in steps:
+            if step.key in self.steps:
+                raise PreprocessError(f"Duplicate preprocessing step: {step.key}")
+            self.steps[step.key] = step
+        self.cpus = max(1, cpus or os.cpu_count() or 1)
+        self.memory_gb = memory_gb
+        self.max_concurrent = max_concurrent or len(self.steps) or 1
+        self.state_file = state_file
+        self.stop_event = stop_event
+        self.dependencies = self._dependencies()
+        self._check_acyclic()
+
+    # ── Graph ─────────────────────────────────────────────────────────────
+
+    def _dependencies(self) -> dict[str, set[str]]:
+        producers: dict[tuple[str, str], list[str]] = {}
+        for key, step in self.steps.items():
+            for artefact in step.outputs:
+                producers.setdefault((step.subject_id, artefact), []).append(key)
+        return {
+            key: {
+                producer
+                for artefact in step.inputs
+                for producer in producers.get((step.subject_id, artefact), ())
+                if producer != key
+            }
+            for key, step in self.steps.items()
+        }
+
+    def _check_acyclic(self) -> None:
+        remaining = {key: set(deps) for key, deps in self.dependencies.items()}
+        while remaining:
+            ready = [key for key, deps in remaining.items() if not deps]
+            if not ready:
+                raise PreprocessError(
+                    f"Preprocessing steps depend on each other: {sorted(remaining)}"
+                )
+            for key in ready:
+                del remaining[key]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def _demand(self, step: PipelineStep) -> tuple[int, float]:
+        cpus = min(max(1, step.cpus), self.cpus)
+        memory = step.memory_gb
+        if self.memory_gb is not None:
+            memory = min(memory, self.memory_gb)
+        return cpus, memory
+
+    # ── State file ────────────────────────────────────────────────────────
+
+    def _save_state(self, results: dict[str, StepResult]) -> None:
+        if not self.state_file:
+            return
+        state = {"updated": time.strftime("%Y-%m-%dT%H:%M:%S"), "steps": {}}
+        for key, result in results.items():
+            entry = asdict(result)
+            try:
+                json.dumps(entry["value"])
+            except (TypeError, ValueError):
+                entry["value"] = None
+            state["steps"][key] = entry
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_file)), exist_ok=True)
+        tmp = f"{self.state_file}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp, self.state_file)
+
+    # ── Execution ─────────────────────────────────────────────────────────
+
+    def run(self) -> dict[str, StepResult]:
+        """Run every step and return results keyed by :attr:`PipelineStep.key`.
+
+        A step that still fails after its retries blocks its dependents but
+        not unrelated steps.  Once everything that can run has finished, the
+        failure is re-raised -- the original exception for a single failure,
+        a :class:`PreprocessError` listing all of them otherwise.
+        """
+        results: dict[str, StepResult] = {}
+        pending = list(self.steps)
+        errors: dict[str, Exception] = {}
+        running: dict = {}
+        free_cpus, free_memory = self.cpus, self.memory_gb
+        cancelled = False
+
+        def _status(key: str) -> str | None:
+            return results[key].status if key in results else None
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent) as pool:
+            while pending or running:
+                if self.stop_event is not None and self.stop_event.is_set():
+                    cancelled = True
+
+                for key in [] if cancelled else list(pending):
+                    deps = self.dependencies[key]
+                    if any(_status(dep) in _UNSUCCESSFUL for dep in deps):
+                        pending.remove(key)
+                        results[key] = StepResult("blocked")
+                        continue
+                    if not all(_status(dep) in _SUCCESSFUL for dep in deps):
+                        continue
+                    if len(running) >= self.max_concurrent:
+                        break
+                    cpus, memory = self._demand(self.steps[key])
+                    if cpus > free_cpus or (
+                        free_memory is not None and memory > free_memory
+                    ):
+                        continue
+                    pending.remove(key)
+                    free_cpus -= cpus
+                    if free_memory is not None:
+                        free_memory -= memory
+                    result = results.setdefault(key, StepResult("running"))
+                    result.attempts += 1
+                    running[pool.submit(self._attempt, key, result.attempts)] = key
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key = running.pop(future)
+                    step = self.steps[key]
+                    cpus, memory = self._demand(step)
+                    free_cpus += cpus
+                    if free_memory is not None:
+                        free_memory += memory
+
+                    result = results[key]
+                    value, elapsed, exc = future.result()
+                    result.elapsed += elapsed
+                    result.error = None if exc is None else str(exc)
+                    if exc is None:
+                        result.status, result.value = "completed", value
+                    elif isinstance(exc, PreprocessCancelled):
+                        result.status = "cancelled"
+                        cancelled = True
+                    elif result.attempts <= step.retries and not cancelled:
+                        logger.warning(
+                            f"{key}: attempt {result.attempts} failed ({exc}); "
+                            "retrying"
+                        )
+                        pending.insert(0, key)
+                    else:
+                        result.status = "failed"
+                        errors[key] = exc
+                        logger.error(
+                            f"{key}: failed after {result.attempts} attempt(s)"
+                        )
+                self._save_state(results)
+
+        for key in pending:
+            results.setdefault(key, StepResult("running"))
+            results[key].status = "cancelled" if cancelled else "blocked"
+        self._save_state(results)
+
+        if cancelled:
+            raise PreprocessCancelled("Preprocessing cancelled")
+        if len(errors) == 1:
+            raise next(iter(errors.values()))
+        if errors:
+            lines = "\n".join(f"- {key}: {exc}" for key, exc in errors.items())
+            raise PreprocessError(
+                f"{len(errors)} preprocessing steps failed:\n{lines}"
+            ) from next(iter(errors.values()))
+        return results
+
+    def _attempt(self, key: str, attempt: int) -> tuple[Any, float, Exception | None]:
+        t0 = time.time()
+        try:
+            value = self.steps[key].run(attempt)
+        except Exception as exc:  # reported to the scheduling loop
+            return None, time.time() - t0, exc
+        return value, time.time() - t0, None
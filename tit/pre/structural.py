@@ -16,20 +16,29 @@ run_pipeline
 See Also
 --------
 tit.pre : Package-level overview and convenience re-exports.
+tit.pre.scheduler : Dependency-graph scheduler that runs the steps.
+tit.stage_cache : Content-addressed cache deciding which steps can be reused.
 """
 
 import os
 import time
 from collections.abc import Callable, Iterable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
 from tit import constants as const
 from tit.paths import get_path_manager
+from tit.stage_cache import StageCache, subject_stage_cache
+from tit.tracing import span, start_trace
 
 from .charm import run_charm, run_subject_atlas
 from .dicom2nifti import run_dicom_to_nifti
 from .qsi import extract_dti_tensor, run_qsiprep, run_qsirecon
-from .recon_all import run_recon_all, run_subcortical_segmentations
+from .recon_all import (
+    SUBCORTICAL_SEGMENTATION_FILES,
+    run_recon_all,
+    run_subcortical_segmentations,
+)
+from .scheduler import PipelineStep, StepScheduler, total_memory_gb
 from .tissue_analyzer import run_tissue_analysis
 from .preflight import (
     STEP_CHARM,
@@ -53,8 +62,10 @@ from .utils import (
 )
 
 
-def _run_step(label: str, func, logger) -> float:
-    """Execute a single pipeline step with logging.
+def _run_step(label: str, func, logger, **attrs) -> float:
+    """Execute a single pipeline step with logging and a tracing span.
+
+    *attrs* are stored with the step's span (see :mod:`tit.tracing`).
 
     Returns
     -------
@@ -63,7 +74,8 @@ def _run_step(label: str, func, logger) -> float:
     """
     logger.info(f"{label}: Started")
     t0 = time.time()
-    func()
+    with span(label, **attrs):
+        func()
     duration = time.time() - t0
     logger.info(f"{label}: ✓ Complete ({duration:.1f}s)")
     return duration
@@ -77,8 +89,15 @@ def _should_run_output_step(
     logger,
     skip_existing_outputs: bool,
     replace_existing_outputs: bool,
+    cache_status: str | None = None,
 ) -> bool:
-    """Apply the selected existing-output policy for one pipeline step."""
+    """Apply the selected existing-output policy for one pipeline step.
+
+    *cache_status* is the step's :meth:`StageCache.status`.  Outputs the
+    stage cache recorded for unchanged inputs are reused, and outputs it
+    recorded for different inputs are replaced, whatever the policy; the
+    policy applies to outputs the cache knows nothing about.
+    """
     existing_outputs = existing_outputs_for_step(project_dir, subject_id, step)
     if not existing_outputs:
         return True
@@ -86,8 +105,17 @@ def _should_run_output_step(
     paths = ", ".join(str(output.path) for output in existing_outputs)
     label = existing_outputs[0].label
 
-    if replace_existing_outputs:
-        logger.warning(f"{label}: replacing existing output(s): {paths}")
+    if cache_status == "hit" and not replace_existing_outputs:
+        logger.info(f"{label}: inputs unchanged since the last run, reusing: {paths}")
+        return False
+
+    if replace_existing_outputs or cache_status == "changed":
+        reason = (
+            "replacing existing output(s)"
+            if replace_existing_outputs
+            else "inputs changed since the last run, replacing output(s)"
+        )
+        logger.warning(f"{label}: {reason}: {paths}")
         for output in existing_outputs:
             remove_preprocessing_output(output)
         return True
@@ -121,11 +149,20 @@ def _format_input_problems(problems) -> str:
     return "\n".join(lines)
 
 
-def _run_subject_pipeline(
+# QSI settings that change how fast a step runs but not what it writes.
+_QSI_RESOURCE_KEYS = ("cpus", "memory_gb", "omp_threads")
+
+
+def _qsi_cache_config(cfg: dict) -> dict:
+    return {k: v for k, v in cfg.items() if k not in _QSI_RESOURCE_KEYS}
+
+
+def _subject_steps(
     project_dir: str,
     subject_id: str,
     *,
     runner: CommandRunner,
+    logger,
     convert_dicom: bool = False,
     run_recon: bool = False,
     parallel_recon: bool = False,
@@ -137,211 +174,286 @@ def _run_subject_pipeline(
     qsi_recon_config: dict | None = None,
     extract_dti_step: bool = False,
     run_subcortical: bool = False,
-    callback: Callable | None = None,
     skip_existing_outputs: bool = False,
     replace_existing_outputs: bool = False,
-) -> dict[str, float | None]:
-    """Run the full preprocessing sequence for a single subject.
-
-    Returns
-    -------
-    dict[str, float | None]
-        Mapping of step name to duration in seconds, or ``None`` when skipped.
+    retries: int = 0,
+    cache: StageCache | None = None,
+) -> list[PipelineStep]:
+    """Build the selected preprocessing steps for one subject, in pipeline order.
+
+    Each step's ``run(attempt)`` applies the existing-output policy, runs
+    the step and returns its duration, or ``None`` when it was skipped.  A
+    retry replaces the partial output of the failed attempt.  CPU and
+    memory demands are rough peaks, only precise enough to keep a machine
+    busy without oversubscribing it.
+
+    With a *cache*, each step is fingerprinted from the files it reads and
+    the tool versions it runs, just before it would start.  A step whose
+    fingerprint matches its last completed run is skipped, and one whose
+    inputs changed replaces its earlier output; both are recorded again
+    after running.
     """
-    logger = build_logger(
-        "preprocess",
-        subject_id,
-        project_dir,
-        console=callback is None,
-    )
-
-    logger.info(f"Beginning pre-processing for subject: {subject_id}")
-
-    durations: dict[str, float | None] = {}
-
-    if convert_dicom:
-        if _should_run_output_step(
-            project_dir,
-            subject_id,
-            STEP_DICOM,
-            logger=logger,
-            skip_existing_outputs=skip_existing_outputs,
-            replace_existing_outputs=replace_existing_outputs,
-        ):
-            durations["DICOM Conversion"] = _run_step(
-                "DICOM conversion",
-                lambda: run_dicom_to_nifti(
+    pm = get_path_manager(project_dir)
+    steps: list[PipelineStep] = []
+    skipped: set[str] = set()
+
+    def add(
+        name,
+        label,
+        func,
+        *,
+        output_step=None,
+        skip_with=None,
+        inputs=(),
+        outputs=(),
+        stage=None,
+        fingerprint=None,
+        products=(),
+        **demand,
+    ):
+        stage = stage or output_step
+
+        def run(attempt: int) -> float | None:
+            replace = replace_existing_outputs or attempt > 1
+            key = status = None
+            if cache is not None and fingerprint is not None:
+                key = cache.fingerprint(**fingerprint)
+                status = cache.status(stage, key)
+
+            if skip_with in skipped:
+                should_run = False
+            elif output_step is not None:
+                should_run = _should_run_output_step(
                     project_dir,
                     subject_id,
+                    output_step,
                     logger=logger,
-                    runner=runner,
-                ),
-                logger,
+                    skip_existing_outputs=skip_existing_outputs,
+                    replace_existing_outputs=replace,
+                    cache_status=status,
+                )
+            else:
+                should_run = replace or status != "hit"
+                if not should_run:
+                    logger.info(
+                        f"{label}: inputs unchanged since the last run, skipping"
+                    )
+            if not should_run:
+                skipped.add(name)
+                return None
+
+            duration = _run_step(label, func, logger, subject=subject_id)
+            if key is not None:
+                cache.record(stage, key, products)
+            return duration
+
+        steps.append(
+            PipelineStep(
+                name,
+                subject_id,
+                run,
+                inputs=inputs,
+                outputs=outputs,
+                retries=retries,
+                **demand,
             )
-        else:
-            durations["DICOM Conversion"] = None
+        )
+
+    if convert_dicom:
+        add(
+            "DICOM Conversion",
+            "DICOM conversion",
+            lambda: run_dicom_to_nifti(
+                project_dir,
+                subject_id,
+                logger=logger,
+                runner=runner,
+            ),
+            output_step=STEP_DICOM,
+            outputs=("nifti",),
+            fingerprint={
+                "files": [pm.sourcedata_subject(subject_id)],
+                "tools": ["dcm2niix"],
+            },
+            products=(pm.bids_anat(subject_id), pm.bids_dwi(subject_id)),
+            cpus=1,
+            memory_gb=2,
+        )
 
     if create_m2m:
-        if _should_run_output_step(
-            project_dir,
-            subject_id,
-            STEP_CHARM,
-            logger=logger,
-            skip_existing_outputs=skip_existing_outputs,
-            replace_existing_outputs=replace_existing_outputs,
-        ):
-            durations["SimNIBS charm"] = _run_step(
-                "SimNIBS charm",
-                lambda: run_charm(
-                    project_dir,
-                    subject_id,
-                    logger=logger,
-                    runner=runner,
-                ),
-                logger,
-            )
-            durations["Subject Atlas Segmentation"] = _run_step(
-                "Subject atlas segmentation",
-                lambda: run_subject_atlas(
-                    project_dir,
-                    subject_id,
-                    logger=logger,
-                    runner=runner,
-                ),
-                logger,
-            )
-        else:
-            durations["SimNIBS charm"] = None
-            durations["Subject Atlas Segmentation"] = None
+        add(
+            "SimNIBS charm",
+            "SimNIBS charm",
+            lambda: run_charm(
+                project_dir,
+                subject_id,
+                logger=logger,
+                runner=runner,
+            ),
+            output_step=STEP_CHARM,
+            inputs=("nifti",),
+            outputs=("m2m",),
+            fingerprint={"files": [pm.bids_anat(subject_id)], "tools": ["simnibs"]},
+            products=(pm.m2m(subject_id),),
+            cpus=4,
+            memory_gb=8,
+        )
+        add(
+            "Subject Atlas Segmentation",
+            "Subject atlas segmentation",
+            lambda: run_subject_atlas(
+                project_dir,
+                subject_id,
+                logger=logger,
+                runner=runner,
+            ),
+            skip_with="SimNIBS charm",
+            inputs=("m2m",),
+            outputs=("atlas",),
+            cpus=1,
+            memory_gb=4,
+        )
 
     if run_recon:
-        if _should_run_output_step(
-            project_dir,
-            subject_id,
-            STEP_RECON_ALL,
-            logger=logger,
-            skip_existing_outputs=skip_existing_outputs,
-            replace_existing_outputs=replace_existing_outputs,
-        ):
-            durations["FreeSurfer recon-all"] = _run_step(
-                "FreeSurfer recon-all",
-                lambda: run_recon_all(
-                    project_dir,
-                    subject_id,
-                    logger=logger,
-                    parallel=not parallel_recon,
-                    runner=runner,
-                ),
-                logger,
-            )
-        else:
-            durations["FreeSurfer recon-all"] = None
+        add(
+            "FreeSurfer recon-all",
+            "FreeSurfer recon-all",
+            lambda: run_recon_all(
+                project_dir,
+                subject_id,
+                logger=logger,
+                parallel=not parallel_recon,
+                runner=runner,
+            ),
+            output_step=STEP_RECON_ALL,
+            inputs=("nifti",),
+            outputs=("freesurfer",),
+            fingerprint={
+                "files": [pm.bids_anat(subject_id)],
+                "tools": ["freesurfer"],
+            },
+            products=(pm.freesurfer_subject(subject_id),),
+            cpus=1 if parallel_recon else 4,
+            memory_gb=4,
+        )
 
     if run_tissue:
-        durations["Tissue Analysis"] = _run_step(
+        add(
+            "Tissue Analysis",
             "Tissue analysis",
             lambda: run_tissue_analysis(
                 project_dir,
                 subject_id,
                 logger=logger,
             ),
-            logger,
+            inputs=("m2m",),
+            outputs=("tissue",),
+            stage="tissue",
+            fingerprint={
+                "files": [pm.tissue_labeling(subject_id), pm.t1(subject_id)],
+                "tools": ["ti-toolbox"],
+            },
+            products=(pm.tissue_analysis_output(subject_id),),
+            cpus=3,
+            memory_gb=4,
         )
 
     # QSI pipeline steps (DWI preprocessing)
     if run_qsiprep_step:
         qsiprep_cfg = qsiprep_config or {}
-        if _should_run_output_step(
-            project_dir,
-            subject_id,
-            STEP_QSIPREP,
-            logger=logger,
-            skip_existing_outputs=skip_existing_outputs,
-            replace_existing_outputs=replace_existing_outputs,
-        ):
-            durations["QSIPrep"] = _run_step(
-                "QSIPrep DWI preprocessing",
-                lambda: run_qsiprep(
-                    project_dir,
-                    subject_id,
-                    logger=logger,
-                    output_resolution=qsiprep_cfg.get(
-                        "output_resolution", const.QSI_DEFAULT_OUTPUT_RESOLUTION
-                    ),
-                    cpus=qsiprep_cfg.get("cpus"),
-                    memory_gb=qsiprep_cfg.get("memory_gb"),
-                    omp_threads=qsiprep_cfg.get(
-                        "omp_threads", const.QSI_DEFAULT_OMP_THREADS
-                    ),
-                    image_tag=qsiprep_cfg.get("image_tag", const.QSI_QSIPREP_IMAGE_TAG),
-                    skip_bids_validation=qsiprep_cfg.get("skip_bids_validation", True),
-                    denoise_method=qsiprep_cfg.get("denoise_method", "dwidenoise"),
-                    unringing_method=qsiprep_cfg.get("unringing_method", "mrdegibbs"),
-                    runner=runner,
+        add(
+            "QSIPrep",
+            "QSIPrep DWI preprocessing",
+            lambda: run_qsiprep(
+                project_dir,
+                subject_id,
+                logger=logger,
+                output_resolution=qsiprep_cfg.get(
+                    "output_resolution", const.QSI_DEFAULT_OUTPUT_RESOLUTION
                 ),
-                logger,
-            )
-        else:
-            durations["QSIPrep"] = None
+                cpus=qsiprep_cfg.get("cpus"),
+                memory_gb=qsiprep_cfg.get("memory_gb"),
+                omp_threads=qsiprep_cfg.get(
+                    "omp_threads", const.QSI_DEFAULT_OMP_THREADS
+                ),
+                image_tag=qsiprep_cfg.get("image_tag", const.QSI_QSIPREP_IMAGE_TAG),
+                skip_bids_validation=qsiprep_cfg.get("skip_bids_validation", True),
+                denoise_method=qsiprep_cfg.get("denoise_method", "dwidenoise"),
+                unringing_method=qsiprep_cfg.get("unringing_method", "mrdegibbs"),
+                runner=runner,
+            ),
+            output_step=STEP_QSIPREP,
+            inputs=("nifti",),
+            outputs=("qsiprep",),
+            fingerprint={
+                "files": [pm.bids_anat(subject_id), pm.bids_dwi(subject_id)],
+                "config": _qsi_cache_config(qsiprep_cfg),
+            },
+            products=(pm.qsiprep_subject(subject_id),),
+            cpus=qsiprep_cfg.get("cpus") or const.QSI_DEFAULT_CPUS,
+            memory_gb=qsiprep_cfg.get("memory_gb") or const.QSI_DEFAULT_MEMORY_GB,
+        )
 
     if run_qsirecon_step:
         recon_cfg = qsi_recon_config or {}
         recon_specs = recon_cfg.get("recon_specs") if recon_cfg else None
         atlases = recon_cfg.get("atlases") if recon_cfg else None
-        if _should_run_output_step(
-            project_dir,
-            subject_id,
-            STEP_QSIRECON,
-            logger=logger,
-            skip_existing_outputs=skip_existing_outputs,
-            replace_existing_outputs=replace_existing_outputs,
-        ):
-            durations["QSIRecon"] = _run_step(
-                "QSIRecon reconstruction",
-                lambda: run_qsirecon(
-                    project_dir,
-                    subject_id,
-                    logger=logger,
-                    recon_specs=recon_specs,
-                    atlases=atlases,
-                    use_gpu=recon_cfg.get("use_gpu", False),
-                    cpus=recon_cfg.get("cpus"),
-                    memory_gb=recon_cfg.get("memory_gb"),
-                    omp_threads=recon_cfg.get(
-                        "omp_threads", const.QSI_DEFAULT_OMP_THREADS
-                    ),
-                    image_tag=recon_cfg.get("image_tag", const.QSI_QSIRECON_IMAGE_TAG),
-                    skip_odf_reports=recon_cfg.get("skip_odf_reports", True),
-                    runner=runner,
+        add(
+            "QSIRecon",
+            "QSIRecon reconstruction",
+            lambda: run_qsirecon(
+                project_dir,
+                subject_id,
+                logger=logger,
+                recon_specs=recon_specs,
+                atlases=atlases,
+                use_gpu=recon_cfg.get("use_gpu", False),
+                cpus=recon_cfg.get("cpus"),
+                memory_gb=recon_cfg.get("memory_gb"),
+                omp_threads=recon_cfg.get(
+                    "omp_threads", const.QSI_DEFAULT_OMP_THREADS
                 ),
-                logger,
-            )
-        else:
-            durations["QSIRecon"] = None
+                image_tag=recon_cfg.get("image_tag", const.QSI_QSIRECON_IMAGE_TAG),
+                skip_odf_reports=recon_cfg.get("skip_odf_reports", True),
+                runner=runner,
+            ),
+            output_step=STEP_QSIRECON,
+            inputs=("qsiprep",),
+            outputs=("qsirecon",),
+            fingerprint={
+                "files": [pm.qsiprep_subject(subject_id)],
+                "config": _qsi_cache_config(recon_cfg),
+            },
+            products=(pm.qsirecon_subject(subject_id),),
+            cpus=recon_cfg.get("cpus") or const.QSI_DEFAULT_CPUS,
+            memory_gb=recon_cfg.get("memory_gb") or const.QSI_DEFAULT_MEMORY_GB,
+        )
 
     if extract_dti_step:
-        if _should_run_output_step(
-            project_dir,
-            subject_id,
-            STEP_DTI,
-            logger=logger,
-            skip_existing_outputs=skip_existing_outputs,
-            replace_existing_outputs=replace_existing_outputs,
-        ):
-            durations["DTI Tensor Extraction"] = _run_step(
-                "DTI tensor extraction",
-                lambda: extract_dti_tensor(
-                    project_dir,
-                    subject_id,
-                    logger=logger,
-                ),
-                logger,
-            )
-        else:
-            durations["DTI Tensor Extraction"] = None
+        add(
+            "DTI Tensor Extraction",
+            "DTI tensor extraction",
+            lambda: extract_dti_tensor(
+                project_dir,
+                subject_id,
+                logger=logger,
+            ),
+            output_step=STEP_DTI,
+            inputs=("qsirecon", "m2m"),
+            outputs=("dti",),
+            fingerprint={
+                "files": [pm.qsirecon_subject(subject_id), pm.t1(subject_id)],
+                "tools": ["ti-toolbox"],
+            },
+            products=(Path(pm.m2m(subject_id)) / const.FILE_DTI_TENSOR,),
+            cpus=1,
+            memory_gb=4,
+        )
 
     if run_subcortical:
-        durations["Subcortical Segmentations"] = _run_step(
+        fs_mri = Path(pm.freesurfer_mri(subject_id))
+        add(
+            "Subcortical Segmentations",
             "Subcortical segmentations",
             lambda: run_subcortical_segmentations(
                 project_dir,
@@ -349,11 +461,21 @@ def _run_subject_pipeline(
                 logger=logger,
                 runner=runner,
             ),
-            logger,
+            inputs=("freesurfer",),
+            outputs=("subcortical",),
+            stage="subcortical",
+            # The segmentations write into mri/, so only fingerprint the
+            # recon-all volumes they start from.
+            fingerprint={
+                "files": [fs_mri / "aseg.mgz", fs_mri / "norm.mgz"],
+                "tools": ["freesurfer"],
+            },
+            products=tuple(fs_mri / name for name in SUBCORTICAL_SEGMENTATION_FILES),
+            cpus=1,
+            memory_gb=8,
         )
 
-    logger.info(f"Pre-processing completed successfully for subject: {subject_id}")
-    return durations
+    return steps
 
 
 def run_pipeline(
@@ -373,6 +495,7 @@ def run_pipeline(
     run_subcortical_segmentations: bool = False,
     skip_existing_outputs: bool = False,
     replace_existing_outputs: bool = False,
+    step_retries: int = 0,
     stop_event: object | None = None,
     logger_callback: Callable | None = None,
     runner: CommandRunner | None = None,
@@ -393,9 +516,12 @@ def run_pipeline(
     run_recon : bool, optional
         Run FreeSurfer ``recon-all``.
     parallel_recon : bool, optional
-        Run ``recon-all`` in parallel across subjects.
+        Run subjects in parallel: every step starts as soon as its inputs
+        exist and the core/memory budget allows, so e.g. ``charm`` for one
+        subject overlaps ``recon-all`` for another.  ``recon-all`` then runs
+        single-threaded per subject.  Without it, steps run one at a time.
     parallel_cores : int or None, optional
-        Maximum number of parallel subjects for ``recon-all``.
+        Core budget shared by all running steps (default: CPU count).
     create_m2m : bool, optional
         Run SimNIBS ``charm`` (also runs ``subject_atlas`` for ``.annot``
         files).
@@ -415,8 +541,15 @@ def run_pipeline(
         Run thalamic-nuclei and hippocampal-subfield segmentations.
     skip_existing_outputs : bool, optional
         Skip selected preprocessing steps when their output already exists.
+        Independently of this flag, a step whose inputs are unchanged since
+        it last completed (see :mod:`tit.stage_cache`) is reused, and one
+        whose inputs changed replaces its earlier output.
     replace_existing_outputs : bool, optional
         Remove selected existing outputs before rerunning their steps.
+    step_retries : int, optional
+        Extra attempts for a failed step; a retry replaces the failed
+        attempt's partial output.  Dependents of a step that still fails
+        are skipped while other subjects carry on.
     stop_event : object or None, optional
         Threading event used to cancel running steps.
     logger_callback : callable or None, optional
@@ -490,12 +623,18 @@ def run_pipeline(
             run_subcortical_segmentations=run_subcortical_segmentations,
             skip_existing_outputs=skip_existing_outputs,
             replace_existing_outputs=replace_existing_outputs,
+            step_retries=step_retries,
             stop_event=stop_event,
             logger_callback=logger_callback,
             runner=runner,
         )
 
 
+def _pipeline_state_file(pm) -> str:
+    """Scheduler state file recording finished steps across runs."""
+    return os.path.join(pm.ti_toolbox(), "logs", const.FILE_PREPROCESS_STATE)
+
+
 def _run_pipeline_inner(
     subject_ids,
     *,
@@ -513,6 +652,7 @@ def _run_pipeline_inner(
     run_subcortical_segmentations=False,
     skip_existing_outputs=False,
     replace_existing_outputs=False,
+    step_retries=0,
     stop_event=None,
     logger_callback=None,
     runner=None,
@@ -534,93 +674,76 @@ def _run_pipeline_inner(
     ensure_dataset_descriptions(project_dir, datasets)
     ensure_bidsignore(project_dir)
 
+    # One trace per pipeline run, beside the per-subject log directories.
+    start_trace(
+        os.path.join(
+            pm.ti_toolbox(), "logs", f"preprocess_{time.strftime('%Y%m%d_%H%M%S')}.log"
+        )
+    )
+
     if runner is None:
         runner = CommandRunner(stop_event=stop_event)
     elif stop_event is not None and runner.stop_event is not stop_event:
         runner.stop_event = stop_event
 
+    loggers = {}
+    steps: list[PipelineStep] = []
+    for sid in subject_list:
+        loggers[sid] = build_logger(
+            "preprocess",
+            sid,
+            project_dir,
+            console=logger_callback is None,
+        )
+        steps += _subject_steps(
+            project_dir,
+            sid,
+            runner=runner,
+            logger=loggers[sid],
+            convert_dicom=convert_dicom,
+            run_recon=run_recon,
+            parallel_recon=parallel_recon,
+            create_m2m=create_m2m,
+            run_tissue=run_tissue_analysis,
+            run_qsiprep_step=run_qsiprep,
+            run_qsirecon_step=run_qsirecon,
+            qsiprep_config=qsiprep_config,
+            qsi_recon_config=qsi_recon_config,
+            extract_dti_step=extract_dti,
+            run_subcortical=run_subcortical_segmentations,
+            skip_existing_outputs=skip_existing_outputs,
+            replace_existing_outputs=replace_existing_outputs,
+            retries=step_retries,
+            cache=subject_stage_cache(sid, project_dir),
+        )
+        loggers[sid].info(f"Beginning pre-processing for subject: {sid}")
+
+    # Without parallel_recon, steps run one at a time in subject order, as
+    # before; with it, any ready step of any subject starts once the core
+    # and memory budget allows.
+    scheduler = StepScheduler(
+        steps,
+        cpus=parallel_cores,
+        memory_gb=total_memory_gb(),
+        max_concurrent=None if parallel_recon else 1,
+        # Recorded for inspection only: a step is skipped on the evidence
+        # of its outputs (existing-output policy, stage cache), never just
+        # because an earlier run finished it.
+        state_file=_pipeline_state_file(pm),
+        stop_event=runner.stop_event,
+    )
+    results = scheduler.run()
+
     # Collect step durations per subject for reporting
     all_durations: dict[str, dict[str, float | None]] = {
         sid: {} for sid in subject_list
     }
-
-    common = dict(
-        parallel_recon=parallel_recon,
-        qsiprep_config=qsiprep_config,
-        qsi_recon_config=qsi_recon_config,
-        runner=runner,
-        callback=logger_callback,
-        skip_existing_outputs=skip_existing_outputs,
-        replace_existing_outputs=replace_existing_outputs,
-    )
-
-    if parallel_recon and run_recon and len(subject_list) > 1:
-        # Phase 1: per-subject prerequisites, sequential.
-        if convert_dicom or create_m2m:
-            for sid in subject_list:
-                d = _run_subject_pipeline(
-                    project_dir,
-                    sid,
-                    convert_dicom=convert_dicom,
-                    create_m2m=create_m2m,
-                    **common,
-                )
-                all_durations[sid].update(d)
-
-        # Phase 2: recon-all across subjects in parallel.
-        max_workers = parallel_cores or os.cpu_count() or 1
-        max_workers = min(max_workers, len(subject_list))
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(
-                    _run_subject_pipeline,
-                    project_dir,
-                    sid,
-                    run_recon=True,
-                    **common,
-                ): sid
-                for sid in subject_list
-            }
-            for future in as_completed(futures):
-                sid = futures[future]
-                all_durations[sid].update(future.result())
-
-        # Phase 3: per-subject post-recon steps, sequential.
-        if (
-            run_tissue_analysis
-            or run_qsiprep
-            or run_qsirecon
-            or extract_dti
-            or run_subcortical_segmentations
-        ):
-            for sid in subject_list:
-                d = _run_subject_pipeline(
-                    project_dir,
-                    sid,
-                    run_tissue=run_tissue_analysis,
-                    run_qsiprep_step=run_qsiprep,
-                    run_qsirecon_step=run_qsirecon,
-                    extract_dti_step=extract_dti,
-                    run_subcortical=run_subcortical_segmentations,
-                    **common,
-                )
-                all_durations[sid].update(d)
-    else:
-        for sid in subject_list:
-            d = _run_subject_pipeline(
-                project_dir,
-                sid,
-                convert_dicom=convert_dicom,
-                run_recon=run_recon,
-                create_m2m=create_m2m,
-                run_tissue=run_tissue_analysis,
-                run_qsiprep_step=run_qsiprep,
-                run_qsirecon_step=run_qsirecon,
-                extract_dti_step=extract_dti,
-                run_subcortical=run_subcortical_segmentations,
-                **common,
-            )
-            all_durations[sid].update(d)
+    for step in steps:
+        all_durations[step.subject_id][step.name] = results[step.key].value
+    for sid in subject_list:
+        loggers[sid].info(
+            f"Pre-processing completed successfully for subject: {sid}"
+        )
 
     # Generate HTML reports for each subject
     from tit.reporting import PreprocessingReportGenerator
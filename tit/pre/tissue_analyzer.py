@@ -6,6 +6,12 @@ Analyzes tissue types (CSF, bone, skin) from segmented NIfTI data,
 calculating volumes, thickness, and generating visualizations (thickness
 maps and methodology figures).
 
+All requested tissues share one :class:`TissueAnalysisContext`: the label
+volume is read once, every tissue and brain mask comes out of a single
+lookup-table pass, and distance transforms run on the brain bounding box
+only, one thread per tissue.  Figures are described as specs and rendered
+afterwards by :mod:`tit.plotting.figure_service`.
+
 Public API
 ----------
 run_tissue_analysis
@@ -13,15 +19,19 @@ run_tissue_analysis
 TissueAnalyzer
     Low-level class that performs volume, thickness, and visualization
     analysis on a single tissue type.
+TissueAnalysisContext
+    Label volume, masks and crop shared by the analyzers of one subject.
 
 See Also
 --------
 tit.pre.structural.run_pipeline : Full preprocessing pipeline.
 tit.pre.charm : CHARM head-mesh generation (produces the segmentation
     input consumed here).
+tit.plotting.figure_service : Deferred, cached figure rendering.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
@@ -30,6 +40,7 @@ import numpy as np
 from scipy import ndimage
 
 from tit.paths import get_path_manager
+from tit.plotting.figure_service import FigureSpec, render_figure, render_figures
 from .utils import PreprocessError
 
 # Tissue configurations
@@ -63,6 +74,207 @@ TISSUE_CONFIGS = {
 DEFAULT_TISSUES = ("bone", "csf", "skin")
 
 
+def _load_label_names(nifti_path: Path, logger: logging.Logger) -> dict[int, str]:
+    """Load label-ID-to-name mapping from ``labeling_LUT.txt``."""
+    label_names = {}
+
+    # Search for LUT file
+    search_paths = [
+        nifti_path.parent / "labeling_LUT.txt",
+    ]
+
+    # Check SimNIBS derivatives structure
+    if "SimNIBS" in nifti_path.parts:
+        for i, part in enumerate(nifti_path.parts):
+            if part == "SimNIBS" and i + 1 < len(nifti_path.parts):
+                simnibs_dir = Path(*nifti_path.parts[: i + 2])
+                for subdir in simnibs_dir.iterdir():
+                    if subdir.name.startswith("m2m_"):
+                        lut = subdir / "segmentation" / "labeling_LUT.txt"
+                        if lut.exists():
+                            search_paths.insert(0, lut)
+
+    for lut_path in search_paths:
+        if not lut_path.exists():
+            continue
+        try:
+            with open(lut_path, encoding="utf-8", errors="ignore") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    parts = line.split("\t")
+                    if len(parts) >= 2:
+                        try:
+                            label_id = int(parts[0].strip())
+                            label_name = parts[1].strip().rstrip(":")
+                            label_names[label_id] = label_name
+                        except ValueError:
+                            continue
+            logger.debug(f"Loaded {len(label_names)} labels from {lut_path}")
+            return label_names
+        except OSError as e:
+            logger.debug(f"Failed to load LUT: {e}")
+
+    return label_names
+
+
+def _brain_bounds(brain_mask: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+    """Inclusive per-axis ``(min, max)`` voxel indices of *brain_mask*."""
+    lo, hi = [], []
+    for axis in range(brain_mask.ndim):
+        others = tuple(a for a in range(brain_mask.ndim) if a != axis)
+        idx = np.flatnonzero(brain_mask.any(axis=others))
+        if idx.size == 0:
+            return None
+        lo.append(idx[0])
+        hi.append(idx[-1])
+    return np.array(lo), np.array(hi)
+
+
+def _brain_region(
+    bounds: tuple[np.ndarray, np.ndarray], padding: int, shape: tuple
+) -> tuple[slice, ...]:
+    """Padded brain bounding box, cut below ``brain_center_z - padding``."""
+    lo, hi = bounds
+    start = np.maximum(lo - padding, 0)
+    stop = np.minimum(hi + padding, shape)
+
+    # Z-coordinate filter (exclude lower regions)
+    brain_center_z = (lo[2] + hi[2]) // 2
+    start[2] = max(start[2], brain_center_z - padding)
+
+    return tuple(slice(int(a), int(b)) for a, b in zip(start, stop))
+
+
+def _apply_region(tissue_mask: np.ndarray, region: tuple[slice, ...]) -> np.ndarray:
+    """Zero *tissue_mask* outside *region*."""
+    filtered = np.zeros(tissue_mask.shape, dtype=np.uint8)
+    filtered[region] = tissue_mask[region]
+    return filtered
+
+
+class TissueAnalysisContext:
+    """Label volume and derived masks shared by several tissue analyzers.
+
+    The volume is loaded once and every label group (each tissue's labels
+    and its brain reference labels) gets one bit in a label lookup table,
+    so a single ``lut[labels]`` pass yields all masks.  The brain bounding
+    box and the crop covering every tissue's analysis region are computed
+    once as well.
+
+    Parameters
+    ----------
+    nifti_path : str or pathlib.Path
+        Path to the segmented labeling NIfTI file.
+    logger : logging.Logger
+        Logger for progress messages.
+    tissues : iterable of str, optional
+        Tissue types the context is prepared for.  Defaults to all of
+        ``TISSUE_CONFIGS``.
+
+    Attributes
+    ----------
+    data : numpy.ndarray
+        Label volume as returned by ``get_fdata``.
+    crop : tuple of slice
+        Sub-volume containing every prepared tissue's analysis region plus
+        a one-voxel background margin (the whole volume without brain).
+
+    Raises
+    ------
+    PreprocessError
+        If a tissue type is not a recognised key in ``TISSUE_CONFIGS``.
+    """
+
+    def __init__(
+        self,
+        nifti_path: str | Path,
+        logger: logging.Logger,
+        tissues: Iterable[str] = tuple(TISSUE_CONFIGS),
+    ):
+        self.nifti_path = Path(nifti_path)
+        self.logger = logger
+        self.tissues = tuple(tissues)
+        for tissue in self.tissues:
+            if tissue not in TISSUE_CONFIGS:
+                raise PreprocessError(f"Unknown tissue type: {tissue}")
+
+        self.logger.info(f"Loading NIfTI: {nifti_path}")
+        self.nii = nib.load(str(nifti_path))
+        self.data = self.nii.get_fdata()
+        self.voxel_dims = self.nii.header.get_zooms()[:3]
+        self.voxel_volume = float(np.prod(self.voxel_dims))
+        self.label_names = _load_label_names(self.nifti_path, logger)
+
+        labels = self.data.astype(np.int32)
+        np.maximum(labels, 0, out=labels)
+        self._label_counts = np.bincount(labels.ravel())
+
+        # One bit per label group; identical groups share a bit
+        groups = []
+        for tissue in self.tissues:
+            config = TISSUE_CONFIGS[tissue]
+            for group in (config["labels"], config["brain_labels"]):
+                if tuple(group) not in groups:
+                    groups.append(tuple(group))
+        self._bits = {group: 1 << i for i, group in enumerate(groups)}
+
+        lut_size = max([len(self._label_counts)] + [max(g) + 1 for g in groups])
+        lut_dtype = np.min_scalar_type(1 << max(len(groups) - 1, 0))
+        lut = np.zeros(lut_size, dtype=lut_dtype)
+        for group, bit in self._bits.items():
+            lut[list(group)] |= bit
+        self._codes = lut[labels]
+        del labels
+
+        self._bounds = {}
+        self.crop = self._union_crop()
+
+    def mask(self, labels: Iterable[int]) -> np.ndarray:
+        """Binary ``uint8`` mask of voxels carrying any of *labels*."""
+        bit = self._bits.get(tuple(labels))
+        if bit is None:
+            return np.isin(self.data, list(labels)).view(np.uint8)
+        return ((self._codes & bit) != 0).view(np.uint8)
+
+    def label_count(self, label: int) -> int:
+        """Number of voxels carrying *label*."""
+        if 0 < label < len(self._label_counts):
+            return int(self._label_counts[label])
+        return int(np.sum(self.data == label))
+
+    def region(
+        self, padding: int, brain_labels: Iterable[int]
+    ) -> tuple[slice, ...] | None:
+        """Analysis region for *padding*, or ``None`` without brain voxels."""
+        key = tuple(brain_labels)
+        if key not in self._bounds:
+            self._bounds[key] = _brain_bounds(self.mask(key))
+        bounds = self._bounds[key]
+        if bounds is None:
+            return None
+        return _brain_region(bounds, padding, self.data.shape)
+
+    def _union_crop(self) -> tuple[slice, ...]:
+        full = tuple(slice(0, s) for s in self.data.shape)
+        regions = [
+            self.region(TISSUE_CONFIGS[t]["padding"], TISSUE_CONFIGS[t]["brain_labels"])
+            for t in self.tissues
+        ]
+        if not regions or any(r is None for r in regions):
+            return full
+        # The margin keeps distance transforms identical to full-volume ones:
+        # every voxel just outside the crop is background anyway.
+        return tuple(
+            slice(
+                max(min(r[axis].start for r in regions) - 1, 0),
+                min(max(r[axis].stop for r in regions) + 1, size),
+            )
+            for axis, size in enumerate(self.data.shape)
+        )
+
+
 class TissueAnalyzer:
     """Analyze a single tissue type from segmented NIfTI data.
 
@@ -81,6 +293,9 @@ class TissueAnalyzer:
         One of ``'csf'``, ``'bone'``, or ``'skin'``.
     logger : logging.Logger
         Logger for progress messages.
+    context : TissueAnalysisContext or None, optional
+        Shared label volume and masks.  When ``None`` a context is built
+        for this tissue alone.
 
     Attributes
     ----------
@@ -107,6 +322,7 @@ class TissueAnalyzer:
         output_dir: str | Path,
         tissue_type: str,
         logger: logging.Logger,
+        context: TissueAnalysisContext | None = None,
     ):
         self.nifti_path = Path(nifti_path)
         self.output_dir = Path(output_dir)
@@ -117,6 +333,7 @@ class TissueAnalyzer:
             raise PreprocessError(f"Unknown tissue type: {tissue_type}")
 
         config = TISSUE_CONFIGS[tissue_type]
+        self.tissue_type = tissue_type
         self.tissue_name = config["name"]
         self.tissue_labels = config["labels"]
         self.padding = config["padding"]
@@ -124,103 +341,32 @@ class TissueAnalyzer:
         self.tissue_color = config["tissue_color"]
         self.brain_labels = config["brain_labels"]
 
-        # Load NIfTI
-        self.logger.info(f"Loading NIfTI: {nifti_path}")
-        self.nii = nib.load(str(nifti_path))
-        self.data = self.nii.get_fdata()
-        self.voxel_dims = self.nii.header.get_zooms()[:3]
-        self.voxel_volume = float(np.prod(self.voxel_dims))
-
-        # Load label names
-        self.label_names = self._load_label_names()
-
-    def _load_label_names(self) -> dict[int, str]:
-        """Load label-ID-to-name mapping from ``labeling_LUT.txt``."""
-        label_names = {}
-
-        # Search for LUT file
-        search_paths = [
-            self.nifti_path.parent / "labeling_LUT.txt",
-        ]
-
-        # Check SimNIBS derivatives structure
-        if "SimNIBS" in self.nifti_path.parts:
-            for i, part in enumerate(self.nifti_path.parts):
-                if part == "SimNIBS" and i + 1 < len(self.nifti_path.parts):
-                    simnibs_dir = Path(*self.nifti_path.parts[: i + 2])
-                    for subdir in simnibs_dir.iterdir():
-                        if subdir.name.startswith("m2m_"):
-                            lut = subdir / "segmentation" / "labeling_LUT.txt"
-                            if lut.exists():
-                                search_paths.insert(0, lut)
-
-        for lut_path in search_paths:
-            if not lut_path.exists():
-                continue
-            try:
-                with open(lut_path, encoding="utf-8", errors="ignore") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line or line.startswith("#"):
-                            continue
-                        parts = line.split("\t")
-                        if len(parts) >= 2:
-                            try:
-                                label_id = int(parts[0].strip())
-                                label_name = parts[1].strip().rstrip(":")
-                                label_names[label_id] = label_name
-                            except ValueError:
-                                continue
-                self.logger.debug(f"Loaded {len(label_names)} labels from {lut_path}")
-                return label_names
-            except OSError as e:
-                self.logger.debug(f"Failed to load LUT: {e}")
-
-        return label_names
+        if context is None:
+            context = TissueAnalysisContext(nifti_path, logger, (tissue_type,))
+        self.context = context
+        self.nii = context.nii
+        self.data = context.data
+        self.voxel_dims = context.voxel_dims
+        self.voxel_volume = context.voxel_volume
+        self.label_names = context.label_names
 
     def _create_tissue_mask(self) -> np.ndarray:
         """Create a combined binary mask for all tissue labels."""
-        mask = np.zeros_like(self.data, dtype=np.uint8)
-        for label in self.tissue_labels:
-            mask |= (self.data == label).astype(np.uint8)
-        return mask
+        return self.context.mask(self.tissue_labels)
 
     def _create_brain_mask(self) -> np.ndarray:
         """Create a binary mask for brain reference regions."""
-        mask = np.zeros_like(self.data, dtype=np.uint8)
-        for label in self.brain_labels:
-            mask |= (self.data == label).astype(np.uint8)
-        return mask
+        return self.context.mask(self.brain_labels)
 
     def _filter_to_brain_region(
         self, tissue_mask: np.ndarray, brain_mask: np.ndarray
     ) -> np.ndarray:
         """Restrict tissue mask to the brain bounding box with padding."""
-        brain_coords = np.where(brain_mask > 0)
-        if len(brain_coords[0]) == 0:
+        bounds = _brain_bounds(brain_mask)
+        if bounds is None:
             return tissue_mask
-
-        # Brain bounding box with padding
-        min_coords = [max(0, c.min() - self.padding) for c in brain_coords]
-        max_coords = [
-            min(s, c.max() + self.padding)
-            for c, s in zip(brain_coords, tissue_mask.shape)
-        ]
-
-        # Create region mask
-        region_mask = np.zeros_like(tissue_mask)
-        region_mask[
-            min_coords[0] : max_coords[0],
-            min_coords[1] : max_coords[1],
-            min_coords[2] : max_coords[2],
-        ] = 1
-
-        # Z-coordinate filter (exclude lower regions)
-        brain_center_z = (brain_coords[2].min() + brain_coords[2].max()) // 2
-        z_threshold = brain_center_z - self.padding
-        region_mask[:, :, :z_threshold] = 0
-
-        return (tissue_mask * region_mask).astype(np.uint8)
+        region = _brain_region(bounds, self.padding, tissue_mask.shape)
+        return _apply_region(tissue_mask, region)
 
     def _calculate_thickness(self, mask: np.ndarray) -> dict:
         """Calculate thickness statistics using a 3-D distance transform."""
@@ -238,350 +384,168 @@ class TissueAnalyzer:
             "thickness_map": distance_map * 2,
         }
 
-    def _create_thickness_figure(
-        self,
-        filtered_mask: np.ndarray,
-        thickness_stats: dict,
-        plt,
-    ) -> Path | None:
-        """Create thickness visualization with 3 views and a histogram."""
+    def _thickness_figure_spec(
+        self, filtered_mask: np.ndarray, thickness_stats: dict
+    ) -> FigureSpec | None:
+        """Describe the thickness figure: 3 slice views and a histogram."""
         thickness_map = thickness_stats.get("thickness_map")
         if thickness_map is None or np.sum(filtered_mask) == 0:
             return None
 
-        # Layout: top row has 3 views, bottom row has histogram spanning all columns
-        fig = plt.figure(figsize=(16, 10))
-        gs = fig.add_gridspec(2, 3, height_ratios=[2, 1], width_ratios=[1, 1, 1])
-
-        vx, vy, vz = self.voxel_dims
         mid = [s // 2 for s in thickness_map.shape]
-        thickness_values = thickness_map[filtered_mask > 0]
-        vmin, vmax = np.nanmin(thickness_values), np.nanmax(thickness_values)
-
-        # A. Axial view (top-left)
-        ax1 = fig.add_subplot(gs[0, 0])
-        masked = np.where(
-            filtered_mask[:, :, mid[2]] > 0, thickness_map[:, :, mid[2]], np.nan
-        )
-        im = ax1.imshow(
-            masked.T,
-            cmap=self.color_scheme,
-            origin="lower",
-            aspect=vy / vx,
-            interpolation="bilinear",
-            vmin=vmin,
-            vmax=vmax,
-        )
-        ax1.set_title("A. Axial View", fontsize=12, fontweight="bold")
-        ax1.set_xlabel("X (Anterior-Posterior)")
-        ax1.set_ylabel("Y (Left-Right)")
-
-        # B. Coronal view (top-center)
-        ax2 = fig.add_subplot(gs[0, 1])
-        masked = np.where(
-            filtered_mask[:, mid[1], :] > 0, thickness_map[:, mid[1], :], np.nan
-        )
-        ax2.imshow(
-            masked.T,
-            cmap=self.color_scheme,
-            origin="lower",
-            aspect=vz / vx,
-            interpolation="bilinear",
-            vmin=vmin,
-            vmax=vmax,
-        )
-        ax2.set_title("B. Coronal View", fontsize=12, fontweight="bold")
-        ax2.set_xlabel("X (Anterior-Posterior)")
-        ax2.set_ylabel("Z (Inferior-Superior)")
-
-        # C. Sagittal view (top-right)
-        ax3 = fig.add_subplot(gs[0, 2])
-        masked = np.where(
-            filtered_mask[mid[0], :, :] > 0, thickness_map[mid[0], :, :], np.nan
-        )
-        ax3.imshow(
-            masked.T,
-            cmap=self.color_scheme,
-            origin="lower",
-            aspect=vz / vy,
-            interpolation="bilinear",
-            vmin=vmin,
-            vmax=vmax,
-        )
-        ax3.set_title("C. Sagittal View", fontsize=12, fontweight="bold")
-        ax3.set_xlabel("Y (Left-Right)")
-        ax3.set_ylabel("Z (Inferior-Superior)")
-
-        # Colorbar for the 3 views
-        cbar_ax = fig.add_axes([0.92, 0.55, 0.015, 0.35])
-        cbar = fig.colorbar(im, cax=cbar_ax)
-        cbar.set_label("Thickness (mm)", fontweight="bold")
-
-        # D. Histogram (bottom, spanning all columns)
-        ax4 = fig.add_subplot(gs[1, :])
-        ax4.hist(
-            thickness_values,
-            bins=50,
-            alpha=0.7,
-            color="steelblue",
-            edgecolor="navy",
-            density=True,
-        )
+        views = {
+            "axial": np.s_[:, :, mid[2]],
+            "coronal": np.s_[:, mid[1], :],
+            "sagittal": np.s_[mid[0], :, :],
+        }
+        arrays = {
+            view: np.where(filtered_mask[idx] > 0, thickness_map[idx], np.nan)
+            for view, idx in views.items()
+        }
 
-        # Statistical lines
-        mean, std = thickness_stats["mean"], thickness_stats["std"]
-        ax4.axvline(
-            mean,
-            color="red",
-            linestyle="-",
-            linewidth=2.5,
-            label=f"Mean: {mean:.2f} mm",
-        )
-        ax4.axvline(
-            mean + std,
-            color="red",
-            linestyle="--",
-            linewidth=1.5,
-            label=f"+1 SD: {mean + std:.2f} mm",
-        )
-        ax4.axvline(
-            mean - std,
-            color="red",
-            linestyle="--",
-            linewidth=1.5,
-            label=f"-1 SD: {mean - std:.2f} mm",
+        thickness_values = thickness_map[filtered_mask > 0]
+        arrays["hist_counts"], arrays["hist_edges"] = np.histogram(
+            thickness_values, bins=50, density=True
         )
-
         p25, p75 = np.percentile(thickness_values, [25, 75])
-        ax4.axvline(
-            p25,
-            color="orange",
-            linestyle=":",
-            linewidth=1.5,
-            alpha=0.8,
-            label=f"25th %ile: {p25:.2f} mm",
-        )
-        ax4.axvline(
-            p75,
-            color="orange",
-            linestyle=":",
-            linewidth=1.5,
-            alpha=0.8,
-            label=f"75th %ile: {p75:.2f} mm",
-        )
-
-        ax4.set_xlabel(
-            f"{self.tissue_name} Thickness (mm)", fontsize=11, fontweight="bold"
-        )
-        ax4.set_ylabel("Probability Density", fontsize=11, fontweight="bold")
-        ax4.set_title("D. Thickness Distribution", fontsize=12, fontweight="bold")
-        ax4.legend(loc="upper right", fontsize=9, framealpha=0.9)
-        ax4.grid(True, alpha=0.3, axis="y")
-
-        # Statistics text box
-        volume_cm3 = np.sum(filtered_mask) * self.voxel_volume / 1000
-        stats_text = (
-            f"Statistics Summary:\n"
-            f"Range: {thickness_stats['min']:.2f} - {thickness_stats['max']:.2f} mm\n"
-            f"Mean ± SD: {mean:.2f} ± {std:.2f} mm\n"
-            f"Median: {np.median(thickness_values):.2f} mm\n"
-            f"IQR: {p25:.2f} - {p75:.2f} mm\n"
-            f"Voxels: {np.sum(filtered_mask):,}\n"
-            f"Volume: {volume_cm3:.1f} cm³\n"
-            f"Voxel dims: {vx:.2f}×{vy:.2f}×{vz:.2f} mm"
-        )
-        ax4.text(
-            0.02,
-            0.98,
-            stats_text,
-            transform=ax4.transAxes,
-            fontsize=9,
-            verticalalignment="top",
-            bbox=dict(
-                boxstyle="round,pad=0.4", facecolor="white", alpha=0.9, edgecolor="gray"
-            ),
-        )
-
-        fig.suptitle(
-            f"{self.tissue_name} Thickness Analysis",
-            fontsize=16,
-            fontweight="bold",
-            y=0.98,
+        voxels = int(np.sum(filtered_mask))
+
+        return FigureSpec(
+            render=_render_thickness_figure,
+            output=self.output_dir / f"{self.tissue_name.lower()}_thickness",
+            arrays=arrays,
+            meta={
+                "tissue_name": self.tissue_name,
+                "color_scheme": self.color_scheme,
+                "voxel_dims": [float(v) for v in self.voxel_dims],
+                "vmin": float(np.nanmin(thickness_values)),
+                "vmax": float(np.nanmax(thickness_values)),
+                "mean": thickness_stats["mean"],
+                "std": thickness_stats["std"],
+                "min": thickness_stats["min"],
+                "max": thickness_stats["max"],
+                "median": float(np.median(thickness_values)),
+                "p25": float(p25),
+                "p75": float(p75),
+                "voxels": voxels,
+                "volume_cm3": voxels * self.voxel_volume / 1000,
+            },
+            rc=_FIGURE_RC,
         )
-        plt.tight_layout()
-        plt.subplots_adjust(right=0.90, top=0.93, bottom=0.08, hspace=0.25)
-
-        # Save
-        output_png = self.output_dir / f"{self.tissue_name.lower()}_thickness.png"
-        output_pdf = self.output_dir / f"{self.tissue_name.lower()}_thickness.pdf"
-        plt.savefig(output_png, dpi=300, bbox_inches="tight", facecolor="white")
-        plt.savefig(output_pdf, bbox_inches="tight", facecolor="white")
-        plt.close()
-
-        self.logger.debug(f"Saved thickness figure: {output_png}")
-        return output_png
 
-    def _create_methodology_figure(
+    def _methodology_figure_spec(
         self,
         tissue_mask: np.ndarray,
         brain_mask: np.ndarray,
         filtered_mask: np.ndarray,
-        plt,
-    ) -> Path | None:
-        """Create methodology figure showing brain regions and Z-cutoff."""
+    ) -> FigureSpec | None:
+        """Describe the methodology figure: brain regions and Z-cutoff."""
         if np.sum(tissue_mask) == 0:
             return None
 
-        # Layout: 2 rows x 3 columns (Row 1: brain reference, Row 2: filtered extraction)
-        fig = plt.figure(figsize=(18, 12))
-        gs = fig.add_gridspec(2, 3, height_ratios=[1, 1], width_ratios=[1, 1, 1])
-
-        vx, vy, vz = self.voxel_dims
         mid = [s // 2 for s in tissue_mask.shape]
-
-        # Create separate masks for visualization
-        hemisphere_mask = np.zeros_like(brain_mask)
-        brainstem_mask = np.zeros_like(brain_mask)
-        for label in self.brain_labels:
-            if label in [3, 42]:  # Cerebral cortex labels
-                hemisphere_mask |= (self.data == label).astype(np.uint8)
-            elif label == 16:  # Brainstem
-                brainstem_mask = (self.data == label).astype(np.uint8)
+        hemisphere_labels = [lb for lb in self.brain_labels if lb in (3, 42)]
+        brainstem_labels = [lb for lb in self.brain_labels if lb == 16]
 
         # Calculate Z-cutoff parameters
-        brain_coords = np.where(brain_mask > 0)
-        if len(brain_coords[0]) > 0:
-            brain_center_z = (brain_coords[2].min() + brain_coords[2].max()) // 2
-            z_threshold = brain_center_z - self.padding
+        bounds = _brain_bounds(brain_mask)
+        if bounds is not None:
+            brain_center_z = int((bounds[0][2] + bounds[1][2]) // 2)
         else:
             brain_center_z = mid[2]
-            z_threshold = mid[2] - self.padding
-
-        kept_pct = np.sum(filtered_mask) / max(np.sum(tissue_mask), 1) * 100
-        view_configs = [
-            ("Axial", lambda m: m[:, :, mid[2]], vy / vx),
-            ("Coronal", lambda m: m[:, mid[1], :], vz / vx),
-            ("Sagittal", lambda m: m[mid[0], :, :], vz / vy),
-        ]
-
-        # Row labels
-        row_labels = [
-            "A. Brain Reference Regions",
-            "B. Filtered Tissue Extraction",
-        ]
+        z_threshold = brain_center_z - self.padding
 
-        for row in range(2):
-            for col, (view_name, slice_fn, aspect) in enumerate(view_configs):
-                ax = fig.add_subplot(gs[row, col])
-
-                # Get slices
-                tissue_slice = slice_fn(tissue_mask)
-                filtered_slice = slice_fn(filtered_mask)
-                hemisphere_slice = slice_fn(hemisphere_mask)
-                brainstem_slice = slice_fn(brainstem_mask)
-
-                # Create RGB image
-                img = np.zeros((tissue_slice.shape[1], tissue_slice.shape[0], 3))
-
-                if row == 0:  # Brain reference row
-                    img[tissue_slice.T > 0] = self.tissue_color
-                    img[hemisphere_slice.T > 0] = [0.5, 0.5, 0.5]  # Gray for cortex
-                    img[brainstem_slice.T > 0] = [0, 0.8, 0]  # Green for brainstem
-
-                else:  # Filtered extraction row
-                    # Dimmed tissue for excluded regions
-                    dimmed = [c * 0.3 for c in self.tissue_color]
-                    img[tissue_slice.T > 0] = dimmed
-                    img[filtered_slice.T > 0] = self.tissue_color
-                    img[hemisphere_slice.T > 0] = [0.5, 0.5, 0.5]
-                    img[brainstem_slice.T > 0] = [0, 0.8, 0]
-
-                    # Add Z-cutoff lines for coronal and sagittal views
-                    if col in [1, 2]:
-                        ax.axhline(
-                            y=z_threshold,
-                            color="yellow",
-                            linewidth=3,
-                            linestyle="--",
-                            alpha=0.9,
-                            label="Z-cutoff",
-                        )
-                        ax.axhline(
-                            y=brain_center_z,
-                            color="white",
-                            linewidth=2,
-                            linestyle=":",
-                            alpha=0.8,
-                            label="Brain center",
-                        )
-
-                ax.imshow(img, origin="lower", aspect=aspect)
-                ax.set_title(f"{view_name} View", fontsize=11, fontweight="bold")
-                ax.set_xticks([])
-                ax.set_yticks([])
-
-                # Add legend on first column only
-                if col == 0:
-                    if row == 0:
-                        legend_text = (
-                            f"Brain Reference:\n"
-                            f"• Gray: Cerebral Cortex\n"
-                            f"• Green: Brainstem\n"
-                            f"• Colored: {self.tissue_name}"
-                        )
-                        box_color = "lightblue"
-                    else:
-                        legend_text = (
-                            f"Tissue Extraction:\n"
-                            f"• Bright: Kept ({kept_pct:.1f}%)\n"
-                            f"• Dim: Excluded\n"
-                            f"• Yellow: Z-cutoff\n"
-                            f"• White: Brain center"
-                        )
-                        box_color = "lightyellow"
-
-                    ax.text(
-                        0.02,
-                        0.98,
-                        legend_text,
-                        transform=ax.transAxes,
-                        fontsize=9,
-                        verticalalignment="top",
-                        bbox=dict(
-                            boxstyle="round,pad=0.3", facecolor=box_color, alpha=0.85
-                        ),
-                    )
+        views = {
+            "axial": np.s_[:, :, mid[2]],
+            "coronal": np.s_[:, mid[1], :],
+            "sagittal": np.s_[mid[0], :, :],
+        }
+        tissue_color = np.asarray(self.tissue_color, dtype=np.float32)
+        arrays = {}
+        for view, idx in views.items():
+            tissue_slice = tissue_mask[idx].T > 0
+            filtered_slice = filtered_mask[idx].T > 0
+            hemisphere_slice = np.isin(self.data[idx], hemisphere_labels).T
+            brainstem_slice = np.isin(self.data[idx], brainstem_labels).T
+
+            # Brain reference row
+            img = np.zeros(tissue_slice.shape + (3,), dtype=np.float32)
+            img[tissue_slice] = tissue_color
+            img[hemisphere_slice] = [0.5, 0.5, 0.5]  # Gray for cortex
+            img[brainstem_slice] = [0, 0.8, 0]  # Green for brainstem
+            arrays[f"{view}_reference"] = img
+
+            # Filtered extraction row: dimmed tissue for excluded regions
+            img = np.zeros(tissue_slice.shape + (3,), dtype=np.float32)
+            img[tissue_slice] = tissue_color * 0.3
+            img[filtered_slice] = tissue_color
+            img[hemisphere_slice] = [0.5, 0.5, 0.5]
+            img[brainstem_slice] = [0, 0.8, 0]
+            arrays[f"{view}_extraction"] = img
+
+        return FigureSpec(
+            render=_render_methodology_figure,
+            output=self.output_dir / f"{self.tissue_name.lower()}_methodology",
+            arrays=arrays,
+            meta={
+                "tissue_name": self.tissue_name,
+                "voxel_dims": [float(v) for v in self.voxel_dims],
+                "z_threshold": int(z_threshold),
+                "brain_center_z": int(brain_center_z),
+                "kept_pct": float(
+                    np.sum(filtered_mask) / max(np.sum(tissue_mask), 1) * 100
+                ),
+            },
+            rc=_FIGURE_RC,
+        )
 
-            # Row label on left side
-            fig.text(
-                0.02,
-                0.75 - row * 0.42,
-                row_labels[row],
-                fontsize=12,
-                fontweight="bold",
-                ha="left",
-                va="center",
-                rotation=90,
-            )
+    def figure_specs(self, measurement: dict) -> list[FigureSpec]:
+        """Figure specs for a :meth:`measure` result, for deferred rendering.
 
-        fig.suptitle(
-            f"{self.tissue_name} Extraction Methodology",
-            fontsize=16,
-            fontweight="bold",
-            y=0.96,
-        )
-        plt.tight_layout()
-        plt.subplots_adjust(
-            left=0.06, right=0.98, top=0.92, bottom=0.05, wspace=0.08, hspace=0.15
-        )
+        See Also
+        --------
+        tit.plotting.figure_service.render_figures : Renders the specs.
+        """
+        if not measurement:
+            return []
+        specs = [
+            self._thickness_figure_spec(
+                measurement["filtered_mask"], measurement["thickness_stats"]
+            ),
+            self._methodology_figure_spec(
+                measurement["tissue_mask"],
+                measurement["brain_mask"],
+                measurement["filtered_mask"],
+            ),
+        ]
+        return [spec for spec in specs if spec is not None]
 
-        # Save
-        output_png = self.output_dir / f"{self.tissue_name.lower()}_methodology.png"
-        output_pdf = self.output_dir / f"{self.tissue_name.lower()}_methodology.pdf"
-        plt.savefig(output_png, dpi=300, bbox_inches="tight", facecolor="white")
-        plt.savefig(output_pdf, bbox_inches="tight", facecolor="white")
-        plt.close()
+    def _create_thickness_figure(
+        self,
+        filtered_mask: np.ndarray,
+        thickness_stats: dict,
+        plt,
+    ) -> Path | None:
+        """Create thickness visualization with 3 views and a histogram."""
+        spec = self._thickness_figure_spec(filtered_mask, thickness_stats)
+        if spec is None:
+            return None
+        output_png = render_figure(spec, plt=plt)[0]
+        self.logger.debug(f"Saved thickness figure: {output_png}")
+        return output_png
 
+    def _create_methodology_figure(
+        self,
+        tissue_mask: np.ndarray,
+        brain_mask: np.ndarray,
+        filtered_mask: np.ndarray,
+        plt,
+    ) -> Path | None:
+        """Create methodology figure showing brain regions and Z-cutoff."""
+        spec = self._methodology_figure_spec(tissue_mask, brain_mask, filtered_mask)
+        if spec is None:
+            return None
+        output_png = render_figure(spec, plt=plt)[0]
         self.logger.debug(f"Saved methodology figure: {output_png}")
         return output_png
 
@@ -599,16 +563,6 @@ class TissueAnalyzer:
             self.logger.warning("matplotlib not available, skipping visualizations")
             return
 
-        plt.style.use("default")
-        plt.rcParams.update(
-            {
-                "font.size": 11,
-                "font.family": "DejaVu Sans",
-                "axes.linewidth": 1.2,
-                "figure.dpi": 150,
-            }
-        )
-
         # Create thickness figure
         self._create_thickness_figure(filtered_mask, thickness_stats, plt)
 
@@ -646,20 +600,23 @@ class TissueAnalyzer:
             f.write("LABELS ANALYZED:\n")
             for label in self.tissue_labels:
                 name = self.label_names.get(label, str(label))
-                count = int(np.sum(self.data == label))
+                count = self.context.label_count(label)
                 f.write(f"  {label}: {name} ({count:,} voxels)\n")
 
         return report_path
 
-    def analyze(self) -> dict:
-        """Run the complete tissue analysis.
+    def measure(self) -> dict:
+        """Build the masks and compute thickness, without writing outputs.
+
+        Only numpy and scipy work happens here, so analyzers sharing a
+        context can measure concurrently.  The distance transform runs on
+        the context's crop.
 
         Returns
         -------
         dict
-            Analysis results with keys ``'volume_cm3'``, ``'volume_mm3'``,
-            ``'thickness'`` (dict with mean/std/min/max), ``'voxels'``
-            (dict with total/filtered), and ``'report_path'``.
+            Masks, thickness statistics and voxel counts consumed by
+            :meth:`analyze`; empty when no tissue voxels are found.
         """
         self.logger.info(f"Analyzing {self.tissue_name}...")
 
@@ -667,36 +624,81 @@ class TissueAnalyzer:
         tissue_mask = self._create_tissue_mask()
         brain_mask = self._create_brain_mask()
 
-        total_voxels = int(np.sum(tissue_mask))
+        total_voxels = int(np.count_nonzero(tissue_mask))
         if total_voxels == 0:
             self.logger.warning(f"No {self.tissue_name} tissue found")
-            return {
-                "volume_cm3": 0,
-                "thickness": {"mean": 0, "std": 0, "min": 0, "max": 0},
-            }
+            return {}
 
         # Filter to brain region
-        if np.sum(brain_mask) > 0:
-            filtered_mask = self._filter_to_brain_region(tissue_mask, brain_mask)
+        region = self.context.region(self.padding, self.brain_labels)
+        if region is not None:
+            filtered_mask = _apply_region(tissue_mask, region)
         else:
             filtered_mask = tissue_mask
 
-        filtered_voxels = int(np.sum(filtered_mask))
+        filtered_voxels = int(np.count_nonzero(filtered_mask))
         self.logger.debug(
             f"Voxels: {total_voxels:,} total, {filtered_voxels:,} filtered"
         )
 
-        # Calculate thickness
-        thickness_stats = self._calculate_thickness(filtered_mask)
+        # Calculate thickness on the crop, then place it back in the volume
+        crop = self.context.crop
+        cropped = filtered_mask[crop]
+        thickness_stats = self._calculate_thickness(cropped)
+        thickness_map = thickness_stats["thickness_map"]
+        if thickness_map is not None and cropped.shape != filtered_mask.shape:
+            thickness_stats["thickness_map"] = np.zeros(filtered_mask.shape)
+            thickness_stats["thickness_map"][crop] = thickness_map
+
+        return {
+            "tissue_mask": tissue_mask,
+            "brain_mask": brain_mask,
+            "filtered_mask": filtered_mask,
+            "thickness_stats": thickness_stats,
+            "voxels": {"total": total_voxels, "filtered": filtered_voxels},
+        }
+
+    def analyze(self, measurement: dict | None = None, figures: bool = True) -> dict:
+        """Run the complete tissue analysis.
+
+        Parameters
+        ----------
+        measurement : dict or None, optional
+            Result of an earlier :meth:`measure` call; measured now when
+            ``None``.
+        figures : bool, optional
+            Render the figures inline.  Pass ``False`` to render
+            :meth:`figure_specs` later instead.
+
+        Returns
+        -------
+        dict
+            Analysis results with keys ``'volume_cm3'``, ``'volume_mm3'``,
+            ``'thickness'`` (dict with mean/std/min/max), ``'voxels'``
+            (dict with total/filtered), and ``'report_path'``.
+        """
+        if measurement is None:
+            measurement = self.measure()
+        if not measurement:
+            return {
+                "volume_cm3": 0,
+                "thickness": {"mean": 0, "std": 0, "min": 0, "max": 0},
+            }
+
+        tissue_mask = measurement["tissue_mask"]
+        brain_mask = measurement["brain_mask"]
+        filtered_mask = measurement["filtered_mask"]
+        thickness_stats = measurement["thickness_stats"]
 
         # Calculate volume
-        volume_mm3 = filtered_voxels * self.voxel_volume
+        volume_mm3 = measurement["voxels"]["filtered"] * self.voxel_volume
         volume_cm3 = volume_mm3 / 1000
 
         # Generate outputs
-        self._create_visualizations(
-            tissue_mask, brain_mask, filtered_mask, thickness_stats
-        )
+        if figures:
+            self._create_visualizations(
+                tissue_mask, brain_mask, filtered_mask, thickness_stats
+            )
         report_path = self._write_report(tissue_mask, filtered_mask, thickness_stats)
 
         self.logger.info(
@@ -713,22 +715,286 @@ class TissueAnalyzer:
                 "min": thickness_stats["min"],
                 "max": thickness_stats["max"],
             },
-            "voxels": {"total": total_voxels, "filtered": filtered_voxels},
+            "voxels": measurement["voxels"],
             "report_path": str(report_path),
         }
 
 
+_FIGURE_RC = {
+    "font.size": 11,
+    "font.family": "DejaVu Sans",
+    "axes.linewidth": 1.2,
+    "figure.dpi": 150,
+}
+
+
+def _render_thickness_figure(spec: FigureSpec, plt):
+    """Draw a :meth:`TissueAnalyzer._thickness_figure_spec` figure."""
+    meta, arrays = spec.meta, spec.arrays
+
+    # Layout: top row has 3 views, bottom row has histogram spanning all columns
+    fig = plt.figure(figsize=(16, 10))
+    gs = fig.add_gridspec(2, 3, height_ratios=[2, 1], width_ratios=[1, 1, 1])
+
+    vx, vy, vz = meta["voxel_dims"]
+    views = [
+        ("axial", "A. Axial View", vy / vx, "X (Anterior-Posterior)", "Y (Left-Right)"),
+        (
+            "coronal",
+            "B. Coronal View",
+            vz / vx,
+            "X (Anterior-Posterior)",
+            "Z (Inferior-Superior)",
+        ),
+        (
+            "sagittal",
+            "C. Sagittal View",
+            vz / vy,
+            "Y (Left-Right)",
+            "Z (Inferior-Superior)",
+        ),
+    ]
+    for col, (view, title, aspect, xlabel, ylabel) in enumerate(views):
+        ax = fig.add_subplot(gs[0, col])
+        image = ax.imshow(
+            arrays[view].T,
+            cmap=meta["color_scheme"],
+            origin="lower",
+            aspect=aspect,
+            interpolation="bilinear",
+            vmin=meta["vmin"],
+            vmax=meta["vmax"],
+        )
+        if col == 0:
+            im = image
+        ax.set_title(title, fontsize=12, fontweight="bold")
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+
+    # Colorbar for the 3 views
+    cbar_ax = fig.add_axes([0.92, 0.55, 0.015, 0.35])
+    cbar = fig.colorbar(im, cax=cbar_ax)
+    cbar.set_label("Thickness (mm)", fontweight="bold")
+
+    # D. Histogram (bottom, spanning all columns); densities are precomputed
+    ax4 = fig.add_subplot(gs[1, :])
+    edges = arrays["hist_edges"]
+    ax4.hist(
+        edges[:-1],
+        bins=edges,
+        weights=arrays["hist_counts"],
+        alpha=0.7,
+        color="steelblue",
+        edgecolor="navy",
+    )
+
+    # Statistical lines
+    mean, std = meta["mean"], meta["std"]
+    ax4.axvline(
+        mean,
+        color="red",
+        linestyle="-",
+        linewidth=2.5,
+        label=f"Mean: {mean:.2f} mm",
+    )
+    ax4.axvline(
+        mean + std,
+        color="red",
+        linestyle="--",
+        linewidth=1.5,
+        label=f"+1 SD: {mean + std:.2f} mm",
+    )
+    ax4.axvline(
+        mean - std,
+        color="red",
+        linestyle="--",
+        linewidth=1.5,
+        label=f"-1 SD: {mean - std:.2f} mm",
+    )
+
+    p25, p75 = meta["p25"], meta["p75"]
+    ax4.axvline(
+        p25,
+        color="orange",
+        linestyle=":",
+        linewidth=1.5,
+        alpha=0.8,
+        label=f"25th %ile: {p25:.2f} mm",
+    )
+    ax4.axvline(
+        p75,
+        color="orange",
+        linestyle=":",
+        linewidth=1.5,
+        alpha=0.8,
+        label=f"75th %ile: {p75:.2f} mm",
+    )
+
+    ax4.set_xlabel(
+        f"{meta['tissue_name']} Thickness (mm)", fontsize=11, fontweight="bold"
+    )
+    ax4.set_ylabel("Probability Density", fontsize=11, fontweight="bold")
+    ax4.set_title("D. Thickness Distribution", fontsize=12, fontweight="bold")
+    ax4.legend(loc="upper right", fontsize=9, framealpha=0.9)
+    ax4.grid(True, alpha=0.3, axis="y")
+
+    # Statistics text box
+    stats_text = (
+        f"Statistics Summary:\n"
+        f"Range: {meta['min']:.2f} - {meta['max']:.2f} mm\n"
+        f"Mean ± SD: {mean:.2f} ± {std:.2f} mm\n"
+        f"Median: {meta['median']:.2f} mm\n"
+        f"IQR: {p25:.2f} - {p75:.2f} mm\n"
+        f"Voxels: {meta['voxels']:,}\n"
+        f"Volume: {meta['volume_cm3']:.1f} cm³\n"
+        f"Voxel dims: {vx:.2f}×{vy:.2f}×{vz:.2f} mm"
+    )
+    ax4.text(
+        0.02,
+        0.98,
+        stats_text,
+        transform=ax4.transAxes,
+        fontsize=9,
+        verticalalignment="top",
+        bbox=dict(
+            boxstyle="round,pad=0.4", facecolor="white", alpha=0.9, edgecolor="gray"
+        ),
+    )
+
+    fig.suptitle(
+        f"{meta['tissue_name']} Thickness Analysis",
+        fontsize=16,
+        fontweight="bold",
+        y=0.98,
+    )
+    fig.tight_layout()
+    fig.subplots_adjust(right=0.90, top=0.93, bottom=0.08, hspace=0.25)
+    return fig
+
+
+def _render_methodology_figure(spec: FigureSpec, plt):
+    """Draw a :meth:`TissueAnalyzer._methodology_figure_spec` figure."""
+    meta, arrays = spec.meta, spec.arrays
+
+    # Layout: 2 rows x 3 columns (Row 1: brain reference, Row 2: filtered extraction)
+    fig = plt.figure(figsize=(18, 12))
+    gs = fig.add_gridspec(2, 3, height_ratios=[1, 1], width_ratios=[1, 1, 1])
+
+    vx, vy, vz = meta["voxel_dims"]
+    view_configs = [
+        ("Axial", "axial", vy / vx),
+        ("Coronal", "coronal", vz / vx),
+        ("Sagittal", "sagittal", vz / vy),
+    ]
+
+    # Row labels
+    row_labels = [
+        "A. Brain Reference Regions",
+        "B. Filtered Tissue Extraction",
+    ]
+
+    for row, suffix in enumerate(("reference", "extraction")):
+        for col, (view_name, view, aspect) in enumerate(view_configs):
+            ax = fig.add_subplot(gs[row, col])
+
+            # Add Z-cutoff lines for coronal and sagittal views
+            if row == 1 and col in [1, 2]:
+                ax.axhline(
+                    y=meta["z_threshold"],
+                    color="yellow",
+                    linewidth=3,
+                    linestyle="--",
+                    alpha=0.9,
+                    label="Z-cutoff",
+                )
+                ax.axhline(
+                    y=meta["brain_center_z"],
+                    color="white",
+                    linewidth=2,
+                    linestyle=":",
+                    alpha=0.8,
+                    label="Brain center",
+                )
+
+            ax.imshow(arrays[f"{view}_{suffix}"], origin="lower", aspect=aspect)
+            ax.set_title(f"{view_name} View", fontsize=11, fontweight="bold")
+            ax.set_xticks([])
+            ax.set_yticks([])
+
+            # Add legend on first column only
+            if col == 0:
+                if row == 0:
+                    legend_text = (
+                        f"Brain Reference:\n"
+                        f"• Gray: Cerebral Cortex\n"
+                        f"• Green: Brainstem\n"
+                        f"• Colored: {meta['tissue_name']}"
+                    )
+                    box_color = "lightblue"
+                else:
+                    legend_text = (
+                        f"Tissue Extraction:\n"
+                        f"• Bright: Kept ({meta['kept_pct']:.1f}%)\n"
+                        f"• Dim: Excluded\n"
+                        f"• Yellow: Z-cutoff\n"
+                        f"• White: Brain center"
+                    )
+                    box_color = "lightyellow"
+
+                ax.text(
+                    0.02,
+                    0.98,
+                    legend_text,
+                    transform=ax.transAxes,
+                    fontsize=9,
+                    verticalalignment="top",
+                    bbox=dict(
+                        boxstyle="round,pad=0.3", facecolor=box_color, alpha=0.85
+                    ),
+                )
+
+        # Row label on left side
+        fig.text(
+            0.02,
+            0.75 - row * 0.42,
+            row_labels[row],
+            fontsize=12,
+            fontweight="bold",
+            ha="left",
+            va="center",
+            rotation=90,
+        )
+
+    fig.suptitle(
+        f"{meta['tissue_name']} Extraction Methodology",
+        fontsize=16,
+        fontweight="bold",
+        y=0.96,
+    )
+    fig.tight_layout()
+    fig.subplots_adjust(
+        left=0.06, right=0.98, top=0.92, bottom=0.05, wspace=0.08, hspace=0.15
+    )
+    return fig
+
+
 def run_tissue_analysis(
     project_dir: str,
     subject_id: str,
     *,
     tissues: Iterable[str] = DEFAULT_TISSUES,
     logger: logging.Logger,
+    n_jobs: int = -1,
+    fidelity: str = "publication",
+    figure_workers: int | None = None,
 ) -> dict:
     """Run tissue analysis for a subject.
 
     Creates a ``TissueAnalyzer`` for each requested tissue type, computes
     volume and thickness statistics, and writes reports and visualizations.
+    The analyzers share one :class:`TissueAnalysisContext` and measure in
+    parallel threads.  Figures are rendered afterwards from lightweight
+    specs in a process pool, skipping figures whose inputs are unchanged.
 
     Parameters
     ----------
@@ -740,6 +1006,15 @@ def run_tissue_analysis(
         Tissue types to analyze.  Defaults to ``('bone', 'csf', 'skin')``.
     logger : logging.Logger
         Logger for progress output.
+    n_jobs : int, optional
+        Tissues measured concurrently; ``-1`` (default) uses one thread
+        per tissue.
+    fidelity : str, optional
+        Figure fidelity preset: ``'publication'`` (300 dpi PNG and PDF,
+        default) or ``'preview'`` (100 dpi PNG).
+    figure_workers : int or None, optional
+        Figure rendering processes; defaults to one per figure, capped at
+        the CPU count.
 
     Returns
     -------
@@ -764,15 +1039,40 @@ def run_tissue_analysis(
         raise PreprocessError(f"labeling.nii.gz not found: {label_path}")
 
     output_root = Path(pm.ensure(pm.tissue_analysis_output(subject_id)))
-    results = {}
 
+    selected = []
     for tissue in tissues:
         if tissue not in TISSUE_CONFIGS:
             logger.warning(f"Unknown tissue type: {tissue}, skipping")
             continue
+        selected.append(tissue)
+    if not selected:
+        return {}
+
+    context = TissueAnalysisContext(label_path, logger, selected)
+    analyzers = {
+        tissue: TissueAnalyzer(
+            label_path, output_root / f"{tissue}_analysis", tissue, logger, context
+        )
+        for tissue in selected
+    }
 
-        output_dir = output_root / f"{tissue}_analysis"
-        analyzer = TissueAnalyzer(label_path, output_dir, tissue, logger)
-        results[tissue] = analyzer.analyze()
+    n_workers = len(analyzers) if n_jobs == -1 else min(max(n_jobs, 1), len(analyzers))
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        measurements = list(pool.map(lambda a: a.measure(), analyzers.values()))
+
+    results = {}
+    specs = []
+    for (tissue, analyzer), measurement in zip(analyzers.items(), measurements):
+        results[tissue] = analyzer.analyze(measurement, figures=False)
+        specs.extend(analyzer.figure_specs(measurement))
+
+    if specs:
+        try:
+            import matplotlib  # noqa: F401
+        except ImportError:
+            logger.warning("matplotlib not available, skipping visualizations")
+        else:
+            render_figures(specs, fidelity, workers=figure_workers)
 
     return results
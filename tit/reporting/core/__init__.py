@@ -14,6 +14,10 @@ Base reportlets
     TextReportlet, ErrorReportlet, ReferencesReportlet
 Assembler
     ReportAssembler
+Image assets
+    AssetStore, use_asset_store, image_tag
+Fragment rendering
+    render_fragments, prune_fragments
 Templates
     DEFAULT_CSS_STYLES, DEFAULT_JS_SCRIPTS, get_html_template
 
@@ -44,6 +48,10 @@ from .base import (
 
 from .assembler import ReportAssembler
 
+from .assets import AssetStore, image_tag, use_asset_store
+
+from .fragments import prune_fragments, render_fragments
+
 from .templates import (
     DEFAULT_CSS_STYLES,
     DEFAULT_JS_SCRIPTS,
@@ -68,6 +76,13 @@ __all__ = [
     "ReferencesReportlet",
     # Assembler
     "ReportAssembler",
+    # Image assets
+    "AssetStore",
+    "use_asset_store",
+    "image_tag",
+    # Fragment rendering
+    "render_fragments",
+    "prune_fragments",
     # Templates
     "DEFAULT_CSS_STYLES",
     "DEFAULT_JS_SCRIPTS",
@@ -13,12 +13,16 @@ See Also
 --------
 tit.reporting.core.base : Base reportlet classes added to sections.
 tit.reporting.core.templates : HTML/CSS/JS templates used during rendering.
+tit.reporting.core.assets : Image files written beside non-self-contained reports.
+tit.reporting.core.fragments : Parallel, cached rendering of reportlets.
 """
 
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Self
 
+from .assets import ASSETS_DIR, AssetStore, use_asset_store
+from .fragments import FRAGMENT_CACHE_DIR, prune_fragments, render_fragments
 from .protocols import ReportMetadata, ReportSection
 from .templates import get_html_template
 
@@ -205,26 +209,76 @@ class ReportAssembler:
 
         return f'<div class="header-meta">{"".join(parts)}</div>'
 
-    def render_sections(self) -> str:
+    def render_sections(
+        self,
+        asset_store: AssetStore | None = None,
+        *,
+        workers: int | None = 1,
+        cache_dir: str | Path | None = None,
+    ) -> str:
         """Render all sections as HTML.
 
+        Parameters
+        ----------
+        asset_store : AssetStore or None, optional
+            Image store active while rendering (``None`` embeds images).
+        workers : int or None, optional
+            Worker processes for rendering reportlets; see
+            :func:`~tit.reporting.core.fragments.render_fragments`.  The
+            default renders everything in the current process.
+        cache_dir : str or pathlib.Path or None, optional
+            Reuse the cached HTML of reportlets whose data has not changed.
+
         Returns
         -------
         str
             HTML string for all sections.
         """
         sorted_sections = sorted(self.sections, key=lambda s: s.order)
-        return "\n".join(section.render_html() for section in sorted_sections)
+        if workers == 1 and cache_dir is None:
+            with use_asset_store(asset_store):
+                return "\n".join(section.render_html() for section in sorted_sections)
+
+        fragments = render_fragments(
+            [r for section in sorted_sections for r in section.reportlets],
+            cache_dir=cache_dir,
+            asset_store=asset_store,
+            workers=workers,
+        )
+        parts, start = [], 0
+        for section in sorted_sections:
+            end = start + len(section.reportlets)
+            parts.append(section.render_html(fragments[start:end]))
+            start = end
+        return "\n".join(parts)
 
-    def render_html(self) -> str:
+    def render_html(
+        self,
+        asset_store: AssetStore | None = None,
+        *,
+        workers: int | None = 1,
+        cache_dir: str | Path | None = None,
+    ) -> str:
         """Render the complete report as HTML.
 
+        Parameters
+        ----------
+        asset_store : AssetStore or None, optional
+            Write images to this store and reference them by URL.  ``None``
+            (default) embeds every image as base64.
+        workers : int or None, optional
+            Worker processes for rendering reportlets (default: none).
+        cache_dir : str or pathlib.Path or None, optional
+            Fragment cache directory; see :meth:`render_sections`.
+
         Returns
         -------
         str
             Complete HTML document as a string.
         """
-        content = self.render_sections()
+        content = self.render_sections(
+            asset_store, workers=workers, cache_dir=cache_dir
+        )
         toc_html = self.render_toc()
         metadata_html = self.render_metadata()
 
@@ -241,6 +295,9 @@ class ReportAssembler:
         self,
         output_path: str | Path,
         create_dirs: bool = True,
+        self_contained: bool = True,
+        incremental: bool = False,
+        workers: int | None = 1,
     ) -> Path:
         """Save the report to a file.
 
@@ -250,6 +307,21 @@ class ReportAssembler:
             Path to save the HTML file.
         create_dirs : bool, optional
             Create parent directories if needed (default *True*).
+        self_contained : bool, optional
+            Embed images as base64 so the HTML file stands alone (default).
+            When *False*, images are written once to a content-hashed
+            ``assets/`` directory beside the report and loaded lazily,
+            which keeps large reports small and fast to open.  Reports in
+            the same directory share that asset directory.
+        incremental : bool, optional
+            Cache each reportlet's HTML in a ``.fragments/`` directory beside
+            the report and reuse it when the report is saved again, so only
+            reportlets whose data changed are re-rendered.  Fragments unused
+            for ``FRAGMENT_MAX_AGE_DAYS`` are pruned.
+        workers : int or None, optional
+            Worker processes for rendering reportlets.  ``None`` starts a
+            pool only when enough reportlets need rendering; the default
+            renders in the current process.
 
         Returns
         -------
@@ -261,8 +333,16 @@ class ReportAssembler:
         if create_dirs:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        html_content = self.render_html()
+        asset_store = (
+            None if self_contained else AssetStore(output_path.parent / ASSETS_DIR)
+        )
+        cache_dir = output_path.parent / FRAGMENT_CACHE_DIR if incremental else None
+        html_content = self.render_html(
+            asset_store, workers=workers, cache_dir=cache_dir
+        )
         output_path.write_text(html_content, encoding="utf-8")
+        if cache_dir is not None:
+            prune_fragments(cache_dir)
 
         return output_path
 
@@ -0,0 +1,196 @@
+"""Externalised image assets for HTML reports.
+
+By default reportlets embed their images as base64 ``data:`` URIs, which
+keeps a report self-contained but makes large reports slow to write and to
+open.  While an :class:`AssetStore` is active, images are instead written
+once to a content-hashed directory beside the report and referenced with
+lazily loaded ``<img>`` tags.  Identical images -- shared across montages
+or across re-runs of the same report -- map to the same file and are never
+written twice.  Wide images also get a downscaled thumbnail for the inline
+view, linked to the full-resolution file (requires Pillow; without it the
+full image is shown).
+
+Public API
+----------
+AssetStore
+    Content-hashed image directory written beside a report.
+use_asset_store
+    Context manager routing image rendering to an :class:`AssetStore`.
+image_tag
+    Render an ``<img>`` for base64 image data, inline or as an asset.
+ASSETS_DIR
+    Default asset directory name, relative to the report.
+
+See Also
+--------
+tit.reporting.core.assembler.ReportAssembler.save : Chooses the image mode.
+"""
+
+import base64
+import binascii
+import hashlib
+import io
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+
+ASSETS_DIR = "assets"
+THUMBNAIL_WIDTH = 800
+
+_EXTENSIONS = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/gif": ".gif",
+    "image/svg+xml": ".svg",
+    "image/webp": ".webp",
+}
+
+_ACTIVE_STORE: ContextVar["AssetStore | None"] = ContextVar(
+    "tit_report_asset_store", default=None
+)
+
+
+class AssetStore:
+    """Write report images to a content-hashed directory.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        Directory the image files are written to; created on first use.
+    url_prefix : str, optional
+        Prefix of the ``src`` URLs, i.e. *directory* relative to the report.
+    thumbnail_width : int or None, optional
+        Images wider than this many pixels are shown as a thumbnail of this
+        width linking to the full image.  ``None`` disables thumbnails.
+
+    Attributes
+    ----------
+    written : int
+        Files written by this store; images already on disk are reused.
+    used : set of str
+        Names of every file referenced through this store.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        url_prefix: str = ASSETS_DIR,
+        thumbnail_width: int | None = THUMBNAIL_WIDTH,
+    ):
+        self.directory = Path(directory)
+        self.url_prefix = url_prefix.rstrip("/")
+        self.thumbnail_width = thumbnail_width
+        self.written = 0
+        self.used: set[str] = set()
+
+    def add(
+        self, data: bytes, mime_type: str = "image/png"
+    ) -> tuple[str, str | None]:
+        """Store *data* and return ``(url, thumbnail_url)``.
+
+        *thumbnail_url* is ``None`` when the image needs no thumbnail.
+        """
+        digest = hashlib.sha256(data).hexdigest()[:20]
+        name = f"{digest}{_EXTENSIONS.get(mime_type, '.png')}"
+        self._write(name, lambda: data)
+
+        thumbnail = None
+        if self.thumbnail_width and mime_type in ("image/png", "image/jpeg"):
+            thumb_name = f"{digest}.w{self.thumbnail_width}.png"
+            if self._write(thumb_name, lambda: _thumbnail(data, self.thumbnail_width)):
+                thumbnail = f"{self.url_prefix}/{thumb_name}"
+        return f"{self.url_prefix}/{name}", thumbnail
+
+    def _write(self, name: str, produce) -> bool:
+        """Write ``produce()`` to *name* unless present; False if nothing to write."""
+        path = self.directory / name
+        if not path.exists():
+            data = produce()
+            if data is None:
+                return False
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{name}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            self.written += 1
+        self.used.add(name)
+        return True
+
+
+@lru_cache(maxsize=None)
+def _pillow():
+    """The ``PIL.Image`` module, or ``None`` when Pillow is not installed."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+
+def _thumbnail(data: bytes, width: int) -> bytes | None:
+    """PNG of *data* scaled to *width*, or ``None`` if unneeded or unavailable."""
+    Image = _pillow()
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if img.width <= width:
+                return None
+            height = max(1, round(img.height * width / img.width))
+            buffer = io.BytesIO()
+            img.resize((width, height)).save(buffer, format="PNG", optimize=True)
+            return buffer.getvalue()
+    except (OSError, ValueError):
+        return None
+
+
+@contextmanager
+def use_asset_store(store: AssetStore | None) -> Iterator[AssetStore | None]:
+    """Route :func:`image_tag` to *store* inside the block (``None``: inline)."""
+    token = _ACTIVE_STORE.set(store)
+    try:
+        yield store
+    finally:
+        _ACTIVE_STORE.reset(token)
+
+
+def image_tag(
+    base64_data: str,
+    mime_type: str = "image/png",
+    *,
+    alt: str = "",
+    css_class: str = "",
+    style: str = "",
+) -> str:
+    """Return an ``<img>`` element for base64-encoded image data.
+
+    Outside :func:`use_asset_store` -- or if *base64_data* does not decode
+    -- the image is embedded as a ``data:`` URI.  Inside it, the image is
+    written to the active store and loaded lazily; a thumbnail, when one
+    was made, links to the full image.
+    """
+    attrs = f'alt="{alt}"'
+    if style:
+        attrs += f' style="{style}"'
+    if css_class:
+        attrs += f' class="{css_class}"'
+
+    store = _ACTIVE_STORE.get()
+    if store is not None:
+        try:
+            data = base64.b64decode(base64_data, validate=True)
+        except (binascii.Error, ValueError):
+            data = None
+        if data:
+            url, thumbnail = store.add(data, mime_type)
+            lazy = f'loading="lazy" decoding="async" {attrs}'
+            if thumbnail is None:
+                return f'<img src="{url}" {lazy} />'
+            return (
+                f'<a href="{url}" class="report-image-link" target="_blank">'
+                f'<img src="{thumbnail}" {lazy} /></a>'
+            )
+    return f'<img src="data:{mime_type};base64,{base64_data}" {attrs} />'
@@ -10,7 +10,7 @@ BaseReportlet
 MetadataReportlet
     Key-value metadata display (table or card grid).
 ImageReportlet
-    Inline image display (base64-embedded).
+    Image display, embedded or written to the report's asset directory.
 TableReportlet
     Tabular data display.
 TextReportlet
@@ -33,6 +33,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
+from .assets import image_tag
 from .protocols import ReportletType, SeverityLevel, StatusType
 
 
@@ -202,8 +203,9 @@ class ImageReportlet(BaseReportlet):
     """
     Reportlet for displaying images.
 
-    Supports embedding images as base64 or referencing external paths.
-    Images can be loaded from file paths, PIL Images, or raw bytes.
+    Images can be loaded from file paths, PIL Images, or raw bytes.  They
+    are embedded as base64 unless rendered inside
+    :func:`~tit.reporting.core.assets.use_asset_store`.
     """
 
     def __init__(
@@ -292,14 +294,18 @@ class ImageReportlet(BaseReportlet):
             else ""
         )
 
+        img_html = image_tag(
+            self._base64_data,
+            self._mime_type,
+            alt=self.alt_text,
+            css_class="report-image",
+            style=style,
+        )
         return f"""
         <div class="reportlet image-reportlet" id="{self.reportlet_id}">
             {title_html}
             <figure class="image-figure">
-                <img src="data:{self._mime_type};base64,{self._base64_data}"
-                     alt="{self.alt_text}"
-                     style="{style}"
-                     class="report-image" />
+                {img_html}
                 {caption_html}
             </figure>
         </div>
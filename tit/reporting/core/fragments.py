@@ -0,0 +1,241 @@
+"""Parallel, cached rendering of reportlet HTML fragments.
+
+:func:`render_fragments` renders a batch of reportlets to HTML.  Each
+reportlet's fragment is cached on disk under a hash of its class, its
+state (everything except its random id, which is swapped into a reused
+fragment), the image mode and the toolbox version, so re-generating a
+report after a small change re-renders only the reportlets whose data
+changed and re-assembles the document from the cached fragments.
+Fragments that do need rendering are rendered in worker processes when
+there are enough of them to pay for the pool; the workers are never forked,
+since reports are generated from the GUI and after threaded pipelines.
+
+Public API
+----------
+render_fragments
+    Render reportlets, in parallel, reusing cached fragments.
+fragment_key
+    Cache key of one reportlet's fragment.
+prune_fragments
+    Delete cached fragments that have not been reused for a while.
+FRAGMENT_CACHE_DIR
+    Default cache directory name, relative to the report.
+
+See Also
+--------
+tit.reporting.core.assembler.ReportAssembler.save : Enables this mode.
+tit.plotting.figure_service.render_figures : Same pattern for figures.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any
+
+from .assets import AssetStore, use_asset_store
+
+logger = logging.getLogger(__name__)
+
+FRAGMENT_CACHE_DIR = ".fragments"
+# Fragments not reused for this long are deleted when a report is saved.
+FRAGMENT_MAX_AGE_DAYS = 30
+# Below this many fragments to render, a process pool costs more than it saves.
+MIN_PARALLEL_FRAGMENTS = 16
+
+
+def _toolbox_version() -> str:
+    try:
+        from tit import __version__
+    except ImportError:
+        return "unknown"
+    return __version__
+
+
+def fragment_key(reportlet: Any, asset_store: AssetStore | None = None) -> str | None:
+    """Hash of everything *reportlet*'s HTML depends on.
+
+    Returns ``None`` for reportlets whose state cannot be pickled; those
+    are always rendered in the current process.
+    """
+    cls = type(reportlet)
+    state = {k: v for k, v in vars(reportlet).items() if k != "_id"}
+    mode = (
+        None
+        if asset_store is None
+        else (asset_store.url_prefix, asset_store.thumbnail_width)
+    )
+    try:
+        payload = pickle.dumps(
+            (f"{cls.__module__}.{cls.__qualname__}", state, mode, _toolbox_version()),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _render(reportlet: Any, store: AssetStore | None) -> tuple[str, list[str], int]:
+    """Render *reportlet* with its own store; return HTML, assets used, written."""
+    with use_asset_store(store):
+        html = reportlet.render_html()
+    if store is None:
+        return html, [], 0
+    return html, sorted(store.used), store.written
+
+
+def _render_in_worker(
+    reportlet: Any, store_args: tuple | None
+) -> tuple[str, list[str], int]:
+    store = AssetStore(*store_args) if store_args is not None else None
+    return _render(reportlet, store)
+
+
+def _load_fragment(
+    cache_dir: Path, key: str, reportlet_id: str | None, asset_store: AssetStore | None
+) -> str | None:
+    path = cache_dir / f"{key}.json"
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    assets = entry.get("assets", [])
+    if assets and (
+        asset_store is None
+        or not all((asset_store.directory / name).exists() for name in assets)
+    ):
+        return None
+    os.utime(path)
+    if asset_store is not None:
+        asset_store.used.update(assets)
+    html = entry.get("html")
+    if html is not None and entry.get("id") and reportlet_id:
+        html = html.replace(entry["id"], reportlet_id)
+    return html
+
+
+def _save_fragment(
+    cache_dir: Path, key: str, reportlet_id: str | None, html: str, assets: list[str]
+) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_dir / f"{key}.json"
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w") as f:
+        json.dump({"html": html, "assets": assets, "id": reportlet_id}, f)
+    os.replace(tmp, path)
+
+
+def prune_fragments(
+    cache_dir: str | Path, max_age_days: float = FRAGMENT_MAX_AGE_DAYS
+) -> int:
+    """Delete cached fragments not reused within *max_age_days*; return count."""
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for path in Path(cache_dir).glob("*.json"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def render_fragments(
+    reportlets: list[Any],
+    *,
+    cache_dir: str | Path | None = None,
+    asset_store: AssetStore | None = None,
+    workers: int | None = None,
+) -> list[str]:
+    """Render *reportlets* to HTML, in order.
+
+    Parameters
+    ----------
+    reportlets : list
+        Reportlets to render.
+    cache_dir : str or pathlib.Path or None, optional
+        Fragment cache directory.  ``None`` renders everything afresh.
+    asset_store : AssetStore or None, optional
+        Image store active while rendering (``None`` embeds images).
+    workers : int or None, optional
+        Worker processes for fragments that need rendering.  ``None`` uses
+        one per CPU once at least ``MIN_PARALLEL_FRAGMENTS`` are pending
+        and renders in the current process otherwise; ``1`` never starts a
+        pool.
+
+    Returns
+    -------
+    list of str
+        One HTML fragment per reportlet.
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else None
+    html: list[str | None] = [None] * len(reportlets)
+    keys: list[str | None] = [None] * len(reportlets)
+    pending: list[int] = []
+
+    for i, reportlet in enumerate(reportlets):
+        keys[i] = fragment_key(reportlet, asset_store)
+        if cache_dir is not None and keys[i] is not None:
+            html[i] = _load_fragment(
+                cache_dir, keys[i], getattr(reportlet, "_id", None), asset_store
+            )
+        if html[i] is None:
+            pending.append(i)
+
+    if cache_dir is not None and reportlets:
+        logger.debug(
+            f"Rendering {len(pending)} of {len(reportlets)} report fragment(s) "
+            f"({len(reportlets) - len(pending)} cached)"
+        )
+
+    def _done(i: int, fragment: str, assets: list[str], written: int) -> None:
+        html[i] = fragment
+        if asset_store is not None:
+            asset_store.used.update(assets)
+            asset_store.written += written
+        if cache_dir is not None and keys[i] is not None:
+            reportlet_id = getattr(reportlets[i], "_id", None)
+            _save_fragment(cache_dir, keys[i], reportlet_id, fragment, assets)
+
+    if workers is None:
+        workers = (
+            min(len(pending), os.cpu_count() or 1)
+            if len(pending) >= MIN_PARALLEL_FRAGMENTS
+            else 1
+        )
+    # Reportlets that cannot be pickled cannot reach a worker either.
+    remote = [i for i in pending if workers > 1 and keys[i] is not None]
+    local = [i for i in pending if workers <= 1 or keys[i] is None]
+
+    store_args = (
+        None
+        if asset_store is None
+        else (
+            asset_store.directory,
+            asset_store.url_prefix,
+            asset_store.thumbnail_width,
+        )
+    )
+    for i in local:
+        store = AssetStore(*store_args) if store_args is not None else None
+        _done(i, *_render(reportlets[i], store))
+    if remote:
+        from tit.plotting.figure_service import pool_context
+
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=pool_context()
+        ) as pool:
+            futures = {
+                pool.submit(_render_in_worker, reportlets[i], store_args): i
+                for i in remote
+            }
+            for future in as_completed(futures):
+                _done(futures[future], *future.result())
+
+    return html
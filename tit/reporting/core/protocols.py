@@ -187,21 +187,25 @@ class ReportSection:
         """Add a reportlet to this section."""
         self.reportlets.append(reportlet)
 
-    def render_html(self) -> str:
+    def render_html(self, fragments: list[str] | None = None) -> str:
         """Render the section and all its reportlets as HTML.
 
+        Parameters
+        ----------
+        fragments : list of str or None, optional
+            Already rendered HTML of each reportlet, in order.  When
+            *None*, the reportlets are rendered here.
+
         Returns
         -------
         str
             HTML fragment for the complete section.
         """
         collapse_class = "collapsible" if self.collapsed else ""
-        content_parts = []
-
-        for reportlet in self.reportlets:
-            content_parts.append(reportlet.render_html())
+        if fragments is None:
+            fragments = [reportlet.render_html() for reportlet in self.reportlets]
 
-        content = "\n".join(content_parts)
+        content = "\n".join(fragments)
 
         description_html = ""
         if self.description:
@@ -262,6 +262,12 @@ body {
     box-shadow: var(--shadow-sm);
 }
 
+.report-image-link {
+    display: inline-block;
+    max-width: 100%;
+    cursor: zoom-in;
+}
+
 .image-caption {
     margin-top: var(--spacing-sm);
     font-size: 0.9rem;
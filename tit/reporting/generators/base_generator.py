@@ -344,12 +344,25 @@ class BaseReportGenerator(ABC):
         """Build the report content. Must be implemented by subclasses."""
         pass
 
-    def generate(self, output_path: str | Path | None = None) -> Path:
+    def generate(
+        self,
+        output_path: str | Path | None = None,
+        self_contained: bool = False,
+        incremental: bool = True,
+        workers: int | None = None,
+    ) -> Path:
         """
         Generate the HTML report.
 
         Args:
             output_path: Optional custom output path
+            self_contained: Embed images in the HTML file instead of writing
+                them to the shared ``assets/`` directory beside it; use this
+                to export a single file that can be moved or mailed on its own
+            incremental: Reuse the cached HTML of reportlets whose data is
+                unchanged since the last report written to the same directory
+            workers: Worker processes for rendering reportlets; ``None``
+                starts a pool only when enough reportlets need rendering
 
         Returns:
             Path to the generated report file
@@ -376,7 +389,11 @@ class BaseReportGenerator(ABC):
             else:
                 final_path = self.get_output_path()
 
-            # Save the self-contained HTML report.
-            self.assembler.save(final_path)
+            self.assembler.save(
+                final_path,
+                self_contained=self_contained,
+                incremental=incremental,
+                workers=workers,
+            )
 
             return final_path
@@ -38,7 +38,9 @@ class DTIQCReportGenerator(BaseReportGenerator):
     def _get_report_prefix(self) -> str:
         return "dti_qc"
 
-    def generate(self, tensor_file: str, t1_file: str) -> Path:
+    def generate(
+        self, tensor_file: str, t1_file: str, self_contained: bool = False
+    ) -> Path:
         """Generate the DTI QC report.
 
         Parameters
@@ -47,6 +49,9 @@ class DTIQCReportGenerator(BaseReportGenerator):
             Path to the 6-component tensor NIfTI.
         t1_file : str
             Path to the T1-weighted anatomical NIfTI.
+        self_contained : bool, optional
+            Embed images in the HTML instead of the shared ``assets/``
+            directory (see :meth:`BaseReportGenerator.generate`).
 
         Returns
         -------
@@ -69,7 +74,7 @@ class DTIQCReportGenerator(BaseReportGenerator):
         self._fa_overlay_images = self._generate_fa_overlay(tensor_file, t1_file)
 
         # 4. Build and save report (calls _build_report via super)
-        return super().generate()
+        return super().generate(self_contained=self_contained)
 
     def _generate_fa_overlay(self, tensor_file: str, t1_file: str) -> dict:
         """Compute FA volume as temp NIfTI and overlay on T1."""
@@ -10,6 +10,7 @@ import io
 from pathlib import Path
 from typing import Any
 
+from ..core.assets import image_tag
 from ..core.base import BaseReportlet, ImageReportlet
 from ..core.protocols import ReportletType
 
@@ -118,10 +119,12 @@ class SliceSeriesReportlet(BaseReportlet):
             label = slice_data.get("label", "")
             label_html = f'<span class="slice-label">{label}</span>' if label else ""
 
+            img_html = image_tag(
+                slice_data["base64"], mime_type, alt=label or "Brain slice"
+            )
             slice_images.append(f"""
                 <div class="slice-image">
-                    <img src="data:{mime_type};base64,{slice_data["base64"]}"
-                         alt="{label or 'Brain slice'}" />
+                    {img_html}
                     {label_html}
                 </div>
                 """)
@@ -298,11 +301,15 @@ class MontageImageReportlet(BaseReportlet):
         # Image display
         image_html = ""
         if self._base64_data:
+            img_html = image_tag(
+                self._base64_data,
+                self._mime_type,
+                alt=self.montage_name or "Electrode montage",
+                css_class="report-image montage-image",
+            )
             image_html = f"""
             <figure class="montage-figure">
-                <img src="data:{self._mime_type};base64,{self._base64_data}"
-                     alt="{self.montage_name or 'Electrode montage'}"
-                     class="report-image montage-image" />
+                {img_html}
             </figure>
             """
         else:
@@ -418,12 +425,13 @@ class MultiViewBrainReportlet(BaseReportlet):
         view_panels = []
         for view_name, base64_data in self.views.items():
             if base64_data:
+                img_html = image_tag(
+                    base64_data, alt=f"{view_name} view", css_class="view-image"
+                )
                 view_panels.append(f"""
                     <div class="view-panel {view_name}">
                         <div class="view-label">{view_name.capitalize()}</div>
-                        <img src="data:image/png;base64,{base64_data}"
-                             alt="{view_name} view"
-                             class="view-image" />
+                        {img_html}
                     </div>
                     """)
             else:
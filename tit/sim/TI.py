@@ -202,6 +202,7 @@ class TISimulation(BaseSimulation):
             ],
             self.m2m_dir,
             self.logger,
+            cache=self.cache,
         )
         self.logger.info("NIfTI transformation: \u2713 Complete")
 
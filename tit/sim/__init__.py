@@ -42,21 +42,28 @@ tit.opt : Optimization modules that consume simulation results.
 tit.analyzer : Field analysis applied to simulation outputs.
 """
 
-from tit.sim.base import BaseSimulation
-from tit.sim.config import (
-    SimulationConfig,
-    Montage,
-    SimulationMode,
-    parse_intensities,
-)
-from tit.sim.utils import (
-    run_simulation,
-    load_montages,
-    list_montage_names,
-    load_montage_data,
-    save_montage_data,
-    ensure_montage_file,
-    upsert_montage,
+from tit._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "tit.sim.base": ["BaseSimulation"],
+        "tit.sim.config": [
+            "SimulationConfig",
+            "Montage",
+            "SimulationMode",
+            "parse_intensities",
+        ],
+        "tit.sim.utils": [
+            "run_simulation",
+            "load_montages",
+            "list_montage_names",
+            "load_montage_data",
+            "save_montage_data",
+            "ensure_montage_file",
+            "upsert_montage",
+        ],
+    },
 )
 
 __all__ = [
@@ -76,6 +76,7 @@ def _build_sim_config(data: dict) -> SimulationConfig:
         aniso_maxratio=data.get("aniso_maxratio", 10.0),
         aniso_maxcond=data.get("aniso_maxcond", 2.0),
         output_fields=data.get("output_fields", [const.FIELD_TI_MAX]),
+        force=data.get("force", False),
     )
 
 
@@ -4,7 +4,7 @@
 ``BaseSimulation`` factors out the identical code shared by
 ``TISimulation`` and ``mTISimulation``:
 
-* ``__init__`` -- config, montage, logger, path manager, m2m_dir
+* ``__init__`` -- config, montage, logger, stage cache, path manager, m2m_dir
 * ``_apply_tissue_conductivities`` -- env-var conductivity overrides
 * ``run`` -- template method (setup dirs, viz, build session, post-process)
 * ``_init_session`` -- common SESSION setup (subpath, tensor, eeg_cap, flags)
@@ -39,6 +39,7 @@ from tit.sim.utils import (
     run_montage_visualization,
     setup_montage_directories,
 )
+from tit.tracing import span
 
 
 class BaseSimulation(ABC):
@@ -55,6 +56,8 @@ class BaseSimulation(ABC):
         The electrode montage to simulate.
     logger : logging.Logger
         Logger instance for status and diagnostic messages.
+    cache : tit.stage_cache.StageCache or None
+        Stage cache for the NIfTI conversion; ``None`` always converts.
 
     Attributes
     ----------
@@ -64,6 +67,8 @@ class BaseSimulation(ABC):
         Electrode montage supplied at construction.
     logger : logging.Logger
         Logger instance used throughout the pipeline.
+    cache : tit.stage_cache.StageCache or None
+        Stage cache supplied at construction.
     pm : tit.paths.PathManager
         Singleton path manager for BIDS path resolution.
     m2m_dir : str
@@ -76,10 +81,13 @@ class BaseSimulation(ABC):
     run_simulation : Orchestrates ``BaseSimulation.run`` across montages.
     """
 
-    def __init__(self, config: SimulationConfig, montage: Montage, logger):
+    def __init__(
+        self, config: SimulationConfig, montage: Montage, logger, cache=None
+    ):
         self.config = config
         self.montage = montage
         self.logger = logger
+        self.cache = cache
         self.pm = get_path_manager()
         self.m2m_dir = self.pm.m2m(config.subject_id)
 
@@ -153,10 +161,12 @@ class BaseSimulation(ABC):
         )
 
         self.logger.info("SimNIBS simulation: Started")
-        run_simnibs(self._build_session(dirs["hf_dir"]))
+        with span("simnibs", montage=self.montage.name):
+            run_simnibs(self._build_session(dirs["hf_dir"]))
         self.logger.info("SimNIBS simulation: \u2713 Complete")
 
-        output_mesh = self._post_process(dirs)
+        with span("post_process", montage=self.montage.name):
+            output_mesh = self._post_process(dirs)
         self.logger.info(f"\u2713 {self.montage.name} complete")
 
         return {
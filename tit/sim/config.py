@@ -237,6 +237,9 @@ class SimulationConfig:
         ``TI_Max`` (capital M) on disk for mTI meshes. Defaults to
         ``["TI_max"]`` only -- ``TI_avg`` and the safety fields
         (``hf_peak``, ``hf_sar``) must be opted into.
+    force : bool
+        Simulate every montage even when the subject's stage cache holds
+        an up-to-date result for it.  The new run is recorded as usual.
 
     Raises
     ------
@@ -272,6 +275,7 @@ class SimulationConfig:
     aniso_maxratio: float = 10.0
     aniso_maxcond: float = 2.0
     output_fields: list[str] = field(default_factory=lambda: [const.FIELD_TI_MAX])
+    force: bool = False
 
     def __post_init__(self):
         if self.conductivity not in _VALID_CONDUCTIVITIES:
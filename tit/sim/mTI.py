@@ -265,6 +265,7 @@ class mTISimulation(BaseSimulation):
             ],
             self.m2m_dir,
             self.logger,
+            cache=self.cache,
         )
         self.logger.info("NIfTI transformation: \u2713 Complete")
 
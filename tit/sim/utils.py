@@ -44,11 +44,13 @@ import shutil
 import subprocess
 import time
 import csv
+from dataclasses import asdict
 from datetime import datetime
 from typing import Callable
 
 from tit.paths import get_path_manager
 from tit import constants as const
+from tit.stage_cache import conductivity_env, run_stage, subject_stage_cache
 from tit.sim.config import (
     Montage,
     parse_intensities,
@@ -721,7 +723,9 @@ def transform_to_nifti(
     )
 
 
-def transform_dirs_to_nifti(specs: list[dict], m2m_dir: str, logger) -> None:
+def transform_dirs_to_nifti(
+    specs: list[dict], m2m_dir: str, logger, cache=None
+) -> None:
     """Convert several mesh directories to NIfTI in a single process pool.
 
     Thin wrapper over ``tit.tools.mesh2nii.convert_mesh_dirs``.  Overlaps
@@ -738,6 +742,8 @@ def transform_dirs_to_nifti(specs: list[dict], m2m_dir: str, logger) -> None:
         Path to the subject's m2m directory, used for coordinate transforms.
     logger : logging.Logger
         Logger instance for status messages.
+    cache : tit.stage_cache.StageCache or None
+        Stage cache; directories whose NIfTIs are up to date are skipped.
 
     See Also
     --------
@@ -745,7 +751,7 @@ def transform_dirs_to_nifti(specs: list[dict], m2m_dir: str, logger) -> None:
     """
     from tit.tools.mesh2nii import convert_mesh_dirs
 
-    convert_mesh_dirs(specs=specs, m2m_dir=m2m_dir)
+    convert_mesh_dirs(specs=specs, m2m_dir=m2m_dir, cache=cache)
 
 
 def start_t1_to_mni(m2m_dir: str, subject_id: str) -> subprocess.Popen:
@@ -894,6 +900,13 @@ def run_simulation(
     Montages are processed sequentially.  If no *logger* is provided,
     a file logger is created under the subject's log directory.
 
+    Each montage is a stage of the subject's :mod:`tit.stage_cache`,
+    fingerprinted from the head mesh, EEG cap, DTI tensor, the simulation
+    parameters, the SimNIBS version and the ``TISSUE_COND_*`` environment.
+    A montage whose inputs are unchanged and whose outputs are still on
+    disk is not simulated again; its result carries ``cached=True``.  Set
+    ``config.force`` to simulate every montage regardless.
+
     Parameters
     ----------
     config : SimulationConfig
@@ -997,6 +1010,8 @@ def _run_simulation_inner(
     from tit.sim.TI import TISimulation
     from tit.sim.mTI import mTISimulation
 
+    cache = subject_stage_cache(config.subject_id)
+
     montages = config.montages
     results = []
     total = len(montages)
@@ -1011,15 +1026,60 @@ def _run_simulation_inner(
             if montage.simulation_mode == SimulationMode.TI
             else mTISimulation
         )
-        results.append(cls(config, montage, logger).run(simulation_dir))
+        result, hit = run_stage(
+            cache,
+            f"simulation/{montage.name}",
+            lambda: cls(config, montage, logger, cache=cache).run(simulation_dir),
+            **_simulation_stage_inputs(config, montage),
+            outputs=_simulation_outputs,
+            force=config.force,
+        )
+        results.append({**result, "cached": True} if hit else result)
         if config.map_to_fsavg:
-            _project_montage_to_fsaverage(config, montage, logger)
+            _project_montage_to_fsaverage(config, montage, logger, overwrite=not hit)
     if progress_callback:
         progress_callback(total, total, "Complete")
     return results
 
 
-def _project_montage_to_fsaverage(config: SimulationConfig, montage, logger) -> None:
+def _simulation_stage_inputs(config: SimulationConfig, montage) -> dict:
+    """Fingerprint ingredients of one montage simulation."""
+    pm = get_path_manager()
+    m2m_dir = pm.m2m(config.subject_id)
+    files = [
+        os.path.join(m2m_dir, f"{config.subject_id}.msh"),
+        os.path.join(m2m_dir, const.FILE_DTI_TENSOR),
+    ]
+    if not montage.is_xyz:
+        files.append(os.path.join(pm.eeg_positions(config.subject_id), montage.eeg_net))
+    # Only settings that change the written outputs; the montage list,
+    # post-run options and the cache override are not part of one montage's
+    # result.
+    settings = asdict(config)
+    for key in ("montages", "map_to_fsavg", "open_in_gmsh", "force"):
+        settings.pop(key, None)
+    return {
+        "files": files,
+        "config": {"simulation": settings, "montage": asdict(montage)},
+        "tools": ["simnibs", "ti-toolbox"],
+        "env": conductivity_env(),
+    }
+
+
+def _simulation_outputs(result: dict) -> list[str]:
+    """Primary mesh and NIfTI directories written by one montage simulation."""
+    field_dir = os.path.dirname(os.path.dirname(result["output_mesh"]))
+    montage_dir = os.path.dirname(field_dir)
+    return [
+        result["output_mesh"],
+        os.path.join(field_dir, "niftis"),
+        os.path.join(montage_dir, "high_Frequency", "niftis"),
+    ]
+
+
+def _project_montage_to_fsaverage(
+    config: SimulationConfig, montage, logger, overwrite: bool = True
+) -> None:
     """Project a finished TI montage's surface fields onto fsaverage5.
 
     Auxiliary step driven by ``config.map_to_fsavg``; runs in the same
@@ -1029,6 +1089,8 @@ def _project_montage_to_fsaverage(config: SimulationConfig, montage, logger) ->
     ponytail: best-effort -- a projection failure logs a warning and never aborts
     the simulation. mTI overlays are not yet supported, so mTI montages are
     skipped explicitly rather than failing the carrier/central-surface lookups.
+    *overwrite* is ``False`` when the montage was served from the stage cache,
+    so an existing projection of the unchanged overlays is kept.
     """
     if montage.simulation_mode != SimulationMode.TI:
         logger.info(
@@ -1042,7 +1104,7 @@ def _project_montage_to_fsaverage(config: SimulationConfig, montage, logger) ->
         # overwrite=True: this montage's overlays were just (re)written, so any
         # cached projection from a prior run of the same montage name is stale.
         _, status, msg = project_subject(
-            config.subject_id, montage.name, FsavgMapConfig(overwrite=True)
+            config.subject_id, montage.name, FsavgMapConfig(overwrite=overwrite)
         )
         logger.info("fsaverage projection [%s] %s: %s", status, montage.name, msg)
     except Exception as exc:  # noqa: BLE001 - auxiliary step, never fatal
@@ -1054,8 +1116,10 @@ def _make_file_logger(
 ) -> logging.Logger:
     """Create a file-backed logger for simulation output."""
     from tit.logger import add_file_handler
+    from tit.tracing import start_trace
 
     add_file_handler(log_file, level=logging.getLevelName(level), logger_name=name)
     # Also capture simnibs output in the same log file
     add_file_handler(log_file, logger_name="simnibs")
+    start_trace(log_file)
     return logging.getLogger(name)
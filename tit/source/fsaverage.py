@@ -23,6 +23,11 @@ Unlike SimNIBS's native ``map_to_fsavg`` (which only runs at simulation time and
 only emits ``TI_max``), this works *post-hoc* on any finished simulation and on
 the derived ``TI_normal`` / ``hf_peak`` / ``hf_sar`` quantities.
 
+The subject->fsaverage morph depends only on the subject's surfaces, so it is
+built once per subject as a sparse operator, persisted under the subject's
+``forward/`` directory (keyed by a hash of the ``m2m/surfaces`` files), and
+reused for every simulation and field of that subject.
+
 Runs under ``simnibs_python`` (reads SimNIBS meshes)::
 
     simnibs_python -m tit.source fsavg_config.json
@@ -35,6 +40,7 @@ tit.source.forward.prepare_forward : The companion forward pipeline.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
@@ -48,6 +54,195 @@ from tit.source.config import FsavgMapConfig
 
 logger = logging.getLogger(__name__)
 
+#: Bumped whenever the persisted morph-operator layout changes.
+_MORPH_FORMAT = 1
+
+#: Per-process memo of loaded subject morphs, keyed by ``(m2m, spacing)``.
+_MORPH_MEMO: dict[tuple[str, int], "_SubjectMorph"] = {}
+
+#: Per-process memo of surface-file digests, keyed by ``(path, size, mtime_ns)``.
+_FILE_DIGESTS: dict[tuple[str, int, int], bytes] = {}
+
+
+class _SparseMorph:
+    """Precomputed sparse subject-surface -> fsaverage interpolation matrix.
+
+    Drop-in for the SimNIBS ``SurfaceMorph`` objects returned by
+    ``cross_subject_map``: only :meth:`resample` is used by this module.  Held
+    as COO triplets so applying it needs nothing beyond NumPy.
+    """
+
+    def __init__(self, row: np.ndarray, col: np.ndarray, data: np.ndarray, shape):
+        self.row = np.asarray(row, dtype=np.int64)
+        self.col = np.asarray(col, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self.shape = (int(shape[0]), int(shape[1]))
+
+    def resample(self, values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values, dtype=float).reshape(-1)
+        if values.shape[0] != self.shape[1]:
+            raise ValueError(
+                f"morph expects {self.shape[1]} nodes, got {values.shape[0]}"
+            )
+        return np.bincount(
+            self.row, weights=self.data * values[self.col], minlength=self.shape[0]
+        )
+
+
+class _SubjectMorph:
+    """Morph operators plus the central surfaces they were built against."""
+
+    def __init__(self, m2m: Path, key: str | None, morph: dict, hemispheres):
+        self.m2m = m2m
+        self.key = key
+        self.morph = morph
+        self.hemispheres = tuple(hemispheres)
+        self._central = None
+
+    @property
+    def central(self) -> dict:
+        """Subject central surfaces, read on first use and kept for reuse.
+
+        Every field needs their per-hemisphere node counts to split values
+        before morphing; the hf fields also interpolate onto them.
+        """
+        if self._central is None:
+            from simnibs.mesh_tools import mesh_io
+            from simnibs.utils.file_finder import SubjectFiles
+
+            self._central = mesh_io.load_subject_surfaces(
+                SubjectFiles(subpath=str(self.m2m)), "central"
+            )
+        return self._central
+
+
+def _file_digest(path: Path) -> bytes:
+    """SHA-256 of *path*, read once per process while its size and mtime hold."""
+    stat = path.stat()
+    memo_key = (str(path), stat.st_size, stat.st_mtime_ns)
+    digest = _FILE_DIGESTS.get(memo_key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha.update(chunk)
+        digest = _FILE_DIGESTS[memo_key] = sha.digest()
+    return digest
+
+
+def _surface_key(m2m: Path, spacing: int) -> str | None:
+    """Content hash of the subject's surface files plus the target spacing.
+
+    Each file is hashed once per process (see :func:`_file_digest`), so
+    checking the memoised morph for every simulation of a subject only stats
+    the surfaces.  Returns ``None`` when no surfaces are found, in which case
+    the morph is neither persisted nor memoised (there is nothing to validate
+    it against).
+    """
+    files = sorted((m2m / "surfaces").glob("*.gii"))
+    if not files:
+        return None
+    digest = hashlib.sha256(f"v{_MORPH_FORMAT}:fsaverage{spacing}".encode())
+    for path in files:
+        digest.update(path.name.encode())
+        digest.update(_file_digest(path))
+    return digest.hexdigest()
+
+
+def _morph_cache_path(pm, subject_id: str, spacing: int) -> Path:
+    out_dir = Path(pm.forward(subject_id))
+    return out_dir / f"sub-{subject_id}_space-fsaverage{spacing}_morph.npz"
+
+
+def _save_morph(path: Path, key: str, morph: dict, hemispheres) -> bool:
+    """Persist per-hemisphere morph matrices; False if not representable."""
+    arrays: dict[str, np.ndarray] = {}
+    for hemi in hemispheres:
+        matrix = getattr(morph[hemi], "morph_mat", None)
+        if matrix is None:
+            return False
+        coo = matrix.tocoo()
+        arrays[f"{hemi}_row"] = np.asarray(coo.row)
+        arrays[f"{hemi}_col"] = np.asarray(coo.col)
+        arrays[f"{hemi}_data"] = np.asarray(coo.data, dtype=float)
+        arrays[f"{hemi}_shape"] = np.asarray(coo.shape)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp.npz")
+    np.savez(tmp, key=key, hemispheres=np.asarray(hemispheres), **arrays)
+    tmp.replace(path)
+    return True
+
+
+def _read_morph(path: Path, key: str) -> tuple[dict, tuple[str, ...]] | None:
+    """Load persisted morph matrices, or ``None`` if missing/stale/unreadable."""
+    if not path.exists():
+        return None
+    try:
+        with np.load(path) as data:
+            if str(data["key"]) != key:
+                return None
+            hemispheres = tuple(str(h) for h in data["hemispheres"])
+            morph = {
+                hemi: _SparseMorph(
+                    data[f"{hemi}_row"],
+                    data[f"{hemi}_col"],
+                    data[f"{hemi}_data"],
+                    data[f"{hemi}_shape"],
+                )
+                for hemi in hemispheres
+            }
+    except Exception as exc:  # noqa: BLE001 - a corrupt cache is just rebuilt
+        logger.warning("ignoring unreadable morph cache %s: %r", path, exc)
+        return None
+    return morph, hemispheres
+
+
+def _subject_morph(pm, subject_id: str, spacing: int) -> _SubjectMorph:
+    """Return the subject->fsaverage morph, building it at most once.
+
+    Looks in the per-process memo, then the persisted operator under
+    :meth:`~tit.paths.PathManager.forward`, and only then runs SimNIBS
+    ``cross_subject_map`` (persisting the result for later runs/workers).
+    """
+    from simnibs.utils.file_finder import SubjectFiles
+    from simnibs.utils.transformations import cross_subject_map
+
+    m2m = Path(pm.m2m(subject_id))
+    key = _surface_key(m2m, spacing)
+    memo_key = (str(m2m), spacing)
+    cached = _MORPH_MEMO.get(memo_key)
+    if cached is not None and key is not None and cached.key == key:
+        return cached
+
+    cache_path = _morph_cache_path(pm, subject_id, spacing)
+    loaded = _read_morph(cache_path, key) if key is not None else None
+    if loaded is not None:
+        morph, hemispheres = loaded
+        logger.debug("reusing fsaverage morph %s", cache_path)
+    else:
+        subject_files = SubjectFiles(subpath=str(m2m))
+        morph = cross_subject_map(subject_files, "fsaverage", subsampling_to=spacing)
+        hemispheres = subject_files.hemispheres
+        if key is not None:
+            if _save_morph(cache_path, key, morph, hemispheres):
+                logger.info("cached fsaverage morph -> %s", cache_path)
+            else:
+                logger.debug("morph has no sparse matrix; not persisting it")
+
+    subject_morph = _SubjectMorph(m2m, key, morph, hemispheres)
+    if key is not None:
+        _MORPH_MEMO[memo_key] = subject_morph
+    return subject_morph
+
+
+def _prepare_subject_morph(subject_id: str, spacing: int) -> tuple[str, str | None]:
+    """Build (or validate) one subject's persisted morph; pool-friendly."""
+    try:
+        _subject_morph(get_path_manager(), subject_id, spacing)
+    except Exception as exc:  # noqa: BLE001 - surfaced again per simulation
+        return subject_id, repr(exc)
+    return subject_id, None
+
 
 def _read_surface_scalar(path: Path, field_name: str) -> np.ndarray:
     """Read a node scalar field from a central-surface overlay mesh."""
@@ -161,17 +356,10 @@ def _compute_fields(
     pm, subject_id: str, sim: str, cfg: FsavgMapConfig
 ) -> dict[str, np.ndarray]:
     """Project the requested fields for one (subject, simulation) to fsaverage."""
-    from simnibs.mesh_tools import mesh_io
-    from simnibs.utils.file_finder import SubjectFiles
-    from simnibs.utils.transformations import cross_subject_map
-
-    m2m = Path(pm.m2m(subject_id))
-    subject_files = SubjectFiles(subpath=str(m2m))
-    morph = cross_subject_map(
-        subject_files, "fsaverage", subsampling_to=cfg.fsaverage_spacing
-    )
-    central = mesh_io.load_subject_surfaces(subject_files, "central")
-    hemispheres = subject_files.hemispheres
+    subject_morph = _subject_morph(pm, subject_id, cfg.fsaverage_spacing)
+    morph = subject_morph.morph
+    central = subject_morph.central
+    hemispheres = subject_morph.hemispheres
     n_lh, n_rh = central["lh"].nodes.nr, central["rh"].nodes.nr
 
     # Each field is projected independently so one bad input (e.g. a missing
@@ -284,6 +472,7 @@ def project_fields_to_fsaverage(
     """
     workers = max(1, min(cfg.workers, len(subjects))) if subjects else 1
     logger.info("Projecting %d simulation(s) with %d worker(s)", len(subjects), workers)
+    _prepare_morphs(subjects, cfg, workers)
 
     results: list[tuple[str, str, str]] = []
     if workers == 1:
@@ -304,6 +493,43 @@ def project_fields_to_fsaverage(
     return results
 
 
+def _prepare_morphs(
+    subjects: list[tuple[str, str]], cfg: FsavgMapConfig, workers: int
+) -> None:
+    """Build each pending subject's morph once before fanning out simulations.
+
+    Without this, every pool job for the same subject would race to run
+    ``cross_subject_map`` itself; afterwards jobs only load the persisted
+    operator.  Subjects whose outputs are all cached are skipped.
+    """
+    pm = get_path_manager()
+    pending = sorted(
+        {
+            sid
+            for sid, sim in subjects
+            if cfg.overwrite
+            or not _output_path(pm, sid, sim, cfg.fsaverage_spacing).exists()
+        }
+    )
+    if not pending:
+        return
+    n_workers = max(1, min(workers, len(pending)))
+    if n_workers == 1:
+        results = [_prepare_subject_morph(sid, cfg.fsaverage_spacing) for sid in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(
+                pool.map(
+                    _prepare_subject_morph,
+                    pending,
+                    [cfg.fsaverage_spacing] * len(pending),
+                )
+            )
+    for sid, error in results:
+        if error is not None:
+            logger.warning("fsaverage morph for %s failed: %s", sid, error)
+
+
 def _log_result(result: tuple[str, str, str]) -> None:
     subject_id, status, msg = result
     tag = {"ok": "✓", "cached": "CACHED", "failed": "✗ FAILED"}.get(status, status)
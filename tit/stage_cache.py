@@ -0,0 +1,454 @@
+"""Content-addressed cache of pipeline stage results.
+
+A *stage* is one unit of pipeline work -- a preprocessing step, a montage
+simulation, a mesh-to-NIfTI conversion or an ROI analysis.  Its
+*fingerprint* hashes everything that determines its outputs: the contents
+of the files it reads, its configuration, the versions of the external
+tools it runs and, for simulations, the tissue-conductivity environment.
+:class:`StageCache` keeps a JSON manifest recording, for each completed
+stage, that fingerprint and the outputs it wrote.  Re-running a stage whose
+fingerprint matches and whose outputs are still present is a cache hit.
+
+Stages are chained through content: a downstream stage lists the files an
+upstream stage writes among its own inputs.  Changing an input therefore
+re-runs the stage that reads it and, when that changes its outputs, exactly
+the stages downstream of it; an upstream re-run that reproduces identical
+outputs leaves downstream stages cached.
+
+File hashes are memoised in the manifest by size and modification time, so
+a re-run only reads files that changed since they were last hashed.
+
+Public API
+----------
+StageCache
+    Manifest of stage fingerprints and outputs, with hit/miss lookup.
+run_stage
+    Run a callable as a cached stage.
+subject_stage_cache
+    The stage cache of one subject in the current project.
+tool_versions
+    Versions of external tools that go into a fingerprint.
+conductivity_env
+    Tissue-conductivity overrides from the environment.
+
+See Also
+--------
+tit.pre.structural : Preprocessing steps cached per subject.
+tit.sim.utils.run_simulation : Montage simulations cached per subject.
+tit.tools.mesh2nii.convert_mesh_dirs : Cached mesh-to-NIfTI conversion.
+tit.analyzer.Analyzer : Cached ROI analyses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+_CHUNK = 1 << 20
+_LOCKS: dict[str, threading.Lock] = {}
+_LOCKS_GUARD = threading.Lock()
+
+
+def _manifest_lock(path: Path) -> threading.Lock:
+    """One lock per manifest file, shared by every cache object in the process."""
+    with _LOCKS_GUARD:
+        return _LOCKS.setdefault(str(path.resolve()), threading.Lock())
+
+
+# ---------------------------------------------------------------------------
+# Fingerprint ingredients
+# ---------------------------------------------------------------------------
+
+
+def _simnibs_version() -> str | None:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("simnibs")
+    except PackageNotFoundError:
+        return None
+
+
+def _freesurfer_version() -> str | None:
+    home = os.environ.get("FREESURFER_HOME")
+    if not home:
+        return None
+    try:
+        return Path(home, "build-stamp.txt").read_text().strip() or None
+    except OSError:
+        return None
+
+
+def _dcm2niix_version() -> str | None:
+    try:
+        proc = subprocess.run(
+            ["dcm2niix", "-v"], capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    for line in (proc.stdout + proc.stderr).splitlines():
+        if line.strip():
+            return line.strip()
+    return None
+
+
+def _toolbox_version() -> str:
+    import tit
+
+    return tit.__version__
+
+
+_TOOLS: dict[str, Callable[[], str | None]] = {
+    "ti-toolbox": _toolbox_version,
+    "simnibs": _simnibs_version,
+    "freesurfer": _freesurfer_version,
+    "dcm2niix": _dcm2niix_version,
+}
+
+
+@lru_cache(maxsize=None)
+def _tool_version(name: str) -> str | None:
+    return _TOOLS[name]()
+
+
+def tool_versions(*tools: str) -> dict[str, str | None]:
+    """Return the installed version of each named tool (``None`` if absent).
+
+    Parameters
+    ----------
+    *tools : str
+        Any of ``"ti-toolbox"``, ``"simnibs"``, ``"freesurfer"`` and
+        ``"dcm2niix"``.  Versions are looked up once per process.
+
+    Raises
+    ------
+    ValueError
+        If a tool name is unknown.
+    """
+    unknown = sorted(set(tools) - set(_TOOLS))
+    if unknown:
+        raise ValueError(f"Unknown tool(s) {unknown}; expected any of {sorted(_TOOLS)}")
+    return {name: _tool_version(name) for name in tools}
+
+
+def conductivity_env() -> dict[str, str]:
+    """Return the ``TISSUE_COND_<n>`` overrides simulations apply."""
+    return {k: v for k, v in os.environ.items() if k.startswith("TISSUE_COND_")}
+
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _has_content(path: Path) -> bool:
+    """True for a file, or a directory containing at least one entry."""
+    if path.is_dir():
+        return any(path.iterdir())
+    return path.exists()
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+
+class StageCache:
+    """Manifest of completed stages, keyed by stage name.
+
+    Parameters
+    ----------
+    manifest_path : str or pathlib.Path
+        JSON manifest file; created on the first :meth:`record`.
+    root : str or pathlib.Path or None, optional
+        Paths under *root* are stored relative to it so the manifest stays
+        valid when the project is moved.  Defaults to the manifest's
+        directory.
+
+    Notes
+    -----
+    Every :meth:`record` re-reads the manifest under a lock before writing
+    it atomically, so stages of one subject may record concurrently.
+    """
+
+    def __init__(self, manifest_path: str | Path, root: str | Path | None = None):
+        self.manifest_path = Path(manifest_path)
+        self.root = Path(root) if root is not None else self.manifest_path.parent
+        self._lock = _manifest_lock(self.manifest_path)
+        self._manifest = self._load()
+
+    # ── Manifest I/O ──────────────────────────────────────────────────────
+
+    def _load(self) -> dict:
+        try:
+            with open(self.manifest_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") != MANIFEST_VERSION:
+            data = {}
+        data.setdefault("version", MANIFEST_VERSION)
+        data.setdefault("stages", {})
+        data.setdefault("files", {})
+        return data
+
+    def _save(self) -> None:
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
+
+    def relative(self, path: str | Path) -> str:
+        """*path* as stored in the manifest: relative to :attr:`root` if inside it."""
+        path = Path(path).absolute()
+        try:
+            return path.relative_to(self.root.absolute()).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _absolute(self, stored: str) -> Path:
+        path = Path(stored)
+        return path if path.is_absolute() else self.root / path
+
+    # ── Hashing ───────────────────────────────────────────────────────────
+
+    def _digest_file(self, path: Path) -> str:
+        st = path.stat()
+        key = self.relative(path)
+        memo = self._manifest["files"].get(key)
+        if memo and memo[0] == st.st_size and memo[1] == st.st_mtime_ns:
+            return memo[2]
+        digest = _file_sha256(path)
+        self._manifest["files"][key] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def digest(self, path: str | Path) -> str:
+        """Content hash of a file or directory tree (``"missing"`` if absent).
+
+        A directory hashes the relative paths and contents of every file
+        under it, so renames and additions change the digest.
+        """
+        path = Path(path)
+        if path.is_file():
+            return self._digest_file(path)
+        if not path.is_dir():
+            return "missing"
+        h = hashlib.sha256()
+        for sub in sorted(p for p in path.rglob("*") if p.is_file()):
+            h.update(sub.relative_to(path).as_posix().encode())
+            h.update(self._digest_file(sub).encode())
+        return h.hexdigest()
+
+    def fingerprint(
+        self,
+        *,
+        files: Iterable[str | Path] = (),
+        config: Any = None,
+        tools: Iterable[str] = (),
+        env: dict[str, str] | None = None,
+    ) -> str:
+        """Hash everything that determines a stage's outputs.
+
+        Parameters
+        ----------
+        files : iterable of path-like
+            Files and directories the stage reads.  Missing paths hash to a
+            fixed marker, so creating one later changes the fingerprint.
+        config : JSON-serialisable, optional
+            Stage parameters.  Non-JSON values are hashed via ``str``.
+        tools : iterable of str
+            External tools whose versions matter (see
+            :func:`tool_versions`).
+        env : dict, optional
+            Environment variables that affect the result.
+
+        Returns
+        -------
+        str
+            Hex SHA-256 fingerprint.
+        """
+        payload = {
+            "files": {self.relative(p): self.digest(p) for p in files},
+            "config": config,
+            "tools": tool_versions(*tools),
+            "env": env or {},
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    # ── Lookup ────────────────────────────────────────────────────────────
+
+    def entry(self, stage: str) -> dict | None:
+        """Manifest record of *stage*, or ``None`` if it never completed."""
+        return self._manifest["stages"].get(stage)
+
+    def status(self, stage: str, fingerprint: str) -> str:
+        """Classify *stage* against a freshly computed *fingerprint*.
+
+        Returns
+        -------
+        str
+            ``"hit"`` (same fingerprint, outputs present), ``"changed"``
+            (inputs differ from the recorded run), ``"missing"`` (same
+            fingerprint but recorded outputs were removed) or ``"new"``
+            (never recorded).
+        """
+        entry = self.entry(stage)
+        if entry is None:
+            return "new"
+        if entry.get("fingerprint") != fingerprint:
+            return "changed"
+        if not all(_has_content(self._absolute(p)) for p in entry.get("outputs", ())):
+            return "missing"
+        return "hit"
+
+    def value(self, stage: str) -> Any:
+        """Value recorded with *stage* (``None`` if none)."""
+        entry = self.entry(stage)
+        return entry.get("value") if entry else None
+
+    # ── Updates ───────────────────────────────────────────────────────────
+
+    def record(
+        self,
+        stage: str,
+        fingerprint: str,
+        outputs: Iterable[str | Path] = (),
+        value: Any = None,
+    ) -> None:
+        """Record that *stage* completed with *fingerprint*.
+
+        Parameters
+        ----------
+        stage : str
+            Stage name, unique within the manifest.
+        fingerprint : str
+            Fingerprint computed before the stage ran.
+        outputs : iterable of path-like
+            Files and directories the stage wrote.  Paths that do not exist
+            are dropped; the remaining ones must still exist (directories
+            non-empty) for a later hit.
+        value : JSON-serialisable, optional
+            Result returned to callers on a hit.
+
+        Notes
+        -----
+        A stage is only recorded when at least one of its *outputs* exists
+        and *value* is JSON-serialisable.  Otherwise a hit could not be
+        checked against anything on disk, or could not return the result,
+        so any earlier record is forgotten and the stage runs again next
+        time.
+        """
+        existing = [self.relative(p) for p in outputs if _has_content(Path(p))]
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            logger.warning(f"{stage}: result is not JSON-serialisable, not cached")
+            self.invalidate(stage)
+            return
+        if not existing:
+            logger.warning(f"{stage}: no outputs on disk, not cached")
+            self.invalidate(stage)
+            return
+        entry = {
+            "fingerprint": fingerprint,
+            "outputs": existing,
+            "value": value,
+            "recorded": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        with self._lock:
+            files = self._manifest["files"]
+            self._manifest = self._load()
+            self._manifest["files"].update(files)
+            self._manifest["stages"][stage] = entry
+            self._save()
+
+    def invalidate(self, *stages: str) -> None:
+        """Forget *stages* so their next run is a miss."""
+        with self._lock:
+            files = self._manifest["files"]
+            self._manifest = self._load()
+            self._manifest["files"].update(files)
+            for stage in stages:
+                self._manifest["stages"].pop(stage, None)
+            self._save()
+
+
+def run_stage(
+    cache: StageCache | None,
+    stage: str,
+    func: Callable[[], Any],
+    *,
+    files: Iterable[str | Path] = (),
+    config: Any = None,
+    tools: Iterable[str] = (),
+    env: dict[str, str] | None = None,
+    outputs: Iterable[str | Path] | Callable[[Any], Iterable[str | Path]] = (),
+    force: bool = False,
+) -> tuple[Any, bool]:
+    """Run *func* as a cached stage.
+
+    Parameters
+    ----------
+    cache : StageCache or None
+        Cache to consult; ``None`` always runs *func*.
+    stage : str
+        Stage name.
+    func : callable
+        Zero-argument callable doing the work.
+    files, config, tools, env
+        Fingerprint ingredients (see :meth:`StageCache.fingerprint`).
+    outputs : iterable of path-like, or callable
+        Outputs to record, or ``outputs(value)`` computing them from the
+        return value of *func*.
+    force : bool, optional
+        Run even on a hit (the new run is still recorded).
+
+    Returns
+    -------
+    tuple
+        ``(value, hit)``: *func*'s return value, or the recorded value on a
+        hit, and whether the stage was served from the cache.
+    """
+    if cache is None:
+        return func(), False
+    fingerprint = cache.fingerprint(files=files, config=config, tools=tools, env=env)
+    if not force and cache.status(stage, fingerprint) == "hit":
+        logger.info(f"{stage}: inputs unchanged since the last run, reusing outputs")
+        return cache.value(stage), True
+    value = func()
+    if callable(outputs):
+        outputs = outputs(value)
+    cache.record(stage, fingerprint, outputs, value)
+    return value, False
+
+
+def subject_stage_cache(
+    subject_id: str, project_dir: str | None = None
+) -> StageCache:
+    """Return the stage cache of *subject_id* in the current project.
+
+    The manifest lives at :meth:`tit.paths.PathManager.stage_manifest` and
+    stores project paths relative to the project root.
+    """
+    from tit.paths import get_path_manager
+
+    pm = get_path_manager(project_dir)
+    return StageCache(pm.stage_manifest(subject_id), root=pm.project_dir)
@@ -26,13 +26,20 @@ See Also
 tit.analyzer : Single-subject ROI-level field analysis.
 """
 
-from tit.stats.config import (
-    CorrelationConfig,
-    CorrelationResult,
-    GroupComparisonConfig,
-    GroupComparisonResult,
+from tit._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "tit.stats.config": [
+            "CorrelationConfig",
+            "CorrelationResult",
+            "GroupComparisonConfig",
+            "GroupComparisonResult",
+        ],
+        "tit.stats.permutation": ["run_correlation", "run_group_comparison"],
+    },
 )
-from tit.stats.permutation import run_correlation, run_group_comparison
 
 __all__ = [
     "run_group_comparison",
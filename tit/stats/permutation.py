@@ -21,6 +21,7 @@ import numpy as np
 
 from tit.logger import add_file_handler
 from tit.paths import get_path_manager
+from tit.tracing import span, start_trace
 
 from tit.atlas import atlas_overlap_analysis
 from .config import (
@@ -58,6 +59,7 @@ def _setup_logger(output_dir: str, analysis_type: str, callback_handler=None):
     log = logging.getLogger(logger_name)
     log.setLevel(logging.DEBUG)
     add_file_handler(log_file, level="DEBUG", logger_name=logger_name)
+    start_trace(log_file)
     if callback_handler:
         log.addHandler(callback_handler)
     return log, log_file
@@ -221,8 +223,15 @@ def _run_group_comparison_inner(config, callback_handler=None, stop_callback=Non
         n_jobs=config.n_jobs,
         log=log,
     )
-    sig_mask, cluster_threshold, sig_clusters, null_dist, all_clusters, corr_data = (
-        engine.correct_groups(
+    with span("permutation", n_permutations=config.n_permutations):
+        (
+            sig_mask,
+            cluster_threshold,
+            sig_clusters,
+            null_dist,
+            all_clusters,
+            corr_data,
+        ) = engine.correct_groups(
             responders,
             non_responders,
             p_values=p_values,
@@ -233,7 +242,6 @@ def _run_group_comparison_inner(config, callback_handler=None, stop_callback=Non
             subject_ids_resp=resp_ids,
             subject_ids_non_resp=non_resp_ids,
         )
-    )
 
     log.info(
         "Significant clusters: %d, voxels: %d  (%.1fs)",
@@ -476,8 +484,15 @@ def run_correlation(
         n_jobs=config.n_jobs,
         log=log,
     )
-    sig_mask, cluster_threshold, sig_clusters, null_dist, all_clusters, corr_data = (
-        engine.correct_correlation(
+    with span("permutation", n_permutations=config.n_permutations):
+        (
+            sig_mask,
+            cluster_threshold,
+            sig_clusters,
+            null_dist,
+            all_clusters,
+            corr_data,
+        ) = engine.correct_correlation(
             subject_data,
             effect_sizes,
             r_values=r_values,
@@ -489,7 +504,6 @@ def run_correlation(
             perm_log_file=perm_log_file,
             subject_ids=subject_ids,
         )
-    )
 
     log.info(
         "Significant clusters: %d, voxels: %d  (%.1fs)",
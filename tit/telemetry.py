@@ -68,6 +68,7 @@ from typing import Any, Generator
 
 import tit
 from tit import constants as const
+from tit.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -526,6 +527,11 @@ def track_operation(op_name: str) -> Generator[None, None, None]:
     The exception is always re-raised — this context manager is
     transparent to control flow.
 
+    The operation is also timed as the root :func:`tit.tracing.span` of the
+    run; that record is only written to a local trace file (see
+    :mod:`tit.tracing`) and is never sent.  A trace the run starts with
+    :func:`tit.tracing.start_trace` ends when the operation does.
+
     Parameters
     ----------
     op_name : str
@@ -545,7 +551,8 @@ def track_operation(op_name: str) -> Generator[None, None, None]:
     track_event(op_name, {"status": "start", "run_id": run_id})
     t0 = time.monotonic()
     try:
-        yield
+        with span(op_name):
+            yield
     except Exception as exc:
         duration_s = int(round(time.monotonic() - t0))
         track_event(
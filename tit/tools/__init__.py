@@ -27,4 +27,6 @@ nifti_to_mesh
     Convert a NIfTI segmentation/mask to an STL or Gmsh surface mesh.
 read_annot
     Read and display FreeSurfer ``.annot`` annotation files.
+surface_io
+    Vectorised binary STL, Gmsh and PLY surface writers.
 """
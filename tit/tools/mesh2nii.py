@@ -13,11 +13,14 @@ msh_to_mni
     Convert a single mesh to MNI-space NIfTI.
 convert_mesh_dir
     Batch-convert every ``.msh`` file in a directory.
+convert_mesh_dirs
+    Convert several directories in one pool, skipping up-to-date ones.
 
 See Also
 --------
 tit.tools.nifti_to_mesh : Inverse operation (NIfTI to surface mesh).
 tit.tools.field_extract : Extract tissue sub-meshes before conversion.
+tit.stage_cache : Decides which directories are already up to date.
 """
 
 import concurrent.futures
@@ -28,6 +31,8 @@ from copy import deepcopy
 
 from simnibs import mesh_io, transformations
 
+from tit.tracing import span
+
 logger = logging.getLogger(__name__)
 
 
@@ -195,6 +200,7 @@ def convert_mesh_dirs(
     specs: list[dict],
     m2m_dir: str,
     max_workers: int | None = None,
+    cache=None,
 ) -> None:
     """Convert several mesh directories to NIfTI in a single process pool.
 
@@ -204,6 +210,10 @@ def convert_mesh_dirs(
     other (e.g. the TI-mesh and HF-mesh directories in the simulation
     pipeline) and avoids nesting process pools.
 
+    With a *cache*, each directory is a stage fingerprinted from its mesh
+    contents, the selected fields and the subject's reference T1 and MNI
+    warp.  Directories whose NIfTIs are up to date are not converted again.
+
     Parameters
     ----------
     specs : list[dict]
@@ -214,6 +224,8 @@ def convert_mesh_dirs(
         Path to the ``m2m_{subject}`` directory.
     max_workers : int | None
         Number of worker processes.  See :func:`convert_mesh_dir`.
+    cache : tit.stage_cache.StageCache or None
+        Stage cache to consult and update.
 
     See Also
     --------
@@ -221,7 +233,15 @@ def convert_mesh_dirs(
     """
     all_tasks: list[tuple] = []
     all_temp: list[str] = []
+    converted: list[tuple[dict, str | None]] = []
     for spec in specs:
+        fingerprint = None
+        if cache is not None:
+            stage = _nifti_stage(cache, spec["output_dir"])
+            fingerprint = cache.fingerprint(**_nifti_stage_inputs(spec, m2m_dir))
+            if cache.status(stage, fingerprint) == "hit":
+                logger.info("NIfTIs up to date, skipping: %s", spec["output_dir"])
+                continue
         tasks, temp_paths = _collect_tasks(
             spec["mesh_dir"],
             spec["output_dir"],
@@ -230,14 +250,71 @@ def convert_mesh_dirs(
         )
         all_tasks.extend(tasks)
         all_temp.extend(temp_paths)
+        converted.append((spec, fingerprint))
 
     if not all_tasks:
-        logger.warning("No .msh files to convert in any of %d directories", len(specs))
+        if converted:
+            logger.warning(
+                "No .msh files to convert in any of %d directories", len(converted)
+            )
         return
 
     _run_tasks(all_tasks, m2m_dir, all_temp, max_workers)
-    for spec in specs:
+    for spec, fingerprint in converted:
         logger.info("NIfTI conversion complete: %s", spec["output_dir"])
+        if fingerprint is not None:
+            cache.record(
+                _nifti_stage(cache, spec["output_dir"]),
+                fingerprint,
+                _nifti_outputs(spec),
+            )
+
+
+def _nifti_stage(cache, output_dir: str) -> str:
+    return f"nifti/{cache.relative(output_dir)}"
+
+
+def _mesh_files(mesh_dir: str, skip_patterns: list[str] | None) -> list[str]:
+    """``.msh`` files in *mesh_dir* that are converted, in sorted order."""
+    if skip_patterns is None:
+        skip_patterns = ["normal"]
+    if not os.path.isdir(mesh_dir):
+        return []
+    return [
+        f
+        for f in sorted(os.listdir(mesh_dir))
+        if f.endswith(".msh")
+        and not any(p in os.path.splitext(f)[0] for p in skip_patterns)
+    ]
+
+
+def _nifti_stage_inputs(spec: dict, m2m_dir: str) -> dict:
+    meshes = _mesh_files(spec["mesh_dir"], spec.get("skip_patterns"))
+    return {
+        "files": [
+            *(os.path.join(spec["mesh_dir"], f) for f in meshes),
+            os.path.join(m2m_dir, "T1.nii.gz"),
+            os.path.join(m2m_dir, "toMNI"),
+        ],
+        "config": {
+            "fields": spec.get("fields"),
+            "skip_patterns": spec.get("skip_patterns"),
+        },
+        "tools": ["simnibs"],
+    }
+
+
+def _nifti_outputs(spec: dict) -> list[str]:
+    """NIfTIs written for *spec*: every file sharing a converted mesh's stem."""
+    stems = [
+        os.path.splitext(f)[0]
+        for f in _mesh_files(spec["mesh_dir"], spec.get("skip_patterns"))
+    ]
+    return [
+        os.path.join(spec["output_dir"], f)
+        for f in sorted(os.listdir(spec["output_dir"]))
+        if any(f.startswith((f"{stem}_subject", f"{stem}_MNI")) for stem in stems)
+    ]
 
 
 def _collect_tasks(
@@ -299,14 +376,17 @@ def _run_tasks(
     )
 
     try:
-        if workers == 1:
-            for fn, src, out in tasks:
-                fn(src, m2m_dir, out)
-        else:
-            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as ex:
-                futures = [ex.submit(fn, src, m2m_dir, out) for fn, src, out in tasks]
-                for fut in concurrent.futures.as_completed(futures):
-                    fut.result()  # re-raise any worker exception
+        with span("nifti_conversion", tasks=len(tasks), workers=workers):
+            if workers == 1:
+                for fn, src, out in tasks:
+                    fn(src, m2m_dir, out)
+            else:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as ex:
+                    futures = [
+                        ex.submit(fn, src, m2m_dir, out) for fn, src, out in tasks
+                    ]
+                    for fut in concurrent.futures.as_completed(futures):
+                        fut.result()  # re-raise any worker exception
     finally:
         for path in temp_paths:
             try:
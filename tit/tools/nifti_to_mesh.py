@@ -2,17 +2,21 @@
 """Convert a NIfTI segmentation/mask to a surface mesh.
 
 Applies marching cubes to a binary mask derived from a NIfTI volume
-and writes the resulting surface as binary STL or Gmsh ASCII ``.msh``.
+and writes the resulting surface as binary STL or binary Gmsh ``.msh``.
+Large high-resolution masks can be meshed slab by slab to bound peak
+memory (``--slab-size``).
 
 Usage
 -----
 $ python -m tit.tools.nifti_to_mesh segmentation.nii.gz -o thalamus.stl
 $ python -m tit.tools.nifti_to_mesh mask.nii.gz --clean --output mesh.msh
+$ python -m tit.tools.nifti_to_mesh mask_05mm.nii.gz --slab-size 64
 
 See Also
 --------
 tit.tools.mesh2nii : Inverse operation (mesh to NIfTI).
 tit.tools.extract_labels : Pre-filter labels before meshing.
+tit.tools.surface_io : Vectorised STL / Gmsh / PLY writers.
 """
 
 import argparse
@@ -20,9 +24,10 @@ import sys
 import nibabel as nib
 import numpy as np
 from pathlib import Path
-from skimage import measure
 from scipy import ndimage
 
+from tit.tools.surface_io import write_binary_stl, write_gmsh_surface
+
 
 def remove_small_components(mask, threshold=0.1):
     """
@@ -57,7 +62,72 @@ def remove_small_components(mask, threshold=0.1):
     return cleaned, num_features - len(keep_labels)
 
 
-def mask_to_surface(input_file, clean_components=False, clean_threshold=0.1):
+def _merge_seam_vertices(verts, faces, seam_planes):
+    """Merge the duplicate vertices produced on shared slab boundaries.
+
+    Neighbouring slabs both emit the vertices lying on their shared voxel
+    plane (axis 0).  Those vertices are computed identically by both, so
+    exact coordinate matches are merged and faces remapped.
+    """
+    candidates = np.flatnonzero(np.isin(verts[:, 0], seam_planes))
+    if len(candidates) == 0:
+        return verts, faces
+
+    _, first, inverse = np.unique(
+        verts[candidates], axis=0, return_index=True, return_inverse=True
+    )
+    target = np.arange(len(verts))
+    target[candidates] = candidates[first][inverse.reshape(-1)]
+    keep = target == np.arange(len(verts))
+    new_index = np.cumsum(keep) - 1
+    return verts[keep], new_index[target[faces]]
+
+
+def _marching_cubes_slabs(read_slab, n_slices, slab_size, marching_cubes):
+    """Run marching cubes slab by slab along axis 0 and stitch the result.
+
+    Parameters
+    ----------
+    read_slab : callable
+        ``read_slab(start, stop)`` returning the boolean mask slices
+        ``[start, stop)`` along axis 0.
+    n_slices : int
+        Mask extent along axis 0.
+    slab_size : int
+        Voxel planes per slab; consecutive slabs overlap by one plane so
+        every marching cube is processed exactly once.
+    marching_cubes : callable
+        ``skimage.measure.marching_cubes``-compatible function.
+
+    Returns
+    -------
+    tuple
+        ``(verts, faces)`` in voxel coordinates of the full mask.
+    """
+    verts_parts, faces_parts, n_verts = [], [], 0
+    for start in range(0, max(n_slices - 1, 1), slab_size):
+        stop = min(start + slab_size + 1, n_slices)
+        slab = read_slab(start, stop)
+        if slab.shape[0] < 2 or slab.min() == slab.max():
+            continue  # no surface crosses this slab
+        verts, faces, _normals, _ = marching_cubes(slab, level=0.5)
+        verts[:, 0] += start
+        verts_parts.append(verts)
+        faces_parts.append(faces + n_verts)
+        n_verts += len(verts)
+
+    if not verts_parts:
+        raise ValueError("Mask contains no surface")
+
+    seams = np.arange(slab_size, n_slices - 1, slab_size)
+    return _merge_seam_vertices(
+        np.concatenate(verts_parts), np.concatenate(faces_parts), seams
+    )
+
+
+def mask_to_surface(
+    input_file, clean_components=False, clean_threshold=0.1, slab_size=None
+):
     """Run marching cubes on a NIfTI mask and return the world-space surface.
 
     Parameters
@@ -68,6 +138,11 @@ def mask_to_surface(input_file, clean_components=False, clean_threshold=0.1):
         Whether to remove small disconnected components.
     clean_threshold : float
         Minimum size threshold for component removal (fraction of largest).
+    slab_size : int or None
+        When set, read and mesh the volume in slabs of this many voxel
+        planes along the first axis, bounding peak memory for large
+        high-resolution masks.  The surface is identical up to vertex
+        order.  Component cleaning still needs the whole (boolean) mask.
 
     Returns
     -------
@@ -75,22 +150,46 @@ def mask_to_surface(input_file, clean_components=False, clean_threshold=0.1):
         ``(verts_world, faces, removed_components)`` where ``verts_world`` is an
         ``(N, 3)`` array of RAS world coordinates.
     """
+    from skimage import measure
+
     img = nib.load(str(Path(input_file)))
-    data = img.get_fdata()
     affine = img.affine
 
-    # Create binary mask (any non-zero value)
-    mask = data > 0
-
-    # Remove small disconnected components if requested
     removed_components = 0
-    if clean_components:
-        mask, removed_components = remove_small_components(
-            mask, threshold=clean_threshold
-        )
+    if slab_size is None:
+        data = img.get_fdata()
+
+        # Create binary mask (any non-zero value)
+        mask = data > 0
+
+        # Remove small disconnected components if requested
+        if clean_components:
+            mask, removed_components = remove_small_components(
+                mask, threshold=clean_threshold
+            )
+
+        # Run marching cubes
+        verts, faces, _normals, _ = measure.marching_cubes(mask, level=0.5)
+    else:
+        if slab_size < 1:
+            raise ValueError("slab_size must be a positive number of voxels")
+        if clean_components:
+            mask = np.asanyarray(img.dataobj) > 0
+            mask, removed_components = remove_small_components(
+                mask, threshold=clean_threshold
+            )
 
-    # Run marching cubes
-    verts, faces, _normals, _ = measure.marching_cubes(mask, level=0.5)
+            def read_slab(start, stop):
+                return mask[start:stop]
+
+        else:
+
+            def read_slab(start, stop):
+                return np.asanyarray(img.dataobj[start:stop]) > 0
+
+        verts, faces = _marching_cubes_slabs(
+            read_slab, img.shape[0], slab_size, measure.marching_cubes
+        )
 
     # Transform vertices to world coordinates (RAS)
     verts_world = nib.affines.apply_affine(affine, verts)
@@ -99,7 +198,11 @@ def mask_to_surface(input_file, clean_components=False, clean_threshold=0.1):
 
 
 def nifti_to_mesh(
-    input_file, output_file=None, clean_components=False, clean_threshold=0.1
+    input_file,
+    output_file=None,
+    clean_components=False,
+    clean_threshold=0.1,
+    slab_size=None,
 ):
     """
     Convert a NIfTI segmentation/mask to a surface mesh.
@@ -114,6 +217,8 @@ def nifti_to_mesh(
         Whether to remove small disconnected components
     clean_threshold : float
         Minimum size threshold for component removal (as fraction of largest component)
+    slab_size : int or None
+        Mesh the mask slab by slab (see :func:`mask_to_surface`)
 
     Returns
     -------
@@ -132,7 +237,10 @@ def nifti_to_mesh(
         raise ValueError("Output file must have .stl or .msh extension")
 
     verts_world, faces, removed_components = mask_to_surface(
-        input_path, clean_components=clean_components, clean_threshold=clean_threshold
+        input_path,
+        clean_components=clean_components,
+        clean_threshold=clean_threshold,
+        slab_size=slab_size,
     )
 
     # Save based on extension
@@ -221,7 +329,8 @@ def nifti_to_field_ply(
         ``{'vertices': int, 'faces': int, 'output_file': str,
         'removed_components': int, 'field_min': float, 'field_max': float}``.
     """
-    from tit.blender.io import field_to_colormap, write_ply_with_colors
+    from tit.blender.io import field_to_colormap
+    from tit.tools.surface_io import write_ply_with_colors
 
     output_path = Path(output_file)
     if output_path.suffix.lower() != ".ply":
@@ -257,38 +366,15 @@ def nifti_to_field_ply(
 
 
 def save_stl(verts, faces, filename):
-    """Save mesh as binary STL format using ``numpy-stl``."""
-
-    from stl import mesh as stl_mesh
-
-    surface = stl_mesh.Mesh(np.zeros(faces.shape[0], dtype=stl_mesh.Mesh.dtype))
-    for i, f in enumerate(faces):
-        for j in range(3):
-            surface.vectors[i][j] = verts[f[j], :]
-
-    surface.save(filename)
-
-
-def save_gmsh(verts, faces, filename):
-    """Save mesh as Gmsh .msh format (v2.2 ASCII)."""
-    with open(filename, "w") as f:
-        # Header
-        f.write("$MeshFormat\n2.2 0 8\n$EndMeshFormat\n")
+    """Save mesh as binary STL format."""
+    write_binary_stl(
+        filename, verts, faces, header_text="TI-Toolbox nifti_to_mesh surface"
+    )
 
-        # Nodes
-        f.write("$Nodes\n")
-        f.write(f"{len(verts)}\n")
-        for i, v in enumerate(verts, 1):
-            f.write(f"{i} {v[0]} {v[1]} {v[2]}\n")
-        f.write("$EndNodes\n")
 
-        # Elements (triangles = type 2)
-        f.write("$Elements\n")
-        f.write(f"{len(faces)}\n")
-        for i, face in enumerate(faces, 1):
-            # elem_id, elem_type(2=tri), num_tags, tag1, tag2, node1, node2, node3
-            f.write(f"{i} 2 2 1 1 {face[0]+1} {face[1]+1} {face[2]+1}\n")
-        f.write("$EndElements\n")
+def save_gmsh(verts, faces, filename, version="2.2", binary=True):
+    """Save mesh as Gmsh .msh format (v2.2 binary by default)."""
+    write_gmsh_surface(filename, verts, faces, version=version, binary=binary)
 
 
 def main():
@@ -302,7 +388,7 @@ Examples:
   %(prog)s mask.nii.gz --clean --output mesh.msh
   %(prog)s brain.nii.gz  # outputs brain.stl
 
-Supported output formats: .stl (binary STL), .msh (Gmsh ASCII)
+Supported output formats: .stl (binary STL), .msh (Gmsh 2.2 binary)
         """,
     )
     parser.add_argument("input", help="Input NIfTI segmentation file")
@@ -318,6 +404,12 @@ Supported output formats: .stl (binary STL), .msh (Gmsh ASCII)
         default=0.1,
         help="Minimum size threshold for component removal (0-1, default: 0.1)",
     )
+    parser.add_argument(
+        "--slab-size",
+        type=int,
+        default=None,
+        help="Mesh the mask in slabs of N voxel planes to bound memory use",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Print verbose output"
     )
@@ -335,6 +427,7 @@ Supported output formats: .stl (binary STL), .msh (Gmsh ASCII)
             args.output,
             clean_components=args.clean,
             clean_threshold=args.clean_threshold,
+            slab_size=args.slab_size,
         )
 
         if args.verbose:
@@ -0,0 +1,354 @@
+"""
+Vectorised surface-mesh writers and readers.
+
+Single source of truth for writing triangle surfaces to disk:
+- Binary STL reading and writing
+- Gmsh ``.msh`` writing (2.2 ASCII/binary, 4.1 binary)
+- ASCII PLY writing (with per-vertex colors or scalars)
+
+Every writer formats whole arrays at once (structured NumPy records for
+binary output, block-wise ``%``-formatting for text) instead of emitting one
+line or record per vertex/face from Python.  Only NumPy is required, so the
+module can be used both from :mod:`tit.blender` and from the standalone
+command-line tools.
+"""
+
+from __future__ import annotations
+
+import io
+from typing import Optional
+
+import numpy as np
+
+# Rows formatted per ``%`` operation in the text writers.
+_TEXT_BLOCK = 65536
+
+_STL_RECORD = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attr", "<u2")]
+)
+
+
+def _write_text_rows(f, row_format: str, rows: np.ndarray) -> None:
+    """Write ``row_format % row`` for every row of *rows*, block by block."""
+    rows = np.asarray(rows)
+    for start in range(0, len(rows), _TEXT_BLOCK):
+        block = rows[start : start + _TEXT_BLOCK]
+        f.write((row_format * len(block)) % tuple(block.ravel().tolist()))
+
+
+def face_normals(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Unit normals of triangles; ``[0, 0, 1]`` for degenerate faces.
+
+    Args:
+        vertices: Array of shape [N, 3] with vertex coordinates.
+        faces: Array of shape [M, 3] with vertex indices.
+
+    Returns:
+        Array of shape [M, 3] with float64 unit normals.
+    """
+    tri = np.asarray(vertices, dtype=np.float64)[np.asarray(faces)]
+    normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    length = np.linalg.norm(normals, axis=1)
+    ok = length > 1e-12
+    normals[ok] /= length[ok, None]
+    normals[~ok] = [0.0, 0.0, 1.0]
+    return normals
+
+
+# ---------------------------------------------------------------------------
+# Binary STL
+# ---------------------------------------------------------------------------
+
+
+def read_binary_stl(path: str) -> tuple[np.ndarray, np.ndarray]:
+    """Read vertices and faces from a binary STL file.
+
+    Duplicate vertices (common in STL) are merged so the returned arrays
+    use shared vertex indices, numbered in order of first appearance.
+
+    Args:
+        path: Path to the binary STL file.
+
+    Returns:
+        Tuple of (vertices, faces) where vertices is [N, 3] float64 and
+        faces is [M, 3] int64 with indices into the vertex array.
+    """
+    with open(path, "rb") as f:
+        f.read(80)  # header
+        num_triangles = int(np.frombuffer(f.read(4), dtype="<u4")[0])
+        records = np.frombuffer(
+            f.read(num_triangles * _STL_RECORD.itemsize),
+            dtype=_STL_RECORD,
+            count=num_triangles,
+        )
+
+    corners = records["vertices"].reshape(-1, 3)
+    if len(corners) == 0:
+        return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64)
+
+    _, first, inverse = np.unique(
+        corners, axis=0, return_index=True, return_inverse=True
+    )
+    inverse = inverse.reshape(-1)
+    # Renumber unique vertices by first appearance.
+    order = np.argsort(first, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    vertices = corners[first[order]].astype(np.float64)
+    faces = rank[inverse].reshape(-1, 3).astype(np.int64)
+    return vertices, faces
+
+
+def write_binary_stl(
+    path: str,
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    normals: Optional[np.ndarray] = None,
+    header_text: str = "TI-Toolbox Mesh",
+) -> None:
+    """Write a binary STL file from vertices and faces.
+
+    Args:
+        path: Output file path.
+        vertices: Array of shape [N, 3] with vertex coordinates.
+        faces: Array of shape [M, 3] with vertex indices for each triangle.
+        normals: Optional array of shape [M, 3] with per-face normals.
+            If *None*, normals are computed from the triangle edges.
+        header_text: ASCII text written into the 80-byte STL header.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+
+    records = np.zeros(len(faces), dtype=_STL_RECORD)
+    records["vertices"] = vertices[faces]
+    records["normal"] = (
+        face_normals(vertices, faces) if normals is None else np.asarray(normals)
+    )
+
+    with open(path, "wb") as f:
+        f.write(header_text.encode("ascii")[:80].ljust(80, b"\x00"))
+        f.write(np.uint32(len(faces)).astype("<u4").tobytes())
+        f.write(records.tobytes())
+
+
+# ---------------------------------------------------------------------------
+# Gmsh
+# ---------------------------------------------------------------------------
+
+
+def write_gmsh_surface(
+    path: str,
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    version: str = "2.2",
+    binary: bool = True,
+    tag: int = 1,
+) -> None:
+    """Write a triangle surface as a Gmsh ``.msh`` file.
+
+    Args:
+        path: Output file path.
+        vertices: Array of shape [N, 3] with vertex coordinates.
+        faces: Array of shape [M, 3] with 0-based vertex indices.
+        version: ``"2.2"`` (readable by SimNIBS) or ``"4.1"``.
+        binary: Write the binary variant of the format.  Version 4.1 is
+            only written in binary.
+        tag: Physical/elementary tag of every triangle (entity tag in 4.1).
+
+    Raises:
+        ValueError: For unsupported *version* / *binary* combinations.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    if version == "2.2":
+        _write_gmsh22(path, vertices, faces, binary, tag)
+    elif version == "4.1" and binary:
+        _write_gmsh41_binary(path, vertices, faces, tag)
+    else:
+        mode = "binary" if binary else "ASCII"
+        raise ValueError(f"Unsupported Gmsh format: {version} {mode}")
+
+
+def _write_gmsh22(path, vertices, faces, binary, tag):
+    n_nodes, n_elm = len(vertices), len(faces)
+    node_ids = np.arange(1, n_nodes + 1)
+    elm_ids = np.arange(1, n_elm + 1)
+
+    with open(path, "wb") as f:
+        f.write(b"$MeshFormat\n")
+        if binary:
+            f.write(b"2.2 1 8\n")
+            f.write(np.int32(1).tobytes() + b"\n")
+        else:
+            f.write(b"2.2 0 8\n")
+        f.write(b"$EndMeshFormat\n")
+
+        f.write(f"$Nodes\n{n_nodes}\n".encode("ascii"))
+        if binary:
+            nodes = np.zeros(n_nodes, dtype=[("id", "<i4"), ("xyz", "<f8", (3,))])
+            nodes["id"] = node_ids
+            nodes["xyz"] = vertices
+            f.write(nodes.tobytes() + b"\n")
+        else:
+            rows = np.column_stack([node_ids, vertices])
+            f.write(_format_rows("%d %r %r %r\n", rows))
+        f.write(b"$EndNodes\n")
+
+        # Triangles: type 2 with 2 tags (physical, elementary).
+        f.write(f"$Elements\n{n_elm}\n".encode("ascii"))
+        if binary:
+            if n_elm:
+                f.write(np.array([2, n_elm, 2], dtype="<i4").tobytes())
+            elms = np.empty((n_elm, 6), dtype="<i4")
+            elms[:, 0] = elm_ids
+            elms[:, 1:3] = tag
+            elms[:, 3:] = faces + 1
+            f.write(elms.tobytes() + b"\n")
+        else:
+            rows = np.column_stack([elm_ids, np.full((n_elm, 2), tag), faces + 1])
+            f.write(_format_rows("%d 2 2 %d %d %d %d %d\n", rows))
+        f.write(b"$EndElements\n")
+
+
+def _write_gmsh41_binary(path, vertices, faces, tag):
+    n_nodes, n_elm = len(vertices), len(faces)
+    size_t = "<u8"
+
+    with open(path, "wb") as f:
+        f.write(b"$MeshFormat\n4.1 1 8\n")
+        f.write(np.int32(1).tobytes() + b"\n")
+        f.write(b"$EndMeshFormat\n")
+
+        # One surface entity holding every node and triangle.
+        f.write(b"$Entities\n")
+        f.write(np.array([0, 0, 1, 0], dtype=size_t).tobytes())
+        bbox = np.zeros(6)
+        if n_nodes:
+            bbox = np.concatenate([vertices.min(axis=0), vertices.max(axis=0)])
+        f.write(np.int32(tag).tobytes())
+        f.write(bbox.astype("<f8").tobytes())
+        f.write(np.array([0], dtype=size_t).tobytes())  # physical tags
+        f.write(np.array([0], dtype=size_t).tobytes())  # bounding curves
+        f.write(b"\n$EndEntities\n")
+
+        f.write(b"$Nodes\n")
+        f.write(np.array([1, n_nodes, 1, n_nodes], dtype=size_t).tobytes())
+        f.write(np.array([2, tag, 0], dtype="<i4").tobytes())
+        f.write(np.array([n_nodes], dtype=size_t).tobytes())
+        f.write(np.arange(1, n_nodes + 1, dtype=size_t).tobytes())
+        f.write(vertices.astype("<f8").tobytes())
+        f.write(b"\n$EndNodes\n")
+
+        f.write(b"$Elements\n")
+        f.write(np.array([1, n_elm, 1, n_elm], dtype=size_t).tobytes())
+        f.write(np.array([2, tag, 2], dtype="<i4").tobytes())
+        f.write(np.array([n_elm], dtype=size_t).tobytes())
+        elms = np.empty((n_elm, 4), dtype=size_t)
+        elms[:, 0] = np.arange(1, n_elm + 1)
+        elms[:, 1:] = faces + 1
+        f.write(elms.tobytes())
+        f.write(b"\n$EndElements\n")
+
+
+def _format_rows(row_format: str, rows) -> bytes:
+    """Return ``row_format % row`` for all *rows* as ASCII bytes."""
+    buf = io.StringIO()
+    _write_text_rows(buf, row_format, rows)
+    return buf.getvalue().encode("ascii")
+
+
+# ---------------------------------------------------------------------------
+# PLY
+# ---------------------------------------------------------------------------
+
+
+def _ply_faces(f, faces: np.ndarray) -> None:
+    _write_text_rows(f, "3 %d %d %d\n", np.asarray(faces, dtype=np.int64))
+
+
+def write_ply_with_colors(
+    path: str,
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    colors: np.ndarray,
+    comment: str = "",
+) -> None:
+    """Write an ASCII PLY file with per-vertex RGB colors.
+
+    Args:
+        path: Output file path.
+        vertices: Array of shape [N, 3] vertex coordinates.
+        faces: Array of shape [M, 3] face indices.
+        colors: Array of shape [N, 3] RGB values in 0-255 range.
+        comment: Optional comment line written into the header.
+    """
+    n_vertices = len(vertices)
+    n_faces = len(faces)
+
+    with open(path, "w") as f:
+        f.write("ply\n")
+        f.write("format ascii 1.0\n")
+        if comment:
+            f.write(f"comment {comment}\n")
+        f.write(f"element vertex {n_vertices}\n")
+        f.write("property float x\n")
+        f.write("property float y\n")
+        f.write("property float z\n")
+        f.write("property uchar red\n")
+        f.write("property uchar green\n")
+        f.write("property uchar blue\n")
+        f.write(f"element face {n_faces}\n")
+        f.write("property list uchar int vertex_indices\n")
+        f.write("end_header\n")
+
+        rows = np.column_stack(
+            [
+                np.asarray(vertices, dtype=np.float64),
+                np.asarray(colors)[:, :3].astype(int),
+            ]
+        )
+        _write_text_rows(f, "%.6f %.6f %.6f %d %d %d\n", rows)
+        _ply_faces(f, faces)
+
+
+def write_ply_with_scalars(
+    path: str,
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    scalars: np.ndarray,
+    scalar_name: str = "scalar",
+    comment: str = "",
+) -> None:
+    """Write an ASCII PLY file with a per-vertex scalar property.
+
+    Args:
+        path: Output file path.
+        vertices: Array of shape [N, 3] vertex coordinates.
+        faces: Array of shape [M, 3] face indices.
+        scalars: Array of shape [N] scalar values.
+        scalar_name: Name for the scalar property in the PLY header.
+        comment: Optional comment line written into the header.
+    """
+    n_vertices = len(vertices)
+    n_faces = len(faces)
+
+    with open(path, "w") as f:
+        f.write("ply\n")
+        f.write("format ascii 1.0\n")
+        if comment:
+            f.write(f"comment {comment}\n")
+        f.write(f"element vertex {n_vertices}\n")
+        f.write("property float x\n")
+        f.write("property float y\n")
+        f.write("property float z\n")
+        f.write(f"property float {scalar_name}\n")
+        f.write(f"element face {n_faces}\n")
+        f.write("property list uchar int vertex_indices\n")
+        f.write("end_header\n")
+
+        rows = np.column_stack(
+            [np.asarray(vertices, dtype=np.float64), np.asarray(scalars, dtype=float)]
+        )
+        _write_text_rows(f, "%.6f %.6f %.6f %.6f\n", rows)
+        _ply_faces(f, faces)
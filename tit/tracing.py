@@ -0,0 +1,412 @@
+"""Per-stage timing and memory tracing.
+
+A *span* times one stage of a run -- a preprocessing step, a leadfield
+load, a simulation's post-processing, a permutation test -- and records its
+wall and CPU time, the CPU time of the external tools it ran, the peak
+resident memory of the process and of those tools, and the bytes it read
+and wrote.  Spans nest: each record carries the id of the span that was
+open when it started.
+
+Spans are always measured (a few microseconds each), but are only written
+while a trace is active.  :func:`start_trace` activates one beside a run's
+log file, as ``<log name>.trace.jsonl`` with one JSON record per finished
+span; :func:`~tit.telemetry.track_operation` opens the root span of every
+run, and a trace started inside it ends when that span closes.  Nothing in
+a trace leaves the machine.
+
+:func:`summarize` turns a trace into a flame-style breakdown::
+
+    python -m tit.tracing derivatives/ti-toolbox/logs/sub-01/sim_*.trace.jsonl
+
+Public API
+----------
+span
+    Context manager timing one stage.
+traced
+    Decorator wrapping a function in a :func:`span`.
+start_trace
+    Write the spans of this process beside a log file.
+stop_trace
+    Stop writing spans.
+active_trace
+    The active :class:`Tracer`, if any.
+Tracer
+    Append-only JSONL span writer.
+load_trace
+    Read the records of a trace file.
+summarize
+    Flame-style text breakdown of trace records.
+
+See Also
+--------
+tit.telemetry.track_operation : Opens the root span of each run.
+tit.logger.add_file_handler : Creates the log files traces are written beside.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TRACE_SUFFIX = ".trace.jsonl"
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+_MAXRSS_BYTES = 1 if sys.platform == "darwin" else 1024
+_MB = 1024 * 1024
+
+_CURRENT_SPAN: ContextVar[str | None] = ContextVar("tit_trace_span", default=None)
+_OPEN_SPANS: set[str] = set()
+_TRACER: Tracer | None = None
+_TRACER_LOCK = threading.Lock()
+
+
+class Tracer:
+    """Append span records to a JSONL file.
+
+    Each record is written with a single ``write`` on a file opened in
+    append mode, so spans from threads and forked workers interleave by
+    line without corrupting each other.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Trace file; parent directories are created.
+    owner : str or None, optional
+        Id of the span that was open when the trace started (the run).
+    previous : Tracer or None, optional
+        Trace active before this one, restored when *owner* closes.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        owner: str | None = None,
+        previous: Tracer | None = None,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.owner = owner
+        self.previous = previous
+        self._lock = threading.Lock()
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Append *record*; I/O errors are ignored."""
+        line = json.dumps(record, default=str) + "\n"
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError:
+            pass
+
+
+def trace_path(log_file: str | Path) -> Path:
+    """The trace file written beside *log_file*."""
+    log_file = Path(log_file)
+    if log_file.name.endswith(TRACE_SUFFIX):
+        return log_file
+    return log_file.with_name(log_file.stem + TRACE_SUFFIX)
+
+
+def start_trace(log_file: str | Path) -> Tracer:
+    """Write this process's spans beside *log_file* for the current run.
+
+    The trace ends when the span open at this call -- the run's root span
+    from :func:`~tit.telemetry.track_operation` -- closes, and the trace it
+    replaced, if any, becomes active again.  Started outside any span, it
+    lasts until :func:`stop_trace`.
+
+    The active trace is kept when it already writes beside *log_file*, or
+    when the run that started it is still open -- a run nested in another
+    (a subject's analysis inside a group analysis) is traced with its
+    parent.  Otherwise a new trace replaces it.
+    """
+    global _TRACER
+    path = trace_path(log_file)
+    with _TRACER_LOCK:
+        if _TRACER is not None and (
+            _TRACER.path == path or _TRACER.owner in _OPEN_SPANS
+        ):
+            return _TRACER
+        _TRACER = Tracer(path, owner=_CURRENT_SPAN.get(), previous=_TRACER)
+        return _TRACER
+
+
+def stop_trace() -> None:
+    """Stop writing spans, including those of any outer trace."""
+    global _TRACER
+    with _TRACER_LOCK:
+        _TRACER = None
+
+
+def _end_run(span_id: str) -> None:
+    """End the trace owned by the span *span_id*, restoring the one before."""
+    global _TRACER
+    with _TRACER_LOCK:
+        if _TRACER is not None and _TRACER.owner == span_id:
+            _TRACER = _TRACER.previous
+
+
+def active_trace() -> Tracer | None:
+    """The active :class:`Tracer`, or ``None``."""
+    return _TRACER
+
+
+def _io_bytes() -> tuple[int, int] | None:
+    """Bytes this process has read from and written to storage."""
+    try:
+        with open("/proc/self/io") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+        return int(fields["read_bytes"]), int(fields["write_bytes"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _snapshot() -> dict[str, Any]:
+    snap = {
+        "time": time.time(),
+        "perf": time.perf_counter(),
+        "cpu": time.process_time(),
+        "io": _io_bytes(),
+    }
+    if resource is not None:
+        own = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        snap["peak_rss"] = own.ru_maxrss * _MAXRSS_BYTES
+        snap["child_cpu"] = children.ru_utime + children.ru_stime
+        snap["child_peak_rss"] = children.ru_maxrss * _MAXRSS_BYTES
+    return snap
+
+
+def _record(
+    name: str,
+    span_id: str,
+    parent: str | None,
+    before: dict[str, Any],
+    after: dict[str, Any],
+    attrs: dict[str, Any],
+    error: str | None,
+) -> dict[str, Any]:
+    record: dict[str, Any] = {
+        "id": span_id,
+        "parent": parent,
+        "name": name,
+        "start": round(before["time"], 6),
+        "wall_s": round(after["perf"] - before["perf"], 6),
+        "cpu_s": round(after["cpu"] - before["cpu"], 6),
+        "pid": os.getpid(),
+        "thread": threading.current_thread().name,
+    }
+    if "peak_rss" in after:
+        record["child_cpu_s"] = round(after["child_cpu"] - before["child_cpu"], 6)
+        record["peak_rss_mb"] = round(after["peak_rss"] / _MB, 1)
+        record["child_peak_rss_mb"] = round(after["child_peak_rss"] / _MB, 1)
+    if before["io"] is not None and after["io"] is not None:
+        record["read_bytes"] = after["io"][0] - before["io"][0]
+        record["write_bytes"] = after["io"][1] - before["io"][1]
+    if attrs:
+        record["attrs"] = attrs
+    if error is not None:
+        record["error"] = error
+    return record
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[str]:
+    """Time the enclosed block as stage *name*.
+
+    Parameters
+    ----------
+    name : str
+        Stage name; sibling spans with the same name are merged by
+        :func:`summarize`.
+    **attrs
+        JSON-serialisable details stored with the record (subject, montage,
+        sizes...).
+
+    Yields
+    ------
+    str
+        The span id.
+
+    Notes
+    -----
+    ``peak_rss_mb`` is the process's memory high-water mark when the span
+    ends, not the growth within it; ``child_*`` fields cover subprocesses
+    that finished during the span.  Spans started on a new thread have no
+    parent.  A trace started while this span was innermost ends with it.
+
+    Examples
+    --------
+    >>> from tit.tracing import span
+    >>> with span("load_leadfield", path=leadfield_hdf):
+    ...     leadfield = load(leadfield_hdf)
+    """
+    parent = _CURRENT_SPAN.get()
+    span_id = uuid.uuid4().hex[:16]
+    token = _CURRENT_SPAN.set(span_id)
+    _OPEN_SPANS.add(span_id)
+    before = _snapshot()
+    error = None
+    try:
+        yield span_id
+    except BaseException as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        _CURRENT_SPAN.reset(token)
+        _OPEN_SPANS.discard(span_id)
+        tracer = _TRACER
+        if tracer is not None:
+            tracer.write(
+                _record(name, span_id, parent, before, _snapshot(), attrs, error)
+            )
+            _end_run(span_id)
+
+
+def traced(name: str | None = None) -> Callable[[Callable], Callable]:
+    """Decorator running the function inside ``span(name)``.
+
+    *name* defaults to the function's qualified name.
+    """
+
+    def decorate(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+# ---------------------------------------------------------------------------
+# Summary
+# ---------------------------------------------------------------------------
+
+
+def load_trace(path: str | Path) -> list[dict[str, Any]]:
+    """Read the span records of a trace file, skipping malformed lines."""
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def _new_node(name: str) -> dict[str, Any]:
+    return {
+        "name": name,
+        "count": 0,
+        "wall_s": 0.0,
+        "cpu_s": 0.0,
+        "peak_rss_mb": 0.0,
+        "children": {},
+    }
+
+
+def _merge(node: dict[str, Any], record: dict[str, Any], by_parent: dict) -> None:
+    node["count"] += 1
+    node["wall_s"] += record.get("wall_s", 0.0)
+    node["cpu_s"] += record.get("cpu_s", 0.0) + record.get("child_cpu_s", 0.0)
+    node["peak_rss_mb"] = max(
+        node["peak_rss_mb"],
+        record.get("peak_rss_mb", 0.0),
+        record.get("child_peak_rss_mb", 0.0),
+    )
+    for child in by_parent.get(record.get("id"), ()):
+        name = child.get("name", "?")
+        sub = node["children"].setdefault(name, _new_node(name))
+        _merge(sub, child, by_parent)
+
+
+def summarize(records: Iterable[dict[str, Any]], width: int = 30) -> str:
+    """Flame-style breakdown of span *records*.
+
+    Spans are arranged by parent and merged by name among siblings; each
+    line shows total wall time, CPU time (including subprocesses), peak
+    memory, call count and a bar scaled to the whole trace's wall time.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        Span records, e.g. from :func:`load_trace`.
+    width : int, optional
+        Width of the widest bar in characters.
+
+    Returns
+    -------
+    str
+        The breakdown, one line per merged span, heaviest first.
+    """
+    records = list(records)
+    ids = {r.get("id") for r in records}
+    by_parent: dict[str | None, list[dict[str, Any]]] = {}
+    for record in sorted(records, key=lambda r: r.get("start", 0.0)):
+        parent = record.get("parent") if record.get("parent") in ids else None
+        by_parent.setdefault(parent, []).append(record)
+
+    root = _new_node("")
+    for record in by_parent.get(None, ()):
+        name = record.get("name", "?")
+        _merge(root["children"].setdefault(name, _new_node(name)), record, by_parent)
+
+    total = sum(node["wall_s"] for node in root["children"].values()) or 1.0
+    lines = [f"{'wall s':>10} {'cpu s':>10} {'peak MB':>9} {'calls':>6}  stage"]
+
+    def emit(node: dict[str, Any], depth: int) -> None:
+        bar = "█" * max(1, round(width * node["wall_s"] / total))
+        lines.append(
+            f"{node['wall_s']:>10.2f} {node['cpu_s']:>10.2f} "
+            f"{node['peak_rss_mb']:>9.1f} {node['count']:>6}  "
+            f"{'  ' * depth}{node['name']}  {bar}"
+        )
+        for child in sorted(
+            node["children"].values(), key=lambda n: n["wall_s"], reverse=True
+        ):
+            emit(child, depth + 1)
+
+    for node in sorted(
+        root["children"].values(), key=lambda n: n["wall_s"], reverse=True
+    ):
+        emit(node, 0)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print the summary of one or more trace files."""
+    parser = argparse.ArgumentParser(
+        prog="python -m tit.tracing",
+        description="Summarise TI-Toolbox stage traces (*.trace.jsonl).",
+    )
+    parser.add_argument("traces", nargs="+", help="Trace files to summarise.")
+    parser.add_argument("--width", type=int, default=30, help="Bar width.")
+    args = parser.parse_args(argv)
+
+    records = [r for path in args.traces for r in load_trace(path)]
+    print(summarize(records, width=args.width))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())